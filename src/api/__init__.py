@@ -0,0 +1,6 @@
+"""Service JSON local de simulation (asyncio, regroupement des requêtes).
+
+Usage (depuis ``src/``)::
+
+    python -m api --host 127.0.0.1 --port 8765 --workers 4
+"""
@@ -0,0 +1,58 @@
+"""Lancement du service JSON de simulation."""
+
+import argparse
+import asyncio
+import os
+import sys
+
+from api.batcher import DEFAULT_MAX_BATCH_SIZE, DEFAULT_MAX_WAIT_MS
+from api.server import READ_TIMEOUT_SECONDS, serve
+from api.service import SimulationService
+
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+
+async def _serve(args: argparse.Namespace) -> None:
+    async with SimulationService(
+        workers=args.workers,
+        max_batch_size=args.max_batch_size,
+        max_wait_ms=args.max_wait_ms,
+    ) as service:
+        print(f"Service à l'écoute sur http://{args.host}:{args.port}", file=sys.stderr)
+        await serve(service, args.host, args.port, args.read_timeout)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Point d'entrée : démarre le service jusqu'à interruption."""
+    parser = argparse.ArgumentParser(prog="python -m api")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 1,
+        help="Processus de calcul (défaut : %(default)s).",
+    )
+    parser.add_argument(
+        "--max-batch-size", type=int, default=DEFAULT_MAX_BATCH_SIZE,
+        help="Scénarios maximum par appel au moteur (défaut : %(default)s).",
+    )
+    parser.add_argument(
+        "--max-wait-ms", type=float, default=DEFAULT_MAX_WAIT_MS,
+        help="Attente maximale avant envoi d'un paquet (défaut : %(default)s ms).",
+    )
+    parser.add_argument(
+        "--read-timeout", type=float, default=READ_TIMEOUT_SECONDS,
+        help="Délai de réception d'une requête avant réponse 408 "
+        "(défaut : %(default)s s).",
+    )
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
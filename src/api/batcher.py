@@ -0,0 +1,151 @@
+"""Regroupement des requêtes concurrentes en appels vectorisés.
+
+Les scénarios soumis dans une courte fenêtre sont accumulés puis évalués
+ensemble par un seul appel au moteur, exécuté dans un pool de workers :
+la boucle asyncio ne fait que collecter et répartir les résultats. Si
+l'appel échoue, le paquet est coupé en deux et chaque moitié réévaluée :
+l'erreur n'atteint que les éléments qui la provoquent, pas les requêtes
+regroupées avec eux.
+"""
+
+import asyncio
+from collections import deque
+from collections.abc import Callable, Sequence
+from concurrent.futures import Executor
+from typing import Any
+
+
+DEFAULT_MAX_BATCH_SIZE = 512
+DEFAULT_MAX_WAIT_MS = 5.0
+BATCH_SIZE_SAMPLES = 10_000
+
+
+class MicroBatcher:
+    """File d'attente asynchrone vidée par paquets.
+
+    Un paquet part dès que ``max_batch_size`` éléments sont en attente, ou
+    ``max_wait_ms`` après l'arrivée du premier élément du paquet. Doit être
+    créé et utilisé depuis la boucle asyncio.
+    """
+
+    def __init__(
+        self,
+        evaluate: Callable[[list], Sequence],
+        executor: Executor,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait_ms: float = DEFAULT_MAX_WAIT_MS,
+    ) -> None:
+        """Initialise la file.
+
+        Args:
+            evaluate: Fonction exécutée dans le pool ; reçoit la liste des
+                éléments d'un paquet et retourne un résultat par élément,
+                dans l'ordre. Doit être sérialisable (pool de processus).
+            executor: Pool de workers.
+            max_batch_size: Nombre maximal d'éléments par appel.
+            max_wait_ms: Attente maximale d'un élément avant envoi (ms).
+
+        Raises:
+            ValueError: Si ``max_batch_size`` < 1 ou ``max_wait_ms`` < 0.
+        """
+        if max_batch_size < 1 or max_wait_ms < 0:
+            raise ValueError("max_batch_size ≥ 1 et max_wait_ms ≥ 0 attendus.")
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self._evaluate = evaluate
+        self._executor = executor
+        self._pending: list[tuple[Any, asyncio.Future]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+        self._in_flight = 0
+        self.max_queue_depth = 0
+        self.batches = 0
+        self.items = 0
+        self.batch_sizes: deque[int] = deque(maxlen=BATCH_SIZE_SAMPLES)
+
+    @property
+    def queue_depth(self) -> int:
+        """Éléments en attente ou en cours d'évaluation."""
+        return len(self._pending) + self._in_flight
+
+    async def submit(self, item: Any) -> Any:
+        """Soumet un élément et attend son résultat."""
+        return (await self.submit_many([item]))[0]
+
+    async def submit_many(self, items: Sequence[Any]) -> list:
+        """Soumet plusieurs éléments et attend leurs résultats, dans l'ordre.
+
+        Les éléments peuvent être répartis sur plusieurs paquets et
+        partager ceux-ci avec d'autres requêtes.
+        """
+        loop = asyncio.get_running_loop()
+        futures = [loop.create_future() for _ in items]
+        self._pending.extend(zip(items, futures))
+        self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+        while len(self._pending) >= self.max_batch_size:
+            self._flush()
+        if self._pending and self._timer is None:
+            self._timer = loop.call_later(self.max_wait_ms / 1000, self._flush)
+        return list(await asyncio.gather(*futures))
+
+    async def drain(self) -> None:
+        """Envoie les éléments en attente et attend la fin des paquets."""
+        while self._pending:
+            self._flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _flush(self) -> None:
+        """Envoie au pool les ``max_batch_size`` plus anciens éléments."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        chunk = self._pending[: self.max_batch_size]
+        del self._pending[: self.max_batch_size]
+        if not chunk:
+            return
+        if self._pending:
+            loop = asyncio.get_running_loop()
+            self._timer = loop.call_later(self.max_wait_ms / 1000, self._flush)
+        self.batches += 1
+        self.items += len(chunk)
+        self.batch_sizes.append(len(chunk))
+        self._in_flight += len(chunk)
+        task = asyncio.get_running_loop().create_task(self._execute(chunk))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _execute(self, chunk: list[tuple[Any, asyncio.Future]]) -> None:
+        """Évalue un paquet dans le pool et distribue les résultats."""
+        try:
+            await self._evaluate_isolating(chunk)
+        finally:
+            self._in_flight -= len(chunk)
+
+    async def _evaluate_isolating(
+        self, chunk: list[tuple[Any, asyncio.Future]]
+    ) -> None:
+        """Évalue un paquet ; en cas d'échec, réévalue ses deux moitiés.
+
+        Seul un élément isolé dont l'évaluation échoue reçoit l'erreur.
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            results = await loop.run_in_executor(
+                self._executor, self._evaluate, [item for item, _ in chunk]
+            )
+        except Exception as exc:
+            if len(chunk) == 1:
+                _, future = chunk[0]
+                if not future.done():
+                    future.set_exception(exc)
+                return
+            middle = len(chunk) // 2
+            await asyncio.gather(
+                self._evaluate_isolating(chunk[:middle]),
+                self._evaluate_isolating(chunk[middle:]),
+            )
+        else:
+            for (_, future), result in zip(chunk, results):
+                if not future.done():
+                    future.set_result(result)
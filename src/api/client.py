@@ -0,0 +1,50 @@
+"""Client en processus : appelle le service sans réseau.
+
+Les requêtes et réponses passent par JSON comme sur HTTP, ce qui permet
+d'éprouver le service (validation, regroupement, métriques) localement.
+"""
+
+import json
+from dataclasses import dataclass
+from typing import Any
+
+from api.service import SimulationService
+
+
+@dataclass(frozen=True)
+class Response:
+    """Réponse du service.
+
+    Attributes:
+        status: Code HTTP.
+        json: Corps décodé.
+    """
+
+    status: int
+    json: Any
+
+
+class InProcessClient:
+    """Client asynchrone branché directement sur un ``SimulationService``."""
+
+    def __init__(self, service: SimulationService) -> None:
+        """Initialise le client.
+
+        Args:
+            service: Service démarré (contexte ``async with`` ouvert).
+        """
+        self._service = service
+
+    async def get(self, path: str) -> Response:
+        """Envoie une requête ``GET``."""
+        return await self._request("GET", path, b"")
+
+    async def post(self, path: str, payload: Any) -> Response:
+        """Envoie une requête ``POST`` avec un corps JSON."""
+        return await self._request("POST", path, json.dumps(payload).encode("utf-8"))
+
+    async def _request(self, method: str, path: str, body: bytes) -> Response:
+        status, response = await self._service.handle(method, path, body)
+        # Aller-retour JSON, comme à travers le serveur HTTP.
+        encoded = json.dumps(response, ensure_ascii=False, allow_nan=False)
+        return Response(status=status, json=json.loads(encoded))
@@ -0,0 +1,165 @@
+"""Serveur HTTP/1.1 minimal (asyncio, bibliothèque standard) du service.
+
+Gère le strict nécessaire pour des appels machine à machine : corps à
+``Content-Length``, connexions persistantes, réponses JSON. Un client qui
+n'envoie pas son en-tête ou son corps dans le délai imparti reçoit un 408
+et la connexion est fermée ; un en-tête trop long reçoit un 431.
+"""
+
+import asyncio
+import json
+from http import HTTPStatus
+from urllib.parse import urlsplit
+
+from api.service import SimulationService
+
+
+MAX_BODY_BYTES = 1 << 20
+MAX_HEADER_LINES = 100
+# Délai de réception de l'en-tête (connexion inactive comprise), puis du
+# corps d'une requête (s).
+READ_TIMEOUT_SECONDS = 30.0
+
+
+class _HeaderTooLarge(Exception):
+    """En-tête de plus de ``MAX_HEADER_LINES`` lignes ou ligne trop longue."""
+
+
+async def start(
+    service: SimulationService,
+    host: str,
+    port: int,
+    read_timeout: float = READ_TIMEOUT_SECONDS,
+) -> asyncio.Server:
+    """Ouvre le port d'écoute (``port=0`` : port libre choisi par le système).
+
+    Args:
+        service: Service démarré (contexte ``async with`` ouvert).
+        host: Adresse d'écoute.
+        port: Port d'écoute.
+        read_timeout: Délai de réception de l'en-tête puis du corps (s).
+
+    Returns:
+        Serveur asyncio, déjà à l'écoute.
+    """
+
+    async def on_connection(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while await _handle_request(service, reader, writer, read_timeout):
+                pass
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    return await asyncio.start_server(on_connection, host, port)
+
+
+async def serve(
+    service: SimulationService,
+    host: str,
+    port: int,
+    read_timeout: float = READ_TIMEOUT_SECONDS,
+) -> None:
+    """Sert les requêtes jusqu'à l'annulation de la tâche.
+
+    Args:
+        service: Service démarré (contexte ``async with`` ouvert).
+        host: Adresse d'écoute.
+        port: Port d'écoute.
+        read_timeout: Délai de réception de l'en-tête puis du corps (s).
+    """
+    server = await start(service, host, port, read_timeout)
+    async with server:
+        await server.serve_forever()
+
+
+async def _handle_request(
+    service: SimulationService,
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+    read_timeout: float,
+) -> bool:
+    """Traite une requête ; retourne ``False`` si la connexion doit se fermer."""
+    try:
+        head = await asyncio.wait_for(_read_head(reader), read_timeout)
+    except asyncio.TimeoutError:
+        await _respond(writer, 408, {"error": "Délai de requête dépassé"}, False)
+        return False
+    except _HeaderTooLarge:
+        await _respond(writer, 431, {"error": "En-tête trop volumineux"}, False)
+        return False
+    if head is None:
+        return False
+    request_line, headers = head
+    try:
+        method, target, version = request_line.decode("latin-1").split()
+    except ValueError:
+        await _respond(writer, 400, {"error": "Ligne de requête invalide"}, False)
+        return False
+
+    keep_alive = (
+        version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+    )
+    try:
+        length = int(headers.get("content-length", "0"))
+    except ValueError:
+        length = -1
+    if not 0 <= length <= MAX_BODY_BYTES:
+        await _respond(writer, 413, {"error": "Corps absent ou trop volumineux"}, False)
+        return False
+    try:
+        body = (
+            await asyncio.wait_for(reader.readexactly(length), read_timeout)
+            if length
+            else b""
+        )
+    except asyncio.TimeoutError:
+        await _respond(writer, 408, {"error": "Délai de requête dépassé"}, False)
+        return False
+    status, response = await service.handle(method, urlsplit(target).path, body)
+    await _respond(writer, status, response, keep_alive)
+    return keep_alive
+
+
+async def _read_head(
+    reader: asyncio.StreamReader,
+) -> tuple[bytes, dict[str, str]] | None:
+    """Lit la ligne de requête et les en-têtes ; ``None`` si le client a fermé.
+
+    Raises:
+        _HeaderTooLarge: Au-delà de ``MAX_HEADER_LINES`` lignes d'en-tête ou
+            d'une ligne dépassant la limite du lecteur.
+    """
+    try:
+        request_line = await reader.readline()
+        if not request_line:
+            return None
+        headers: dict[str, str] = {}
+        for _ in range(MAX_HEADER_LINES + 1):
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                return request_line, headers
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+    except ValueError as exc:
+        # ``readline`` signale ainsi une ligne plus longue que sa limite.
+        raise _HeaderTooLarge from exc
+    raise _HeaderTooLarge
+
+
+async def _respond(
+    writer: asyncio.StreamWriter, status: int, response: object, keep_alive: bool
+) -> None:
+    """Écrit une réponse JSON."""
+    data = json.dumps(response, ensure_ascii=False, allow_nan=False).encode("utf-8")
+    head = (
+        f"HTTP/1.1 {status} {HTTPStatus(status).phrase}\r\n"
+        "Content-Type: application/json; charset=utf-8\r\n"
+        f"Content-Length: {len(data)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    writer.write(head.encode("latin-1") + data)
+    await writer.drain()
@@ -0,0 +1,371 @@
+"""Service de simulation : routes JSON, regroupement et métriques.
+
+Le service est indépendant du transport : :meth:`SimulationService.handle`
+reçoit une méthode, un chemin et un corps JSON et retourne un statut et
+une réponse. Le serveur HTTP (:mod:`api.server`) et le client en
+processus (:mod:`api.client`) s'appuient dessus.
+
+Routes :
+
+* ``POST /simulate`` : indicateurs et séries annuelles d'un scénario ;
+* ``POST /kpi`` : indicateurs seuls ;
+* ``POST /sweep`` : indicateurs pour chaque valeur d'un champ ;
+* ``POST /goal-seek`` : valeur d'un champ atteignant un objectif ;
+* ``GET /metrics`` : latences par route et état de la file ;
+* ``GET /health``.
+"""
+
+import json
+import math
+import os
+import time
+from collections import defaultdict, deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any
+
+import numpy as np
+
+from api.batcher import DEFAULT_MAX_BATCH_SIZE, DEFAULT_MAX_WAIT_MS, MicroBatcher
+from application.batch import BatchSimulation
+from application.params_batch import FIELD_NAMES, INTEGER_FIELDS, NUMERIC_FIELDS
+from application.runner import SUMMARY_COLUMNS
+from infrastructure.scenario_loader import load_records
+
+
+MAX_SWEEP_POINTS = 10_000
+LATENCY_SAMPLES = 10_000
+GOAL_SEEK_POINTS = 17
+GOAL_SEEK_MAX_ROUNDS = 12
+DEFAULT_GOAL_SEEK_TOLERANCE = 0.01
+KPI_COLUMNS = SUMMARY_COLUMNS + ("gross_yield", "net_yield")
+ANNUAL_SERIES = (
+    "incomes",
+    "expenses",
+    "annuities",
+    "loan_interests",
+    "remaining_balances",
+    "depreciations",
+    "cashflow",
+)
+
+
+class RequestError(Exception):
+    """Requête invalide : convertie en réponse d'erreur JSON.
+
+    Attributes:
+        status: Code HTTP.
+        message: Motif.
+    """
+
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class SimulationService:
+    """Service asynchrone de simulation, à utiliser comme contexte ``async with``."""
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait_ms: float = DEFAULT_MAX_WAIT_MS,
+        executor: Executor | None = None,
+    ) -> None:
+        """Configure le service (le pool est créé à l'entrée du contexte).
+
+        Args:
+            workers: Processus du pool (défaut : nombre de CPU).
+            max_batch_size: Scénarios maximum par appel au moteur.
+            max_wait_ms: Attente maximale avant envoi d'un paquet (ms).
+            executor: Pool fourni par l'appelant (ex: ``ThreadPoolExecutor``
+                pour les essais) ; il n'est alors pas fermé par le service.
+        """
+        self._workers = workers or os.cpu_count() or 1
+        self._max_batch_size = max_batch_size
+        self._max_wait_ms = max_wait_ms
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._batcher: MicroBatcher | None = None
+        self._latencies: dict[str, deque[float]] = defaultdict(
+            lambda: deque(maxlen=LATENCY_SAMPLES)
+        )
+        self._counts: dict[str, int] = defaultdict(int)
+        self._errors: dict[str, int] = defaultdict(int)
+        self._routes = {
+            ("POST", "/simulate"): self._simulate,
+            ("POST", "/kpi"): self._kpi,
+            ("POST", "/sweep"): self._sweep,
+            ("POST", "/goal-seek"): self._goal_seek,
+            ("GET", "/metrics"): self._metrics,
+            ("GET", "/health"): self._health,
+        }
+
+    async def __aenter__(self) -> "SimulationService":
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self._workers)
+        self._batcher = MicroBatcher(
+            _evaluate_records, self._executor, self._max_batch_size, self._max_wait_ms
+        )
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self._batcher.drain()
+        if self._owns_executor:
+            self._executor.shutdown()
+            self._executor = None
+
+    async def handle(self, method: str, path: str, body: bytes) -> tuple[int, Any]:
+        """Traite une requête.
+
+        Args:
+            method: Méthode HTTP.
+            path: Chemin (sans paramètres de requête).
+            body: Corps JSON (vide pour ``GET``).
+
+        Returns:
+            Statut HTTP et réponse sérialisable en JSON.
+        """
+        started = time.perf_counter()
+        handler = self._routes.get((method, path))
+        try:
+            if handler is None:
+                if any(p == path for _, p in self._routes):
+                    raise RequestError(405, f"Méthode {method} non autorisée")
+                raise RequestError(404, f"Route inconnue : {path}")
+            payload = _decode(body) if method == "POST" else None
+            status, response = 200, await handler(payload)
+        except RequestError as exc:
+            status, response = exc.status, {"error": exc.message}
+        except Exception as exc:
+            # Échec du moteur : la requête échoue, le service continue.
+            status, response = 500, {"error": f"Erreur interne : {exc}"}
+        if handler is not None:
+            self._counts[path] += 1
+            self._errors[path] += status >= 400
+            self._latencies[path].append(time.perf_counter() - started)
+        return status, response
+
+    async def _evaluate(self, records: list[dict]) -> list[dict]:
+        """Valide et évalue des scénarios via la file de regroupement.
+
+        Raises:
+            RequestError: Si un scénario est rejeté par la validation.
+        """
+        results = await self._batcher.submit_many(records)
+        for i, result in enumerate(results):
+            if "error" in result:
+                where = f"scénario {i} : " if len(results) > 1 else ""
+                raise RequestError(400, where + result["error"])
+        return results
+
+    async def _simulate(self, payload: Any) -> dict:
+        (result,) = await self._evaluate([_scenario_record(payload)])
+        return result
+
+    async def _kpi(self, payload: Any) -> dict:
+        (result,) = await self._evaluate([_scenario_record(payload)])
+        return {name: result[name] for name in KPI_COLUMNS}
+
+    async def _sweep(self, payload: Any) -> dict:
+        base, field = _parse_field_request(payload)
+        values = _require(payload, "values")
+        if not isinstance(values, list) or not values:
+            raise RequestError(400, "values : liste non vide attendue")
+        if len(values) > MAX_SWEEP_POINTS:
+            raise RequestError(400, f"values : au plus {MAX_SWEEP_POINTS} points")
+        results = await self._evaluate(_with_values(base, field, values))
+        return {
+            "field": field,
+            "points": [
+                {"value": value, **{name: r[name] for name in KPI_COLUMNS}}
+                for value, r in zip(values, results)
+            ],
+        }
+
+    async def _goal_seek(self, payload: Any) -> dict:
+        """Recherche par grilles successives (un appel vectorisé par tour).
+
+        Chaque tour évalue ``GOAL_SEEK_POINTS`` valeurs régulièrement
+        espacées et resserre l'intervalle autour du premier changement de
+        signe de ``indicateur − objectif``.
+        """
+        base, field = _parse_field_request(payload)
+        if field in INTEGER_FIELDS:
+            raise RequestError(400, f"{field} : champ entier non pris en charge")
+        metric = _require(payload, "metric")
+        if metric not in KPI_COLUMNS:
+            raise RequestError(400, f"metric inconnu : {metric!r}")
+        target = _number(payload, "target")
+        low, high = _number(payload, "low"), _number(payload, "high")
+        tolerance = _number(payload, "tolerance", DEFAULT_GOAL_SEEK_TOLERANCE)
+        if not low < high or tolerance <= 0:
+            raise RequestError(400, "low < high et tolerance > 0 attendus")
+
+        for rounds in range(1, GOAL_SEEK_MAX_ROUNDS + 1):
+            grid = np.linspace(low, high, GOAL_SEEK_POINTS)
+            results = await self._evaluate(_with_values(base, field, grid.tolist()))
+            gaps = np.array(
+                [np.nan if r[metric] is None else r[metric] - target for r in results]
+            )
+            crossing = np.flatnonzero(np.sign(gaps[:-1]) * np.sign(gaps[1:]) <= 0)
+            if not len(crossing):
+                if rounds == 1:
+                    raise RequestError(
+                        422, f"{metric} n'atteint pas {target} entre {low} et {high}"
+                    )
+                break
+            i = int(crossing[0])
+            low, high = float(grid[i]), float(grid[i + 1])
+            g_low, g_high = gaps[i], gaps[i + 1]
+            if high - low <= tolerance or g_low == 0 or g_high == 0:
+                break
+        if g_low == 0:
+            value = low
+        elif g_high == 0:
+            value = high
+        else:
+            value = low - g_low * (high - low) / (g_high - g_low)
+        (achieved,) = await self._evaluate(_with_values(base, field, [value]))
+        return {
+            "field": field,
+            "value": value,
+            "metric": metric,
+            "target": target,
+            "achieved": achieved[metric],
+            "rounds": rounds,
+        }
+
+    async def _metrics(self, payload: Any) -> dict:
+        batcher = self._batcher
+        sizes = list(batcher.batch_sizes)
+        return {
+            "routes": {
+                path: {
+                    "requests": self._counts[path],
+                    "errors": self._errors[path],
+                    **_latency_summary(samples),
+                }
+                for path, samples in self._latencies.items()
+            },
+            "batcher": {
+                "queue_depth": batcher.queue_depth,
+                "max_queue_depth": batcher.max_queue_depth,
+                "batches": batcher.batches,
+                "scenarios": batcher.items,
+                "mean_batch_size": float(np.mean(sizes)) if sizes else 0.0,
+                "max_batch_size": batcher.max_batch_size,
+                "max_wait_ms": batcher.max_wait_ms,
+            },
+        }
+
+    async def _health(self, payload: Any) -> dict:
+        return {"status": "ok"}
+
+
+def _evaluate_records(records: list[dict]) -> list[dict]:
+    """Valide et évalue un paquet (dans un worker), résultats en JSON.
+
+    La validation est celle du chargeur de fichiers, vectorisée sur le
+    paquet ; un scénario rejeté produit ``{"error": motif}``.
+    """
+    batch = load_records(records, "<requête>")
+    results: list[dict] = [{} for _ in records]
+    for error in batch.errors:
+        results[error.line] = {"error": error.message}
+    if not len(batch.params):
+        return results
+    simulated = BatchSimulation().run(batch.params, with_taxation=False)
+    columns = {name: getattr(simulated, name) for name in SUMMARY_COLUMNS}
+    annual_rent = batch.params.column("monthly_rent") * 12
+    columns["gross_yield"] = annual_rent / simulated.total_cost * 100
+    columns["net_yield"] = (
+        (annual_rent - simulated.resolved_annual_expenses) / simulated.total_cost * 100
+    )
+    for i, line in enumerate(batch.lines):
+        results[line] = {
+            **{name: _finite(values[i]) for name, values in columns.items()},
+            "annual": {
+                name: getattr(simulated, name)[i].tolist() for name in ANNUAL_SERIES
+            },
+        }
+    return results
+
+
+def _finite(value: float) -> float | None:
+    """Nombre JSON : ``None`` pour NaN ou infini."""
+    value = float(value)
+    return value if math.isfinite(value) else None
+
+
+def _latency_summary(samples: deque[float]) -> dict[str, float]:
+    """Percentiles de latence (ms) sur les derniers échantillons."""
+    values = np.array(samples) * 1000
+    if not len(values):
+        return {"p50_ms": 0.0, "p95_ms": 0.0, "p99_ms": 0.0, "max_ms": 0.0}
+    p50, p95, p99 = np.percentile(values, [50, 95, 99])
+    return {
+        "p50_ms": float(p50),
+        "p95_ms": float(p95),
+        "p99_ms": float(p99),
+        "max_ms": float(values.max()),
+    }
+
+
+def _decode(body: bytes) -> Any:
+    """Décode un corps JSON."""
+    try:
+        return json.loads(body or b"null")
+    except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+        raise RequestError(400, f"JSON invalide : {exc}") from exc
+
+
+def _require(payload: Any, key: str) -> Any:
+    """Valeur obligatoire d'un objet JSON."""
+    if not isinstance(payload, dict) or key not in payload:
+        raise RequestError(400, f"{key} manquant")
+    return payload[key]
+
+
+def _number(payload: Any, key: str, default: float | None = None) -> float:
+    """Nombre d'un objet JSON (obligatoire si ``default`` est ``None``)."""
+    if default is not None and isinstance(payload, dict) and key not in payload:
+        return default
+    value = _require(payload, key)
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise RequestError(400, f"{key} : nombre attendu")
+    return float(value)
+
+
+def _scenario_record(payload: Any) -> dict:
+    """Scénario JSON : l'objet lui-même ou sa clé ``params``.
+
+    Seule la forme est contrôlée ici ; les valeurs sont validées dans le
+    worker, par paquet.
+    """
+    if isinstance(payload, dict) and isinstance(payload.get("params"), dict):
+        payload = payload["params"]
+    if not isinstance(payload, dict):
+        raise RequestError(400, "Objet JSON de paramètres attendu")
+    unknown = sorted(set(payload) - set(FIELD_NAMES))
+    if unknown:
+        raise RequestError(400, f"Champs inconnus : {', '.join(unknown)}")
+    return payload
+
+
+def _parse_field_request(payload: Any) -> tuple[dict, str]:
+    """Scénario de base (clé ``params``) et champ numérique (clé ``field``)."""
+    base = _scenario_record(_require(payload, "params"))
+    field = _require(payload, "field")
+    if field not in NUMERIC_FIELDS:
+        raise RequestError(400, f"field : champ numérique attendu, reçu {field!r}")
+    return base, field
+
+
+def _with_values(base: dict, field: str, values: list) -> list[dict]:
+    """Copies du scénario, une par valeur du champ."""
+    for value in values:
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise RequestError(400, f"{field} : nombre attendu, reçu {value!r}")
+    return [{**base, field: value} for value in values]
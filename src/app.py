@@ -2,6 +2,11 @@
 
 import streamlit as st
 
+from application import instrumentation, prewarm
+from application.result_cache import shared_result_cache
+from infrastructure.config import default_config_path, load_default_params
+from infrastructure.result_store import default_result_store
+
 
 welcome_pg = st.Page("views/welcome.py", title="Accueil", default=True)
 home_pg = st.Page("views/home.py", title="Paramètres")
@@ -12,8 +17,20 @@ taxes_pg = st.Page("views/taxes.py", title="Impôts")
 resale_pg = st.Page("views/resale.py", title="Revente")
 about_pg = st.Page("views/about.py", title="À propos")
 
-pg = st.navigation(
-    [welcome_pg, home_pg, summary_pg, profitability_pg, loan_pg, taxes_pg, resale_pg, about_pg]
-)
+pages = [welcome_pg, home_pg, summary_pg, profitability_pg, loan_pg, taxes_pg, resale_pg, about_pg]
+# Page de diagnostics masquée : enregistrée uniquement si LMNP_DIAGNOSTICS
+# est défini au démarrage du serveur (l'instrumentation est alors active).
+if instrumentation.ENABLED_AT_STARTUP:
+    pages.append(
+        st.Page("views/diagnostics.py", title="Diagnostics", url_path="diagnostics")
+    )
+
+# Cache de résultats partagé par toutes les pages, adossé au cache persistant.
+shared_result_cache().set_backing(default_result_store())
+
+# Simulation du scénario par défaut en arrière-plan, une fois par serveur.
+prewarm.start(lambda: load_default_params(default_config_path()))
+
+pg = st.navigation(pages)
 st.set_page_config(page_title="🏠 Simulateur LMNP", layout="wide")
 pg.run()
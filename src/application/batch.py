@@ -0,0 +1,973 @@
+"""Moteur de simulation vectorisé : N scénarios évalués en un seul lot.
+
+Reproduit les règles de :class:`~application.simulation.LMNPSimulation`
+sur des tableaux NumPy (une ligne par scénario, une colonne par année) :
+
+* l'emprunt est évalué en forme fermée aux seules bornes d'années
+  (capital restant dû), sans tableau mensuel ;
+* les étapes emprunt et amortissement ne sont calculées qu'une fois par
+  combinaison distincte de leurs entrées, puis diffusées aux scénarios ;
+* la fiscalité boucle sur les années, vectorisée sur les scénarios, avec
+  un stock de déficits par année d'origine (FIFO, 10 ans) ;
+* le TRI est résolu par Newton vectorisé, avec repli sur
+  ``numpy_financial.irr`` pour les rares scénarios non convergés.
+
+:meth:`BatchSimulation.iter_years` produit les mêmes grandeurs année par
+année et retire au fil de l'eau les scénarios dont la recherche est
+terminée.
+
+Les écarts avec le moteur scalaire sont des erreurs d'arrondi flottant,
+à une exception près : les intérêts annuels, tirés de la forme fermée et
+non de la somme des intérêts mensuels, diffèrent d'environ 1e-8 €. Quand
+un montant tombe sur un demi-centime, les colonnes fiscales arrondies
+peuvent alors s'écarter de 0,01 € (quelques cellules sur des milliers).
+"""
+
+from collections.abc import Callable, Iterator, Sequence
+from dataclasses import dataclass
+
+import numpy as np
+from numpy_financial import irr
+
+from application import instrumentation
+from application.params import SimulationParams
+from application.params_batch import ParamsBatch
+from application.simulation import (
+    DEFAULT_DISCOUNT_RATE,
+    FEE_AMOUNT_THRESHOLD,
+    PERIOD_MULTIPLIERS,
+    RESALE_VALUE_THRESHOLD,
+    SIMULATION_DURATION_YEARS,
+)
+from domain.depreciation import FURNITURE_DURATION, PROPERTY_COMPONENTS
+from domain.taxation import DEFICIT_CARRY_LIMIT
+
+
+DEFAULT_CHUNK_SIZE = 8192
+IRR_MAX_ITERATIONS = 50
+IRR_TOLERANCE = 1e-10
+BIC_RATE = 0.50
+
+_EXPENSE_FIELDS = [
+    ("pno_insurance", "pno_period"),
+    ("gli_insurance", "gli_period"),
+    ("agency_management_fee", "agency_management_fee_period"),
+    ("property_tax", "property_tax_period"),
+    ("condo_fees", "condo_fees_period"),
+    ("accounting_fee", "accounting_fee_period"),
+]
+_NUMERIC_FIELDS = [
+    "property_price", "agency_fee_rate", "notary_fee_rate", "renovation_cost",
+    "furniture_cost", "down_payment", "loan_rate", "loan_duration",
+    "monthly_rent", "annual_expenses", "rent_increase_rate", "resale",
+    "loan_nominal_rate", "loan_insurance_rate", "broker_fee", "guarantee_fee",
+    "dossier_fee", "death_insurance_monthly", "resale_horizon", "start_month",
+] + [amount for amount, _ in _EXPENSE_FIELDS]
+
+
+@dataclass(frozen=True)
+class BatchTaxation:
+    """Tableau fiscal d'un lot : un tableau ``(n, années)`` par colonne.
+
+    Les colonnes reprennent les champs homonymes de
+    :class:`~domain.taxation.TaxationEntry`, arrondis à 2 décimales.
+    """
+
+    income: np.ndarray
+    current_expenses: np.ndarray
+    result_before_amort: np.ndarray
+    depreciation: np.ndarray
+    depreciation_used: np.ndarray
+    carry_depreciation_used: np.ndarray
+    carry_forward_depreciation: np.ndarray
+    deficit_added: np.ndarray
+    deficit_used: np.ndarray
+    carry_forward_deficit: np.ndarray
+    fiscal_result: np.ndarray
+    taxable_bic: np.ndarray
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """Résultats d'un lot de simulations (une ligne par scénario).
+
+    Attributes:
+        total_cost: Coût total d'acquisition (€), ``(n,)``.
+        loan_amount: Montant emprunté (€), ``(n,)``.
+        monthly_payment: Mensualité hors assurance décès (€), ``(n,)``.
+        effective_loan_rate: Taux effectif annuel (%), ``(n,)``.
+        resolved_annual_expenses: Charges annuelles effectives (€), ``(n,)``.
+        start_month: Mois de démarrage de l'activité, ``(n,)``.
+        incomes: Revenus locatifs annuels (€), ``(n, années)``.
+        expenses: Charges annuelles (€), ``(n, années)``.
+        annuities: Annuités d'emprunt, assurance décès incluse (€).
+        principals: Part capital remboursée (€), ``(n, années)``.
+        loan_interests: Intérêts d'emprunt annuels (€), ``(n, années)``.
+        remaining_balances: Capital restant dû en fin d'année (€).
+        depreciations: Dotations aux amortissements (€), ``(n, années)``.
+        acquisition_fees_deductible: Frais d'acquisition déduits en année 1
+            (€, 0 en mode amortissement), ``(n,)``.
+        cashflow: Cashflow annuel (€), ``(n, années)``.
+        npv_value: VAN sur l'horizon de revente (€), ``(n,)``.
+        irr_value: TRI sur l'horizon de revente (%), ``(n,)``.
+        wealth_growth: Enrichissement cumulé à l'horizon (€), ``(n,)``.
+        taxation: Tableau fiscal, ou ``None`` si non demandé.
+    """
+
+    total_cost: np.ndarray
+    loan_amount: np.ndarray
+    monthly_payment: np.ndarray
+    effective_loan_rate: np.ndarray
+    resolved_annual_expenses: np.ndarray
+    start_month: np.ndarray
+    incomes: np.ndarray
+    expenses: np.ndarray
+    annuities: np.ndarray
+    principals: np.ndarray
+    loan_interests: np.ndarray
+    remaining_balances: np.ndarray
+    depreciations: np.ndarray
+    acquisition_fees_deductible: np.ndarray
+    cashflow: np.ndarray
+    npv_value: np.ndarray
+    irr_value: np.ndarray
+    wealth_growth: np.ndarray
+    taxation: BatchTaxation | None
+
+    def __len__(self) -> int:
+        return len(self.total_cost)
+
+    @property
+    def first_year_cashflow(self) -> np.ndarray:
+        """Cashflow annuel de la première année pleine (€), ``(n,)``.
+
+        Même convention que la page Résumé : l'année 2 si l'activité
+        démarre en cours d'année, sinon l'année 1.
+        """
+        year_idx = np.where(self.start_month > 1, 1, 0)
+        return self.cashflow[np.arange(len(self)), year_idx]
+
+
+@dataclass(frozen=True)
+class BatchYear:
+    """Une année de simulation pour les scénarios encore suivis d'un lot.
+
+    Tous les tableaux sont ``(m,)``, alignés sur ``scenarios``.
+
+    Attributes:
+        year: Année (1-indexée).
+        scenarios: Position des scénarios suivis dans le lot.
+        income: Revenus locatifs (€).
+        expenses: Charges (€).
+        annuity: Annuité d'emprunt, assurance décès incluse (€).
+        principal: Part capital remboursée (€).
+        interest: Intérêts d'emprunt (€).
+        remaining_balance: Capital restant dû en fin d'année (€).
+        depreciation: Dotation aux amortissements (€).
+        cashflow: Cashflow de l'année (€).
+        cumulative_cashflow: Cashflow cumulé depuis l'année 1 (€).
+        cumulative_wealth: Enrichissement cumulé depuis l'année 1 (€).
+        taxation: Colonnes fiscales de l'année (``(m,)`` chacune), ou
+            ``None`` si non demandées.
+    """
+
+    year: int
+    scenarios: np.ndarray
+    income: np.ndarray
+    expenses: np.ndarray
+    annuity: np.ndarray
+    principal: np.ndarray
+    interest: np.ndarray
+    remaining_balance: np.ndarray
+    depreciation: np.ndarray
+    cashflow: np.ndarray
+    cumulative_cashflow: np.ndarray
+    cumulative_wealth: np.ndarray
+    taxation: BatchTaxation | None
+
+    def __len__(self) -> int:
+        return len(self.scenarios)
+
+
+class BatchSimulation:
+    """Orchestrateur vectorisé d'un lot de simulations LMNP."""
+
+    def __init__(
+        self,
+        duration_years: int = SIMULATION_DURATION_YEARS,
+        discount_rate: float = DEFAULT_DISCOUNT_RATE,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        """Initialise le moteur.
+
+        Args:
+            duration_years: Horizon de projection global (années).
+            discount_rate: Taux d'actualisation pour le calcul de VAN (décimal).
+            chunk_size: Nombre de scénarios traités par passe, pour borner
+                la mémoire des tableaux intermédiaires.
+        """
+        self._duration = duration_years
+        self._discount_rate = discount_rate
+        self._chunk_size = chunk_size
+
+    def run(
+        self,
+        params: Sequence[SimulationParams] | ParamsBatch,
+        with_taxation: bool = True,
+    ) -> BatchResult:
+        """Exécute la simulation de tous les scénarios du lot.
+
+        Args:
+            params: Scénarios à évaluer, en objets ou déjà en colonnes.
+            with_taxation: Calcule le tableau fiscal. Les indicateurs VAN,
+                TRI et cashflow étant avant impôts, le désactiver accélère
+                les balayages qui ne s'intéressent qu'à eux.
+
+        Returns:
+            Résultats du lot, dans l'ordre des scénarios.
+
+        Raises:
+            ValueError: Si le lot est vide.
+        """
+        if not len(params):
+            raise ValueError("Le lot de scénarios est vide.")
+        with instrumentation.stage("batch.run"):
+            if not isinstance(params, ParamsBatch):
+                params = ParamsBatch.from_params(params)
+            chunks = [
+                self._run_chunk(
+                    _columns(params.slice(i, i + self._chunk_size)), with_taxation
+                )
+                for i in range(0, len(params), self._chunk_size)
+            ]
+        return _concatenate(chunks)
+
+    def iter_years(
+        self,
+        params: Sequence[SimulationParams] | ParamsBatch,
+        until: Callable[[BatchYear], np.ndarray] | None = None,
+        with_taxation: bool = True,
+    ) -> Iterator[BatchYear]:
+        """Produit la simulation du lot année par année.
+
+        Mêmes règles que :meth:`run`, sans les indicateurs de revente :
+        emprunt, loyers et amortissements sont évalués pour la seule année
+        produite, et l'état fiscal (stocks reportés) avance d'une année à
+        chaque pas. Les scénarios pour lesquels ``until`` retourne vrai ne
+        sont plus calculés les années suivantes ; la génération s'arrête
+        quand il n'en reste aucun ou à l'horizon de projection.
+
+        Le lot est traité en une passe : découper les très grands lots
+        avec :meth:`ParamsBatch.slice`.
+
+        Args:
+            params: Scénarios à évaluer, en objets ou déjà en colonnes.
+            until: Critère d'arrêt évalué sur chaque année produite, masque
+                booléen ``(m,)`` des scénarios terminés.
+            with_taxation: Calcule les colonnes fiscales de chaque année.
+
+        Yields:
+            Année de chaque pas, restreinte aux scénarios encore suivis.
+
+        Raises:
+            ValueError: Si le lot est vide.
+        """
+        if not len(params):
+            raise ValueError("Le lot de scénarios est vide.")
+        if not isinstance(params, ParamsBatch):
+            params = ParamsBatch.from_params(params)
+        cols = _columns(params)
+        scenarios = np.arange(len(params))
+        start_month = cols["start_month"].astype(np.int64)
+        loan_rate, total_cost, acquisition_fees = _acquisition(cols)
+        amount = total_cost - cols["down_payment"]
+        n_months = (cols["loan_duration"] * 12).astype(np.int64)
+        payment = _monthly_payment(amount, loan_rate, n_months)
+        amortise_fees = cols["amortise_fees"]
+        state = {
+            "start_month": start_month,
+            "loan_rate": loan_rate,
+            "amount": amount,
+            "n_months": n_months,
+            "payment": payment,
+            "monthly_rent": cols["monthly_rent"],
+            "rent_increase_rate": cols["rent_increase_rate"],
+            "expenses": _resolve_annual_expenses(cols),
+            "death_annual": cols["death_insurance_monthly"] * 12,
+            "fees_deductible": np.where(amortise_fees, 0.0, acquisition_fees),
+            "carry_depreciation": np.zeros(len(params)),
+            "cumulative_cashflow": np.zeros(len(params)),
+            "cumulative_wealth": np.zeros(len(params)),
+        }
+        components = _depreciation_components(
+            cols["property_price"],
+            cols["furniture_cost"],
+            np.where(amortise_fees, acquisition_fees, 0.0),
+        )
+        deficit_stock = np.zeros((len(params), self._duration))
+
+        for i in range(self._duration):
+            year = np.array([i + 1])
+            proration = (13 - state["start_month"]) / 12
+            growth = (1 + state["rent_increase_rate"][:, None] / 100) ** (year - 1)
+            year_proration = np.where(year == 1, proration[:, None], 1.0)
+            income = _round_cents(
+                state["monthly_rent"][:, None] * 12 * growth * year_proration
+            )[:, 0]
+            expenses = _round_cents(state["expenses"][:, None] * year_proration)[:, 0]
+
+            # Bornes de l'année : mois écoulés au début et à la fin.
+            first_year_months = 13 - state["start_month"]
+            end = np.minimum(first_year_months + 12 * i, state["n_months"])
+            start = (
+                np.minimum(first_year_months + 12 * (i - 1), state["n_months"])
+                if i
+                else np.zeros_like(end)
+            )
+            active = start < state["n_months"]
+            balances = _balance_after(
+                state["amount"],
+                state["loan_rate"],
+                state["payment"],
+                np.column_stack([start, end]),
+            )
+            principal = np.where(active, balances[:, 0] - balances[:, 1], 0.0)
+            payments = state["payment"] * (end - start)
+            interest = np.where(active, payments - principal, 0.0)
+            remaining_balance = np.where(active, balances[:, 1], 0.0)
+            depreciation = _depreciation_total(
+                components, state["start_month"].astype(np.float64), year
+            )[:, 0]
+
+            taxation = None
+            if with_taxation:
+                step = _taxation_step(
+                    i,
+                    deficit_stock,
+                    state["carry_depreciation"],
+                    income,
+                    expenses,
+                    interest,
+                    depreciation,
+                    state["fees_deductible"],
+                )
+                state["carry_depreciation"] = step["carry_forward_depreciation"]
+                taxation = BatchTaxation(
+                    income=income,
+                    depreciation=depreciation,
+                    taxable_bic=_round_cents(income * BIC_RATE),
+                    **{name: _round_cents(values) for name, values in step.items()},
+                )
+
+            death = np.where(
+                active,
+                state["death_annual"] * proration if i == 0 else state["death_annual"],
+                0.0,
+            )
+            annuity = payments + death
+            cashflow = income - expenses - annuity
+            state["cumulative_cashflow"] = state["cumulative_cashflow"] + cashflow
+            state["cumulative_wealth"] = state["cumulative_wealth"] + (
+                principal + cashflow
+            )
+            current = BatchYear(
+                year=i + 1,
+                scenarios=scenarios,
+                income=income,
+                expenses=expenses,
+                annuity=annuity,
+                principal=principal,
+                interest=interest,
+                remaining_balance=remaining_balance,
+                depreciation=depreciation,
+                cashflow=cashflow,
+                cumulative_cashflow=state["cumulative_cashflow"],
+                cumulative_wealth=state["cumulative_wealth"],
+                taxation=taxation,
+            )
+            yield current
+
+            if until is not None:
+                done = np.asarray(until(current), dtype=bool)
+                if done.any():
+                    keep = ~done
+                    scenarios = scenarios[keep]
+                    if not len(scenarios):
+                        return
+                    state = {name: values[keep] for name, values in state.items()}
+                    components = [(a[keep], d) for a, d in components]
+                    deficit_stock = deficit_stock[keep]
+
+    def first_year(
+        self,
+        params: Sequence[SimulationParams] | ParamsBatch,
+        condition: Callable[[BatchYear], np.ndarray],
+        with_taxation: bool = True,
+    ) -> np.ndarray:
+        """Première année où chaque scénario vérifie ``condition``.
+
+        Exemple : ``first_year(params, lambda y: y.cumulative_cashflow > 0)``.
+        Les scénarios sont retirés du calcul dès que le critère est atteint.
+
+        Args:
+            params: Scénarios à évaluer.
+            condition: Critère vectorisé, masque booléen ``(m,)``.
+            with_taxation: Calcule les colonnes fiscales (inutile si le
+                critère ne les lit pas).
+
+        Returns:
+            Année atteinte par scénario (``int64``, 0 si jamais atteinte sur
+            l'horizon de projection), ``(n,)``.
+        """
+        reached = np.zeros(len(params), dtype=np.int64)
+
+        def until(year: BatchYear) -> np.ndarray:
+            done = np.asarray(condition(year), dtype=bool)
+            reached[year.scenarios[done]] = year.year
+            return done
+
+        for _ in self.iter_years(params, until, with_taxation):
+            pass
+        return reached
+
+    def _run_chunk(
+        self, cols: dict[str, np.ndarray], with_taxation: bool
+    ) -> BatchResult:
+        """Évalue un paquet de scénarios déjà mis en colonnes."""
+        years = np.arange(1, self._duration + 1)
+        start_month = cols["start_month"].astype(np.int64)
+        proration = (13 - start_month) / 12
+
+        with instrumentation.stage("batch.fees"):
+            loan_rate, total_cost, acquisition_fees = _acquisition(cols)
+            loan_amount = total_cost - cols["down_payment"]
+            resolved_expenses = _resolve_annual_expenses(cols)
+
+        with instrumentation.stage("batch.loan"):
+            loan = _dedup_stage(
+                self._loan_stage,
+                loan_amount,
+                loan_rate,
+                cols["loan_duration"],
+                start_month.astype(np.float64),
+                cols["resale_horizon"],
+            )
+            monthly_payment, payments, interests, principals, balances, active, horizon_balance = loan
+
+        with instrumentation.stage("batch.rental"):
+            growth = (1 + cols["rent_increase_rate"][:, None] / 100) ** (years - 1)
+            year_proration = np.where(years == 1, proration[:, None], 1.0)
+            incomes = _round_cents(
+                cols["monthly_rent"][:, None] * 12 * growth * year_proration
+            )
+            expenses = _round_cents(resolved_expenses[:, None] * year_proration)
+
+        amortise_fees = cols["amortise_fees"]
+        with instrumentation.stage("batch.depreciation"):
+            (depreciations,) = _dedup_stage(
+                self._depreciation_stage,
+                cols["property_price"],
+                cols["furniture_cost"],
+                np.where(amortise_fees, acquisition_fees, 0.0),
+                start_month.astype(np.float64),
+            )
+
+        fees_deductible = np.where(amortise_fees, 0.0, acquisition_fees)
+        taxation = None
+        if with_taxation:
+            with instrumentation.stage("batch.taxation"):
+                taxation = _compute_taxation(
+                    incomes, expenses, interests, depreciations, fees_deductible
+                )
+
+        with instrumentation.stage("batch.cashflow"):
+            death_annual = cols["death_insurance_monthly"] * 12
+            death = np.where(
+                active,
+                np.where(years == 1, (death_annual * proration)[:, None],
+                         death_annual[:, None]),
+                0.0,
+            )
+            annuities = payments + death
+            cashflow = incomes - expenses - annuities
+
+        with instrumentation.stage("batch.npv_irr"):
+            horizon = cols["resale_horizon"].astype(np.int64)
+            resale_value = _resale_value(cols, horizon)
+            flows, mask = _discounted_flows(
+                cashflow,
+                cols["down_payment"],
+                resale_value - horizon_balance,
+                horizon,
+            )
+            discount = (1 + self._discount_rate) ** -np.arange(flows.shape[1])
+            npv_value = flows @ discount
+            irr_value = _vectorized_irr(flows, mask) * 100
+
+        return BatchResult(
+            total_cost=total_cost,
+            loan_amount=loan_amount,
+            monthly_payment=monthly_payment,
+            effective_loan_rate=loan_rate * 100,
+            resolved_annual_expenses=resolved_expenses,
+            start_month=start_month,
+            incomes=incomes,
+            expenses=expenses,
+            annuities=annuities,
+            principals=principals,
+            loan_interests=interests,
+            remaining_balances=balances,
+            depreciations=depreciations,
+            acquisition_fees_deductible=fees_deductible,
+            cashflow=cashflow,
+            npv_value=npv_value,
+            irr_value=irr_value,
+            wealth_growth=flows.sum(axis=1),
+            taxation=taxation,
+        )
+
+    def _loan_stage(
+        self,
+        amount: np.ndarray,
+        annual_rate: np.ndarray,
+        duration_years: np.ndarray,
+        start_month: np.ndarray,
+        resale_horizon: np.ndarray,
+    ) -> tuple[np.ndarray, ...]:
+        """Agrégats annuels de l'emprunt, en forme fermée.
+
+        Le capital restant dû après ``k`` mensualités vaut
+        ``A(1+r)^k − P((1+r)^k − 1)/r``. Les intérêts d'une année sont les
+        mensualités payées moins le capital amorti entre ses deux bornes.
+
+        Returns:
+            Tuple (mensualité, annuités, intérêts, capital, capital restant
+            dû, masque des années de prêt, capital restant dû à l'horizon).
+        """
+        years = np.arange(1, self._duration + 1)
+        n_months = (duration_years * 12).astype(np.int64)
+        first_year_months = 13 - start_month.astype(np.int64)
+        payment = _monthly_payment(amount, annual_rate, n_months)
+
+        def balance_after(months: np.ndarray) -> np.ndarray:
+            return _balance_after(amount, annual_rate, payment, months)
+
+        # Bornes des années : mois écoulés en fin d'année y, plafonnés à la durée.
+        ends = np.minimum(
+            first_year_months[:, None] + 12 * (years - 1), n_months[:, None]
+        )
+        starts = np.concatenate(
+            [np.zeros((len(amount), 1), dtype=np.int64), ends[:, :-1]], axis=1
+        )
+        active = starts < n_months[:, None]
+        boundary = balance_after(np.concatenate([starts[:, :1], ends], axis=1))
+        boundary = np.where(
+            np.concatenate([np.ones_like(active[:, :1]), active], axis=1),
+            boundary,
+            0.0,
+        )
+        principals = np.where(active, boundary[:, :-1] - boundary[:, 1:], 0.0)
+        payments = payment[:, None] * (ends - starts)
+        interests = np.where(active, payments - principals, 0.0)
+        balances = np.where(active, boundary[:, 1:], 0.0)
+
+        # Capital restant dû au terme de l'année de revente (ou du prêt).
+        loan_years = active.sum(axis=1)
+        horizon_year = np.minimum(resale_horizon.astype(np.int64), loan_years)
+        horizon_months = np.minimum(
+            first_year_months + 12 * (horizon_year - 1), n_months
+        )
+        horizon_balance = balance_after(horizon_months)
+        return payment, payments, interests, principals, balances, active, horizon_balance
+
+    def _depreciation_stage(
+        self,
+        property_value: np.ndarray,
+        furniture_cost: np.ndarray,
+        acquisition_fees: np.ndarray,
+        start_month: np.ndarray,
+    ) -> tuple[np.ndarray]:
+        """Plan d'amortissement annuel, même règles que ``Depreciation``."""
+        components = _depreciation_components(
+            property_value, furniture_cost, acquisition_fees
+        )
+        years = np.arange(1, self._duration + 1)
+        return (_depreciation_total(components, start_month, years),)
+
+
+def _columns(params: ParamsBatch) -> dict[str, np.ndarray]:
+    """Met un paquet de paramètres en colonnes ``float64`` de pleine taille."""
+    cols = {
+        name: params.column(name).astype(np.float64) for name in _NUMERIC_FIELDS
+    }
+    for amount, period in _EXPENSE_FIELDS:
+        cols[period] = params.lookup(period, PERIOD_MULTIPLIERS, 1)
+    cols["amortise_fees"] = params.lookup(
+        "acquisition_fees_treatment", {"amortissement": 1}, 0
+    ).astype(bool)
+    return cols
+
+
+def _round_cents(values: np.ndarray) -> np.ndarray:
+    """Arrondi au centime identique à ``round(x, 2)`` de Python.
+
+    ``np.round`` arrondit ``x × 100`` calculé en flottant : lorsque ce
+    produit tombe exactement sur un demi-centime, le sens de l'arrondi
+    dépend de l'erreur du produit, que Python prend en compte. Cette
+    erreur est obtenue exactement par le produit sans erreur de Dekker.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    scaled = values * 100
+    rounded = np.rint(scaled)
+    half = scaled - np.floor(scaled) == 0.5
+    if half.any():
+        v, p = values[half], scaled[half]
+        split = v * 134_217_729.0  # 2**27 + 1
+        high = split - (split - v)
+        low = v - high
+        error = (high * 100 - p) + low * 100
+        rounded[half] = np.where(
+            error > 0, np.ceil(p), np.where(error < 0, np.floor(p), rounded[half])
+        )
+    return rounded / 100
+
+
+def _resolve_fee_amount(
+    fee_input: np.ndarray, property_price: np.ndarray
+) -> np.ndarray:
+    """Version vectorisée de ``LMNPSimulation._resolve_fee_amount``."""
+    return np.where(
+        fee_input < FEE_AMOUNT_THRESHOLD, property_price * fee_input / 100, fee_input
+    )
+
+
+def _acquisition(
+    cols: dict[str, np.ndarray],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Taux effectif (décimal), coût total et frais d'acquisition (€)."""
+    agency_fee = _resolve_fee_amount(cols["agency_fee_rate"], cols["property_price"])
+    notary_fee = _resolve_fee_amount(cols["notary_fee_rate"], cols["property_price"])
+    loan_rate = np.where(
+        cols["loan_nominal_rate"] > 0,
+        (cols["loan_nominal_rate"] + cols["loan_insurance_rate"]) / 100,
+        cols["loan_rate"] / 100,
+    )
+    total_cost = (
+        cols["property_price"] + agency_fee + notary_fee
+        + cols["renovation_cost"] + cols["furniture_cost"]
+        + cols["broker_fee"] + cols["guarantee_fee"] + cols["dossier_fee"]
+    )
+    return loan_rate, total_cost, agency_fee + notary_fee + cols["broker_fee"]
+
+
+def _monthly_payment(
+    amount: np.ndarray, annual_rate: np.ndarray, n_months: np.ndarray
+) -> np.ndarray:
+    """Mensualité constante, même formule que ``Loan.monthly_payment``."""
+    monthly_rate = annual_rate / 12
+    has_rate = monthly_rate > 0
+    safe_rate = np.where(has_rate, monthly_rate, 1.0)
+    return np.where(
+        has_rate,
+        amount * safe_rate / (1 - (1 + safe_rate) ** -n_months),
+        amount / n_months,
+    )
+
+
+def _balance_after(
+    amount: np.ndarray,
+    annual_rate: np.ndarray,
+    payment: np.ndarray,
+    months: np.ndarray,
+) -> np.ndarray:
+    """Capital restant dû après ``months`` mensualités, en forme fermée.
+
+    ``months`` a pour première dimension le scénario ; ses dimensions
+    suivantes (années) sont diffusées.
+    """
+    reshape = (-1,) + (1,) * (months.ndim - 1)
+    monthly_rate = annual_rate / 12
+    has_rate = (monthly_rate > 0).reshape(reshape)
+    rate = np.where(has_rate, monthly_rate.reshape(reshape), 1.0)
+    amount = amount.reshape(reshape)
+    payment = payment.reshape(reshape)
+    growth = (1 + rate) ** months
+    closed = amount * growth - payment * (growth - 1) / rate
+    return np.where(has_rate, closed, amount - payment * months)
+
+
+def _depreciation_components(
+    property_value: np.ndarray,
+    furniture_cost: np.ndarray,
+    acquisition_fees: np.ndarray,
+) -> list[tuple[np.ndarray, int]]:
+    """Dotation annuelle et durée de chaque composant amortissable."""
+    fiscal_base = property_value + acquisition_fees
+    components = [
+        (_round_cents(fiscal_base * share / duration), duration)
+        for _, share, duration in PROPERTY_COMPONENTS
+        if duration > 0
+    ]
+    components.append(
+        (_round_cents(furniture_cost / FURNITURE_DURATION), FURNITURE_DURATION)
+    )
+    return components
+
+
+def _depreciation_total(
+    components: list[tuple[np.ndarray, int]],
+    start_month: np.ndarray,
+    years: np.ndarray,
+) -> np.ndarray:
+    """Amortissement des années ``years``, même règles que ``Depreciation``.
+
+    Returns:
+        Dotations arrondies au centime, ``(n, len(years))``.
+    """
+    proration = ((13 - start_month) / 12)[:, None]
+    tail = ((start_month - 1) / 12)[:, None]
+    starts_late = (start_month > 1)[:, None]
+    total = np.zeros((len(start_month), len(years)))
+    for annual, duration in components:
+        annual = annual[:, None]
+        total += np.where(
+            years == 1,
+            annual * proration,
+            np.where(
+                years <= duration,
+                annual,
+                np.where((years == duration + 1) & starts_late, annual * tail, 0.0),
+            ),
+        )
+    return _round_cents(total)
+
+
+def _resolve_annual_expenses(cols: dict[str, np.ndarray]) -> np.ndarray:
+    """Version vectorisée de ``LMNPSimulation._resolve_annual_expenses``."""
+    detailed = sum(cols[amount] * cols[period] for amount, period in _EXPENSE_FIELDS)
+    return np.where(detailed > 0, detailed, cols["annual_expenses"])
+
+
+def _resale_value(cols: dict[str, np.ndarray], horizon: np.ndarray) -> np.ndarray:
+    """Version vectorisée de ``LMNPSimulation._compute_resale_value``."""
+    net_price = cols["property_price"] + cols["renovation_cost"] + cols["furniture_cost"]
+    inflated = np.round(net_price * (1 + cols["resale"] / 100) ** horizon)
+    return np.where(cols["resale"] < RESALE_VALUE_THRESHOLD, inflated, cols["resale"])
+
+
+def _dedup_stage(stage, *inputs: np.ndarray) -> tuple[np.ndarray, ...]:
+    """Évalue ``stage`` sur les seules lignes distinctes de ``inputs``.
+
+    Dans un balayage, la plupart des scénarios partagent les entrées d'une
+    étape (ex: la perturbation du loyer ne change pas l'emprunt) : l'étape
+    est calculée une fois par combinaison distincte puis rediffusée.
+
+    Args:
+        stage: Fonction vectorisée prenant ``inputs`` et retournant un tuple
+            de tableaux dont la première dimension est le scénario.
+        *inputs: Colonnes d'entrée de l'étape, ``(n,)`` chacune.
+
+    Returns:
+        Sorties de l'étape pour les ``n`` scénarios.
+    """
+    stacked = np.column_stack(inputs)
+    unique, first, inverse = np.unique(
+        stacked, axis=0, return_index=True, return_inverse=True
+    )
+    if len(unique) == len(stacked):
+        return stage(*inputs)
+    outputs = stage(*(column[first] for column in inputs))
+    inverse = inverse.reshape(-1)
+    return tuple(output[inverse] for output in outputs)
+
+
+def _compute_taxation(
+    incomes: np.ndarray,
+    expenses: np.ndarray,
+    loan_interests: np.ndarray,
+    depreciations: np.ndarray,
+    acquisition_fees_deductible: np.ndarray,
+) -> BatchTaxation:
+    """Version vectorisée de ``Taxation.compute`` (mêmes 4 étapes).
+
+    Le stock de déficits est une matrice ``(n, années)`` indexée par année
+    d'origine, mise à jour année après année par :func:`_taxation_step`.
+    """
+    n, duration = incomes.shape
+    deficit_stock = np.zeros((n, duration))
+    carry_depreciation = np.zeros(n)
+    out = {
+        name: np.zeros((n, duration))
+        for name in (
+            "current_expenses", "result_before_amort", "depreciation_used",
+            "carry_depreciation_used", "carry_forward_depreciation",
+            "deficit_added", "deficit_used", "carry_forward_deficit",
+            "fiscal_result",
+        )
+    }
+    for i in range(duration):
+        step = _taxation_step(
+            i,
+            deficit_stock,
+            carry_depreciation,
+            incomes[:, i],
+            expenses[:, i],
+            loan_interests[:, i],
+            depreciations[:, i],
+            acquisition_fees_deductible,
+        )
+        carry_depreciation = step["carry_forward_depreciation"]
+        for name, values in step.items():
+            out[name][:, i] = values
+
+    rounded = {name: _round_cents(values) for name, values in out.items()}
+    return BatchTaxation(
+        income=_round_cents(incomes),
+        depreciation=_round_cents(depreciations),
+        taxable_bic=_round_cents(incomes * BIC_RATE),
+        **rounded,
+    )
+
+
+def _taxation_step(
+    i: int,
+    deficit_stock: np.ndarray,
+    carry_depreciation: np.ndarray,
+    income: np.ndarray,
+    expense: np.ndarray,
+    loan_interest: np.ndarray,
+    depreciation: np.ndarray,
+    acquisition_fees_deductible: np.ndarray,
+) -> dict[str, np.ndarray]:
+    """Année ``i`` (0-indexée) du tableau fiscal, pour tous les scénarios.
+
+    L'expiration annule une colonne de ``deficit_stock`` (modifié en
+    place), l'imputation FIFO consomme les colonnes dans l'ordre via une
+    somme cumulée.
+
+    Returns:
+        Colonnes fiscales de l'année, non arrondies ; le stock
+        d'amortissements reporté est ``carry_forward_depreciation``.
+    """
+    expired = i - DEFICIT_CARRY_LIMIT - 1
+    if expired >= 0:
+        deficit_stock[:, expired] = 0.0
+
+    current_exp = expense + loan_interest
+    if i == 0:
+        current_exp = current_exp + acquisition_fees_deductible
+    result = income - current_exp
+    deficit = result < 0
+
+    deficit_added = np.where(deficit, -result, 0.0)
+    deficit_stock[:, i] = deficit_added
+    remaining = np.maximum(result, 0.0)
+
+    depreciation_used = np.where(deficit, 0.0, np.minimum(remaining, depreciation))
+    remaining -= depreciation_used
+    carry_depreciation = carry_depreciation + (depreciation - depreciation_used)
+
+    carry_used = np.where(deficit, 0.0, np.minimum(remaining, carry_depreciation))
+    remaining -= carry_used
+    carry_depreciation -= carry_used
+
+    # FIFO : la colonne j absorbe ce qui reste après les colonnes < j.
+    # Seules les DEFICIT_CARRY_LIMIT dernières origines sont non expirées.
+    window = deficit_stock[:, max(0, i - DEFICIT_CARRY_LIMIT) : i]
+    before = np.cumsum(window, axis=1) - window
+    used = np.clip(remaining[:, None] - before, 0.0, window)
+    window -= used
+    deficit_used = used.sum(axis=1)
+    remaining -= deficit_used
+
+    return {
+        "current_expenses": current_exp,
+        "result_before_amort": result,
+        "depreciation_used": depreciation_used,
+        "carry_depreciation_used": carry_used,
+        "carry_forward_depreciation": carry_depreciation,
+        "deficit_added": deficit_added,
+        "deficit_used": deficit_used,
+        "carry_forward_deficit": deficit_stock.sum(axis=1),
+        "fiscal_result": np.maximum(remaining, 0.0),
+    }
+
+
+def _discounted_flows(
+    cashflow: np.ndarray,
+    down_payment: np.ndarray,
+    terminal: np.ndarray,
+    horizon: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Série VAN/TRI par scénario, alignée à gauche et complétée de zéros.
+
+    Comme ``LMNPSimulation._build_discounted_flows``, un horizon au-delà de
+    la projection est tronqué à celle-ci : le solde de revente est alors
+    porté par la dernière année projetée.
+
+    Returns:
+        Tuple (flux ``(n, min(horizon max, années))``, masque des années
+        valides).
+    """
+    last = np.minimum(horizon, cashflow.shape[1])
+    width = int(last.max())
+    columns = np.arange(width)
+    mask = columns < last[:, None]
+    flows = np.where(mask, cashflow[:, :width], 0.0)
+    rows = np.arange(len(flows))
+    flows[:, 0] -= down_payment
+    flows[rows, last - 1] += terminal
+    return flows, mask
+
+
+def _vectorized_irr(flows: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    """TRI de chaque ligne de ``flows`` (décimal).
+
+    Newton sur ``x = 1/(1+r)`` depuis ``x = 1`` (taux nul), ce qui converge
+    vers la racine la plus proche de zéro, celle que retient
+    ``numpy_financial.irr``. Les lignes non convergées sont recalculées
+    une à une par ``numpy_financial.irr``.
+    """
+    powers = np.arange(flows.shape[1])
+    x = np.ones(len(flows))
+    converged = np.zeros(len(flows), dtype=bool)
+    with np.errstate(all="ignore"):
+        for _ in range(IRR_MAX_ITERATIONS):
+            xp = x[:, None] ** powers
+            value = (flows * xp).sum(axis=1)
+            slope = (flows[:, 1:] * powers[1:] * xp[:, :-1]).sum(axis=1)
+            step = value / slope
+            x = x - step
+            converged = np.abs(step) < IRR_TOLERANCE * np.maximum(1.0, np.abs(x))
+            if converged.all():
+                break
+        rate = 1 / x - 1
+    retry = ~(converged & np.isfinite(rate) & (x > 0))
+    for row in np.flatnonzero(retry):
+        rate[row] = irr(flows[row, mask[row]])
+    return rate
+
+
+def _concatenate(chunks: list[BatchResult]) -> BatchResult:
+    """Concatène les résultats de plusieurs paquets."""
+    if len(chunks) == 1:
+        return chunks[0]
+
+    def join(values: list):
+        if values[0] is None:
+            return None
+        if isinstance(values[0], BatchTaxation):
+            return BatchTaxation(
+                **{
+                    name: np.concatenate([getattr(v, name) for v in values])
+                    for name in BatchTaxation.__dataclass_fields__
+                }
+            )
+        return np.concatenate(values)
+
+    return BatchResult(
+        **{
+            name: join([getattr(c, name) for c in chunks])
+            for name in BatchResult.__dataclass_fields__
+        }
+    )
@@ -0,0 +1,255 @@
+"""Optimisation du plan de financement : offre de prêt, durée et apport.
+
+Pour un bien donné, recherche la combinaison (offre de prêt, apport) qui
+maximise le TRI sous deux contraintes : cashflow de première année pleine
+au moins égal à un plancher, et apport plafonné.
+
+Les candidats sont évalués par lots avec
+:class:`~application.batch.BatchSimulation`, en élaguant tôt :
+
+* les offres dominées (même durée, taux et frais au moins aussi élevés
+  qu'une autre) sont écartées sans évaluation ;
+* la mensualité étant proportionnelle au capital emprunté, le cashflow
+  est affine en l'apport : deux évaluations par offre donnent l'apport
+  minimal respectant le plancher. Les apports inférieurs ne sont jamais
+  évalués, et une offre dont l'apport minimal dépasse le plafond est
+  écartée ;
+* une grille d'apports par offre restante, puis une grille resserrée
+  autour du meilleur point.
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+from application.batch import BatchSimulation
+from application.params import SimulationParams
+from application.params_batch import ParamsBatch
+
+
+DEFAULT_DURATIONS = (5, 10, 15, 20, 25)
+GRID_POINTS = 41
+REFINE_POINTS = 21
+# Sans mise de fonds, le TRI n'est pas défini.
+MIN_DOWN_PAYMENT = 1.0
+BINDING_CASHFLOW = "cashflow"
+BINDING_CONTRIBUTION = "apport"
+
+
+@dataclass(frozen=True)
+class LoanOffer:
+    """Offre de prêt proposée pour le bien.
+
+    Attributes:
+        duration: Durée (années).
+        rate: Taux effectif annuel, assurance incluse (%).
+        dossier_fee: Frais de dossier (€).
+        guarantee_fee: Frais de garantie (€).
+        label: Libellé (banque, courtier…).
+    """
+
+    duration: int
+    rate: float
+    dossier_fee: float = 0.0
+    guarantee_fee: float = 0.0
+    label: str = ""
+
+    def dominates(self, other: "LoanOffer") -> bool:
+        """Vrai si l'offre est au moins aussi avantageuse que ``other``.
+
+        Seules des offres de même durée sont comparables ; à égalité
+        stricte, aucune ne domine l'autre.
+        """
+        own = (self.rate, self.dossier_fee + self.guarantee_fee)
+        theirs = (other.rate, other.dossier_fee + other.guarantee_fee)
+        return (
+            self.duration == other.duration
+            and own != theirs
+            and all(a <= b for a, b in zip(own, theirs))
+        )
+
+
+@dataclass(frozen=True)
+class FinancingPlan:
+    """Meilleur plan de financement trouvé.
+
+    Attributes:
+        params: Scénario optimal (offre et apport appliqués, taux saisi en
+            TAEG).
+        offer: Offre retenue.
+        irr: TRI (%).
+        npv: VAN (€).
+        first_year_cashflow: Cashflow de première année pleine (€).
+        binding: Contraintes saturées à l'optimum (``BINDING_CASHFLOW``,
+            ``BINDING_CONTRIBUTION``).
+        evaluated: Nombre de scénarios évalués.
+        pruned_offers: Nombre d'offres écartées sans grille (dominées ou
+            irréalisables).
+    """
+
+    params: SimulationParams
+    offer: LoanOffer
+    irr: float
+    npv: float
+    first_year_cashflow: float
+    binding: tuple[str, ...]
+    evaluated: int
+    pruned_offers: int
+
+
+def default_offers(
+    params: SimulationParams, durations: Sequence[int] = DEFAULT_DURATIONS
+) -> list[LoanOffer]:
+    """Offres aux conditions du scénario, une par durée.
+
+    Args:
+        params: Scénario (taux effectif et frais repris).
+        durations: Durées proposées (années).
+
+    Returns:
+        Offres, dans l'ordre des durées.
+    """
+    if params.loan_nominal_rate > 0:
+        rate = params.loan_nominal_rate + params.loan_insurance_rate
+    else:
+        rate = params.loan_rate
+    return [
+        LoanOffer(
+            duration=duration,
+            rate=rate,
+            dossier_fee=params.dossier_fee,
+            guarantee_fee=params.guarantee_fee,
+        )
+        for duration in durations
+    ]
+
+
+def optimize_financing(
+    params: SimulationParams,
+    max_contribution: float,
+    min_cashflow: float = 0.0,
+    offers: Sequence[LoanOffer] | None = None,
+    engine: BatchSimulation | None = None,
+) -> FinancingPlan | None:
+    """Plan de financement maximisant le TRI sous contraintes.
+
+    Args:
+        params: Scénario du bien (les champs de prêt et l'apport sont
+            remplacés par ceux des candidats).
+        max_contribution: Apport maximal de l'investisseur (€).
+        min_cashflow: Cashflow minimal de première année pleine (€).
+        offers: Offres de prêt (défaut : :func:`default_offers`).
+        engine: Moteur vectorisé à utiliser.
+
+    Returns:
+        Meilleur plan, ou ``None`` si aucune offre ne respecte les
+        contraintes.
+
+    Raises:
+        ValueError: Si aucune offre n'est fournie ou si le plafond d'apport
+            est négatif.
+    """
+    offers = default_offers(params) if offers is None else list(offers)
+    if not offers:
+        raise ValueError("Aucune offre de prêt à évaluer.")
+    if max_contribution < 0:
+        raise ValueError("Le plafond d'apport doit être positif.")
+    engine = engine or BatchSimulation()
+    base = ParamsBatch.from_params([params])
+    kept = [o for o in offers if not any(p.dominates(o) for p in offers)]
+
+    # Cashflow affine en l'apport : deux sondes par offre (apport nul et
+    # plafond) donnent pente et coût total.
+    probe_offers = [o for o in kept for _ in range(2)]
+    probe_down = np.tile([0.0, max(max_contribution, MIN_DOWN_PAYMENT)], len(kept))
+    probes = engine.run(
+        _candidates(base, probe_offers, probe_down), with_taxation=False
+    )
+    evaluated = len(probes)
+    cashflow = probes.first_year_cashflow.reshape(-1, 2)
+    slope = (cashflow[:, 1] - cashflow[:, 0]) / (probe_down[1] - probe_down[0])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        needed = np.where(
+            cashflow[:, 0] >= min_cashflow,
+            0.0,
+            (min_cashflow - cashflow[:, 0]) / slope,
+        )
+    low = np.ceil(np.maximum(np.nan_to_num(needed, nan=np.inf), MIN_DOWN_PAYMENT))
+    high = np.floor(np.minimum(max_contribution, probes.total_cost[::2]))
+    feasible = np.flatnonzero(low <= high)
+    pruned = len(offers) - len(feasible)
+    if not len(feasible):
+        return None
+
+    # Offre (indice dans ``kept``) et apport de chaque candidat.
+    owner = np.concatenate([np.full(GRID_POINTS, i) for i in feasible])
+    down = np.concatenate(
+        [np.round(np.linspace(low[i], high[i], GRID_POINTS)) for i in feasible]
+    )
+    candidates = _candidates(base, [kept[i] for i in owner], down)
+    result = engine.run(candidates, with_taxation=False)
+    evaluated += len(result)
+    best = _best(result.irr_value)
+    if best is None:
+        return None
+
+    # Grille resserrée entre les voisins du meilleur point, même offre.
+    i = int(owner[best])
+    offer = kept[i]
+    same = np.flatnonzero(owner == i)
+    position = int(np.searchsorted(same, best))
+    left = down[same[max(position - 1, 0)]]
+    right = down[same[min(position + 1, len(same) - 1)]]
+    fine = np.unique(np.round(np.linspace(left, right, REFINE_POINTS)))
+    fine_candidates = _candidates(base, [offer] * len(fine), fine)
+    fine_result = engine.run(fine_candidates, with_taxation=False)
+    evaluated += len(fine_result)
+    fine_best = _best(fine_result.irr_value)
+    if fine_best is not None and (
+        fine_result.irr_value[fine_best] > result.irr_value[best]
+    ):
+        candidates, result, best = fine_candidates, fine_result, fine_best
+
+    plan = candidates[best]
+    binding = []
+    if needed[i] > MIN_DOWN_PAYMENT and plan.down_payment <= low[i]:
+        binding.append(BINDING_CASHFLOW)
+    if plan.down_payment >= high[i] and high[i] >= np.floor(max_contribution):
+        binding.append(BINDING_CONTRIBUTION)
+    return FinancingPlan(
+        params=plan,
+        offer=offer,
+        irr=float(result.irr_value[best]),
+        npv=float(result.npv_value[best]),
+        first_year_cashflow=float(result.first_year_cashflow[best]),
+        binding=tuple(binding),
+        evaluated=evaluated,
+        pruned_offers=pruned,
+    )
+
+
+def _candidates(
+    base: ParamsBatch, offers: Sequence[LoanOffer], down_payments: np.ndarray
+) -> ParamsBatch:
+    """Lot du scénario de base décliné par offre et apport (taux en TAEG)."""
+    batch = base.take(np.zeros(len(offers), dtype=np.intp))
+    columns = {
+        "loan_duration": [o.duration for o in offers],
+        "loan_rate": [o.rate for o in offers],
+        "loan_nominal_rate": 0.0,
+        "loan_insurance_rate": 0.0,
+        "dossier_fee": [o.dossier_fee for o in offers],
+        "guarantee_fee": [o.guarantee_fee for o in offers],
+        "down_payment": down_payments,
+    }
+    for name, values in columns.items():
+        batch = batch.with_column(name, values)
+    return batch
+
+
+def _best(irr: np.ndarray) -> int | None:
+    """Indice du TRI maximal, ``None`` si aucun n'est défini."""
+    if not np.isfinite(irr).any():
+        return None
+    return int(np.nanargmax(np.where(np.isfinite(irr), irr, np.nan)))
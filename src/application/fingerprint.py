@@ -0,0 +1,36 @@
+"""Empreinte stable des paramètres de simulation, clé des caches."""
+
+import hashlib
+import json
+
+from application.params import SimulationParams
+from application.simulation import ENGINE_VERSION, LMNPSimulation
+
+
+def params_fingerprint(
+    params: SimulationParams,
+    simulation: LMNPSimulation | None = None,
+    engine_version: str = ENGINE_VERSION,
+) -> str:
+    """Calcule l'empreinte SHA-256 du calcul correspondant à ``params``.
+
+    L'empreinte porte sur la clé canonique
+    (:meth:`LMNPSimulation.computation_key`) et non sur les champs bruts :
+    deux jeux de paramètres de même économie (ville, surface ou détail des
+    charges différents) partagent la même empreinte, donc le même résultat
+    en cache. Elle est indépendante du processus et de la machine, et inclut
+    la version du moteur pour invalider les résultats stockés.
+
+    Args:
+        params: Paramètres de simulation.
+        simulation: Moteur utilisé (défaut : configuration standard).
+        engine_version: Version du moteur de calcul.
+
+    Returns:
+        Empreinte hexadécimale (64 caractères).
+    """
+    key = (simulation or LMNPSimulation()).computation_key(params)
+    document = json.dumps(
+        {"engine": engine_version, "key": key}, separators=(",", ":")
+    )
+    return hashlib.sha256(document.encode("utf-8")).hexdigest()
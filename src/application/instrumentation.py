@@ -0,0 +1,243 @@
+"""Instrumentation optionnelle des étapes de calcul (temps, appels, cache).
+
+Désactivée par défaut : tant que :func:`enable` n'a pas été appelé,
+:func:`stage` retourne un contexte neutre partagé et :func:`record_cache`
+sort immédiatement, si bien que le coût sur le chemin de calcul se limite
+à un test de booléen.
+
+Exemple::
+
+    from application import instrumentation
+
+    instrumentation.enable()
+    with instrumentation.stage("loan.monthly_schedule"):
+        ...
+    for stats in instrumentation.report():
+        print(stats.name, stats.calls, stats.p95_ms)
+"""
+
+import os
+import threading
+import time
+from collections import deque
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import dataclass, field
+
+
+ENV_FLAG = "LMNP_DIAGNOSTICS"
+MAX_SAMPLES_PER_STAGE = 10_000
+
+ENABLED_AT_STARTUP = os.environ.get(ENV_FLAG, "") not in ("", "0")
+
+_NULL_STAGE = nullcontext()
+_lock = threading.Lock()
+_enabled = ENABLED_AT_STARTUP
+_thread_state = threading.local()
+
+
+@dataclass
+class _StageStats:
+    """Accumulateur interne d'une étape instrumentée."""
+
+    calls: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    samples: deque = field(
+        default_factory=lambda: deque(maxlen=MAX_SAMPLES_PER_STAGE)
+    )
+
+
+_stages: dict[str, _StageStats] = {}
+
+
+@dataclass(frozen=True)
+class StageReport:
+    """Statistiques agrégées d'une étape depuis le dernier :func:`reset`.
+
+    Les percentiles portent sur les ``MAX_SAMPLES_PER_STAGE`` dernières
+    mesures ; ``calls`` et ``total_ms`` couvrent toutes les mesures.
+
+    Attributes:
+        name: Nom de l'étape (ex: ``"taxation.compute"``).
+        calls: Nombre d'exécutions chronométrées.
+        total_ms: Temps cumulé (ms).
+        mean_ms: Temps moyen par appel (ms).
+        p50_ms: Médiane (ms).
+        p95_ms: 95e percentile (ms).
+        p99_ms: 99e percentile (ms).
+        max_ms: Pire temps observé (ms).
+        cache_hits: Nombre de résultats servis depuis un cache.
+        cache_misses: Nombre de résultats recalculés faute de cache.
+    """
+
+    name: str
+    calls: int
+    total_ms: float
+    mean_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+    cache_hits: int
+    cache_misses: int
+
+
+class _Stage:
+    """Contexte chronométrant une étape lorsque l'instrumentation est active."""
+
+    __slots__ = ("_name", "_start")
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._start = 0.0
+
+    def __enter__(self) -> "_Stage":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        elapsed = time.perf_counter() - self._start
+        with _lock:
+            stats = _stages.get(self._name)
+            if stats is None:
+                stats = _stages[self._name] = _StageStats()
+            stats.calls += 1
+            stats.total_seconds += elapsed
+            stats.max_seconds = max(stats.max_seconds, elapsed)
+            stats.samples.append(elapsed)
+
+
+class _CacheLookup:
+    """Contexte classant un accès cache en succès ou en échec."""
+
+    __slots__ = ("_name",)
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+
+    def __enter__(self) -> "_CacheLookup":
+        _thread_state.miss = False
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        record_cache(self._name, hit=not getattr(_thread_state, "miss", False))
+
+
+def is_enabled() -> bool:
+    """Indique si l'instrumentation est active dans ce processus."""
+    return _enabled
+
+
+def enable() -> None:
+    """Active l'instrumentation pour tout le processus."""
+    global _enabled
+    _enabled = True
+
+
+def disable() -> None:
+    """Désactive l'instrumentation (les mesures déjà prises sont conservées)."""
+    global _enabled
+    _enabled = False
+
+
+def reset() -> None:
+    """Efface toutes les mesures accumulées."""
+    with _lock:
+        _stages.clear()
+
+
+def stage(name: str) -> AbstractContextManager:
+    """Retourne un contexte chronométrant l'étape ``name``.
+
+    Args:
+        name: Nom de l'étape, en notation pointée ``"composant.opération"``.
+
+    Returns:
+        Contexte de mesure, ou contexte neutre partagé si désactivé.
+    """
+    if not _enabled:
+        return _NULL_STAGE
+    return _Stage(name)
+
+
+def record_cache(name: str, hit: bool) -> None:
+    """Comptabilise un accès au cache pour l'étape ``name``.
+
+    Args:
+        name: Nom de l'étape mise en cache.
+        hit: ``True`` si le résultat a été servi depuis le cache.
+    """
+    if not _enabled:
+        return
+    with _lock:
+        stats = _stages.get(name)
+        if stats is None:
+            stats = _stages[name] = _StageStats()
+        if hit:
+            stats.cache_hits += 1
+        else:
+            stats.cache_misses += 1
+
+
+def cache_lookup(name: str) -> AbstractContextManager:
+    """Encadre l'appel d'une fonction mise en cache (``st.cache_data``…).
+
+    La fonction mise en cache appelle :func:`mark_cache_miss` dans son
+    corps : s'il n'a pas été exécuté dans le bloc, l'accès est compté
+    comme un succès.
+
+    Args:
+        name: Nom de l'étape mise en cache.
+
+    Returns:
+        Contexte de classification, ou contexte neutre si désactivé.
+    """
+    if not _enabled:
+        return _NULL_STAGE
+    return _CacheLookup(name)
+
+
+def mark_cache_miss() -> None:
+    """Signale, depuis le corps d'une fonction en cache, un recalcul."""
+    if _enabled:
+        _thread_state.miss = True
+
+
+def _percentile(sorted_samples: list[float], fraction: float) -> float:
+    """Percentile par rang le plus proche sur un échantillon trié."""
+    if not sorted_samples:
+        return 0.0
+    index = min(len(sorted_samples) - 1, int(fraction * len(sorted_samples)))
+    return sorted_samples[index]
+
+
+def report() -> list[StageReport]:
+    """Agrège les mesures de toutes les étapes.
+
+    Returns:
+        Une ligne par étape, triée par temps cumulé décroissant.
+    """
+    with _lock:
+        snapshot = [
+            (name, s.calls, s.total_seconds, s.max_seconds, s.cache_hits,
+             s.cache_misses, sorted(s.samples))
+            for name, s in _stages.items()
+        ]
+    rows = [
+        StageReport(
+            name=name,
+            calls=calls,
+            total_ms=total * 1000,
+            mean_ms=total / calls * 1000 if calls else 0.0,
+            p50_ms=_percentile(samples, 0.50) * 1000,
+            p95_ms=_percentile(samples, 0.95) * 1000,
+            p99_ms=_percentile(samples, 0.99) * 1000,
+            max_ms=max_seconds * 1000,
+            cache_hits=hits,
+            cache_misses=misses,
+        )
+        for name, calls, total, max_seconds, hits, misses, samples in snapshot
+    ]
+    return sorted(rows, key=lambda r: r.total_ms, reverse=True)
@@ -0,0 +1,350 @@
+"""Exécution en arrière-plan des calculs longs (Monte Carlo, balayages…).
+
+Un calcul lancé dans le script d'une page bloque celle-ci et est
+interrompu à chaque interaction qui relance le script. Le
+:class:`JobManager` du processus exécute ces calculs dans un pool de
+threads borné, hors des sessions :
+
+* une tâche est identifiée par une clé dérivée de l'empreinte des
+  paramètres (:func:`job_key`) : des soumissions identiques, de la même
+  session ou d'une autre, rejoignent la tâche en cours au lieu de la
+  dupliquer. Chaque soumission nomme son abonné (la session) : une
+  session qui soumet deux fois la même tâche ne compte qu'une fois ;
+* la tâche publie son avancement via son :class:`JobContext`, que les
+  pages interrogent périodiquement (:meth:`JobManager.status`) ;
+* l'annulation est coopérative : la tâche consulte
+  :meth:`JobContext.raise_if_cancelled` entre deux paquets de calcul, et
+  ne s'arrête que lorsque toutes les sessions qui l'attendent l'ont
+  annulée. Soumise à nouveau avant de s'être arrêtée, elle est remplacée
+  par une nouvelle tâche ;
+* le résultat d'une tâche terminée est rangé dans le cache de résultats
+  partagé : une nouvelle soumission de même clé le retrouve sans calcul.
+
+Les calculs vectorisés libèrent le GIL dans NumPy : des threads suffisent
+et les tâches partagent la mémoire du cache sans sérialisation.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+from application.fingerprint import params_fingerprint
+from application.params import SimulationParams
+from application.result_cache import ResultCache, shared_result_cache
+
+
+WORKERS_ENV = "LMNP_JOB_WORKERS"
+DEFAULT_WORKERS = 2
+# Tâches terminées (ou échouées, annulées) dont l'état reste consultable.
+DEFAULT_MAX_FINISHED = 32
+# Abonné des appels qui n'en nomment pas : ils comptent pour un seul.
+DEFAULT_SUBSCRIBER = ""
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+FINISHED_STATES = (DONE, FAILED, CANCELLED)
+
+
+class JobCancelled(Exception):
+    """Levée dans une tâche dont l'annulation a été demandée."""
+
+
+@dataclass(frozen=True)
+class JobStatus:
+    """État d'une tâche à un instant donné.
+
+    Attributes:
+        key: Clé de la tâche.
+        state: ``PENDING``, ``RUNNING``, ``DONE``, ``FAILED`` ou
+            ``CANCELLED``.
+        done: Unités de travail effectuées.
+        total: Unités de travail prévues (0 si inconnu).
+        message: Dernier message d'avancement.
+        result: Résultat de la tâche (état ``DONE``), partagé : ne pas
+            le modifier.
+        error: Message d'erreur (état ``FAILED``).
+    """
+
+    key: str
+    state: str
+    done: int = 0
+    total: int = 0
+    message: str = ""
+    result: Any = None
+    error: str | None = None
+
+    @property
+    def finished(self) -> bool:
+        """Vrai si la tâche ne progressera plus."""
+        return self.state in FINISHED_STATES
+
+    @property
+    def fraction(self) -> float:
+        """Avancement entre 0 et 1."""
+        if self.state == DONE:
+            return 1.0
+        return min(self.done / self.total, 1.0) if self.total else 0.0
+
+
+class _Job:
+    """Tâche soumise : état mutable, protégé par le verrou du gestionnaire."""
+
+    def __init__(self, key: str, total: int, subscriber: str) -> None:
+        self.key = key
+        self.state = PENDING
+        self.done = 0
+        self.total = total
+        self.message = ""
+        self.result: Any = None
+        self.error: str | None = None
+        self.subscribers = {subscriber}
+        self.cancel_event = threading.Event()
+        self.future: Future | None = None
+
+    def snapshot(self) -> JobStatus:
+        return JobStatus(
+            key=self.key,
+            state=self.state,
+            done=self.done,
+            total=self.total,
+            message=self.message,
+            result=self.result,
+            error=self.error,
+        )
+
+
+class JobContext:
+    """Interface d'une tâche en cours avec son gestionnaire."""
+
+    def __init__(self, job: _Job, lock: threading.Lock) -> None:
+        self._job = job
+        self._lock = lock
+
+    @property
+    def cancelled(self) -> bool:
+        """Vrai si l'annulation de la tâche a été demandée."""
+        return self._job.cancel_event.is_set()
+
+    def raise_if_cancelled(self) -> None:
+        """Interrompt la tâche si son annulation a été demandée.
+
+        Raises:
+            JobCancelled: Si l'annulation a été demandée.
+        """
+        if self.cancelled:
+            raise JobCancelled(self._job.key)
+
+    def report(self, done: int, total: int | None = None, message: str = "") -> None:
+        """Publie l'avancement de la tâche.
+
+        Args:
+            done: Unités de travail effectuées.
+            total: Unités prévues (inchangé si ``None``).
+            message: Message d'avancement.
+        """
+        with self._lock:
+            self._job.done = done
+            if total is not None:
+                self._job.total = total
+            self._job.message = message
+
+
+class JobManager:
+    """Pool borné de tâches longues, dédupliquées par clé."""
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_WORKERS,
+        cache: ResultCache | None = None,
+        max_finished: int = DEFAULT_MAX_FINISHED,
+    ) -> None:
+        """Initialise le gestionnaire.
+
+        Args:
+            max_workers: Nombre maximal de tâches exécutées simultanément ;
+                les suivantes attendent leur tour (état ``PENDING``).
+            cache: Cache où ranger les résultats (défaut :
+                ``shared_result_cache()``).
+            max_finished: Nombre de tâches terminées dont l'état est
+                conservé.
+
+        Raises:
+            ValueError: Si ``max_workers`` < 1.
+        """
+        if max_workers < 1:
+            raise ValueError("Il faut au moins un thread de calcul.")
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="job"
+        )
+        self._cache = cache or shared_result_cache()
+        self._max_finished = max_finished
+        self._lock = threading.Lock()
+        self._active: dict[str, _Job] = {}
+        self._finished: OrderedDict[str, _Job] = OrderedDict()
+
+    def submit(
+        self,
+        key: str,
+        compute: Callable[[JobContext], Any],
+        total: int = 0,
+        subscriber: str = DEFAULT_SUBSCRIBER,
+    ) -> JobStatus:
+        """Soumet une tâche, ou rejoint celle de même clé.
+
+        Args:
+            key: Clé de la tâche (:func:`job_key`).
+            compute: Calcul, appelé dans un thread du pool avec le
+                contexte de la tâche.
+            total: Unités de travail prévues, pour l'avancement.
+            subscriber: Identifiant de l'abonné (ex: la session). Une
+                nouvelle soumission du même abonné est sans effet.
+
+        Returns:
+            État de la tâche : en cours si elle existait déjà, terminé si
+            son résultat est en cache. Une tâche annulée qui ne s'est pas
+            encore arrêtée est abandonnée et une nouvelle tâche la
+            remplace.
+        """
+        with self._lock:
+            job = self._active.get(key)
+            if job is not None and not job.cancel_event.is_set():
+                job.subscribers.add(subscriber)
+                return job.snapshot()
+            if job is not None:
+                del self._active[key]
+            cached = self._cache.get(key)
+            if cached is not None:
+                return JobStatus(
+                    key=key, state=DONE, done=total, total=total, result=cached
+                )
+            job = self._active[key] = _Job(key, total, subscriber)
+            job.future = self._executor.submit(self._run, job, compute)
+            return job.snapshot()
+
+    def status(self, key: str) -> JobStatus | None:
+        """État de la tâche ``key``, ``None`` si elle est inconnue.
+
+        Une tâche oubliée dont le résultat est encore en cache est
+        considérée comme terminée.
+        """
+        with self._lock:
+            job = self._active.get(key) or self._finished.get(key)
+            if job is not None:
+                return job.snapshot()
+            cached = self._cache.get(key)
+        if cached is None:
+            return None
+        return JobStatus(key=key, state=DONE, result=cached)
+
+    def cancel(self, key: str, subscriber: str = DEFAULT_SUBSCRIBER) -> bool:
+        """Retire un abonné de la tâche ``key`` et l'annule s'il était le dernier.
+
+        Args:
+            key: Clé de la tâche.
+            subscriber: Abonné qui se retire (celui de :meth:`submit`).
+
+        Returns:
+            Vrai si l'annulation de la tâche a été demandée ; faux si elle
+            est terminée, si ``subscriber`` n'y est pas abonné ou si
+            d'autres abonnés l'attendent encore.
+        """
+        with self._lock:
+            job = self._active.get(key)
+            if job is None or subscriber not in job.subscribers:
+                return False
+            job.subscribers.discard(subscriber)
+            if job.subscribers:
+                return False
+            job.cancel_event.set()
+            if job.future is not None and job.future.cancel():
+                job.state = CANCELLED
+                self._retire(job)
+            return True
+
+    def active(self) -> list[JobStatus]:
+        """États des tâches en attente ou en cours."""
+        with self._lock:
+            return [job.snapshot() for job in self._active.values()]
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Annule toutes les tâches et arrête le pool."""
+        with self._lock:
+            for job in self._active.values():
+                job.cancel_event.set()
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _run(self, job: _Job, compute: Callable[[JobContext], Any]) -> None:
+        """Corps d'une tâche, exécuté dans un thread du pool."""
+        with self._lock:
+            if job.cancel_event.is_set():
+                job.state = CANCELLED
+                self._retire(job)
+                return
+            job.state = RUNNING
+        try:
+            result = compute(JobContext(job, self._lock))
+        except JobCancelled:
+            state, result, error = CANCELLED, None, None
+        except Exception as exc:
+            state, result, error = FAILED, None, str(exc) or type(exc).__name__
+        else:
+            state, error = DONE, None
+            self._cache.get_or_compute(job.key, lambda: result)
+        with self._lock:
+            job.state = state
+            job.result = result
+            job.error = error
+            self._retire(job)
+
+    def _retire(self, job: _Job) -> None:
+        """Déplace une tâche terminée vers l'historique borné (verrou tenu).
+
+        Une tâche abandonnée au profit d'une nouvelle soumission n'est pas
+        conservée : son état masquerait celui de la remplaçante.
+        """
+        if self._active.get(job.key) is not job:
+            return
+        del self._active[job.key]
+        self._finished[job.key] = job
+        self._finished.move_to_end(job.key)
+        while len(self._finished) > self._max_finished:
+            self._finished.popitem(last=False)
+
+
+def job_key(kind: str, params: SimulationParams, **options: Any) -> str:
+    """Clé d'une tâche : type de calcul, empreinte du scénario et options.
+
+    Args:
+        kind: Type de calcul (ex: ``"resale_monte_carlo"``).
+        params: Scénario de base.
+        **options: Options du calcul, sérialisables en JSON.
+
+    Returns:
+        Clé hexadécimale, distincte des empreintes de simulation.
+    """
+    document = json.dumps(
+        {
+            "kind": kind,
+            "params": params_fingerprint(params),
+            "options": options,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return f"{kind}:{hashlib.sha256(document.encode('utf-8')).hexdigest()}"
+
+
+@lru_cache(maxsize=1)
+def shared_job_manager() -> JobManager:
+    """Gestionnaire de tâches du processus (``$LMNP_JOB_WORKERS`` threads)."""
+    return JobManager(max_workers=int(os.environ.get(WORKERS_ENV, DEFAULT_WORKERS)))
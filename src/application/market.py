@@ -0,0 +1,197 @@
+"""Références de marché local : évolution des prix et ventes comparables.
+
+Une :class:`GrowthCurve` décrit l'évolution historique du prix médian au
+m² d'une zone (source : cube DVF, :mod:`infrastructure.dvf_growth`). Le
+mode de revente « marché » remplace le taux d'inflation saisi par le taux
+annuel moyen de cette courbe ; sa dispersion alimente les tirages de
+Monte Carlo.
+
+Le taux est résolu avant la simulation et porté par ``params.resale`` :
+moteur scalaire, moteur vectorisé et empreintes de cache restent
+inchangés, et le coût par simulation est nul.
+
+Les :class:`Comparable` sont les ventes DVF les plus proches du bien
+simulé (source : :mod:`infrastructure.dvf_comparables`), au sens d'une
+distance pondérée par :class:`ComparableWeights`.
+"""
+
+import dataclasses
+import datetime
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Protocol
+
+from application.params import SimulationParams
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+# Précision du taux reporté dans ``params.resale`` (%).
+RATE_DECIMALS = 2
+# Nombre de ventes comparables retournées par défaut.
+DEFAULT_COMPARABLES = 10
+
+
+@dataclass(frozen=True)
+class GrowthCurve:
+    """Évolution annuelle du prix médian au m² d'une zone.
+
+    Attributes:
+        level: Zone retenue (``"section"`` ou ``"commune"``).
+        years: Année d'arrivée de chaque variation (2021 = 2020 → 2021).
+        rates: Variation annuelle du prix médian (décimal).
+    """
+
+    level: str
+    years: tuple[int, ...]
+    rates: tuple[float, ...]
+
+    @property
+    def annual_rate(self) -> float:
+        """Taux annuel moyen (moyenne géométrique, décimal)."""
+        product = 1.0
+        for rate in self.rates:
+            product *= 1 + rate
+        return product ** (1 / len(self.rates)) - 1
+
+    @property
+    def volatility(self) -> float:
+        """Écart-type des variations annuelles (décimal), 0 sur une année."""
+        if len(self.rates) < 2:
+            return 0.0
+        mean = sum(self.rates) / len(self.rates)
+        variance = sum((r - mean) ** 2 for r in self.rates) / (len(self.rates) - 1)
+        return variance**0.5
+
+    def sample_multipliers(
+        self, horizon: int, size: int, seed: int | None = None
+    ) -> "np.ndarray":
+        """Tirages du coefficient de revalorisation à ``horizon`` ans.
+
+        Chaque trajectoire enchaîne ``horizon`` variations tirées avec
+        remise parmi les variations historiques (bootstrap).
+
+        Args:
+            horizon: Nombre d'années jusqu'à la revente.
+            size: Nombre de trajectoires.
+            seed: Graine du générateur (reproductibilité).
+
+        Returns:
+            Tableau ``(size,)`` des coefficients prix de revente / prix net.
+        """
+        import numpy as np
+
+        rng = np.random.default_rng(seed)
+        draws = rng.choice(np.asarray(self.rates), size=(size, horizon))
+        return np.prod(1 + draws, axis=1)
+
+
+def with_market_resale(
+    params: SimulationParams, curve: GrowthCurve
+) -> SimulationParams:
+    """Paramètres dont la revente suit le taux annuel moyen du marché.
+
+    Args:
+        params: Paramètres saisis.
+        curve: Évolution du marché local.
+
+    Returns:
+        Copie de ``params`` avec ``resale`` égal au taux annuel (%).
+    """
+    return dataclasses.replace(
+        params, resale=round(curve.annual_rate * 100, RATE_DECIMALS)
+    )
+
+
+@dataclass(frozen=True)
+class ComparableWeights:
+    """Pondération de la distance entre le bien simulé et une vente.
+
+    La distance est la somme pondérée de l'écart de surface (valeur
+    absolue du logarithme du rapport des surfaces), de l'ancienneté de la
+    vente (années), d'une section cadastrale différente et de l'écart du
+    nombre de pièces (une pièce d'écart si la vente ne le renseigne pas).
+
+    Attributes:
+        surface: Poids de l'écart de surface (|ln(s / s0)|).
+        age: Poids par année d'ancienneté.
+        section: Pénalité d'une autre section que celle demandée.
+        rooms: Poids par pièce d'écart.
+    """
+
+    surface: float = 4.0
+    age: float = 0.5
+    section: float = 1.0
+    rooms: float = 0.5
+
+
+@dataclass(frozen=True)
+class Comparable:
+    """Vente DVF comparable au bien simulé.
+
+    Attributes:
+        date: Date de mutation.
+        address: Adresse (numéro, type de voie, voie).
+        section: Section cadastrale, préfixe inclus.
+        surface: Surface Carrez (m²).
+        rooms: Nombre de pièces principales (``None`` si non renseigné).
+        value: Valeur foncière (€).
+        price_per_m2: Prix au m² (€).
+        distance: Distance pondérée au bien simulé.
+    """
+
+    date: datetime.date
+    address: str
+    section: str
+    surface: float
+    rooms: int | None
+    value: float
+    price_per_m2: float
+    distance: float
+
+
+class ComparableSource(Protocol):
+    """Recherche des ventes les plus proches d'un bien."""
+
+    def nearest(
+        self,
+        city: str,
+        property_type: str,
+        surface: float,
+        section: str | None = None,
+        rooms: int | None = None,
+        k: int = DEFAULT_COMPARABLES,
+        weights: ComparableWeights = ComparableWeights(),
+    ) -> list[Comparable]: ...
+
+
+def comparables(
+    params: SimulationParams,
+    source: ComparableSource,
+    section: str | None = None,
+    rooms: int | None = None,
+    k: int = DEFAULT_COMPARABLES,
+    weights: ComparableWeights = ComparableWeights(),
+) -> list[Comparable]:
+    """Ventes comparables au bien d'une simulation.
+
+    Args:
+        params: Paramètres de simulation (commune, type de bien, surface).
+        source: Magasin de ventes (ex: ``infrastructure.dvf_comparables``).
+        section: Section cadastrale du bien, préfixe inclus (``"826AD"``).
+        rooms: Nombre de pièces du bien.
+        k: Nombre de ventes retournées.
+        weights: Pondération de la distance.
+
+    Returns:
+        Jusqu'à ``k`` ventes, de la plus proche à la plus éloignée.
+    """
+    return source.nearest(
+        params.city,
+        params.property_type,
+        params.surface,
+        section=section,
+        rooms=rooms,
+        k=k,
+        weights=weights,
+    )
@@ -0,0 +1,121 @@
+"""Distribution du TRI et de la VAN selon le prix de revente (Monte Carlo).
+
+Le prix de revente suit des trajectoires tirées dans l'historique du
+marché local (:meth:`GrowthCurve.sample_multipliers`) ; chaque trajectoire
+est un scénario évalué par :class:`~application.batch.BatchSimulation`,
+par paquets. Seul le prix de revente varie : l'emprunt et l'amortissement
+ne sont calculés qu'une fois par paquet.
+
+Le calcul, long pour 100 000 trajectoires, est prévu pour être exécuté en
+tâche de fond (:mod:`application.jobs`) : il publie son avancement et
+s'interrompt sur demande entre deux paquets.
+"""
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from application.jobs import JobContext, job_key
+from application.market import GrowthCurve
+from application.params import SimulationParams
+from application.simulation import RESALE_VALUE_THRESHOLD
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+JOB_KIND = "resale_monte_carlo"
+DEFAULT_PATHS = 10_000
+CHUNK_PATHS = 10_000
+
+
+@dataclass(frozen=True)
+class ResaleDistribution:
+    """Indicateurs à l'horizon de revente, une valeur par trajectoire.
+
+    Attributes:
+        horizon: Horizon de revente (années).
+        resale_values: Prix de revente tirés (€), ``(paths,)``.
+        irr_value: TRI (%), ``NaN`` si non défini, ``(paths,)``.
+        npv_value: VAN (€), ``(paths,)``.
+    """
+
+    horizon: int
+    resale_values: "np.ndarray"
+    irr_value: "np.ndarray"
+    npv_value: "np.ndarray"
+
+    def __len__(self) -> int:
+        return len(self.resale_values)
+
+    @property
+    def loss_probability(self) -> float:
+        """Part des trajectoires de VAN négative (0 à 1)."""
+        return float((self.npv_value < 0).mean())
+
+
+def resale_job_key(
+    params: SimulationParams, curve: GrowthCurve, paths: int, seed: int = 0
+) -> str:
+    """Clé de tâche d'une distribution de revente (:func:`job_key`)."""
+    return job_key(
+        JOB_KIND, params, rates=list(curve.rates), paths=paths, seed=seed
+    )
+
+
+def resale_distribution(
+    params: SimulationParams,
+    curve: GrowthCurve,
+    paths: int = DEFAULT_PATHS,
+    seed: int = 0,
+    context: JobContext | None = None,
+) -> ResaleDistribution:
+    """Évalue le scénario pour ``paths`` prix de revente tirés.
+
+    Args:
+        params: Scénario de base (le champ ``resale`` est remplacé).
+        curve: Évolution du marché local, source des tirages.
+        paths: Nombre de trajectoires.
+        seed: Graine des tirages.
+        context: Contexte de tâche de fond, pour l'avancement et
+            l'annulation.
+
+    Returns:
+        Indicateurs de chaque trajectoire.
+
+    Raises:
+        JobCancelled: Si la tâche est annulée en cours de calcul.
+    """
+    import numpy as np
+
+    from application.batch import BatchSimulation
+    from application.params_batch import ParamsBatch
+
+    horizon = params.resale_horizon
+    net_price = params.property_price + params.renovation_cost + params.furniture_cost
+    resale_values = np.maximum(
+        np.round(net_price * curve.sample_multipliers(horizon, paths, seed)),
+        RESALE_VALUE_THRESHOLD,
+    )
+    base = ParamsBatch.from_params([params])
+    engine = BatchSimulation()
+    irr_value = np.empty(paths)
+    npv_value = np.empty(paths)
+    for start in range(0, paths, CHUNK_PATHS):
+        if context is not None:
+            context.raise_if_cancelled()
+            context.report(start, paths, f"{start} / {paths} trajectoires")
+        stop = min(start + CHUNK_PATHS, paths)
+        batch = base.take(np.zeros(stop - start, dtype=np.intp)).with_column(
+            "resale", resale_values[start:stop]
+        )
+        result = engine.run(batch, with_taxation=False)
+        irr_value[start:stop] = result.irr_value
+        npv_value[start:stop] = result.npv_value
+    if context is not None:
+        context.report(paths, paths, f"{paths} trajectoires")
+    return ResaleDistribution(
+        horizon=horizon,
+        resale_values=resale_values,
+        irr_value=irr_value,
+        npv_value=npv_value,
+    )
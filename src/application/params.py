@@ -3,7 +3,7 @@
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SimulationParams:
     """Paramètres utilisateur d'une simulation.
 
@@ -11,6 +11,9 @@ class SimulationParams:
     pourcentage (ex: 3.5 pour 3,5 %) et non en décimal : la conversion
     a lieu dans la couche application.
 
+    La classe est slottée (pas de ``__dict__`` par instance) ; pour de
+    grands lots, préférer la représentation en colonnes ``ParamsBatch``.
+
     Pour ``agency_fee_rate`` et ``notary_fee_rate``, la saisie est libre :
     si la valeur est < 100 elle est interprétée comme un pourcentage du prix
     d'achat, sinon comme un montant fixe en euros.
@@ -0,0 +1,281 @@
+"""Représentation en colonnes d'un lot de paramètres de simulation.
+
+Un ``ParamsBatch`` stocke un tableau NumPy par champ de ``SimulationParams``
+au lieu d'un objet par scénario :
+
+* les champs numériques sont en ``float64`` (entiers en ``int32``) ;
+* les champs texte sont des codes catégoriels (``uint8`` / ``uint32``)
+  associés à la liste de leurs modalités, fixe pour les périodicités et
+  le traitement des frais d'acquisition ;
+* une colonne identique pour tous les scénarios est stockée une seule
+  fois (tableau 0-d), ce qui est le cas de la plupart des champs d'un
+  balayage.
+
+Un million de scénarios tient ainsi en quelques dizaines de Mo. La
+conversion vers et depuis ``SimulationParams`` est sans perte.
+"""
+
+import dataclasses
+from collections.abc import Iterator, Mapping, Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+from application.params import SimulationParams
+from application.simulation import PERIOD_MULTIPLIERS
+
+
+ACQUISITION_FEES_TREATMENTS = ("deduction", "amortissement")
+
+_FIELDS = dataclasses.fields(SimulationParams)
+_FIELDS_BY_NAME = {f.name: f for f in _FIELDS}
+FIELD_NAMES: tuple[str, ...] = tuple(f.name for f in _FIELDS)
+INTEGER_FIELDS: tuple[str, ...] = tuple(f.name for f in _FIELDS if f.type is int)
+NUMERIC_FIELDS: tuple[str, ...] = tuple(
+    f.name for f in _FIELDS if f.type in (float, int)
+)
+TEXT_FIELDS: tuple[str, ...] = tuple(f.name for f in _FIELDS if f.type is str)
+# Modalités fixes : les codes restent comparables d'un lot à l'autre.
+FIXED_CATEGORIES: dict[str, tuple[str, ...]] = {
+    **{
+        name: tuple(PERIOD_MULTIPLIERS)
+        for name in TEXT_FIELDS
+        if name.endswith("_period")
+    },
+    "acquisition_fees_treatment": ACQUISITION_FEES_TREATMENTS,
+}
+
+
+@dataclass(frozen=True)
+class ParamsBatch:
+    """Lot de paramètres de simulation stocké en colonnes.
+
+    Attributes:
+        size: Nombre de scénarios.
+        columns: Valeurs (numériques) ou codes (texte) par champ, de forme
+            ``(size,)`` ou ``()`` pour une colonne constante.
+        categories: Modalités de chaque champ texte, indexées par code.
+    """
+
+    size: int
+    columns: dict[str, np.ndarray]
+    categories: dict[str, tuple[str, ...]]
+
+    @classmethod
+    def from_params(cls, params: Sequence[SimulationParams]) -> "ParamsBatch":
+        """Construit un lot à partir d'objets ``SimulationParams``.
+
+        Args:
+            params: Scénarios.
+
+        Returns:
+            Lot en colonnes.
+        """
+        return cls.from_columns(
+            {name: [getattr(p, name) for p in params] for name in FIELD_NAMES},
+            size=len(params),
+        )
+
+    @classmethod
+    def from_columns(
+        cls, columns: Mapping[str, object], size: int | None = None
+    ) -> "ParamsBatch":
+        """Construit un lot à partir de colonnes (listes, tableaux, scalaires).
+
+        Les champs absents prennent la valeur par défaut de
+        ``SimulationParams`` ; un scalaire s'applique à tous les scénarios.
+
+        Args:
+            columns: Valeurs par nom de champ.
+            size: Nombre de scénarios, déduit des colonnes si omis.
+
+        Returns:
+            Lot en colonnes.
+
+        Raises:
+            ValueError: Si un champ obligatoire manque, si un champ est
+                inconnu, si les longueurs diffèrent ou si une modalité fixe
+                est invalide.
+        """
+        unknown = set(columns) - set(FIELD_NAMES)
+        if unknown:
+            raise ValueError(f"Champs inconnus : {', '.join(sorted(unknown))}")
+        if size is None:
+            lengths = {len(v) for v in columns.values() if np.ndim(v) == 1}
+            if len(lengths) > 1:
+                raise ValueError("Colonnes de longueurs différentes.")
+            size = lengths.pop() if lengths else 1
+
+        stored: dict[str, np.ndarray] = {}
+        categories: dict[str, tuple[str, ...]] = {}
+        for f in _FIELDS:
+            if f.name in columns:
+                raw = columns[f.name]
+            elif f.default is not dataclasses.MISSING:
+                raw = f.default
+            else:
+                raise ValueError(f"Champ obligatoire absent : {f.name}")
+            if np.ndim(raw) == 1 and len(raw) != size:
+                raise ValueError(f"{f.name} : {len(raw)} valeurs pour {size} scénarios")
+            if f.type is str:
+                stored[f.name], categories[f.name] = _encode(f.name, raw)
+            else:
+                stored[f.name] = _compact(np.asarray(raw, dtype=_dtype(f)))
+        return cls(size=size, columns=stored, categories=categories)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, index: int) -> SimulationParams:
+        """Reconstruit le scénario ``index`` (sans perte)."""
+        if not -self.size <= index < self.size:
+            raise IndexError(index)
+        values = {}
+        for name in FIELD_NAMES:
+            column = self.columns[name]
+            value = column if column.ndim == 0 else column[index]
+            if name in self.categories:
+                values[name] = self.categories[name][int(value)]
+            elif name in INTEGER_FIELDS:
+                values[name] = int(value)
+            else:
+                values[name] = float(value)
+        return SimulationParams(**values)
+
+    def __iter__(self) -> Iterator[SimulationParams]:
+        return (self[i] for i in range(self.size))
+
+    def to_params(self) -> list[SimulationParams]:
+        """Reconstruit tous les scénarios sous forme d'objets."""
+        return list(self)
+
+    @property
+    def nbytes(self) -> int:
+        """Empreinte mémoire des colonnes (octets)."""
+        return sum(c.nbytes for c in self.columns.values())
+
+    def column(self, name: str) -> np.ndarray:
+        """Valeurs numériques d'un champ, de forme ``(size,)``.
+
+        Une colonne constante est diffusée sans copie (vue en lecture seule).
+        """
+        return np.broadcast_to(self.columns[name], (self.size,))
+
+    def codes(self, name: str) -> np.ndarray:
+        """Codes catégoriels d'un champ texte, de forme ``(size,)``."""
+        return np.broadcast_to(self.columns[name], (self.size,))
+
+    def decoded(self, name: str) -> np.ndarray:
+        """Valeurs d'un champ texte, de forme ``(size,)`` (tableau d'objets)."""
+        return np.asarray(self.categories[name], dtype=object)[self.codes(name)]
+
+    def lookup(self, name: str, table: Mapping[str, float], default: float) -> np.ndarray:
+        """Applique une table modalité → valeur à un champ texte.
+
+        La table n'est évaluée qu'une fois par modalité, puis indexée par
+        les codes : ex. ``lookup("pno_period", PERIOD_MULTIPLIERS, 1)``.
+        """
+        values = np.array(
+            [table.get(c, default) for c in self.categories[name]], dtype=np.float64
+        )
+        return values[self.codes(name)]
+
+    def slice(self, start: int, stop: int) -> "ParamsBatch":
+        """Sous-lot ``[start, stop)``, par vues sur les colonnes."""
+        stop = min(stop, self.size)
+        return ParamsBatch(
+            size=max(0, stop - start),
+            columns={
+                name: c if c.ndim == 0 else c[start:stop]
+                for name, c in self.columns.items()
+            },
+            categories=self.categories,
+        )
+
+    def take(self, indices: np.ndarray) -> "ParamsBatch":
+        """Sous-lot des scénarios ``indices`` (dans cet ordre)."""
+        indices = np.asarray(indices)
+        return ParamsBatch(
+            size=len(indices),
+            columns={
+                name: c if c.ndim == 0 else c[indices]
+                for name, c in self.columns.items()
+            },
+            categories=self.categories,
+        )
+
+    def with_column(self, name: str, values: object) -> "ParamsBatch":
+        """Copie du lot avec un champ remplacé, les autres colonnes partagées.
+
+        Équivalent en colonnes de ``dataclasses.replace`` appliqué à tous les
+        scénarios.
+
+        Args:
+            name: Champ à remplacer.
+            values: Nouvelle valeur (scalaire) ou valeurs par scénario.
+
+        Returns:
+            Nouveau lot.
+
+        Raises:
+            ValueError: Si le nombre de valeurs ne correspond pas au lot.
+        """
+        if np.ndim(values) == 1 and len(values) != self.size:
+            raise ValueError(f"{name} : {len(values)} valeurs pour {self.size} scénarios")
+        field = _FIELDS_BY_NAME[name]
+        columns = dict(self.columns)
+        categories = dict(self.categories)
+        if field.type is str:
+            columns[name], categories[name] = _encode(name, values)
+        else:
+            columns[name] = _compact(np.asarray(values, dtype=_dtype(field)))
+        return ParamsBatch(size=self.size, columns=columns, categories=categories)
+
+    @classmethod
+    def concat(cls, batches: Sequence["ParamsBatch"]) -> "ParamsBatch":
+        """Concatène plusieurs lots."""
+        columns: dict[str, object] = {}
+        for name in FIELD_NAMES:
+            if name in TEXT_FIELDS:
+                columns[name] = np.concatenate([b.decoded(name) for b in batches])
+            else:
+                columns[name] = np.concatenate([b.column(name) for b in batches])
+        return cls.from_columns(columns, size=sum(len(b) for b in batches))
+
+
+def _dtype(field: dataclasses.Field) -> type:
+    """Type de stockage d'un champ numérique."""
+    return np.int32 if field.type is int else np.float64
+
+
+def _compact(values: np.ndarray) -> np.ndarray:
+    """Réduit une colonne constante à un tableau 0-d."""
+    if values.ndim == 1 and len(values) > 0 and (values == values[0]).all():
+        return np.asarray(values[0])
+    return values
+
+
+def _encode(name: str, raw: object) -> tuple[np.ndarray, tuple[str, ...]]:
+    """Code un champ texte en entiers et retourne ses modalités.
+
+    Raises:
+        ValueError: Si une valeur sort des modalités fixes du champ.
+    """
+    fixed = FIXED_CATEGORIES.get(name)
+    if np.ndim(raw) == 0:
+        value = str(raw)
+        if fixed is not None:
+            if value not in fixed:
+                raise ValueError(f"{name} : modalité inconnue {value!r}")
+            return np.asarray(fixed.index(value), dtype=np.uint8), fixed
+        return np.asarray(0, dtype=np.uint32), (value,)
+    values = np.asarray(raw, dtype=object).astype(str)
+    if fixed is not None:
+        unknown = set(np.unique(values)) - set(fixed)
+        if unknown:
+            raise ValueError(f"{name} : modalités inconnues {sorted(unknown)!r}")
+        lookup = {c: i for i, c in enumerate(fixed)}
+        codes = np.fromiter((lookup[v] for v in values), dtype=np.uint8, count=len(values))
+        return _compact(codes), fixed
+    uniques, codes = np.unique(values, return_inverse=True)
+    return _compact(codes.astype(np.uint32).reshape(-1)), tuple(uniques.tolist())
@@ -0,0 +1,236 @@
+"""Front de Pareto d'un lot de scénarios sur plusieurs indicateurs.
+
+Quand des centaines de biens sont croisés avec des plans de financement,
+aucun scénario n'est le meilleur sur tous les indicateurs : on retient
+l'ensemble des scénarios non dominés (TRI, cashflow, apport…).
+
+Après un tri lexicographique, un scénario ne peut être dominé que par un
+scénario placé avant lui. Trois algorithmes, sans comparaison de toutes
+les paires :
+
+* deux indicateurs : balayage (minimum courant du second indicateur),
+  entièrement vectorisé, en ``O(n log n)`` ;
+* trois indicateurs : diviser pour régner sur l'ordre lexicographique.
+  À chaque niveau, la première moitié de chaque segment est confrontée à
+  la seconde par un minimum courant du troisième indicateur, les points
+  étant rangés par second indicateur. Un niveau est un tri d'entiers et
+  quelques passes vectorisées : ``O(n log² n)``, quelle que soit la taille
+  du front (un million de points en quelques secondes) ;
+* quatre indicateurs ou plus : *Sort-Filter-Skyline*. Les scénarios sont
+  triés par somme des indicateurs normalisés puis filtrés par paquets
+  contre le front déjà construit, en ``O(n × taille du front)``. Au pire,
+  quand les indicateurs s'opposent et que presque tous les scénarios sont
+  sur le front, le coût redevient quadratique.
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+from application.batch import BatchResult
+from application.params import SimulationParams
+from application.params_batch import ParamsBatch
+
+
+# Indicateurs disponibles et sens d'optimisation.
+OBJECTIVES: dict[str, str] = {
+    "irr_value": "max",
+    "first_year_cashflow": "max",
+    "down_payment": "min",
+    "npv_value": "max",
+    "wealth_growth": "max",
+}
+DEFAULT_OBJECTIVES = ("irr_value", "first_year_cashflow", "down_payment")
+BLOCK_SIZE = 1024
+
+
+@dataclass(frozen=True)
+class ParetoFront:
+    """Scénarios non dominés d'un lot.
+
+    Attributes:
+        objectives: Indicateurs considérés.
+        indices: Position des scénarios du front dans le lot, triés par
+            premier indicateur (du meilleur au moins bon).
+        values: Valeurs des indicateurs, ``(len(indices), len(objectives))``.
+    """
+
+    objectives: tuple[str, ...]
+    indices: np.ndarray
+    values: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def column(self, objective: str) -> np.ndarray:
+        """Valeurs d'un indicateur sur le front."""
+        return self.values[:, self.objectives.index(objective)]
+
+
+def pareto_front(
+    result: BatchResult,
+    params: ParamsBatch | Sequence[SimulationParams],
+    objectives: Sequence[str] = DEFAULT_OBJECTIVES,
+) -> ParetoFront:
+    """Front de Pareto d'un lot évalué par le moteur vectorisé.
+
+    Les scénarios dont un indicateur n'est pas défini (TRI sans solution)
+    sont exclus.
+
+    Args:
+        result: Résultats du lot.
+        params: Scénarios du lot (pour l'apport), dans le même ordre.
+        objectives: Indicateurs parmi ``OBJECTIVES``.
+
+    Returns:
+        Scénarios non dominés.
+
+    Raises:
+        ValueError: Si un indicateur est inconnu ou si le lot et ses
+            scénarios diffèrent en taille.
+    """
+    objectives = tuple(objectives)
+    unknown = [name for name in objectives if name not in OBJECTIVES]
+    if unknown or not objectives:
+        raise ValueError(f"Indicateurs inconnus : {', '.join(unknown) or '∅'}")
+    if len(params) != len(result):
+        raise ValueError(f"{len(params)} scénarios pour {len(result)} résultats")
+    if not isinstance(params, ParamsBatch):
+        params = ParamsBatch.from_params(params)
+
+    values = np.column_stack(
+        [_objective(result, params, name) for name in objectives]
+    )
+    finite = np.flatnonzero(np.isfinite(values).all(axis=1))
+    senses = np.array([-1.0 if OBJECTIVES[n] == "max" else 1.0 for n in objectives])
+    front = finite[non_dominated(values[finite] * senses)]
+    front = front[np.argsort(values[front, 0] * senses[0], kind="stable")]
+    return ParetoFront(objectives=objectives, indices=front, values=values[front])
+
+
+def non_dominated(points: np.ndarray) -> np.ndarray:
+    """Indices des points non dominés, tous les indicateurs étant à minimiser.
+
+    Un point est dominé s'il existe un autre point au moins aussi bon sur
+    tous les indicateurs et strictement meilleur sur l'un d'eux ; les
+    doublons exacts sont donc conservés ensemble.
+
+    Args:
+        points: Indicateurs, ``(n, k)``, valeurs finies.
+
+    Returns:
+        Indices croissants des points du front.
+    """
+    points = np.asarray(points, dtype=np.float64)
+    if len(points) == 0:
+        return np.empty(0, dtype=np.intp)
+    if points.shape[1] == 1:
+        return np.flatnonzero(points[:, 0] == points[:, 0].min())
+    if points.shape[1] > 3:
+        return _sort_filter(points)
+    # Tri lexicographique et regroupement des doublons exacts.
+    order = np.lexsort(points.T[::-1])
+    ordered = points[order]
+    first = np.ones(len(points), dtype=bool)
+    first[1:] = (ordered[1:] != ordered[:-1]).any(axis=1)
+    sweep = _sweep_2d if points.shape[1] == 2 else _sweep_3d
+    kept = np.zeros(first.sum(), dtype=bool)
+    kept[sweep(ordered[first])] = True
+    return np.sort(order[kept[np.cumsum(first) - 1]])
+
+
+def _objective(result: BatchResult, params: ParamsBatch, name: str) -> np.ndarray:
+    """Valeurs ``float64`` d'un indicateur pour tout le lot."""
+    if name == "down_payment":
+        values = params.column(name)
+    else:
+        values = getattr(result, name)
+    return np.broadcast_to(values, (len(result),)).astype(np.float64)
+
+
+def _sweep_2d(points: np.ndarray) -> np.ndarray:
+    """Front de points distincts triés lexicographiquement.
+
+    Un point est dominé si un point précédent (premier indicateur au plus
+    égal) a un second indicateur au plus égal.
+    """
+    best_before = np.minimum.accumulate(points[:, 1])
+    best_before = np.concatenate([[np.inf], best_before[:-1]])
+    return np.flatnonzero(points[:, 1] < best_before)
+
+
+def _sweep_3d(points: np.ndarray) -> np.ndarray:
+    """Front de points distincts triés lexicographiquement, trois indicateurs.
+
+    Le point ``i`` est dominé s'il existe ``j < i`` dont les deux derniers
+    indicateurs sont au plus égaux. Niveau ``l`` : les segments de
+    ``2 ** (l + 1)`` positions sont coupés en deux moitiés ; dans chaque
+    segment, rangé par second indicateur (la première moitié d'abord à
+    égalité), le minimum courant du troisième indicateur sur la première
+    moitié est comparé aux points de la seconde. Chaque paire ``j < i``
+    est examinée à un seul niveau.
+
+    Les indicateurs sont remplacés par leurs rangs (entiers) : un décalage
+    de ``segment × (n + 1)`` isole alors chaque segment dans un unique
+    ``np.minimum.accumulate``.
+    """
+    n = len(points)
+    y_rank = np.unique(points[:, 1], return_inverse=True)[1].astype(np.int64)
+    z_rank = np.unique(points[:, 2], return_inverse=True)[1].astype(np.int64)
+    # Rangés par second indicateur, à égalité par position (stable).
+    by_y = np.argsort(y_rank, kind="stable")
+    position = np.arange(n, dtype=np.int64)
+    dominated = np.zeros(n, dtype=bool)
+    level = 0
+    while (1 << level) < n:
+        segment = position >> (level + 1)
+        # Tri par segment conservant l'ordre du second indicateur.
+        order = by_y[np.sort(segment[by_y] * n + position) % n]
+        offset = segment[order] * (n + 1)
+        first_half = ((order >> level) & 1) == 0
+        z = z_rank[order]
+        best = np.minimum.accumulate(np.where(first_half, z, n) - offset) + offset
+        dominated[order[~first_half & (best <= z)]] = True
+        level += 1
+    return np.flatnonzero(~dominated)
+
+
+def _sort_filter(points: np.ndarray) -> np.ndarray:
+    """Front par *Sort-Filter-Skyline*, en paquets de ``BLOCK_SIZE`` points."""
+    low = points.min(axis=0)
+    span = np.where(points.max(axis=0) > low, points.max(axis=0) - low, 1.0)
+    order = np.argsort(((points - low) / span).sum(axis=1), kind="stable")
+    front = np.empty((0, points.shape[1]))
+    kept: list[np.ndarray] = []
+    for start in range(0, len(order), BLOCK_SIZE):
+        block = order[start : start + BLOCK_SIZE]
+        candidates = points[block]
+        alive = ~_dominated_by(candidates, front)
+        block, candidates = block[alive], candidates[alive]
+        alive = ~_dominance(candidates, candidates).any(axis=1)
+        kept.append(block[alive])
+        front = np.concatenate([front, candidates[alive]])
+    return np.sort(np.concatenate(kept))
+
+
+def _dominated_by(points: np.ndarray, front: np.ndarray) -> np.ndarray:
+    """Masque des ``points`` dominés par au moins un point de ``front``."""
+    dominated = np.zeros(len(points), dtype=bool)
+    for start in range(0, len(front), BLOCK_SIZE):
+        chunk = front[start : start + BLOCK_SIZE]
+        dominated |= _dominance(points, chunk).any(axis=1)
+    return dominated
+
+
+def _dominance(points: np.ndarray, others: np.ndarray) -> np.ndarray:
+    """Matrice ``(len(points), len(others))`` : ``others[j]`` domine ``points[i]``.
+
+    Comparaison colonne par colonne, en tableaux 2D.
+    """
+    weakly = np.ones((len(points), len(others)), dtype=bool)
+    strictly = np.zeros_like(weakly)
+    for j in range(points.shape[1]):
+        weakly &= others[None, :, j] <= points[:, None, j]
+        strictly |= others[None, :, j] < points[:, None, j]
+    return weakly & strictly
@@ -0,0 +1,223 @@
+"""Simulation d'un portefeuille de biens LMNP au sein d'un même foyer fiscal.
+
+Chaque bien passe par les étapes habituelles (emprunt, location,
+amortissement, cashflow), évaluées en un seul lot vectorisé. Les séries
+sont ensuite décalées sur un calendrier commun selon l'année d'acquisition
+de chaque bien, puis les règles propres au foyer sont appliquées une seule
+fois sur les montants agrégés :
+
+* le résultat BIC meublé est déterminé pour l'ensemble de l'activité
+  (déficits et amortissements reportables mutualisés entre les biens) ;
+* l'éligibilité au micro-BIC dépend des recettes totales du foyer : les
+  années éligibles, un foyer qui n'a pas opté pour le réel est imposé sur
+  les recettes après abattement, et le régime réel y est suspendu (charges
+  et amortissements non retenus, stocks reportés non imputés) ;
+* le statut LMP est acquis lorsque les recettes meublées dépassent
+  23 000 € et les autres revenus d'activité du foyer : au réel, le déficit
+  de charges d'une année LMP s'impute sur le revenu global du foyer au lieu
+  d'être reporté.
+
+Le module détermine des bases imposables ; le barème de l'impôt et les
+cotisations sociales restent hors de son périmètre.
+"""
+
+import dataclasses
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+from application.batch import BatchResult, BatchSimulation
+from application.params import SimulationParams
+from domain.taxation import Taxation, TaxationEntry
+
+
+MICRO_BIC_THRESHOLD = 77_700.0
+LMP_RECEIPTS_THRESHOLD = 23_000.0
+
+
+@dataclass(frozen=True)
+class PortfolioAsset:
+    """Bien du portefeuille et sa date d'acquisition.
+
+    Le mois d'acquisition est ``params.start_month``.
+
+    Attributes:
+        params: Paramètres de simulation du bien.
+        acquisition_year: Année civile d'acquisition (ex: 2024).
+    """
+
+    params: SimulationParams
+    acquisition_year: int
+
+
+@dataclass(frozen=True)
+class Household:
+    """Foyer fiscal détenteur du portefeuille.
+
+    Attributes:
+        other_activity_income: Autres revenus d'activité du foyer (salaires,
+            BIC/BNC professionnels…) retenus pour le test LMP (€/an).
+        real_regime_option: Option pour le régime réel ; à ``False``, le
+            micro-BIC s'applique les années où le foyer y est éligible.
+    """
+
+    other_activity_income: float = 0.0
+    real_regime_option: bool = True
+
+
+@dataclass(frozen=True)
+class PortfolioResult:
+    """Résultats agrégés d'un portefeuille sur le calendrier commun.
+
+    Les tableaux annuels ont une colonne par année civile de
+    ``calendar_years`` ; les tableaux par bien une ligne par bien, dans
+    l'ordre de ``assets``.
+
+    Attributes:
+        assets: Biens simulés.
+        calendar_years: Années civiles couvertes.
+        asset_cashflow: Cashflow annuel par bien (€).
+        asset_remaining_debt: Capital restant dû par bien en fin d'année (€).
+        incomes: Recettes locatives du foyer (€).
+        cashflow: Cashflow total du foyer (€).
+        cumulative_cashflow: Cashflow total cumulé (€).
+        remaining_debt: Capital restant dû total en fin d'année (€).
+        taxation_entries: Tableau fiscal de l'activité meublée du foyer ;
+            les années au micro-BIC, seules les recettes y figurent.
+        micro_bic_eligible: Recettes sous le seuil du micro-BIC.
+        micro_bic_applied: Année imposée au micro-BIC.
+        lmp_status: Conditions du statut LMP réunies.
+        global_income_deficit: Déficit de charges imputé sur le revenu
+            global du foyer (années LMP au réel, €).
+        taxable_income: Bénéfice BIC imposable du foyer selon le régime
+            applicable à chaque année (€).
+        assets_batch: Résultats du lot, bien par bien (horizon propre).
+    """
+
+    assets: list[PortfolioAsset]
+    calendar_years: np.ndarray
+    asset_cashflow: np.ndarray
+    asset_remaining_debt: np.ndarray
+    incomes: np.ndarray
+    cashflow: np.ndarray
+    cumulative_cashflow: np.ndarray
+    remaining_debt: np.ndarray
+    taxation_entries: list[TaxationEntry]
+    micro_bic_eligible: np.ndarray
+    micro_bic_applied: np.ndarray
+    lmp_status: np.ndarray
+    global_income_deficit: np.ndarray
+    taxable_income: np.ndarray
+    assets_batch: BatchResult
+
+
+class PortfolioSimulation:
+    """Orchestrateur d'une simulation de portefeuille multi-biens."""
+
+    def __init__(self, engine: BatchSimulation | None = None) -> None:
+        """Initialise le cas d'usage.
+
+        Args:
+            engine: Moteur vectorisé utilisé pour évaluer les biens.
+        """
+        self._engine = engine or BatchSimulation()
+
+    def run(
+        self, assets: Sequence[PortfolioAsset], household: Household = Household()
+    ) -> PortfolioResult:
+        """Simule le portefeuille et applique les règles du foyer.
+
+        Args:
+            assets: Biens détenus (2 à 15 en pratique).
+            household: Foyer fiscal.
+
+        Returns:
+            Résultats agrégés sur le calendrier commun.
+
+        Raises:
+            ValueError: Si le portefeuille est vide.
+        """
+        if not assets:
+            raise ValueError("Le portefeuille ne contient aucun bien.")
+        batch = self._engine.run([a.params for a in assets], with_taxation=False)
+
+        first_year = min(a.acquisition_year for a in assets)
+        offsets = np.array([a.acquisition_year - first_year for a in assets])
+        duration = batch.cashflow.shape[1]
+        span = int(offsets.max()) + duration
+        calendar_years = np.arange(first_year, first_year + span)
+
+        def on_calendar(series: np.ndarray) -> np.ndarray:
+            """Décale chaque ligne ``(n, durée)`` à son année d'acquisition."""
+            placed = np.zeros((len(assets), span))
+            columns = offsets[:, None] + np.arange(duration)
+            placed[np.arange(len(assets))[:, None], columns] = series
+            return placed
+
+        first_year_fees = np.zeros_like(batch.expenses)
+        first_year_fees[:, 0] = batch.acquisition_fees_deductible
+
+        asset_cashflow = on_calendar(batch.cashflow)
+        asset_debt = on_calendar(batch.remaining_balances)
+        incomes = on_calendar(batch.incomes).sum(axis=0)
+        cashflow = asset_cashflow.sum(axis=0)
+
+        # Les frais déductibles de chaque bien sont intégrés aux charges de
+        # son année d'acquisition : le calcul fiscal du foyer est unique.
+        expenses = on_calendar(batch.expenses + first_year_fees).sum(axis=0)
+        interests = on_calendar(batch.loan_interests).sum(axis=0)
+        depreciations = on_calendar(batch.depreciations).sum(axis=0)
+
+        micro_bic_eligible = incomes <= MICRO_BIC_THRESHOLD
+        micro = micro_bic_eligible & (not household.real_regime_option)
+        lmp_status = (incomes > LMP_RECEIPTS_THRESHOLD) & (
+            incomes > household.other_activity_income
+        )
+        result_before_amort = incomes - expenses - interests
+        global_deficit = np.where(
+            lmp_status & ~micro & (result_before_amort < 0),
+            -result_before_amort,
+            0.0,
+        )
+        taxation = Taxation(acquisition_fees_deductible=0.0)
+        # Le déficit imputé sur le revenu global ramène le résultat de
+        # l'année à zéro : il n'entre pas dans le stock reportable.
+        real = ~micro
+        entries = taxation.compute(
+            incomes=np.where(real, incomes + global_deficit, 0.0).tolist(),
+            expenses=np.where(real, expenses, 0.0).tolist(),
+            loan_interests=np.where(real, interests, 0.0).tolist(),
+            depreciations=np.where(real, depreciations, 0.0).tolist(),
+        )
+        taxation_entries = [
+            dataclasses.replace(
+                entry,
+                income=round(float(income), 2),
+                result_before_amort=round(float(result), 2) if applies else 0.0,
+                taxable_bic=round(float(income) * taxation.bic_rate, 2),
+            )
+            for entry, income, result, applies in zip(
+                entries, incomes, result_before_amort, real
+            )
+        ]
+        fiscal_result = np.array([entry.fiscal_result for entry in entries])
+        taxable_income = np.where(micro, incomes * taxation.bic_rate, fiscal_result)
+
+        return PortfolioResult(
+            assets=list(assets),
+            calendar_years=calendar_years,
+            asset_cashflow=asset_cashflow,
+            asset_remaining_debt=asset_debt,
+            incomes=incomes,
+            cashflow=cashflow,
+            cumulative_cashflow=np.cumsum(cashflow),
+            remaining_debt=asset_debt.sum(axis=0),
+            taxation_entries=taxation_entries,
+            micro_bic_eligible=micro_bic_eligible,
+            micro_bic_applied=micro,
+            lmp_status=lmp_status,
+            global_income_deficit=global_deficit,
+            taxable_income=taxable_income,
+            assets_batch=batch,
+        )
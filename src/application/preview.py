@@ -0,0 +1,231 @@
+"""Aperçu instantané des indicateurs pendant la saisie du formulaire.
+
+Chaque modification d'un champ relance la page : l'aperçu doit coûter des
+microsecondes et n'appelle jamais :meth:`LMNPSimulation.run`. Il repose sur
+
+* une table de facteurs d'annuité précalculée sur la grille taux ×
+  durée (:class:`AnnuityTable`) : la mensualité est un produit ;
+* des formes fermées pour le reste : capital restant dû à la revente,
+  cashflow de chaque année jusqu'à l'horizon, TRI résolu par Newton sur
+  une trentaine de flux.
+
+Mêmes règles que le moteur (proratisation de la première année, fin du
+prêt, assurance décès), sans arrondi au centime : les valeurs ne
+s'écartent de la simulation complète que de quelques centimes.
+Entièrement en Python : la page de saisie ne charge pas NumPy.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+
+from application.params import SimulationParams
+from application.simulation import (
+    RESALE_VALUE_THRESHOLD,
+    SIMULATION_DURATION_YEARS,
+    LMNPSimulation,
+)
+
+
+# Grille de la table : taux effectif de 0 à 15 % par pas de 0,01 point,
+# durées de 1 à 30 ans.
+RATE_STEP = 0.01
+MAX_RATE = 15.0
+MAX_DURATION_YEARS = 30
+IRR_MAX_ITERATIONS = 50
+IRR_TOLERANCE = 1e-10
+
+
+class AnnuityTable:
+    """Facteurs d'annuité mensuels précalculés sur la grille taux × durée.
+
+    Le facteur ``r / (1 − (1 + r)^−n)`` (``r`` taux mensuel, ``n`` nombre
+    de mensualités) donne la mensualité d'un euro emprunté. Hors grille
+    (taux non multiple du pas, durée hors bornes), il est calculé.
+    """
+
+    def __init__(
+        self,
+        rate_step: float = RATE_STEP,
+        max_rate: float = MAX_RATE,
+        max_duration_years: int = MAX_DURATION_YEARS,
+    ) -> None:
+        """Construit la table.
+
+        Args:
+            rate_step: Pas de la grille des taux (points de %).
+            max_rate: Taux maximal de la grille (%).
+            max_duration_years: Durée maximale de la grille (années).
+        """
+        self.rate_step = rate_step
+        self.max_duration_years = max_duration_years
+        steps = round(max_rate / rate_step)
+        self._factors = [
+            [
+                annuity_factor(i * rate_step / 100, years)
+                for years in range(1, max_duration_years + 1)
+            ]
+            for i in range(steps + 1)
+        ]
+
+    def factor(self, annual_rate: float, duration_years: int) -> float:
+        """Mensualité d'un euro emprunté.
+
+        Args:
+            annual_rate: Taux effectif annuel (décimal).
+            duration_years: Durée du prêt (années).
+
+        Returns:
+            Facteur d'annuité mensuel.
+        """
+        position = annual_rate * 100 / self.rate_step
+        index = round(position)
+        if (
+            abs(position - index) < 1e-6
+            and 0 <= index < len(self._factors)
+            and 1 <= duration_years <= self.max_duration_years
+        ):
+            return self._factors[index][duration_years - 1]
+        return annuity_factor(annual_rate, duration_years)
+
+
+@dataclass(frozen=True)
+class Preview:
+    """Indicateurs clés estimés pendant la saisie.
+
+    Attributes:
+        total_cost: Coût total d'acquisition (€).
+        loan_amount: Montant emprunté (€).
+        monthly_payment: Mensualité hors assurance décès (€).
+        monthly_cashflow: Cashflow mensuel de la première année pleine (€).
+        gross_yield: Rendement locatif brut (%).
+        net_yield: Rendement locatif net de charges (%).
+        irr: TRI estimé à l'horizon de revente (%), ``None`` si non défini.
+    """
+
+    total_cost: float
+    loan_amount: float
+    monthly_payment: float
+    monthly_cashflow: float
+    gross_yield: float
+    net_yield: float
+    irr: float | None
+
+
+def annuity_factor(annual_rate: float, duration_years: int) -> float:
+    """Facteur d'annuité mensuel, même formule que ``Loan.monthly_payment``."""
+    monthly_rate = annual_rate / 12
+    months = duration_years * 12
+    if monthly_rate > 0:
+        return monthly_rate / (1 - (1 + monthly_rate) ** -months)
+    return 1 / months
+
+
+@lru_cache(maxsize=1)
+def default_annuity_table() -> AnnuityTable:
+    """Table du processus, construite au premier aperçu."""
+    return AnnuityTable()
+
+
+def preview(
+    params: SimulationParams,
+    table: AnnuityTable | None = None,
+    simulation: LMNPSimulation | None = None,
+) -> Preview:
+    """Estime les indicateurs clés d'un scénario en forme fermée.
+
+    Args:
+        params: Paramètres en cours de saisie.
+        table: Table d'annuités (défaut : :func:`default_annuity_table`).
+        simulation: Moteur dont les règles de résolution (frais, taux,
+            charges) sont reprises.
+
+    Returns:
+        Indicateurs estimés.
+    """
+    simulation = simulation or LMNPSimulation()
+    model = simulation.model(params)
+    table = table or default_annuity_table()
+    amount = model.loan_amount
+    payment = amount * table.factor(model.loan_rate, params.loan_duration)
+    months = params.loan_duration * 12
+    first_year_months = 13 - params.start_month
+    annual_rent = params.monthly_rent * 12
+    growth = 1 + params.rent_increase_rate / 100
+    death = model.death_insurance_annual
+    expenses = model.resolved_expenses
+
+    horizon = params.resale_horizon
+    # Comme le moteur, au-delà de la projection les flux sont tronqués et
+    # le solde de revente est porté par la dernière année projetée.
+    last_year = min(horizon, SIMULATION_DURATION_YEARS)
+    first_full_year = 2 if params.start_month > 1 else 1
+    cashflows = []
+    for year in range(1, max(last_year, first_full_year) + 1):
+        proration = first_year_months / 12 if year == 1 else 1.0
+        start = min(first_year_months + 12 * (year - 2), months) if year > 1 else 0
+        end = min(first_year_months + 12 * (year - 1), months)
+        annuity = payment * (end - start)
+        if start < months:
+            annuity += death * proration
+        income = annual_rent * growth ** (year - 1) * proration
+        cashflows.append(income - expenses * proration - annuity)
+
+    flows = cashflows[:last_year]
+    flows[0] -= params.down_payment
+    balance_months = min(first_year_months + 12 * (horizon - 1), months)
+    flows[-1] += _resale_value(params, horizon) - _balance_after(
+        amount, model.loan_rate / 12, payment, balance_months
+    )
+    return Preview(
+        total_cost=model.total_cost,
+        loan_amount=amount,
+        monthly_payment=payment,
+        monthly_cashflow=cashflows[first_full_year - 1] / 12,
+        gross_yield=annual_rent / model.total_cost * 100,
+        net_yield=(annual_rent - expenses) / model.total_cost * 100,
+        irr=_irr(flows),
+    )
+
+
+def _balance_after(
+    amount: float, monthly_rate: float, payment: float, months: int
+) -> float:
+    """Capital restant dû après ``months`` mensualités, en forme fermée."""
+    if monthly_rate > 0:
+        growth = (1 + monthly_rate) ** months
+        return amount * growth - payment * (growth - 1) / monthly_rate
+    return amount - payment * months
+
+
+def _resale_value(params: SimulationParams, horizon: int) -> float:
+    """Même règle que ``LMNPSimulation._compute_resale_value``."""
+    if params.resale < RESALE_VALUE_THRESHOLD:
+        net_price = (
+            params.property_price + params.renovation_cost + params.furniture_cost
+        )
+        return round(net_price * (1 + params.resale / 100) ** horizon)
+    return params.resale
+
+
+def _irr(flows: list[float]) -> float | None:
+    """TRI (%) d'une série de flux annuels, ``None`` s'il n'est pas défini.
+
+    Newton sur ``x = 1/(1+r)`` depuis ``x = 1`` (taux nul), comme le
+    moteur vectorisé : la racine retenue est la plus proche de zéro.
+    """
+    x = 1.0
+    for _ in range(IRR_MAX_ITERATIONS):
+        value = 0.0
+        slope = 0.0
+        for flow in reversed(flows):
+            slope = slope * x + value
+            value = value * x + flow
+        if slope == 0:
+            return None
+        step = value / slope
+        x -= step
+        if x <= 0:
+            return None
+        if abs(step) < IRR_TOLERANCE:
+            return (1 / x - 1) * 100
+    return None
@@ -0,0 +1,53 @@
+"""Préchauffage du processus serveur.
+
+Au démarrage, un thread d'arrière-plan charge le moteur de calcul (pandas,
+numpy_financial) et simule une seule fois le scénario par défaut, via le
+cache de résultats partagé. Les nouvelles sessions, qui démarrent sur ce
+scénario, y trouvent leur résultat au lieu de le recalculer. La table
+d'annuités de l'aperçu du formulaire est construite au passage.
+"""
+
+import threading
+from collections.abc import Callable
+
+from application.params import SimulationParams
+
+
+_lock = threading.Lock()
+_thread: threading.Thread | None = None
+
+
+def start(load_params: Callable[[], SimulationParams]) -> None:
+    """Lance le préchauffage (une seule fois par processus).
+
+    Les appels suivants sont sans effet : la fonction peut être appelée à
+    chaque exécution du script principal. À appeler une fois ``streamlit``
+    importé : Plotly, qu'il charge, inspecte ``sys.modules`` et ne doit
+    pas y trouver un pandas en cours d'import par le thread.
+
+    Args:
+        load_params: Fournit le scénario par défaut ; appelée dans le
+            thread d'arrière-plan.
+    """
+    global _thread
+    if _thread is not None:
+        return
+    with _lock:
+        if _thread is None:
+            _thread = threading.Thread(
+                target=_warm, args=(load_params,), name="prewarm", daemon=True
+            )
+            _thread.start()
+
+
+def _warm(load_params: Callable[[], SimulationParams]) -> None:
+    """Corps du thread : import du moteur puis simulation par défaut."""
+    try:
+        from application.preview import default_annuity_table
+        from application.result_cache import cached_simulation
+
+        default_annuity_table()
+        cached_simulation(load_params())
+    except Exception:
+        # Préchauffage facultatif : les sessions calculeront à la demande.
+        pass
@@ -0,0 +1,381 @@
+"""Cache de résultats partagé par tout le processus serveur.
+
+Remplace les caches ``st.cache_data`` propres à chaque page : un même
+calcul n'est effectué et stocké qu'une fois pour toutes les pages et
+toutes les sessions. Les résultats sont immuables par convention et
+retournés par référence — un succès ne coûte ni copie ni sérialisation.
+
+* taille et budget mémoire bornés, éviction LRU : les résultats que plus
+  aucune session ne consulte sont évincés en premier ;
+* durée de vie (TTL) par entrée ;
+* internement : un résultat évincé mais encore référencé ailleurs (page
+  en cours d'exécution) est retrouvé par référence faible, sans calcul ;
+* calcul unique par clé : des requêtes concurrentes sur la même clé
+  attendent le premier calcul au lieu de le dupliquer ;
+* second niveau facultatif (ex: cache persistant SQLite) consulté avant
+  tout calcul et alimenté après ;
+* compteurs de succès, échecs, évictions et expirations.
+
+Les sessions ne conservent que leurs paramètres : le résultat est résolu
+à chaque affichage depuis ce cache, si bien que la mémoire du serveur ne
+croît pas avec le nombre de sessions.
+"""
+
+import os
+import sys
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import Future
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Protocol
+
+from application import instrumentation
+from application.fingerprint import params_fingerprint
+from application.params import SimulationParams
+
+if TYPE_CHECKING:
+    from application.simulation import SimulationResult
+
+
+ENTRIES_ENV = "LMNP_RESULT_CACHE_ENTRIES"
+TTL_ENV = "LMNP_RESULT_CACHE_TTL_S"
+MAX_MB_ENV = "LMNP_RESULT_CACHE_MAX_MB"
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_TTL_SECONDS = 3600.0
+DEFAULT_MAX_MB = 128
+# Profondeur de parcours de :func:`estimated_size`.
+_SIZE_DEPTH = 6
+_CELL_BYTES = 8
+
+
+class ResultBacking(Protocol):
+    """Second niveau de cache (ex: :class:`~infrastructure.result_store.ResultStore`)."""
+
+    def get(self, key: str) -> Any | None: ...
+
+    def put(self, key: str, value: Any) -> None: ...
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Compteurs d'un cache depuis sa création ou sa dernière remise à zéro.
+
+    Attributes:
+        hits: Résultats servis depuis la mémoire.
+        misses: Résultats absents de la mémoire (second niveau ou calcul).
+        backing_hits: Échecs servis par le second niveau.
+        revivals: Échecs servis par une référence faible (résultat évincé
+            mais encore utilisé).
+        evictions: Entrées évincées (LRU) pour respecter taille ou budget.
+        expirations: Entrées écartées car plus anciennes que le TTL.
+        size: Entrées en mémoire.
+        max_entries: Taille maximale.
+        nbytes: Taille mémoire estimée des entrées (octets).
+        max_bytes: Budget mémoire (octets), ``None`` si illimité.
+    """
+
+    hits: int
+    misses: int
+    backing_hits: int
+    revivals: int
+    evictions: int
+    expirations: int
+    size: int
+    max_entries: int
+    nbytes: int
+    max_bytes: int | None
+
+    @property
+    def hit_rate(self) -> float:
+        """Part des accès servis depuis la mémoire (0 à 1)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ResultCache:
+    """Cache mémoire LRU + TTL, sûr entre threads."""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_bytes: int | None = None,
+        backing: ResultBacking | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sizeof: Callable[[Any], int] | None = None,
+    ) -> None:
+        """Initialise le cache.
+
+        Args:
+            max_entries: Nombre maximal d'entrées en mémoire.
+            ttl_seconds: Durée de vie d'une entrée (s).
+            max_bytes: Budget mémoire (octets) ; ``None`` pour ne borner
+                que le nombre d'entrées.
+            backing: Second niveau consulté avant tout calcul.
+            clock: Horloge (injectable pour les essais).
+            sizeof: Estimation de la taille d'une valeur (défaut :
+                :func:`estimated_size`, calculée une fois à l'insertion).
+
+        Raises:
+            ValueError: Si ``max_entries`` < 1, ``ttl_seconds`` ≤ 0 ou
+                ``max_bytes`` ≤ 0.
+        """
+        if max_entries < 1 or ttl_seconds <= 0:
+            raise ValueError("max_entries ≥ 1 et ttl_seconds > 0 attendus.")
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError("max_bytes > 0 attendu.")
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._backing = backing
+        self._clock = clock
+        self._sizeof = sizeof or estimated_size
+        self._lock = threading.Lock()
+        # clé -> (date d'insertion, valeur, taille estimée)
+        self._entries: OrderedDict[str, tuple[float, Any, int]] = OrderedDict()
+        self._nbytes = 0
+        self._alive: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+        self._in_flight: dict[str, Future] = {}
+        self._reset_counters()
+
+    def set_backing(self, backing: ResultBacking | None) -> None:
+        """Branche (ou retire) le second niveau."""
+        self._backing = backing
+
+    def get(self, key: str) -> Any | None:
+        """Résultat en mémoire pour ``key``, sans calcul ni second niveau."""
+        with self._lock:
+            return self._lookup(key)
+
+    def get_or_compute(self, key: str, compute: Callable[[], Any]) -> Any:
+        """Résultat pour ``key``, calculé au plus une fois à la fois.
+
+        Args:
+            key: Clé canonique du calcul.
+            compute: Calcul à effectuer en cas d'échec des deux niveaux.
+
+        Returns:
+            Résultat partagé (ne pas le modifier).
+        """
+        with self._lock:
+            value = self._lookup(key)
+            if value is not None:
+                self._hits += 1
+                return value
+            self._misses += 1
+            revived = self._alive.get(key)
+            if revived is None:
+                pending = self._in_flight.get(key)
+                owner = pending is None
+                if owner:
+                    pending = self._in_flight[key] = Future()
+        if revived is not None:
+            nbytes = self._size_of(revived)
+            with self._lock:
+                self._revivals += 1
+                self._store(key, revived, nbytes)
+            return revived
+        if not owner:
+            return pending.result()
+        try:
+            value = self._load(key, compute)
+            nbytes = self._size_of(value)
+        except BaseException as exc:
+            with self._lock:
+                del self._in_flight[key]
+            pending.set_exception(exc)
+            raise
+        with self._lock:
+            del self._in_flight[key]
+            self._store(key, value, nbytes)
+        pending.set_result(value)
+        return value
+
+    def stats(self) -> CacheStats:
+        """Instantané des compteurs."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                backing_hits=self._backing_hits,
+                revivals=self._revivals,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                size=len(self._entries),
+                max_entries=self.max_entries,
+                nbytes=self._nbytes,
+                max_bytes=self.max_bytes,
+            )
+
+    def clear(self) -> None:
+        """Vide la mémoire et remet les compteurs à zéro."""
+        with self._lock:
+            self._entries.clear()
+            self._alive.clear()
+            self._nbytes = 0
+            self._reset_counters()
+
+    def _lookup(self, key: str) -> Any | None:
+        """Entrée valide pour ``key`` (verrou tenu), promue en tête LRU."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, value, nbytes = entry
+        if self._clock() - stored_at > self.ttl_seconds:
+            del self._entries[key]
+            self._nbytes -= nbytes
+            self._expirations += 1
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def _store(self, key: str, value: Any, nbytes: int) -> None:
+        """Insère une entrée (verrou tenu) et évince au-delà des bornes.
+
+        L'entrée insérée n'est jamais évincée par sa propre insertion,
+        même si elle dépasse à elle seule le budget.
+        """
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._nbytes -= previous[2]
+        self._entries[key] = (self._clock(), value, nbytes)
+        self._nbytes += nbytes
+        try:
+            self._alive[key] = value
+        except TypeError:
+            pass  # valeur sans référence faible : pas d'internement
+        while len(self._entries) > 1 and (
+            len(self._entries) > self.max_entries
+            or (self.max_bytes is not None and self._nbytes > self.max_bytes)
+        ):
+            _, (_, _, evicted_bytes) = self._entries.popitem(last=False)
+            self._nbytes -= evicted_bytes
+            self._evictions += 1
+
+    def _size_of(self, value: Any) -> int:
+        """Taille estimée d'une valeur (hors verrou), 0 sans budget."""
+        return self._sizeof(value) if self.max_bytes is not None else 0
+
+    def _load(self, key: str, compute: Callable[[], Any]) -> Any:
+        """Second niveau puis calcul (hors verrou)."""
+        backing = self._backing
+        if backing is not None:
+            value = backing.get(key)
+            instrumentation.record_cache("result_store", hit=value is not None)
+            if value is not None:
+                with self._lock:
+                    self._backing_hits += 1
+                return value
+        value = compute()
+        if backing is not None:
+            backing.put(key, value)
+        return value
+
+    def _reset_counters(self) -> None:
+        self._hits = 0
+        self._misses = 0
+        self._backing_hits = 0
+        self._revivals = 0
+        self._evictions = 0
+        self._expirations = 0
+
+
+def estimated_size(value: Any, depth: int = 0) -> int:
+    """Taille mémoire estimée d'une valeur (octets), sans la sérialiser.
+
+    Les tampons (tableaux NumPy, tables Arrow, ``ParamsBatch``…) sont
+    comptés par leur ``nbytes``, les DataFrame à 8 octets par cellule ; une
+    liste ou un tuple est extrapolé depuis son premier élément (les
+    résultats contiennent des listes homogènes de lignes annuelles ou
+    mensuelles) ; les autres objets sont parcourus attribut par attribut.
+
+    Args:
+        value: Valeur à mesurer.
+        depth: Profondeur de parcours (au-delà de ``_SIZE_DEPTH``, seule
+            la taille propre de l'objet est comptée).
+
+    Returns:
+        Estimation en octets.
+    """
+    nbytes = getattr(value, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+    shape = getattr(value, "shape", None)
+    if isinstance(shape, tuple) and len(shape) == 2 and hasattr(value, "columns"):
+        return shape[0] * shape[1] * _CELL_BYTES
+    size = sys.getsizeof(value)
+    if depth >= _SIZE_DEPTH or isinstance(value, (str, bytes, int, float, bool)):
+        return size
+    if isinstance(value, (list, tuple)):
+        if value:
+            size += len(value) * estimated_size(value[0], depth + 1)
+        return size
+    if isinstance(value, dict):
+        items = value.items()
+    else:
+        items = _attributes(value)
+    return size + sum(
+        estimated_size(item, depth + 1) for pair in items for item in pair
+    )
+
+
+def _attributes(value: Any) -> list[tuple[str, Any]]:
+    """Attributs d'instance (``__dict__`` et ``__slots__``)."""
+    attributes = list(getattr(value, "__dict__", {}).items())
+    for cls in type(value).__mro__:
+        for name in getattr(cls, "__slots__", ()):
+            if hasattr(value, name):
+                attributes.append((name, getattr(value, name)))
+    return attributes
+
+
+@lru_cache(maxsize=1)
+def shared_result_cache() -> ResultCache:
+    """Cache de résultats du processus.
+
+    Taille : ``$LMNP_RESULT_CACHE_ENTRIES`` (défaut 256) ; budget
+    mémoire : ``$LMNP_RESULT_CACHE_MAX_MB`` (défaut 128 Mo) ; durée de vie :
+    ``$LMNP_RESULT_CACHE_TTL_S`` (défaut 1 h).
+    """
+    return ResultCache(
+        max_entries=int(os.environ.get(ENTRIES_ENV, DEFAULT_MAX_ENTRIES)),
+        ttl_seconds=float(os.environ.get(TTL_ENV, DEFAULT_TTL_SECONDS)),
+        max_bytes=int(
+            float(os.environ.get(MAX_MB_ENV, DEFAULT_MAX_MB)) * 1024 * 1024
+        ),
+    )
+
+
+def cached_simulation(
+    params: SimulationParams, cache: ResultCache | None = None
+) -> "SimulationResult":
+    """Simulation résolue depuis le cache partagé.
+
+    Le cache est indexé par l'empreinte canonique du calcul : des
+    paramètres de même économie partagent un résultat, qui est alors
+    rattaché à ``params`` par une copie superficielle
+    (:meth:`~application.simulation.SimulationResult.with_params`).
+
+    Args:
+        params: Paramètres d'entrée.
+        cache: Cache à utiliser (défaut : ``shared_result_cache()``).
+
+    Returns:
+        Résultat de simulation, à ne pas modifier.
+    """
+    from application.simulation import LMNPSimulation
+
+    def compute() -> "SimulationResult":
+        instrumentation.mark_cache_miss()
+        return LMNPSimulation().run(params)
+
+    cache = cache or shared_result_cache()
+    with instrumentation.cache_lookup("simulation.run"):
+        result = cache.get_or_compute(params_fingerprint(params), compute)
+    if result.params == params:
+        return result
+    return result.with_params(params)
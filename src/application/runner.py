@@ -0,0 +1,172 @@
+"""Exécution de lots de scénarios hors interface (scripts, tâches planifiées).
+
+Trois moteurs produisent les mêmes indicateurs de synthèse :
+
+* ``scalar`` : :class:`~application.simulation.LMNPSimulation`, scénario par
+  scénario (référence) ;
+* ``batched`` : :class:`~application.batch.BatchSimulation`, un paquet à la
+  fois dans le processus courant ;
+* ``multiprocess`` : le moteur vectorisé réparti sur plusieurs processus,
+  un paquet par tâche, l'ordre des paquets étant conservé.
+
+Les indicateurs sont avant impôts ; le tableau fiscal n'est pas calculé.
+Un échec du moteur sur un paquet ne l'interrompt pas : le paquet est
+coupé en deux jusqu'à isoler les scénarios fautifs, signalés dans la
+colonne ``ERROR_COLUMN``.
+"""
+
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from application.batch import BatchSimulation
+from application.params_batch import ParamsBatch
+from application.simulation import LMNPSimulation, SimulationResult
+
+
+ENGINES = ("scalar", "batched", "multiprocess")
+SUMMARY_COLUMNS = (
+    "total_cost",
+    "loan_amount",
+    "monthly_payment",
+    "effective_loan_rate",
+    "resolved_annual_expenses",
+    "first_year_cashflow",
+    "npv_value",
+    "irr_value",
+    "wealth_growth",
+)
+ERROR_COLUMN = "error"
+# Paquets soumis d'avance par processus : occupe les processus sans
+# accumuler de paquets en mémoire.
+TASKS_PER_WORKER = 2
+
+
+class ScenarioRunner:
+    """Évalue des paquets de scénarios avec le moteur choisi."""
+
+    def __init__(self, engine: str = "batched", workers: int = 1) -> None:
+        """Initialise l'exécution.
+
+        Args:
+            engine: ``"scalar"``, ``"batched"`` ou ``"multiprocess"``.
+            workers: Nombre de processus du moteur ``multiprocess``.
+
+        Raises:
+            ValueError: Si le moteur est inconnu ou ``workers`` < 1.
+        """
+        if engine not in ENGINES:
+            raise ValueError(f"Moteur inconnu : {engine!r}")
+        if workers < 1:
+            raise ValueError("Il faut au moins un processus.")
+        self.engine = engine
+        self.workers = workers
+
+    def run(self, batches: Iterable[ParamsBatch]) -> Iterator[pd.DataFrame]:
+        """Évalue chaque paquet et produit ses indicateurs, dans l'ordre.
+
+        Args:
+            batches: Paquets de scénarios (éventuellement vides).
+
+        Yields:
+            Une table par paquet, colonnes ``SUMMARY_COLUMNS`` puis
+            ``ERROR_COLUMN`` : motif de l'échec du calcul d'un scénario
+            (indicateurs ``NaN``), ``None`` s'il a été évalué.
+        """
+        if self.engine == "multiprocess":
+            yield from self._run_pool(batches)
+            return
+        evaluate = summarize_scalar if self.engine == "scalar" else summarize_batched
+        for batch in batches:
+            yield evaluate(batch)
+
+    def _run_pool(self, batches: Iterable[ParamsBatch]) -> Iterator[pd.DataFrame]:
+        """Répartit les paquets sur un pool de processus, en flux."""
+        pending: deque[Future] = deque()
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            for batch in batches:
+                pending.append(pool.submit(summarize_batched, batch))
+                if len(pending) >= self.workers * TASKS_PER_WORKER:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+
+def summarize_batched(batch: ParamsBatch) -> pd.DataFrame:
+    """Indicateurs de synthèse d'un paquet avec le moteur vectorisé."""
+    return _isolate_failures(_batched_summary, batch)
+
+
+def summarize_scalar(batch: ParamsBatch) -> pd.DataFrame:
+    """Indicateurs de synthèse d'un paquet avec le moteur scalaire."""
+    return _isolate_failures(_scalar_summary, batch)
+
+
+def _isolate_failures(
+    evaluate: Callable[[ParamsBatch], pd.DataFrame], batch: ParamsBatch
+) -> pd.DataFrame:
+    """Évalue un paquet ; en cas d'échec, évalue séparément ses deux moitiés.
+
+    La recherche s'arrête aux scénarios isolés en échec, dont les
+    indicateurs restent ``NaN`` et la colonne ``ERROR_COLUMN`` porte le
+    motif : les autres scénarios du paquet sont évalués normalement.
+    """
+    if not len(batch):
+        return _empty_summary()
+    try:
+        summary = evaluate(batch)
+    except Exception as exc:
+        if len(batch) == 1:
+            summary = pd.DataFrame({name: [np.nan] for name in SUMMARY_COLUMNS})
+            summary[ERROR_COLUMN] = str(exc) or type(exc).__name__
+            return summary
+        middle = len(batch) // 2
+        return pd.concat(
+            [
+                _isolate_failures(evaluate, batch.slice(0, middle)),
+                _isolate_failures(evaluate, batch.slice(middle, len(batch))),
+            ],
+            ignore_index=True,
+        )
+    summary[ERROR_COLUMN] = None
+    return summary
+
+
+def _batched_summary(batch: ParamsBatch) -> pd.DataFrame:
+    """Indicateurs d'un paquet non vide, moteur vectorisé."""
+    result = BatchSimulation().run(batch, with_taxation=False)
+    return pd.DataFrame({name: getattr(result, name) for name in SUMMARY_COLUMNS})
+
+
+def _scalar_summary(batch: ParamsBatch) -> pd.DataFrame:
+    """Indicateurs d'un paquet non vide, moteur scalaire."""
+    simulation = LMNPSimulation()
+    rows = [_scalar_row(simulation.run(params)) for params in batch]
+    return pd.DataFrame(rows, columns=list(SUMMARY_COLUMNS))
+
+
+def _scalar_row(result: SimulationResult) -> tuple[float, ...]:
+    """Indicateurs de synthèse d'un résultat scalaire."""
+    cashflow = result.cashflow["Cashflow (€)"].to_numpy()
+    first_year = 1 if result.params.start_month > 1 else 0
+    return (
+        result.total_cost,
+        result.loan_amount,
+        result.loan_monthly_schedule[0].payment,
+        result.effective_loan_rate,
+        result.resolved_annual_expenses,
+        float(cashflow[first_year]),
+        result.npv_value,
+        result.irr_value,
+        result.wealth_growth,
+    )
+
+
+def _empty_summary() -> pd.DataFrame:
+    """Table de synthèse sans ligne."""
+    summary = pd.DataFrame({name: np.empty(0) for name in SUMMARY_COLUMNS})
+    summary[ERROR_COLUMN] = pd.Series(dtype=object)
+    return summary
@@ -0,0 +1,261 @@
+"""Analyse de sensibilité « tornado » autour d'un scénario de base.
+
+Chaque champ numérique est perturbé à la baisse puis à la hausse ; les
+``2 × k`` scénarios et la base sont évalués en un seul lot par
+:class:`~application.batch.BatchSimulation`, qui ne recalcule l'emprunt et
+l'amortissement que pour les perturbations qui les modifient.
+"""
+
+import dataclasses
+from dataclasses import dataclass
+
+from application.batch import BatchSimulation
+from application.params import SimulationParams
+from application.simulation import (
+    FEE_AMOUNT_THRESHOLD,
+    RESALE_VALUE_THRESHOLD,
+    LMNPSimulation,
+)
+
+
+DEFAULT_RELATIVE_STEP = 0.10
+# Pas absolus par défaut des champs pour lesquels un pas relatif n'a pas de
+# sens (durée de prêt discrète).
+DEFAULT_ABSOLUTE_STEPS: dict[str, float] = {"loan_duration": 5}
+MIN_LOAN_DURATION = 1
+# Plancher du taux nominal perturbé (%) : à 0, le moteur repasserait en
+# mode TAEG et la barre mesurerait un changement de mode, pas de taux.
+MIN_NOMINAL_RATE = 0.01
+
+SENSITIVITY_FIELDS: dict[str, str] = {
+    "property_price": "Prix d'achat",
+    "agency_fee_rate": "Frais d'agence",
+    "notary_fee_rate": "Frais de notaire",
+    "renovation_cost": "Travaux",
+    "furniture_cost": "Mobilier",
+    "monthly_rent": "Loyer",
+    "rent_increase_rate": "Augmentation du loyer",
+    "loan_rate": "Taux d'emprunt",
+    "loan_insurance_rate": "Taux d'assurance",
+    "loan_duration": "Durée du prêt",
+    "annual_expenses": "Charges",
+    "resale": "Revente",
+    "down_payment": "Apport",
+}
+RANK_METRICS = ("irr", "npv", "cashflow")
+
+# Champs dont une valeur < seuil est un pourcentage et ≥ seuil un montant :
+# la perturbation ne doit pas faire basculer d'une interprétation à l'autre.
+_THRESHOLD_FIELDS = {
+    "agency_fee_rate": FEE_AMOUNT_THRESHOLD,
+    "notary_fee_rate": FEE_AMOUNT_THRESHOLD,
+    "resale": RESALE_VALUE_THRESHOLD,
+}
+# Champs pour lesquels une valeur négative a un sens (baisse des loyers ou
+# du prix de revente) : les autres sont bornés à zéro.
+_SIGNED_FIELDS = ("rent_increase_rate", "resale")
+_DETAILED_EXPENSE_FIELDS = (
+    "pno_insurance",
+    "gli_insurance",
+    "agency_management_fee",
+    "property_tax",
+    "condo_fees",
+    "accounting_fee",
+)
+
+
+@dataclass(frozen=True)
+class SensitivityBar:
+    """Effet d'un champ perturbé à la baisse et à la hausse.
+
+    Les deltas sont exprimés par rapport au scénario de base.
+
+    Attributes:
+        field: Nom du champ de ``SimulationParams`` (ou champ virtuel).
+        label: Libellé pour l'affichage.
+        base_value: Valeur de base du champ.
+        low_value: Valeur après perturbation à la baisse.
+        high_value: Valeur après perturbation à la hausse.
+        irr_low: Delta de TRI (points de %) à la baisse.
+        irr_high: Delta de TRI (points de %) à la hausse.
+        npv_low: Delta de VAN (€) à la baisse.
+        npv_high: Delta de VAN (€) à la hausse.
+        cashflow_low: Delta de cashflow de première année pleine (€).
+        cashflow_high: Delta de cashflow de première année pleine (€).
+    """
+
+    field: str
+    label: str
+    base_value: float
+    low_value: float
+    high_value: float
+    irr_low: float
+    irr_high: float
+    npv_low: float
+    npv_high: float
+    cashflow_low: float
+    cashflow_high: float
+
+    def swing(self, metric: str = "irr") -> float:
+        """Amplitude de la barre (écart entre hausse et baisse).
+
+        Args:
+            metric: ``"irr"``, ``"npv"`` ou ``"cashflow"``.
+
+        Returns:
+            Amplitude absolue.
+        """
+        return abs(getattr(self, f"{metric}_high") - getattr(self, f"{metric}_low"))
+
+
+@dataclass(frozen=True)
+class TornadoResult:
+    """Résultat d'une analyse tornado.
+
+    Attributes:
+        base_irr: TRI du scénario de base (%).
+        base_npv: VAN du scénario de base (€).
+        base_cashflow: Cashflow annuel de première année pleine (€).
+        bars: Barres triées par amplitude décroissante.
+    """
+
+    base_irr: float
+    base_npv: float
+    base_cashflow: float
+    bars: list[SensitivityBar]
+
+
+def tornado(
+    base: SimulationParams,
+    fields: list[str] | None = None,
+    relative_step: float = DEFAULT_RELATIVE_STEP,
+    absolute_steps: dict[str, float] | None = None,
+    rank_by: str = "irr",
+    engine: BatchSimulation | None = None,
+) -> TornadoResult:
+    """Mesure l'effet de chaque champ sur le TRI, la VAN et le cashflow.
+
+    Le champ ``loan_rate`` désigne le taux effectivement saisi : le taux
+    nominal si ``loan_nominal_rate > 0``, sinon le TAEG. Le champ
+    ``annual_expenses`` désigne le total annuel résolu, que les charges
+    soient saisies globalement ou en détail.
+
+    Args:
+        base: Scénario de base.
+        fields: Champs à perturber (défaut : ``SENSITIVITY_FIELDS``).
+        relative_step: Pas relatif appliqué par défaut (0,10 = ±10 %).
+        absolute_steps: Pas absolus par champ, prioritaires sur le pas
+            relatif (défaut : ``DEFAULT_ABSOLUTE_STEPS``).
+        rank_by: Indicateur de tri des barres (``"irr"``, ``"npv"`` ou
+            ``"cashflow"``).
+        engine: Moteur vectorisé à utiliser.
+
+    Returns:
+        Indicateurs de base et barres classées.
+
+    Raises:
+        ValueError: Si un champ ou l'indicateur de tri est inconnu.
+    """
+    fields = list(SENSITIVITY_FIELDS) if fields is None else fields
+    unknown = [f for f in fields if f not in SENSITIVITY_FIELDS]
+    if unknown:
+        raise ValueError(f"Champs non perturbables : {', '.join(unknown)}")
+    if rank_by not in RANK_METRICS:
+        raise ValueError(f"Indicateur de tri inconnu : {rank_by!r}")
+    steps = DEFAULT_ABSOLUTE_STEPS if absolute_steps is None else absolute_steps
+
+    resolved = dict(LMNPSimulation().computation_key(base))
+    scenarios = [base]
+    values: list[tuple[float, float, float]] = []
+    for field in fields:
+        base_value = _field_value(base, field, resolved)
+        delta = steps.get(field, abs(base_value) * relative_step)
+        floor = _floor(base, field)
+        low = _clamp(field, base_value, base_value - delta, floor)
+        high = _clamp(field, base_value, base_value + delta, floor)
+        scenarios.append(_with_value(base, field, low))
+        scenarios.append(_with_value(base, field, high))
+        values.append((base_value, low, high))
+
+    batch = (engine or BatchSimulation()).run(scenarios, with_taxation=False)
+    irr = batch.irr_value
+    npv = batch.npv_value
+    cashflow = batch.first_year_cashflow
+
+    bars = []
+    for k, (field, (base_value, low, high)) in enumerate(zip(fields, values)):
+        lo, hi = 1 + 2 * k, 2 + 2 * k
+        bars.append(
+            SensitivityBar(
+                field=field,
+                label=SENSITIVITY_FIELDS[field],
+                base_value=base_value,
+                low_value=low,
+                high_value=high,
+                irr_low=float(irr[lo] - irr[0]),
+                irr_high=float(irr[hi] - irr[0]),
+                npv_low=float(npv[lo] - npv[0]),
+                npv_high=float(npv[hi] - npv[0]),
+                cashflow_low=float(cashflow[lo] - cashflow[0]),
+                cashflow_high=float(cashflow[hi] - cashflow[0]),
+            )
+        )
+    bars.sort(key=lambda b: b.swing(rank_by), reverse=True)
+    return TornadoResult(
+        base_irr=float(irr[0]),
+        base_npv=float(npv[0]),
+        base_cashflow=float(cashflow[0]),
+        bars=bars,
+    )
+
+
+def _field_value(
+    params: SimulationParams, field: str, resolved: dict[str, float]
+) -> float:
+    """Valeur de base d'un champ, champs virtuels résolus."""
+    if field == "loan_rate" and params.loan_nominal_rate > 0:
+        return params.loan_nominal_rate
+    if field == "annual_expenses":
+        return resolved["annual_expenses"]
+    return float(getattr(params, field))
+
+
+def _floor(params: SimulationParams, field: str) -> float:
+    """Plus petite valeur admise d'un champ non signé."""
+    if field == "loan_rate" and params.loan_nominal_rate > 0:
+        return MIN_NOMINAL_RATE
+    return 0.0
+
+
+def _clamp(
+    field: str, base_value: float, value: float, floor: float = 0.0
+) -> float:
+    """Borne une valeur perturbée à un domaine valide pour le champ."""
+    if field == "loan_duration":
+        return float(max(MIN_LOAN_DURATION, round(value)))
+    if field not in _SIGNED_FIELDS:
+        value = max(floor, value)
+    threshold = _THRESHOLD_FIELDS.get(field)
+    if threshold is not None:
+        # Reste du même côté du seuil que la base : un pourcentage ne
+        # bascule pas en montant fixe, ni l'inverse.
+        if base_value < threshold:
+            value = min(value, threshold - 0.01)
+        else:
+            value = max(value, float(threshold))
+    return value
+
+
+def _with_value(
+    params: SimulationParams, field: str, value: float
+) -> SimulationParams:
+    """Copie de ``params`` avec le champ (éventuellement virtuel) modifié."""
+    if field == "loan_rate" and params.loan_nominal_rate > 0:
+        return dataclasses.replace(params, loan_nominal_rate=value)
+    if field == "annual_expenses":
+        # Bascule en saisie globale pour appliquer le nouveau total.
+        detailed = {name: 0.0 for name in _DETAILED_EXPENSE_FIELDS}
+        return dataclasses.replace(params, annual_expenses=value, **detailed)
+    if field == "loan_duration":
+        return dataclasses.replace(params, loan_duration=int(value))
+    return dataclasses.replace(params, **{field: value})
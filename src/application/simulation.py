@@ -1,27 +1,51 @@
 """Cas d'usage principal : orchestration complète d'une simulation LMNP."""
 
+import dataclasses
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass
+from functools import cached_property
+from itertools import islice, tee
+from typing import TYPE_CHECKING
 
-import pandas as pd
-from numpy_financial import irr, npv
-
+from application import instrumentation
 from application.params import SimulationParams
+from application.tables import entries_table, frame_table
 from domain.depreciation import Depreciation
 from domain.loan import AmortizationEntry, Loan
 from domain.rental import Rental, YearlyRentalFlow
 from domain.taxation import Taxation, TaxationEntry
 
-
+# pandas et numpy_financial sont importés au premier calcul et non au
+# chargement du module : les pages qui n'ont besoin que des paramètres ou
+# de la clé de calcul ne chargent pas la pile numérique.
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+
+# Version du moteur de calcul : à incrémenter à chaque changement de règle
+# ou de structure de résultat, pour invalider les caches persistants.
+# 2 : ``SimulationParams`` slottée, dont le pickle n'est plus un ``__dict__``.
+ENGINE_VERSION = "2"
 SIMULATION_DURATION_YEARS = 30
 DEFAULT_DISCOUNT_RATE = 0.05
 DEFAULT_RESALE_HORIZON = 10
 RESALE_VALUE_THRESHOLD = 100
 FEE_AMOUNT_THRESHOLD = 100
+# Précision des montants résolus dans la clé de calcul : absorbe le bruit
+# flottant (8 % de 100 000 € == 8 000 €) sans effet sur les résultats.
+KEY_DECIMALS = 6
 PERIOD_MULTIPLIERS: dict[str, int] = {
     "mensuel": 12,
     "trimestriel": 4,
     "annuel": 1,
 }
+# Tableaux colonnaires dérivés, construits à la demande et non persistés.
+TABLE_ATTRIBUTES = (
+    "loan_monthly_table",
+    "loan_annual_table",
+    "taxation_table",
+    "cashflow_table",
+)
 
 
 @dataclass(frozen=True)
@@ -54,7 +78,7 @@ class SimulationResult:
     loan_annual_schedule: list[AmortizationEntry]
     rental_flows: list[YearlyRentalFlow]
     taxation_entries: list[TaxationEntry]
-    cashflow: pd.DataFrame
+    cashflow: "pd.DataFrame"
     npv_value: float
     irr_value: float
     wealth_growth: float
@@ -91,14 +115,117 @@ class SimulationResult:
         """
         if self.params.loan_nominal_rate == 0:
             return self.params.loan_rate
-        net_received = (
-            self.loan_amount
-            - self.params.guarantee_fee
-            - self.params.dossier_fee
-        )
-        monthly_payment = self.loan_monthly_schedule[0].payment
-        flows = [net_received] + [-monthly_payment] * len(self.loan_monthly_schedule)
-        return float(irr(flows)) * 12 * 100
+        with instrumentation.stage("result.effective_taeg"):
+            net_received = (
+                self.loan_amount
+                - self.params.guarantee_fee
+                - self.params.dossier_fee
+            )
+            monthly_payment = self.loan_monthly_schedule[0].payment
+            flows = [net_received] + [-monthly_payment] * len(
+                self.loan_monthly_schedule
+            )
+            from numpy_financial import irr
+
+            return float(irr(flows)) * 12 * 100
+
+    @cached_property
+    def loan_monthly_table(self) -> "pa.Table":
+        """Tableau d'amortissement mensuel en colonnes Arrow."""
+        return entries_table(self.loan_monthly_schedule, AmortizationEntry)
+
+    @cached_property
+    def loan_annual_table(self) -> "pa.Table":
+        """Tableau d'amortissement annuel en colonnes Arrow."""
+        return entries_table(self.loan_annual_schedule, AmortizationEntry)
+
+    @cached_property
+    def taxation_table(self) -> "pa.Table":
+        """Tableau fiscal annuel en colonnes Arrow."""
+        return entries_table(self.taxation_entries, TaxationEntry)
+
+    @cached_property
+    def cashflow_table(self) -> "pa.Table":
+        """Tableau de cashflow annuel en colonnes Arrow."""
+        return frame_table(self.cashflow)
+
+    def with_params(self, params: SimulationParams) -> "SimulationResult":
+        """Copie superficielle du résultat rattachée à ``params``.
+
+        Les tableaux colonnaires sont construits au besoin sur ce résultat
+        puis partagés avec la copie, qui n'a donc rien à reconstruire.
+
+        Args:
+            params: Paramètres de même empreinte de calcul.
+
+        Returns:
+            Résultat partageant listes, DataFrame et tables avec ``self``.
+        """
+        result = dataclasses.replace(self, params=params)
+        for name in TABLE_ATTRIBUTES:
+            result.__dict__[name] = getattr(self, name)
+        return result
+
+    def __getstate__(self) -> dict:
+        """État sérialisé, sans les tableaux colonnaires dérivés."""
+        return {
+            k: v for k, v in self.__dict__.items() if k not in TABLE_ATTRIBUTES
+        }
+
+
+@dataclass(frozen=True)
+class SimulationYear:
+    """État complet d'une année, produit par :meth:`LMNPSimulation.iter_years`.
+
+    Attributes:
+        year: Année (1-indexée).
+        rental: Flux locatifs de l'année.
+        loan: Agrégat annuel de l'emprunt, ``None`` une fois le prêt soldé.
+        depreciation: Dotation aux amortissements de l'année (€).
+        taxation: Ligne fiscale de l'année, stocks reportés inclus.
+        annuity: Annuité d'emprunt, assurance décès incluse (€).
+        cashflow: Cashflow de l'année (€).
+        cumulative_cashflow: Cashflow cumulé depuis l'année 1 (€).
+        cumulative_wealth: Enrichissement cumulé (capital remboursé et
+            cashflow) depuis l'année 1 (€).
+    """
+
+    year: int
+    rental: YearlyRentalFlow
+    loan: AmortizationEntry | None
+    depreciation: float
+    taxation: TaxationEntry
+    annuity: float
+    cashflow: float
+    cumulative_cashflow: float
+    cumulative_wealth: float
+
+
+@dataclass(frozen=True)
+class SimulationModel:
+    """Entités domaine d'une simulation, résolues depuis les paramètres.
+
+    Attributes:
+        total_cost: Coût total d'acquisition (€).
+        loan_amount: Montant emprunté (€).
+        loan_rate: Taux effectif annuel de l'emprunt (décimal).
+        loan: Entité emprunt.
+        rental: Entité location (charges résolues).
+        depreciation: Plan d'amortissement.
+        taxation: Calcul fiscal (frais d'acquisition déductibles résolus).
+        resolved_expenses: Charges annuelles effectives (€).
+        death_insurance_annual: Coût annuel de l'assurance décès (€).
+    """
+
+    total_cost: float
+    loan_amount: float
+    loan_rate: float
+    loan: Loan
+    rental: Rental
+    depreciation: Depreciation
+    taxation: Taxation
+    resolved_expenses: float
+    death_insurance_annual: float
 
 
 class LMNPSimulation:
@@ -130,6 +257,97 @@ class LMNPSimulation:
         Returns:
             Résultat agrégé de la simulation.
         """
+        with instrumentation.stage("simulation.run"):
+            return self._run(params)
+
+    def iter_years(self, params: SimulationParams) -> Iterator[SimulationYear]:
+        """Produit la simulation année par année, sur l'horizon de projection.
+
+        Chaque année est calculée au moment où elle est demandée, mêmes
+        règles et mêmes valeurs que :meth:`run` : l'appelant qui cherche un
+        seuil (cashflow cumulé positif, stock de déficits épuisé…) peut
+        s'arrêter dès qu'il est atteint, sans calculer les années
+        suivantes ni les indicateurs de revente.
+
+        Args:
+            params: Paramètres d'entrée utilisateur.
+
+        Yields:
+            État de chaque année, de 1 à l'horizon de projection.
+        """
+        model = self.model(params)
+        start_month = params.start_month
+        loan_years = model.loan.iter_annual(start_month)
+        inputs, fiscal_inputs = tee(
+            (flow, next(loan_years, None), depreciation)
+            for flow, depreciation in zip(
+                islice(model.rental.iter_flows(start_month), self._duration),
+                model.depreciation.iter_schedule(start_month),
+            )
+        )
+        fiscal_years = model.taxation.iter_entries(
+            (flow.income, flow.expenses, entry.interest if entry else 0.0, amount)
+            for flow, entry, amount in fiscal_inputs
+        )
+        first_year_death = model.death_insurance_annual * (13 - start_month) / 12
+        cumulative_cashflow = 0.0
+        cumulative_wealth = 0.0
+        for (flow, entry, amount), taxation in zip(inputs, fiscal_years):
+            annuity = 0.0
+            principal = 0.0
+            if entry is not None:
+                death = (
+                    first_year_death
+                    if flow.year == 1
+                    else model.death_insurance_annual
+                )
+                annuity = entry.payment + death
+                principal = entry.principal
+            cashflow = flow.income - flow.expenses - annuity
+            cumulative_cashflow += cashflow
+            cumulative_wealth += principal + cashflow
+            yield SimulationYear(
+                year=flow.year,
+                rental=flow,
+                loan=entry,
+                depreciation=amount,
+                taxation=taxation,
+                annuity=annuity,
+                cashflow=cashflow,
+                cumulative_cashflow=cumulative_cashflow,
+                cumulative_wealth=cumulative_wealth,
+            )
+
+    def first_year(
+        self,
+        params: SimulationParams,
+        condition: Callable[[SimulationYear], bool],
+    ) -> SimulationYear | None:
+        """Première année vérifiant ``condition``, sans calculer les suivantes.
+
+        Exemple : ``first_year(params, lambda y: y.cumulative_cashflow > 0)``.
+
+        Args:
+            params: Paramètres d'entrée utilisateur.
+            condition: Critère évalué sur l'état de chaque année.
+
+        Returns:
+            État de la première année vérifiant le critère, ou ``None`` s'il
+            n'est jamais atteint sur l'horizon de projection.
+        """
+        return next(filter(condition, self.iter_years(params)), None)
+
+    def model(self, params: SimulationParams) -> SimulationModel:
+        """Résout frais, taux et charges puis construit les entités domaine.
+
+        Aucun échéancier n'est calculé : le coût est négligeable.
+
+        Args:
+            params: Paramètres d'entrée utilisateur.
+
+        Returns:
+            Montants résolus et entités de la simulation.
+        """
         agency_fee = self._resolve_fee_amount(
             params.agency_fee_rate, params.property_price
         )
@@ -137,56 +355,136 @@ class LMNPSimulation:
             params.notary_fee_rate, params.property_price
         )
         loan_rate = self._resolve_loan_rate(params)
-        rent_increase = params.rent_increase_rate / 100
-
         total_cost = self._compute_total_cost(params, agency_fee, notary_fee)
         loan_amount = total_cost - params.down_payment
-
-        loan = Loan(
-            amount=loan_amount,
-            duration_years=params.loan_duration,
-            annual_rate=loan_rate,
-        )
-        monthly_schedule = loan.monthly_schedule()
-        annual_schedule = loan.annual_schedule(params.start_month)
-
-        death_insurance_annual = params.death_insurance_monthly * 12
         resolved_expenses = self._resolve_annual_expenses(params)
-        rental = Rental(
-            monthly_rent=params.monthly_rent,
-            annual_expenses=resolved_expenses,
-            rent_increase_rate=rent_increase,
-        )
-        rental_flows = rental.projected_flows(self._duration, params.start_month)
-
         total_acquisition_fees = agency_fee + notary_fee + params.broker_fee
         amortise_fees = params.acquisition_fees_treatment == "amortissement"
+        return SimulationModel(
+            total_cost=total_cost,
+            loan_amount=loan_amount,
+            loan_rate=loan_rate,
+            loan=Loan(
+                amount=loan_amount,
+                duration_years=params.loan_duration,
+                annual_rate=loan_rate,
+            ),
+            rental=Rental(
+                monthly_rent=params.monthly_rent,
+                annual_expenses=resolved_expenses,
+                rent_increase_rate=params.rent_increase_rate / 100,
+            ),
+            depreciation=Depreciation(
+                property_value=params.property_price,
+                furniture_cost=params.furniture_cost,
+                acquisition_fees=total_acquisition_fees if amortise_fees else 0.0,
+            ),
+            taxation=Taxation(
+                acquisition_fees_deductible=(
+                    0.0 if amortise_fees else total_acquisition_fees
+                ),
+            ),
+            resolved_expenses=resolved_expenses,
+            death_insurance_annual=params.death_insurance_monthly * 12,
+        )
+
+    def computation_key(
+        self, params: SimulationParams
+    ) -> tuple[tuple[str, float | int | bool], ...]:
+        """Clé canonique des seules entrées qui influencent les résultats.
+
+        Les frais, le taux et les charges sont résolus comme dans :meth:`run`
+        (``_resolve_fee_amount``, ``_resolve_loan_rate``,
+        ``_resolve_annual_expenses``). Les champs de présentation
+        (``property_type``, ``city``, ``surface``, ``dpe``), le détail des
+        charges aboutissant au même total et ``loan_rate`` lorsque le taux
+        nominal est saisi n'y figurent donc pas : deux annonces de même
+        économie partagent la même clé. La configuration du moteur (durée,
+        taux d'actualisation) en fait partie.
+
+        Args:
+            params: Paramètres d'entrée utilisateur.
 
-        depreciation = Depreciation(
-            property_value=params.property_price,
-            furniture_cost=params.furniture_cost,
-            acquisition_fees=total_acquisition_fees if amortise_fees else 0.0,
+        Returns:
+            Tuple trié de paires (nom, valeur), hashable.
+        """
+        agency_fee = self._resolve_fee_amount(
+            params.agency_fee_rate, params.property_price
+        )
+        notary_fee = self._resolve_fee_amount(
+            params.notary_fee_rate, params.property_price
         )
-        depreciation_schedule = depreciation.annual_schedule(
-            self._duration, params.start_month
+        use_nominal = params.loan_nominal_rate > 0
+        amounts = {
+            "property_price": params.property_price,
+            "agency_fee": agency_fee,
+            "notary_fee": notary_fee,
+            "renovation_cost": params.renovation_cost,
+            "furniture_cost": params.furniture_cost,
+            "broker_fee": params.broker_fee,
+            # Frais de garantie et de dossier : TAEG reconstitué en mode nominal.
+            "guarantee_fee": params.guarantee_fee,
+            "dossier_fee": params.dossier_fee,
+            "down_payment": params.down_payment,
+            "loan_rate": self._resolve_loan_rate(params),
+            "monthly_rent": params.monthly_rent,
+            "annual_expenses": self._resolve_annual_expenses(params),
+            "rent_increase_rate": params.rent_increase_rate,
+            "resale": params.resale,
+            "death_insurance_monthly": params.death_insurance_monthly,
+            "discount_rate": self._discount_rate,
+        }
+        key: dict[str, float | int | bool] = {
+            name: round(float(value), KEY_DECIMALS) for name, value in amounts.items()
+        }
+        key.update(
+            loan_nominal_mode=use_nominal,
+            loan_duration=int(params.loan_duration),
+            start_month=int(params.start_month),
+            resale_horizon=int(params.resale_horizon),
+            amortise_fees=params.acquisition_fees_treatment == "amortissement",
+            duration_years=self._duration,
         )
+        return tuple(sorted(key.items()))
+
+    def _run(self, params: SimulationParams) -> SimulationResult:
+        """Corps de :meth:`run`, découpé en étapes instrumentées."""
+        with instrumentation.stage("simulation.fees"):
+            model = self.model(params)
+        loan = model.loan
+        with instrumentation.stage("loan.monthly_schedule"):
+            monthly_schedule = loan.monthly_schedule()
+        with instrumentation.stage("loan.annual_schedule"):
+            annual_schedule = loan.annual_schedule(params.start_month)
+
+        death_insurance_annual = model.death_insurance_annual
+        with instrumentation.stage("rental.projected_flows"):
+            rental_flows = model.rental.projected_flows(
+                self._duration, params.start_month
+            )
+        with instrumentation.stage("depreciation.annual_schedule"):
+            depreciation_schedule = model.depreciation.annual_schedule(
+                self._duration, params.start_month
+            )
 
-        taxation = Taxation(
-            acquisition_fees_deductible=0.0 if amortise_fees else total_acquisition_fees,
-        )
         loan_interests = self._pad_to_duration(
             [e.interest for e in annual_schedule]
         )
-        taxation_entries = taxation.compute(
-            incomes=[f.income for f in rental_flows],
-            expenses=[f.expenses for f in rental_flows],
-            loan_interests=loan_interests,
-            depreciations=depreciation_schedule,
-        )
+        with instrumentation.stage("taxation.compute"):
+            taxation_entries = model.taxation.compute(
+                incomes=[f.income for f in rental_flows],
+                expenses=[f.expenses for f in rental_flows],
+                loan_interests=loan_interests,
+                depreciations=depreciation_schedule,
+            )
 
-        cashflow_df = self._build_cashflow_frame(
-            rental_flows, annual_schedule, death_insurance_annual, params.start_month
-        )
+        with instrumentation.stage("simulation.cashflow_frame"):
+            cashflow_df = self._build_cashflow_frame(
+                rental_flows,
+                annual_schedule,
+                death_insurance_annual,
+                params.start_month,
+            )
 
         resale_horizon = params.resale_horizon
         resale_value = self._compute_resale_value(params, resale_horizon)
@@ -200,22 +498,28 @@ class LMNPSimulation:
             remaining_balance,
             resale_horizon,
         )
+        from numpy_financial import irr, npv
+
+        with instrumentation.stage("simulation.npv"):
+            npv_value = float(npv(self._discount_rate, discounted_flows))
+        with instrumentation.stage("simulation.irr"):
+            irr_value = float(irr(discounted_flows) * 100)
 
         return SimulationResult(
             params=params,
-            total_cost=total_cost,
-            loan_amount=loan_amount,
+            total_cost=model.total_cost,
+            loan_amount=model.loan_amount,
             loan=loan,
             loan_monthly_schedule=monthly_schedule,
             loan_annual_schedule=annual_schedule,
             rental_flows=rental_flows,
             taxation_entries=taxation_entries,
             cashflow=cashflow_df,
-            npv_value=float(npv(self._discount_rate, discounted_flows)),
-            irr_value=float(irr(discounted_flows) * 100),
+            npv_value=npv_value,
+            irr_value=irr_value,
             wealth_growth=sum(discounted_flows),
-            effective_loan_rate=loan_rate * 100,
-            resolved_annual_expenses=resolved_expenses,
+            effective_loan_rate=model.loan_rate * 100,
+            resolved_annual_expenses=model.resolved_expenses,
             resolved_death_insurance_annual=death_insurance_annual,
         )
 
@@ -320,7 +624,7 @@ class LMNPSimulation:
         annual_schedule: list[AmortizationEntry],
         death_insurance_annual: float = 0.0,
         start_month: int = 1,
-    ) -> pd.DataFrame:
+    ) -> "pd.DataFrame":
         """Construit le DataFrame de cashflow annuel.
 
         Args:
@@ -347,6 +651,8 @@ class LMNPSimulation:
         annuities = [a + d for a, d in zip(raw_annuities, death_ins)]
         principals = self._pad_to_duration([e.principal for e in annual_schedule])
 
+        import pandas as pd
+
         df = pd.DataFrame(
             {
                 "Année": range(1, self._duration + 1),
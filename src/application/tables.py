@@ -0,0 +1,58 @@
+"""Tableaux colonnaires (Apache Arrow) des résultats de simulation.
+
+Les lignes du domaine (``AmortizationEntry``, ``TaxationEntry``) sont
+converties une seule fois en colonnes typées. Les pages en affichent des
+projections (sélection, renommage) sans copie, le formatage des montants
+étant confié au composant d'affichage.
+
+numpy et pyarrow sont importés à la première conversion, comme pandas.
+"""
+
+import dataclasses
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+
+
+def entries_table(entries: Sequence[object], entry_type: type) -> "pa.Table":
+    """Convertit des lignes dataclass en table Arrow, une colonne par champ.
+
+    Les champs ``int`` deviennent des colonnes ``int32``, les autres des
+    colonnes ``float64``.
+
+    Args:
+        entries: Lignes à convertir (instances de ``entry_type``).
+        entry_type: Dataclass des lignes (détermine colonnes et types).
+
+    Returns:
+        Table Arrow de ``len(entries)`` lignes.
+    """
+    import numpy as np
+    import pyarrow as pa
+
+    columns = {}
+    for field in dataclasses.fields(entry_type):
+        dtype = np.int32 if field.type in (int, "int") else np.float64
+        columns[field.name] = np.fromiter(
+            (getattr(e, field.name) for e in entries),
+            dtype=dtype,
+            count=len(entries),
+        )
+    return pa.table(columns)
+
+
+def frame_table(df: "pd.DataFrame") -> "pa.Table":
+    """Convertit un DataFrame (colonnes numériques) en table Arrow.
+
+    Args:
+        df: DataFrame à convertir ; l'index est ignoré.
+
+    Returns:
+        Table Arrow partageant les tampons numériques du DataFrame.
+    """
+    import pyarrow as pa
+
+    return pa.Table.from_pandas(df, preserve_index=False)
@@ -0,0 +1,7 @@
+"""Suite de benchmarks reproductibles du moteur de simulation.
+
+Usage (depuis ``src/``)::
+
+    python -m benchmarks run --output bench.json
+    python -m benchmarks compare benchmarks/baseline.json bench.json --threshold 15
+"""
@@ -0,0 +1,122 @@
+"""Ligne de commande de la suite de benchmarks.
+
+Les benchmarks ne sollicitent que le CPU local : aucun accès réseau ni
+GPU, et les scénarios sont générés avec une graine fixe.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from benchmarks import imports
+from benchmarks.cases import all_cases
+from benchmarks.runner import compare, load_results, run_cases, write_results
+
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+DEFAULT_THRESHOLD_PCT = 20.0
+
+
+def _run(args: argparse.Namespace) -> int:
+    tiers = {"quick", "full"} if args.full else {"quick"}
+    cases = [
+        c
+        for c in all_cases()
+        if c.tier in tiers and (not args.filter or args.filter in c.name)
+    ]
+    document = run_cases(cases, log=lambda line: print(line, file=sys.stderr))
+    write_results(document, args.output)
+    return 0
+
+
+def _compare(args: argparse.Namespace) -> int:
+    baseline = load_results(args.baseline)
+    current = load_results(args.current)
+    deltas, regressions = compare(baseline, current, args.threshold)
+    for d in deltas:
+        flag = "REGRESSION" if d in regressions else "ok"
+        print(
+            f"{d.name:<40} {d.baseline_s * 1000:>12.3f} ms"
+            f" -> {d.current_s * 1000:>12.3f} ms ({d.change_pct:+7.1f} %) {flag}"
+        )
+    if regressions:
+        print(
+            f"{len(regressions)} cas au-delà du seuil de {args.threshold:.1f} %",
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
+def _imports(args: argparse.Namespace) -> int:
+    failures = 0
+    for script in imports.page_scripts():
+        report = imports.measure(script, repeats=args.repeats)
+        problems = imports.violations(
+            report, imports.budget_for(report.name, args.budget_ms)
+        )
+        failures += bool(problems)
+        slowest = ", ".join(f"{m} {ms:.0f} ms" for m, ms in report.slowest[:3])
+        print(
+            f"{report.name:<16} {report.total_ms:>8.1f} ms"
+            f"  {'DÉPASSEMENT ' + '; '.join(problems) if problems else 'ok'}"
+            f"{'  (' + slowest + ')' if slowest else ''}"
+        )
+    if failures:
+        print(f"{failures} page(s) hors budget", file=sys.stderr)
+        return 1
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Point d'entrée : sous-commandes ``run``, ``compare`` et ``imports``."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = sub.add_parser("run", help="Exécute les benchmarks.")
+    run_parser.add_argument(
+        "--output", type=Path, default=Path("bench.json"),
+        help="Fichier JSON de résultats (défaut : bench.json).",
+    )
+    run_parser.add_argument(
+        "--full", action="store_true",
+        help="Inclut les cas longs (lots de 10k et 100k scénarios).",
+    )
+    run_parser.add_argument(
+        "--filter", default="", help="Ne garde que les cas contenant ce texte."
+    )
+    run_parser.set_defaults(handler=_run)
+
+    compare_parser = sub.add_parser(
+        "compare", help="Compare une mesure à la référence."
+    )
+    compare_parser.add_argument(
+        "baseline", type=Path, nargs="?", default=DEFAULT_BASELINE
+    )
+    compare_parser.add_argument("current", type=Path, nargs="?", default=Path("bench.json"))
+    compare_parser.add_argument(
+        "--threshold", type=float, default=DEFAULT_THRESHOLD_PCT,
+        help="Ralentissement toléré en %% (défaut : %(default)s).",
+    )
+    compare_parser.set_defaults(handler=_compare)
+
+    imports_parser = sub.add_parser(
+        "imports", help="Vérifie le budget de temps d'import des pages."
+    )
+    imports_parser.add_argument(
+        "--budget-ms", type=float, default=imports.DEFAULT_BUDGET_MS,
+        help="Budget des pages de résultats, en ms (défaut : %(default)s) ; "
+        f"{imports.LIGHT_BUDGET_MS:.0f} ms pour {', '.join(imports.LIGHT_PAGES)}.",
+    )
+    imports_parser.add_argument(
+        "--repeats", type=int, default=3,
+        help="Interpréteurs lancés par page, meilleure mesure retenue.",
+    )
+    imports_parser.set_defaults(handler=_imports)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,219 @@
+"""Catalogue des cas de benchmark suivis.
+
+Chaque cas prépare ses entrées hors chronométrage (``setup``) et retourne
+la fonction à mesurer. Les cas ``full`` sont trop longs pour un passage
+local rapide et ne tournent qu'avec ``--full``.
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import numpy as np
+
+from application.batch import BatchSimulation
+from application.financing import optimize_financing
+from application.pareto import non_dominated
+from application.preview import default_annuity_table, preview
+from application.sensitivity import tornado
+from application.simulation import SIMULATION_DURATION_YEARS, LMNPSimulation
+from benchmarks.scenarios import default_params, generate_scenarios
+from domain.depreciation import Depreciation
+from domain.loan import Loan
+from domain.taxation import Taxation
+
+
+LOAN_DURATIONS = (5, 10, 15, 20, 25)
+TAXATION_DURATIONS = (30, 50)
+BATCH_SIZES = {1_000: "quick", 10_000: "full", 100_000: "full"}
+PARETO_SIZES = {100_000: "quick", 1_000_000: "full"}
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    """Cas de benchmark.
+
+    Attributes:
+        name: Identifiant stable du cas (clé du fichier JSON).
+        setup: Prépare les entrées et retourne la fonction chronométrée.
+        number: Nombre d'appels par répétition.
+        repeats: Nombre de répétitions (la médiane est retenue).
+        tier: ``"quick"`` (par défaut) ou ``"full"`` (cas longs).
+    """
+
+    name: str
+    setup: Callable[[], Callable[[], object]]
+    number: int = 20
+    repeats: int = 7
+    tier: str = "quick"
+
+
+def _loan(duration: int) -> Loan:
+    """Emprunt représentatif du scénario par défaut."""
+    return Loan(amount=120_000.0, duration_years=duration, annual_rate=0.035)
+
+
+def _monthly_schedule_case(duration: int) -> Callable[[], object]:
+    loan = _loan(duration)
+    return loan.monthly_schedule
+
+
+def _annual_schedule_case(duration: int) -> Callable[[], object]:
+    loan = _loan(duration)
+    return lambda: loan.annual_schedule(start_month=4)
+
+
+def _depreciation_case() -> Callable[[], object]:
+    depreciation = Depreciation(
+        property_value=100_000.0, furniture_cost=3_000.0, acquisition_fees=16_500.0
+    )
+    return lambda: depreciation.annual_schedule(SIMULATION_DURATION_YEARS, 4)
+
+
+def _taxation_case(duration: int) -> Callable[[], object]:
+    # Déficit les premières années pour exercer les reports FIFO.
+    incomes = [7_200.0 * 1.01**y for y in range(duration)]
+    expenses = [1_500.0] * duration
+    interests = [max(0.0, 4_000.0 - 160.0 * y) for y in range(duration)]
+    depreciations = [4_300.0 if y < 15 else 1_500.0 for y in range(duration)]
+    taxation = Taxation(acquisition_fees_deductible=16_500.0)
+    return lambda: taxation.compute(incomes, expenses, interests, depreciations)
+
+
+def _run_default_case() -> Callable[[], object]:
+    params = default_params()
+    simulation = LMNPSimulation()
+    return lambda: simulation.run(params)
+
+
+def _first_year_case() -> Callable[[], object]:
+    params = default_params()
+    simulation = LMNPSimulation()
+    return lambda: simulation.first_year(params, lambda y: y.cumulative_cashflow > 0)
+
+
+def _preview_case() -> Callable[[], object]:
+    params = default_params()
+    simulation = LMNPSimulation()
+    table = default_annuity_table()
+    return lambda: preview(params, table, simulation)
+
+
+def _effective_taeg_case() -> Callable[[], object]:
+    result = LMNPSimulation().run(default_params())
+    return result.effective_taeg
+
+
+def _batch_case(size: int) -> Callable[[], object]:
+    scenarios = generate_scenarios(size)
+    simulation = LMNPSimulation()
+    return lambda: [simulation.run(p) for p in scenarios]
+
+
+def _vectorized_batch_case(size: int) -> Callable[[], object]:
+    scenarios = generate_scenarios(size)
+    simulation = BatchSimulation()
+    return lambda: simulation.run(scenarios)
+
+
+def _vectorized_first_year_case(size: int) -> Callable[[], object]:
+    scenarios = generate_scenarios(size)
+    simulation = BatchSimulation()
+    return lambda: simulation.first_year(
+        scenarios, lambda y: y.cumulative_cashflow > 0, with_taxation=False
+    )
+
+
+def _tornado_case() -> Callable[[], object]:
+    params = default_params()
+    return lambda: tornado(params)
+
+
+def _financing_case() -> Callable[[], object]:
+    params = default_params()
+    return lambda: optimize_financing(params, max_contribution=50_000.0)
+
+
+def _pareto_case(size: int) -> Callable[[], object]:
+    # Trois indicateurs indépendants : front de quelques centaines de points.
+    points = np.random.default_rng(0).normal(size=(size, 3))
+    return lambda: non_dominated(points)
+
+
+def all_cases() -> list[BenchmarkCase]:
+    """Retourne la liste ordonnée de tous les cas suivis."""
+    cases: list[BenchmarkCase] = []
+    for duration in LOAN_DURATIONS:
+        cases.append(
+            BenchmarkCase(
+                f"loan.monthly_schedule[{duration}y]",
+                lambda d=duration: _monthly_schedule_case(d),
+            )
+        )
+        cases.append(
+            BenchmarkCase(
+                f"loan.annual_schedule[{duration}y]",
+                lambda d=duration: _annual_schedule_case(d),
+            )
+        )
+    cases.append(
+        BenchmarkCase("depreciation.annual_schedule", _depreciation_case, number=50)
+    )
+    for duration in TAXATION_DURATIONS:
+        cases.append(
+            BenchmarkCase(
+                f"taxation.compute[{duration}y]",
+                lambda d=duration: _taxation_case(d),
+                number=50,
+            )
+        )
+    cases.append(BenchmarkCase("simulation.run[default]", _run_default_case))
+    cases.append(
+        BenchmarkCase("simulation.first_year[default]", _first_year_case)
+    )
+    cases.append(BenchmarkCase("preview[default]", _preview_case, number=200))
+    cases.append(
+        BenchmarkCase("result.effective_taeg", _effective_taeg_case, number=1)
+    )
+    for size, tier in BATCH_SIZES.items():
+        cases.append(
+            BenchmarkCase(
+                f"batch.run[{size}]",
+                lambda s=size: _batch_case(s),
+                number=1,
+                repeats=3 if tier == "quick" else 1,
+                tier=tier,
+            )
+        )
+    for size, tier in BATCH_SIZES.items():
+        cases.append(
+            BenchmarkCase(
+                f"batch.vectorized[{size}]",
+                lambda s=size: _vectorized_batch_case(s),
+                number=1,
+                tier=tier,
+            )
+        )
+    for size, tier in BATCH_SIZES.items():
+        cases.append(
+            BenchmarkCase(
+                f"batch.first_year[{size}]",
+                lambda s=size: _vectorized_first_year_case(s),
+                number=1,
+                tier=tier,
+            )
+        )
+    cases.append(BenchmarkCase("sensitivity.tornado[default]", _tornado_case))
+    cases.append(
+        BenchmarkCase("financing.optimize[default]", _financing_case, number=5)
+    )
+    for size, tier in PARETO_SIZES.items():
+        cases.append(
+            BenchmarkCase(
+                f"pareto.non_dominated[{size}]",
+                lambda s=size: _pareto_case(s),
+                number=1,
+                repeats=3,
+                tier=tier,
+            )
+        )
+    return cases
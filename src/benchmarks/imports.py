@@ -0,0 +1,118 @@
+"""Budget de temps d'import des pages Streamlit.
+
+Chaque page est un script exécuté par Streamlit : on ne peut pas
+l'importer sans l'afficher. Seules ses instructions d'import de premier
+niveau sont extraites (``ast``) et rejouées dans un interpréteur neuf sous
+``python -X importtime``. Le coût mesuré est celui des modules chargés en
+plus de ``streamlit`` lui-même, déjà présent dans tout processus serveur.
+"""
+
+import ast
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+
+SRC_DIR = Path(__file__).resolve().parents[1]
+# Modules lourds interdits au chargement des pages d'information.
+HEAVY_MODULES = ("pandas", "plotly", "numpy_financial", "pyarrow")
+LIGHT_PAGES = ("app", "welcome", "about")
+DEFAULT_BUDGET_MS = 600.0
+LIGHT_BUDGET_MS = 50.0
+
+
+@dataclass(frozen=True)
+class ImportReport:
+    """Coût d'import d'une page.
+
+    Attributes:
+        name: Nom de la page (fichier sans extension).
+        total_ms: Temps d'import au-delà de ``streamlit`` (ms).
+        heavy_modules: Modules de ``HEAVY_MODULES`` chargés par la page.
+        slowest: Modules de premier niveau les plus coûteux, ``(nom, ms)``.
+    """
+
+    name: str
+    total_ms: float
+    heavy_modules: list[str]
+    slowest: list[tuple[str, float]]
+
+
+def page_scripts() -> list[Path]:
+    """Script principal puis pages, dans l'ordre alphabétique."""
+    return [SRC_DIR / "app.py", *sorted((SRC_DIR / "views").glob("*.py"))]
+
+
+def import_statements(script: Path) -> str:
+    """Instructions d'import de premier niveau d'un script."""
+    tree = ast.parse(script.read_text(encoding="utf-8"))
+    nodes = [n for n in tree.body if isinstance(n, (ast.Import, ast.ImportFrom))]
+    return "\n".join(ast.unparse(n) for n in nodes)
+
+
+def measure(script: Path, repeats: int = 3) -> ImportReport:
+    """Mesure le coût d'import d'une page (meilleure de ``repeats`` mesures).
+
+    Args:
+        script: Script de page.
+        repeats: Nombre d'interpréteurs lancés.
+
+    Returns:
+        Rapport de la meilleure mesure.
+    """
+    statements = import_statements(script)
+    best: ImportReport | None = None
+    for _ in range(repeats):
+        baseline = _self_times("import streamlit")
+        loaded = _self_times("import streamlit\n" + statements)
+        extra = {m: t for m, t in loaded.items() if m not in baseline}
+        total_ms = sum(extra.values()) / 1000
+        if best is None or total_ms < best.total_ms:
+            top_level: dict[str, float] = {}
+            for module, us in extra.items():
+                root = module.split(".")[0]
+                top_level[root] = top_level.get(root, 0.0) + us / 1000
+            best = ImportReport(
+                name=script.stem,
+                total_ms=total_ms,
+                heavy_modules=sorted(
+                    {m.split(".")[0] for m in extra} & set(HEAVY_MODULES)
+                ),
+                slowest=sorted(top_level.items(), key=lambda kv: -kv[1])[:5],
+            )
+    return best
+
+
+def budget_for(name: str, default_budget_ms: float = DEFAULT_BUDGET_MS) -> float:
+    """Budget d'une page (ms)."""
+    return LIGHT_BUDGET_MS if name in LIGHT_PAGES else default_budget_ms
+
+
+def violations(report: ImportReport, budget_ms: float) -> list[str]:
+    """Motifs de dépassement d'une page (liste vide si conforme)."""
+    problems = []
+    if report.total_ms > budget_ms:
+        problems.append(f"{report.total_ms:.0f} ms > budget {budget_ms:.0f} ms")
+    if report.name in LIGHT_PAGES and report.heavy_modules:
+        problems.append(f"charge {', '.join(report.heavy_modules)}")
+    return problems
+
+
+def _self_times(code: str) -> dict[str, int]:
+    """Temps propre d'import (µs) de chaque module chargé par ``code``."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=SRC_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: dict[str, int] = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, _, name = (part.strip() for part in line[12:].split("|"))
+        if self_us.isdigit():
+            times[name] = int(self_us)
+    return times
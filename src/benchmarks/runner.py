@@ -0,0 +1,183 @@
+"""Exécution des cas de benchmark et comparaison à une référence."""
+
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+from benchmarks.cases import BenchmarkCase
+
+
+SCHEMA_VERSION = 1
+
+
+@dataclass(frozen=True)
+class CaseResult:
+    """Mesure d'un cas de benchmark (temps par appel, en secondes).
+
+    Attributes:
+        name: Identifiant du cas.
+        median_s: Médiane des répétitions.
+        min_s: Meilleure répétition.
+        max_s: Pire répétition.
+        number: Nombre d'appels par répétition.
+        repeats: Nombre de répétitions.
+    """
+
+    name: str
+    median_s: float
+    min_s: float
+    max_s: float
+    number: int
+    repeats: int
+
+
+@dataclass(frozen=True)
+class Regression:
+    """Écart d'un cas suivi par rapport à la référence.
+
+    Attributes:
+        name: Identifiant du cas.
+        baseline_s: Meilleur temps de référence (s).
+        current_s: Meilleur temps mesuré (s).
+        change_pct: Variation relative (%), positive si plus lent.
+    """
+
+    name: str
+    baseline_s: float
+    current_s: float
+    change_pct: float
+
+
+def measure(case: BenchmarkCase) -> CaseResult:
+    """Chronomètre un cas : un appel de chauffe puis ``repeats`` séries.
+
+    Le ramasse-miettes est désactivé pendant les séries pour limiter le
+    bruit, comme le fait ``timeit``.
+
+    Args:
+        case: Cas à mesurer.
+
+    Returns:
+        Temps par appel agrégés.
+    """
+    func = case.setup()
+    func()
+    timings: list[float] = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(case.repeats):
+            start = time.perf_counter()
+            for _ in range(case.number):
+                func()
+            timings.append((time.perf_counter() - start) / case.number)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return CaseResult(
+        name=case.name,
+        median_s=statistics.median(timings),
+        min_s=min(timings),
+        max_s=max(timings),
+        number=case.number,
+        repeats=case.repeats,
+    )
+
+
+def run_cases(cases: Iterable[BenchmarkCase], log=None) -> dict:
+    """Exécute les cas et construit le document JSON de résultats.
+
+    Args:
+        cases: Cas à exécuter, dans l'ordre.
+        log: Fonction optionnelle recevant une ligne de progression par cas.
+
+    Returns:
+        Document sérialisable (voir :func:`write_results`).
+    """
+    results: dict[str, dict] = {}
+    for case in cases:
+        result = measure(case)
+        results[case.name] = {
+            "median_s": result.median_s,
+            "min_s": result.min_s,
+            "max_s": result.max_s,
+            "number": result.number,
+            "repeats": result.repeats,
+        }
+        if log:
+            log(f"{case.name:<40} {result.median_s * 1000:>12.3f} ms")
+    return {
+        "schema": SCHEMA_VERSION,
+        "environment": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "platform": sys.platform,
+        },
+        "cases": dict(sorted(results.items())),
+    }
+
+
+def write_results(document: dict, path: Path | str) -> None:
+    """Écrit un document de résultats (JSON trié, indenté, stable)."""
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(document, file, indent=2, sort_keys=True)
+        file.write("\n")
+
+
+def load_results(path: Path | str) -> dict:
+    """Charge un document de résultats et vérifie sa version de schéma.
+
+    Raises:
+        ValueError: Si le schéma n'est pas celui attendu.
+    """
+    with open(path, "r", encoding="utf-8") as file:
+        document = json.load(file)
+    if document.get("schema") != SCHEMA_VERSION:
+        raise ValueError(
+            f"{path}: schéma {document.get('schema')!r} non supporté "
+            f"(attendu {SCHEMA_VERSION})"
+        )
+    return document
+
+
+def compare(
+    baseline: dict, current: dict, threshold_pct: float
+) -> tuple[list[Regression], list[Regression]]:
+    """Compare deux documents de résultats cas par cas.
+
+    Seuls les cas présents dans la référence sont suivis ; les cas absents
+    de la mesure courante (ex: cas ``full`` non exécutés) sont ignorés.
+    La comparaison porte sur la meilleure répétition (``min_s``), moins
+    sensible que la médiane au bruit d'une machine partagée.
+
+    Args:
+        baseline: Document de référence.
+        current: Document mesuré.
+        threshold_pct: Ralentissement toléré (%) avant d'échouer.
+
+    Returns:
+        Tuple (tous les écarts, écarts au-delà du seuil).
+    """
+    deltas: list[Regression] = []
+    for name, reference in baseline["cases"].items():
+        measured = current["cases"].get(name)
+        if measured is None:
+            continue
+        change = (measured["min_s"] / reference["min_s"] - 1) * 100
+        deltas.append(
+            Regression(
+                name=name,
+                baseline_s=reference["min_s"],
+                current_s=measured["min_s"],
+                change_pct=change,
+            )
+        )
+    regressions = [d for d in deltas if d.change_pct > threshold_pct]
+    return deltas, regressions
@@ -0,0 +1,144 @@
+"""Ligne de commande : simulation de lots de scénarios sans interface.
+
+Lit des scénarios depuis des fichiers (CSV, JSONL, répertoire YAML) ou
+l'entrée standard, les évalue avec le moteur choisi et écrit les
+indicateurs de synthèse en JSONL, CSV ou Parquet, paquet par paquet.
+
+N'importe ni ``streamlit`` ni ``plotly`` : le démarrage reste rapide et
+l'outil tient dans un conteneur minimal.
+
+Exemple (depuis ``src/``)::
+
+    python -m cli scenarios.csv -o resultats.parquet --engine multiprocess --workers 4
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections import deque
+from collections.abc import Iterator
+from pathlib import Path
+
+import pandas as pd
+
+from application.params_batch import ParamsBatch
+from application.runner import ENGINES, ERROR_COLUMN, ScenarioRunner
+from infrastructure.result_writer import OUTPUT_FORMATS, ResultWriter
+from infrastructure.scenario_loader import (
+    DEFAULT_BATCH_SIZE,
+    STREAM_FORMATS,
+    ScenarioBatch,
+    iter_scenarios,
+)
+
+
+STDIN = "-"
+
+
+def _iter_inputs(args: argparse.Namespace) -> Iterator[ScenarioBatch]:
+    """Enchaîne les paquets de toutes les entrées, dans l'ordre."""
+    for name in args.inputs:
+        if name == STDIN:
+            yield from iter_scenarios(sys.stdin, args.chunk_size, fmt=args.input_format)
+        else:
+            yield from iter_scenarios(Path(name), args.chunk_size, fmt=args.input_format)
+
+
+def _run(args: argparse.Namespace) -> int:
+    runner = ScenarioRunner(args.engine, args.workers)
+    # Provenance des paquets en cours : le moteur les restitue dans l'ordre.
+    origins: deque[tuple[str | list[str], list[int]]] = deque()
+    rejected = 0
+    started = time.perf_counter()
+
+    def batches() -> Iterator[ParamsBatch]:
+        nonlocal rejected
+        for batch in _iter_inputs(args):
+            for error in batch.errors:
+                print(f"{error.source}:{error.line}: {error.message}", file=sys.stderr)
+            rejected += len(batch.errors)
+            origins.append((batch.sources or batch.source, batch.lines))
+            yield batch.params
+
+    done = 0
+    with ResultWriter(args.output, args.format) as writer:
+        for summary in runner.run(batches()):
+            source, lines = origins.popleft()
+            summary.insert(0, "line", pd.Series(lines, dtype="int64"))
+            summary.insert(0, "source", source)
+            # Échecs du moteur, isolés par le runner : rejetés comme les
+            # lignes invalides, sans interrompre les paquets suivants.
+            errors = summary.pop(ERROR_COLUMN)
+            failed = errors.notna().to_numpy()
+            for where, line, message in zip(
+                summary["source"][failed], summary["line"][failed], errors[failed]
+            ):
+                print(f"{where}:{line}: échec du calcul : {message}", file=sys.stderr)
+            rejected += int(failed.sum())
+            summary = summary[~failed].reset_index(drop=True)
+            writer.write(summary)
+            done += len(summary)
+            if not args.quiet:
+                elapsed = time.perf_counter() - started
+                print(
+                    f"{done} scénarios évalués, {rejected} rejetés"
+                    f" ({done / elapsed:,.0f} scénarios/s)",
+                    file=sys.stderr,
+                )
+    return 1 if rejected else 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Point d'entrée ; code de sortie 1 si des lignes ont été rejetées."""
+    parser = argparse.ArgumentParser(
+        prog="python -m cli",
+        description="Simule des lots de scénarios LMNP sans interface.",
+    )
+    parser.add_argument(
+        "inputs", nargs="*", default=[STDIN],
+        help="Fichiers CSV/JSONL ou répertoires YAML ; « - » pour l'entrée "
+        "standard (défaut).",
+    )
+    parser.add_argument(
+        "-o", "--output", type=Path, default=None,
+        help="Fichier de résultats (défaut : sortie standard, en JSONL).",
+    )
+    parser.add_argument(
+        "--format", choices=OUTPUT_FORMATS, default=None,
+        help="Format de sortie (défaut : déduit de l'extension).",
+    )
+    parser.add_argument(
+        "--input-format", choices=STREAM_FORMATS, default=None,
+        help="Format des entrées, obligatoire pour l'entrée standard.",
+    )
+    parser.add_argument(
+        "--engine", choices=ENGINES, default="batched",
+        help="Moteur de simulation (défaut : %(default)s).",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 1,
+        help="Processus du moteur multiprocess (défaut : %(default)s).",
+    )
+    parser.add_argument(
+        "--chunk-size", type=int, default=DEFAULT_BATCH_SIZE,
+        help="Scénarios lus et évalués par paquet (défaut : %(default)s).",
+    )
+    parser.add_argument(
+        "-q", "--quiet", action="store_true",
+        help="Masque la progression (les rejets restent affichés).",
+    )
+    args = parser.parse_args(argv)
+    if args.chunk_size < 1 or args.workers < 1:
+        parser.error("--chunk-size et --workers doivent être ≥ 1")
+    if STDIN in args.inputs and args.input_format is None:
+        parser.error("--input-format est obligatoire pour l'entrée standard")
+    try:
+        return _run(args)
+    except ValueError as exc:
+        print(f"erreur : {exc}", file=sys.stderr)
+        return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,8 @@
 """Entité domaine : amortissements comptables du bien et du mobilier (LMNP)."""
 
+from collections.abc import Iterator
 from dataclasses import dataclass
+from itertools import count, islice
 
 
 # Composants réglementaires du bien immobilier :
@@ -108,11 +110,22 @@ class Depreciation:
         Returns:
             Liste des montants d'amortissement annuel (€).
         """
+        return list(islice(self.iter_schedule(start_month), duration_years))
+
+    def iter_schedule(self, start_month: int = 1) -> Iterator[float]:
+        """Produit les dotations de :meth:`annual_schedule`, sans horizon.
+
+        Args:
+            start_month: Mois de démarrage de l'activité (1 = janvier,
+                12 = décembre).
+
+        Yields:
+            Amortissement de chaque année (€), indéfiniment.
+        """
         proration = (13 - start_month) / 12
         tail = (start_month - 1) / 12
         comps = self.components()
-        schedule: list[float] = []
-        for year in range(1, duration_years + 1):
+        for year in count(1):
             total = 0.0
             for c in comps:
                 if c.duration_years == 0:
@@ -123,5 +136,4 @@ class Depreciation:
                     total += c.annual_amount
                 elif year == c.duration_years + 1 and start_month > 1:
                     total += c.annual_amount * tail
-            schedule.append(round(total, 2))
-        return schedule
+            yield round(total, 2)
@@ -1,6 +1,8 @@
 """Entité domaine : emprunt immobilier à taux fixe."""
 
+from collections.abc import Iterator
 from dataclasses import dataclass
+from itertools import islice
 
 
 @dataclass(frozen=True)
@@ -77,22 +79,26 @@ class Loan:
         Returns:
             Liste des lignes d'amortissement, une par mois.
         """
-        entries: list[AmortizationEntry] = []
+        return list(self.iter_monthly())
+
+    def iter_monthly(self) -> Iterator[AmortizationEntry]:
+        """Produit les lignes d'amortissement mensuelles une à une.
+
+        Yields:
+            Ligne d'amortissement de chaque mois, dans l'ordre.
+        """
         remaining = self.amount
         for month in range(1, self.duration_months + 1):
             interest = remaining * self.monthly_rate
             principal = self.monthly_payment - interest
             remaining -= principal
-            entries.append(
-                AmortizationEntry(
-                    period=month,
-                    payment=self.monthly_payment,
-                    interest=interest,
-                    principal=principal,
-                    remaining_balance=remaining,
-                )
+            yield AmortizationEntry(
+                period=month,
+                payment=self.monthly_payment,
+                interest=interest,
+                principal=principal,
+                remaining_balance=remaining,
             )
-        return entries
 
     def annual_schedule(self, start_month: int = 1) -> list[AmortizationEntry]:
         """Génère le tableau d'amortissement annuel agrégé.
@@ -109,25 +115,28 @@ class Loan:
         Returns:
             Liste des lignes d'amortissement, une par année calendaire.
         """
-        monthly = self.monthly_schedule()
-        annual: list[AmortizationEntry] = []
-        first_year_months = 13 - start_month
-        idx = 0
+        return list(self.iter_annual(start_month))
+
+    def iter_annual(self, start_month: int = 1) -> Iterator[AmortizationEntry]:
+        """Produit les lignes annuelles de :meth:`annual_schedule` une à une.
+
+        Seules les mensualités de l'année produite sont calculées.
+
+        Args:
+            start_month: Mois de démarrage de l'activité (1 = janvier,
+                12 = décembre).
+
+        Yields:
+            Ligne d'amortissement de chaque année calendaire, dans l'ordre.
+        """
+        monthly = self.iter_monthly()
         year = 1
-        while idx < len(monthly):
-            months_in_year = first_year_months if year == 1 else 12
-            window = monthly[idx : idx + months_in_year]
-            if not window:
-                break
-            annual.append(
-                AmortizationEntry(
-                    period=year,
-                    payment=sum(e.payment for e in window),
-                    interest=sum(e.interest for e in window),
-                    principal=sum(e.principal for e in window),
-                    remaining_balance=window[-1].remaining_balance,
-                )
+        while window := list(islice(monthly, 12 if year > 1 else 13 - start_month)):
+            yield AmortizationEntry(
+                period=year,
+                payment=sum(e.payment for e in window),
+                interest=sum(e.interest for e in window),
+                principal=sum(e.principal for e in window),
+                remaining_balance=window[-1].remaining_balance,
             )
-            idx += months_in_year
             year += 1
-        return annual
@@ -1,6 +1,8 @@
 """Entité domaine : bien en location et projection des flux."""
 
+from collections.abc import Iterator
 from dataclasses import dataclass
+from itertools import islice
 
 
 @dataclass(frozen=True)
@@ -49,16 +51,26 @@ class Rental:
         Returns:
             Liste des flux annuels sur la durée demandée.
         """
-        flows: list[YearlyRentalFlow] = []
+        return list(islice(self.iter_flows(start_month), duration_years))
+
+    def iter_flows(self, start_month: int = 1) -> Iterator[YearlyRentalFlow]:
+        """Produit les flux annuels de :meth:`projected_flows`, sans horizon.
+
+        Args:
+            start_month: Mois de démarrage de l'activité (1 = janvier,
+                12 = décembre).
+
+        Yields:
+            Flux de chaque année, indéfiniment : l'appelant fixe l'arrêt.
+        """
         annual_rent = self.monthly_rent * 12
-        for year in range(1, duration_years + 1):
+        year = 1
+        while True:
             proration = (13 - start_month) / 12 if year == 1 else 1.0
-            flows.append(
-                YearlyRentalFlow(
-                    year=year,
-                    income=round(annual_rent * proration, 2),
-                    expenses=round(self.annual_expenses * proration, 2),
-                )
+            yield YearlyRentalFlow(
+                year=year,
+                income=round(annual_rent * proration, 2),
+                expenses=round(self.annual_expenses * proration, 2),
             )
             annual_rent *= 1 + self.rent_increase_rate
-        return flows
+            year += 1
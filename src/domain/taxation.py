@@ -1,5 +1,6 @@
 """Entité domaine : calcul fiscal LMNP en régime réel."""
 
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 
 
@@ -74,6 +75,24 @@ class Taxation:
     ) -> list[TaxationEntry]:
         """Calcule le tableau fiscal annuel selon les 4 étapes réglementaires.
 
+        Args:
+            incomes: Revenus locatifs annuels (€).
+            expenses: Charges annuelles hors intérêts d'emprunt (€).
+            loan_interests: Intérêts d'emprunt annuels (€).
+            depreciations: Amortissements annuels (€).
+
+        Returns:
+            Liste des lignes fiscales annuelles.
+        """
+        return list(
+            self.iter_entries(zip(incomes, expenses, loan_interests, depreciations))
+        )
+
+    def iter_entries(
+        self, years: Iterable[tuple[float, float, float, float]]
+    ) -> Iterator[TaxationEntry]:
+        """Produit les lignes fiscales année par année, stocks reportés inclus.
+
         Ordre d'imputation strict :
         1. Charges courantes (sans plafond) — crée un déficit reportable
            sur 10 ans si le résultat est négatif.
@@ -84,22 +103,22 @@ class Taxation:
         4. Déficits de charges reportés (FIFO, ≤ 10 ans) — imputés en
            dernier ressort.
 
+        Chaque année n'est lue dans ``years`` qu'au moment de produire sa
+        ligne : l'appelant peut s'arrêter à tout moment.
+
         Args:
-            incomes: Revenus locatifs annuels (€).
-            expenses: Charges annuelles hors intérêts d'emprunt (€).
-            loan_interests: Intérêts d'emprunt annuels (€).
-            depreciations: Amortissements annuels (€).
+            years: Par année, (revenus, charges hors intérêts, intérêts
+                d'emprunt, amortissements) en €.
 
-        Returns:
-            Liste des lignes fiscales annuelles.
+        Yields:
+            Ligne fiscale de chaque année, dans l'ordre.
         """
-        entries: list[TaxationEntry] = []
         # Stock déficits : liste de (année_origine, montant) pour gestion FIFO
         deficit_stock: list[tuple[int, float]] = []
         carry_depreciation = 0.0
         acquisition_fees = self.acquisition_fees_deductible
 
-        for i, income in enumerate(incomes):
+        for i, (income, expense, loan_interest, depreciation) in enumerate(years):
             year = i + 1
 
             # Purge des déficits expirés (> 10 ans)
@@ -109,10 +128,9 @@ class Taxation:
             ]
 
             # --- Étape 1 : charges courantes ---
-            current_exp = expenses[i] + loan_interests[i]
+            current_exp = expense + loan_interest
             if year == 1:
                 current_exp += acquisition_fees
-            depreciation = depreciations[i]
             result_before_amort = income - current_exp
 
             if result_before_amort < 0:
@@ -156,23 +174,19 @@ class Taxation:
 
             carry_forward_deficit = sum(a for _, a in deficit_stock)
 
-            entries.append(
-                TaxationEntry(
-                    year=year,
-                    income=round(income, 2),
-                    current_expenses=round(current_exp, 2),
-                    result_before_amort=round(result_before_amort, 2),
-                    depreciation=round(depreciation, 2),
-                    depreciation_used=round(depreciation_used, 2),
-                    carry_depreciation_used=round(carry_depreciation_used, 2),
-                    carry_forward_depreciation=round(carry_depreciation, 2),
-                    deficit_added=round(deficit_added, 2),
-                    deficit_used=round(deficit_used, 2),
-                    carry_forward_deficit=round(carry_forward_deficit, 2),
-                    fiscal_result=round(fiscal_result, 2),
-                    taxable_real=round(fiscal_result, 2),
-                    taxable_bic=round(income * self.bic_rate, 2),
-                )
+            yield TaxationEntry(
+                year=year,
+                income=round(income, 2),
+                current_expenses=round(current_exp, 2),
+                result_before_amort=round(result_before_amort, 2),
+                depreciation=round(depreciation, 2),
+                depreciation_used=round(depreciation_used, 2),
+                carry_depreciation_used=round(carry_depreciation_used, 2),
+                carry_forward_depreciation=round(carry_depreciation, 2),
+                deficit_added=round(deficit_added, 2),
+                deficit_used=round(deficit_used, 2),
+                carry_forward_deficit=round(carry_forward_deficit, 2),
+                fiscal_result=round(fiscal_result, 2),
+                taxable_real=round(fiscal_result, 2),
+                taxable_bic=round(income * self.bic_rate, 2),
             )
-
-        return entries
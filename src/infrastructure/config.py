@@ -7,6 +7,26 @@ import yaml
 from application.params import SimulationParams
 
 
+# Relatif au répertoire de lancement de l'application.
+DEFAULT_CONFIG_PATH = "./default.yaml"
+# Fichier livré à la racine du dépôt : repli hors du répertoire de lancement.
+REPOSITORY_CONFIG_PATH = Path(__file__).resolve().parents[2] / "default.yaml"
+
+# Chargeur libyaml (C) si disponible, sinon chargeur pur Python.
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def default_config_path() -> Path:
+    """Fichier de configuration par défaut.
+
+    Returns:
+        ``DEFAULT_CONFIG_PATH`` s'il existe dans le répertoire de lancement,
+        sinon ``REPOSITORY_CONFIG_PATH``.
+    """
+    path = Path(DEFAULT_CONFIG_PATH)
+    return path if path.is_file() else REPOSITORY_CONFIG_PATH
+
+
 def load_default_params(path: Path | str) -> SimulationParams:
     """Charge les paramètres de simulation depuis un fichier YAML.
 
@@ -20,5 +40,5 @@ def load_default_params(path: Path | str) -> SimulationParams:
         Paramètres de simulation typés.
     """
     with open(path, "r", encoding="utf-8") as file:
-        raw = yaml.safe_load(file)
+        raw = yaml.load(file, Loader=YAML_LOADER)
     return SimulationParams(**raw)
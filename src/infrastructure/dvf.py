@@ -0,0 +1,383 @@
+"""Ingestion des fichiers DVF (Demandes de Valeurs Foncières) en Parquet.
+
+Les fichiers annuels nationaux publiés par la DGFiP (``*.txt`` séparés
+par ``|``, plusieurs Go) sont lus par paquets, en ne chargeant que les
+colonnes utiles avec des types explicites ; les décimales à virgule sont
+analysées par le lecteur CSV lui-même. Les filtres macro du notebook
+d'exploration sont appliqués (ventes d'un seul lot avec surface Carrez)
+et le résultat est écrit en Parquet partitionné par département, commune
+et année (``department=31/commune_code=555/year=2024/``).
+
+L'ingestion est incrémentale : un manifeste conserve taille et date de
+modification de chaque fichier traité, et seuls les fichiers nouveaux ou
+modifiés sont relus.
+
+Usage::
+
+    python -m infrastructure.dvf data/ output/dvf
+"""
+
+import argparse
+import json
+import sys
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pandas as pd
+
+if TYPE_CHECKING:
+    import pyarrow.dataset as ds
+
+
+DEFAULT_CHUNK_SIZE = 500_000
+SOURCE_PATTERN = "*.txt"
+MANIFEST_NAME = "_manifest.json"
+PARTITION_COLUMNS = ("department", "commune_code", "year")
+# Nombre maximal de partitions écrites par fichier source (communes × années).
+MAX_PARTITIONS = 200_000
+
+# Colonne source → colonne de sortie.
+SOURCE_COLUMNS = {
+    "Date mutation": "mutation_date",
+    "Nature mutation": "nature",
+    "Valeur fonciere": "property_value",
+    "No voie": "street_number",
+    "Type de voie": "street_type",
+    "Voie": "street",
+    "Code postal": "postal_code",
+    "Commune": "commune",
+    "Code departement": "department",
+    "Code commune": "commune_code",
+    "Prefixe de section": "section_prefix",
+    "Section": "section",
+    "No plan": "plan_number",
+    "Surface Carrez du 1er lot": "carrez_area",
+    "Nombre de lots": "lot_count",
+    "Type local": "property_type",
+    "Surface reelle bati": "built_area",
+    "Nombre pieces principales": "rooms",
+}
+# Types de lecture : les codes restent des chaînes (« 2A », « 01000 »),
+# les montants et surfaces sont lus en flottants avec ``decimal=","``.
+SOURCE_DTYPES = {
+    "Date mutation": str,
+    "Nature mutation": str,
+    "Valeur fonciere": "float64",
+    "No voie": "float64",
+    "Type de voie": str,
+    "Voie": str,
+    "Code postal": str,
+    "Commune": str,
+    "Code departement": str,
+    "Code commune": str,
+    "Prefixe de section": str,
+    "Section": str,
+    "No plan": "float64",
+    "Surface Carrez du 1er lot": "float64",
+    "Nombre de lots": "float64",
+    "Type local": str,
+    "Surface reelle bati": "float64",
+    "Nombre pieces principales": "float64",
+}
+OUTPUT_COLUMNS = (
+    "mutation_date",
+    "year",
+    "department",
+    "commune_code",
+    "commune",
+    "postal_code",
+    "section_prefix",
+    "section",
+    "plan_number",
+    "street_number",
+    "street_type",
+    "street",
+    "property_type",
+    "rooms",
+    "property_value",
+    "carrez_area",
+    "built_area",
+    "price_per_m2",
+)
+
+
+@dataclass(frozen=True)
+class IngestionReport:
+    """Bilan de l'ingestion d'un fichier source.
+
+    Attributes:
+        source: Nom du fichier source.
+        rows_read: Lignes lues (0 si le fichier était déjà ingéré).
+        rows_kept: Mutations retenues après filtres.
+        skipped: ``True`` si le fichier, inchangé, n'a pas été relu.
+    """
+
+    source: str
+    rows_read: int
+    rows_kept: int
+    skipped: bool
+
+
+def read_dvf(
+    path: Path | str, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[tuple[int, pd.DataFrame]]:
+    """Lit un fichier DVF par paquets, filtrés et typés.
+
+    Filtres (notebook d'exploration) : nature « Vente », un seul lot,
+    surface Carrez et valeur foncière renseignées et positives.
+
+    Args:
+        path: Fichier DVF (``|`` séparateur, virgule décimale).
+        chunk_size: Nombre de lignes lues par paquet.
+
+    Yields:
+        ``(lignes lues, mutations retenues)`` par paquet, colonnes
+        ``OUTPUT_COLUMNS``.
+    """
+    reader = pd.read_csv(
+        path,
+        sep="|",
+        decimal=",",
+        usecols=list(SOURCE_COLUMNS),
+        dtype=SOURCE_DTYPES,
+        chunksize=chunk_size,
+        encoding="utf-8",
+    )
+    with reader:
+        for chunk in reader:
+            yield len(chunk), _clean(chunk.rename(columns=SOURCE_COLUMNS))
+
+
+def ingest(
+    sources: Iterable[Path | str],
+    output_dir: Path | str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> list[IngestionReport]:
+    """Ingère des fichiers DVF dans le magasin Parquet partitionné.
+
+    Un fichier déjà ingéré, de même taille et date de modification, est
+    ignoré. Un fichier modifié remplace les données qu'il avait produites.
+
+    Args:
+        sources: Fichiers DVF.
+        output_dir: Racine du magasin Parquet.
+        chunk_size: Nombre de lignes lues par paquet.
+
+    Returns:
+        Un bilan par fichier source, dans l'ordre des sources.
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    manifest = _load_manifest(output_dir)
+    reports = []
+    for source in map(Path, sources):
+        signature = _signature(source)
+        if manifest.get(source.name, {}).get("signature") == signature:
+            reports.append(
+                IngestionReport(
+                    source=source.name,
+                    rows_read=0,
+                    rows_kept=manifest[source.name]["rows"],
+                    skipped=True,
+                )
+            )
+            continue
+        _remove_outputs(output_dir, source)
+        rows_read = 0
+        kept = []
+        for read, frame in read_dvf(source, chunk_size):
+            rows_read += read
+            kept.append(frame)
+        data = pd.concat(kept, ignore_index=True) if kept else _clean_empty()
+        _write(data, output_dir, source)
+        manifest[source.name] = {"signature": signature, "rows": len(data)}
+        _save_manifest(output_dir, manifest)
+        reports.append(
+            IngestionReport(
+                source=source.name,
+                rows_read=rows_read,
+                rows_kept=len(data),
+                skipped=False,
+            )
+        )
+    return reports
+
+
+def ingest_directory(
+    input_dir: Path | str,
+    output_dir: Path | str,
+    pattern: str = SOURCE_PATTERN,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> list[IngestionReport]:
+    """Ingère tous les fichiers DVF d'un répertoire (ordre alphabétique).
+
+    Args:
+        input_dir: Répertoire des fichiers DVF.
+        output_dir: Racine du magasin Parquet.
+        pattern: Motif des fichiers sources.
+        chunk_size: Nombre de lignes lues par paquet.
+
+    Returns:
+        Un bilan par fichier source.
+    """
+    return ingest(sorted(Path(input_dir).glob(pattern)), output_dir, chunk_size)
+
+
+def open_dataset(root: Path | str) -> "ds.Dataset":
+    """Ouvre le magasin Parquet en lecture.
+
+    Le schéma des partitions est explicite : sans lui, les codes commune
+    (« 004 ») seraient relus comme des entiers.
+
+    Args:
+        root: Racine du magasin Parquet.
+
+    Returns:
+        Jeu de données ``pyarrow`` (lecture paresseuse, filtres poussés
+        jusqu'aux partitions).
+    """
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    partitioning = ds.partitioning(
+        pa.schema(
+            [
+                ("department", pa.string()),
+                ("commune_code", pa.string()),
+                ("year", pa.int16()),
+            ]
+        ),
+        flavor="hive",
+    )
+    return ds.dataset(root, format="parquet", partitioning=partitioning)
+
+
+def _clean(df: pd.DataFrame) -> pd.DataFrame:
+    """Filtres macro, typage et colonnes dérivées d'un paquet."""
+    keep = (
+        (df["nature"] == "Vente")
+        & (df["lot_count"] == 1)
+        & (df["carrez_area"] > 0)
+        & (df["property_value"] > 0)
+    )
+    df = df.loc[keep.to_numpy()]
+    dates = pd.to_datetime(df["mutation_date"], format="%d/%m/%Y", errors="coerce")
+    out = pd.DataFrame(
+        {
+            "mutation_date": dates,
+            "year": dates.dt.year.astype("Int16"),
+            "department": df["department"].str.strip(),
+            "commune_code": df["commune_code"].str.strip().str.zfill(3),
+            "commune": df["commune"].str.strip(),
+            "postal_code": df["postal_code"].str.strip(),
+            "section_prefix": df["section_prefix"].str.strip().str.zfill(3),
+            "section": df["section"].str.strip(),
+            "plan_number": df["plan_number"].astype("Int32"),
+            "street_number": df["street_number"].astype("Int32"),
+            "street_type": df["street_type"],
+            "street": df["street"],
+            "property_type": df["property_type"],
+            "rooms": df["rooms"].astype("Int16"),
+            "property_value": df["property_value"],
+            "carrez_area": df["carrez_area"],
+            "built_area": df["built_area"],
+            "price_per_m2": df["property_value"] / df["carrez_area"],
+        }
+    )
+    return out.loc[out["year"].notna().to_numpy()].reset_index(drop=True)
+
+
+def _clean_empty() -> pd.DataFrame:
+    """Paquet vide au schéma de sortie."""
+    empty = pd.DataFrame(
+        {source: pd.Series(dtype=dtype) for source, dtype in SOURCE_DTYPES.items()}
+    )
+    return _clean(empty.rename(columns=SOURCE_COLUMNS))
+
+
+def _write(data: pd.DataFrame, output_dir: Path, source: Path) -> None:
+    """Écrit les mutations d'un fichier source, une partition par commune/année."""
+    if data.empty:
+        return
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    table = pa.Table.from_pandas(data, preserve_index=False)
+    ds.write_dataset(
+        table,
+        output_dir,
+        format="parquet",
+        partitioning=list(PARTITION_COLUMNS),
+        partitioning_flavor="hive",
+        basename_template=f"{source.stem}-{{i}}.parquet",
+        existing_data_behavior="overwrite_or_ignore",
+        max_partitions=MAX_PARTITIONS,
+    )
+
+
+def _remove_outputs(output_dir: Path, source: Path) -> None:
+    """Supprime les fichiers Parquet produits par une ingestion précédente."""
+    for path in output_dir.glob(f"*/*/*/{source.stem}-*.parquet"):
+        path.unlink()
+
+
+def _signature(path: Path) -> list[int]:
+    """Taille et date de modification (ns) d'un fichier."""
+    stat = path.stat()
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def _load_manifest(output_dir: Path) -> dict:
+    """Manifeste des fichiers déjà ingérés (vide s'il n'existe pas)."""
+    path = output_dir / MANIFEST_NAME
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _save_manifest(output_dir: Path, manifest: dict) -> None:
+    """Enregistre le manifeste (remplacement atomique)."""
+    path = output_dir / MANIFEST_NAME
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8")
+    tmp.replace(path)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Point d'entrée en ligne de commande.
+
+    Args:
+        argv: Arguments (défaut : ``sys.argv[1:]``).
+
+    Returns:
+        Code de sortie (0 en cas de succès).
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m infrastructure.dvf",
+        description="Ingestion incrémentale des fichiers DVF en Parquet partitionné.",
+    )
+    parser.add_argument("input_dir", type=Path, help="répertoire des fichiers DVF")
+    parser.add_argument("output_dir", type=Path, help="racine du magasin Parquet")
+    parser.add_argument("--pattern", default=SOURCE_PATTERN, help="motif des fichiers")
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help="lignes lues par paquet",
+    )
+    args = parser.parse_args(argv)
+    for report in ingest_directory(
+        args.input_dir, args.output_dir, args.pattern, args.chunk_size
+    ):
+        status = "inchangé" if report.skipped else f"{report.rows_read} lignes lues"
+        print(
+            f"{report.source}: {status}, {report.rows_kept} mutations",
+            file=sys.stderr,
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
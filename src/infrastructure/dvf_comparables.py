@@ -0,0 +1,341 @@
+"""Magasin de recherche des ventes DVF comparables à un bien.
+
+Construit depuis le magasin Parquet (:mod:`infrastructure.dvf`) après
+chaque ingestion, il range les ventes par groupe (type de bien × commune)
+puis par surface croissante, en tableaux colonnes ``.npy`` ouverts en
+mémoire projetée. Une recherche localise le groupe par dichotomie, puis
+la fenêtre de surfaces utile, et ne calcule la distance pondérée
+(:class:`application.market.ComparableWeights`) que sur cette fenêtre.
+
+La fenêtre est élargie jusqu'à ce que toute vente hors fenêtre soit, par
+son seul écart de surface, plus éloignée que la k-ième retenue : le
+résultat est exactement celui d'un parcours complet du groupe.
+
+Usage::
+
+    python -m infrastructure.dvf_comparables output/dvf output/dvf_comparables
+"""
+
+import argparse
+import datetime
+import os
+import sys
+from collections.abc import Sequence
+from functools import cached_property, lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from application.market import DEFAULT_COMPARABLES, Comparable, ComparableWeights
+from infrastructure.dvf_index import (
+    PROPERTY_TYPES,
+    commune_directory,
+    load_sales,
+    resolve_commune,
+)
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+COMPARABLES_PATH_ENV = "LMNP_DVF_COMPARABLES"
+DEFAULT_COMPARABLES_PATH = "./output/dvf_comparables"
+ARRAYS = (
+    "groups",
+    "offsets",
+    "surfaces",
+    "days",
+    "sections",
+    "rooms",
+    "values",
+    "addresses",
+    "commune_names",
+    "commune_codes",
+)
+# Fenêtre de surface initiale : [s / 1,5 ; s × 1,5].
+SURFACE_WINDOW = 1.5
+EPOCH = datetime.date(1970, 1, 1)
+
+
+class ComparableStore:
+    """Ventes DVF triées par groupe (type de bien × commune) et surface."""
+
+    def __init__(
+        self,
+        groups: "np.ndarray",
+        offsets: "np.ndarray",
+        surfaces: "np.ndarray",
+        days: "np.ndarray",
+        sections: "np.ndarray",
+        rooms: "np.ndarray",
+        values: "np.ndarray",
+        addresses: "np.ndarray",
+        commune_names: "np.ndarray",
+        commune_codes: "np.ndarray",
+    ) -> None:
+        """Initialise le magasin depuis ses tableaux.
+
+        Args:
+            groups: Clés de groupe triées (``b"A|31555"``).
+            offsets: Début de chaque groupe dans les tableaux de ventes,
+                plus la fin du dernier (``len(groups) + 1`` valeurs).
+            surfaces: Surface Carrez (m²), croissante dans chaque groupe.
+            days: Date de mutation (jours depuis le 1er janvier 1970).
+            sections: Section cadastrale, préfixe inclus.
+            rooms: Nombre de pièces (0 si non renseigné).
+            values: Valeur foncière (€), en ``float64`` (un ``float32``
+                perd les centimes dès 131 072 €).
+            addresses: Adresse de la vente.
+            commune_names: Noms de commune normalisés, triés.
+            commune_codes: Code INSEE de chaque nom.
+        """
+        self.groups = groups
+        self.offsets = offsets
+        self.surfaces = surfaces
+        self.days = days
+        self.sections = sections
+        self.rooms = rooms
+        self.values = values
+        self.addresses = addresses
+        self.commune_names = commune_names
+        self.commune_codes = commune_codes
+
+    def __len__(self) -> int:
+        return len(self.surfaces)
+
+    @cached_property
+    def latest(self) -> datetime.date:
+        """Date de la vente la plus récente (référence d'ancienneté)."""
+        return EPOCH + datetime.timedelta(days=int(self.days.max()))
+
+    @classmethod
+    def open(cls, directory: Path | str) -> "ComparableStore":
+        """Ouvre un magasin écrit par :meth:`save`, en mémoire projetée."""
+        import numpy as np
+
+        directory = Path(directory)
+        return cls(
+            **{
+                name: np.load(directory / f"{name}.npy", mmap_mode="r")
+                for name in ARRAYS
+            }
+        )
+
+    def save(self, directory: Path | str) -> None:
+        """Écrit le magasin, un fichier ``.npy`` par tableau."""
+        import numpy as np
+
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        for name in ARRAYS:
+            np.save(directory / f"{name}.npy", getattr(self, name))
+
+    def nearest(
+        self,
+        city: str,
+        property_type: str,
+        surface: float,
+        section: str | None = None,
+        rooms: int | None = None,
+        k: int = DEFAULT_COMPARABLES,
+        weights: ComparableWeights = ComparableWeights(),
+        as_of: datetime.date | None = None,
+    ) -> list[Comparable]:
+        """Les ``k`` ventes de la commune les plus proches du bien.
+
+        Args:
+            city: Commune (nom ou code INSEE).
+            property_type: ``"Appartement"`` ou ``"Maison"``.
+            surface: Surface du bien (m²).
+            section: Section cadastrale du bien, préfixe inclus.
+            rooms: Nombre de pièces du bien.
+            k: Nombre de ventes retournées.
+            weights: Pondération de la distance.
+            as_of: Date de référence de l'ancienneté (défaut : vente la
+                plus récente du magasin).
+
+        Returns:
+            Jusqu'à ``k`` ventes, de la plus proche à la plus éloignée ;
+            liste vide pour une commune ou un type de bien inconnus.
+        """
+        import numpy as np
+
+        code = resolve_commune(self.commune_names, self.commune_codes, city)
+        type_code = PROPERTY_TYPES.get(property_type)
+        if code is None or type_code is None or surface <= 0 or k <= 0:
+            return []
+        group = f"{type_code}|{code}".encode()
+        g = int(np.searchsorted(self.groups, group))
+        if g == len(self.groups) or self.groups[g] != group:
+            return []
+        lo, hi = int(self.offsets[g]), int(self.offsets[g + 1])
+        reference = ((as_of or self.latest) - EPOCH).days
+        surfaces = self.surfaces[lo:hi]
+        ratio = SURFACE_WINDOW if weights.surface > 0 else np.inf
+        widened = False
+        while True:
+            start = lo + int(np.searchsorted(surfaces, surface / ratio, "left"))
+            stop = lo + int(np.searchsorted(surfaces, surface * ratio, "right"))
+            complete = start == lo and stop == hi
+            if stop - start < k and not complete:
+                ratio *= ratio
+                continue
+            distances = self._distances(
+                start, stop, surface, section, rooms, reference, weights
+            )
+            order = _smallest(distances, k)
+            bound = float(distances[order[-1]]) if len(order) else 0.0
+            # Hors fenêtre, le seul écart de surface dépasse
+            # weights.surface × ln(ratio) : le résultat est exact.
+            if complete or widened or bound <= weights.surface * np.log(ratio):
+                return [self._comparable(start + i, distances[i]) for i in order]
+            ratio = float(np.exp(bound / weights.surface))
+            widened = True
+
+    def _distances(
+        self,
+        start: int,
+        stop: int,
+        surface: float,
+        section: str | None,
+        rooms: int | None,
+        reference: int,
+        weights: ComparableWeights,
+    ) -> "np.ndarray":
+        """Distance pondérée au bien des ventes ``[start, stop)``."""
+        import numpy as np
+
+        distances = weights.surface * np.abs(
+            np.log(np.asarray(self.surfaces[start:stop], dtype=np.float64) / surface)
+        )
+        age = np.abs(reference - np.asarray(self.days[start:stop], dtype=np.int64))
+        distances += weights.age * age / 365.25
+        if section is not None:
+            distances += weights.section * (
+                self.sections[start:stop] != section.encode()
+            )
+        if rooms is not None:
+            sale_rooms = np.asarray(self.rooms[start:stop], dtype=np.int16)
+            gap = np.where(sale_rooms > 0, np.abs(sale_rooms - rooms), 1)
+            distances += weights.rooms * gap
+        return distances
+
+    def _comparable(self, i: int, distance: float) -> Comparable:
+        """Vente ``i`` du magasin."""
+        surface = round(float(self.surfaces[i]), 2)
+        value = float(self.values[i])
+        rooms = int(self.rooms[i])
+        return Comparable(
+            date=EPOCH + datetime.timedelta(days=int(self.days[i])),
+            address=self.addresses[i].decode(),
+            section=self.sections[i].decode(),
+            surface=surface,
+            rooms=rooms or None,
+            value=value,
+            price_per_m2=value / surface,
+            distance=float(distance),
+        )
+
+
+def _smallest(values: "np.ndarray", k: int) -> "np.ndarray":
+    """Indices des ``k`` plus petites valeurs, par ordre croissant."""
+    import numpy as np
+
+    if len(values) > k:
+        candidates = np.argpartition(values, k - 1)[:k]
+        return candidates[np.argsort(values[candidates], kind="stable")]
+    return np.argsort(values, kind="stable")
+
+
+def build_store(store: Path | str) -> ComparableStore:
+    """Construit le magasin de comparables depuis le magasin Parquet DVF.
+
+    Args:
+        store: Racine du magasin Parquet (:func:`infrastructure.dvf.ingest`).
+
+    Returns:
+        Magasin prêt à être enregistré ou interrogé.
+    """
+    import numpy as np
+
+    df = load_sales(
+        store,
+        columns=(
+            "mutation_date",
+            "carrez_area",
+            "property_value",
+            "street_number",
+            "street_type",
+            "street",
+        ),
+    )
+    groups = (df["type_code"] + "|" + df["insee"]).to_numpy(dtype=bytes)
+    surfaces = df["carrez_area"].to_numpy(dtype=np.float32)
+    order = np.lexsort((surfaces, groups))
+    groups = groups[order]
+    keys, starts = np.unique(groups, return_index=True)
+    addresses = (
+        df["street_number"].astype("string").fillna("")
+        + " "
+        + df["street_type"].fillna("")
+        + " "
+        + df["street"].fillna("")
+    ).str.split().str.join(" ")
+    days = df["mutation_date"].to_numpy().astype("datetime64[D]").astype(np.int32)
+    commune_names, commune_codes = commune_directory(df)
+    return ComparableStore(
+        groups=keys,
+        offsets=np.append(starts, len(groups)).astype(np.int64),
+        surfaces=surfaces[order],
+        days=days[order],
+        sections=df["section_key"].to_numpy(dtype=bytes)[order],
+        rooms=df["rooms"].fillna(0).to_numpy(dtype=np.int8)[order],
+        values=df["property_value"].to_numpy(dtype=np.float64)[order],
+        addresses=addresses.to_numpy(dtype=bytes)[order],
+        commune_names=commune_names,
+        commune_codes=commune_codes,
+    )
+
+
+@lru_cache(maxsize=1)
+def default_comparable_store() -> ComparableStore | None:
+    """Magasin du processus (``$LMNP_DVF_COMPARABLES``), ``None`` s'il n'existe pas."""
+    path = Path(os.environ.get(COMPARABLES_PATH_ENV, DEFAULT_COMPARABLES_PATH))
+    if not (path / "groups.npy").exists():
+        return None
+    return ComparableStore.open(path)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Point d'entrée en ligne de commande.
+
+    Args:
+        argv: Arguments (défaut : ``sys.argv[1:]``).
+
+    Returns:
+        Code de sortie (0 en cas de succès).
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m infrastructure.dvf_comparables",
+        description="Construction du magasin de ventes comparables DVF.",
+    )
+    parser.add_argument("store", type=Path, help="racine du magasin Parquet DVF")
+    parser.add_argument(
+        "output",
+        type=Path,
+        nargs="?",
+        default=Path(DEFAULT_COMPARABLES_PATH),
+        help="répertoire du magasin de comparables",
+    )
+    args = parser.parse_args(argv)
+    comparables = build_store(args.store)
+    comparables.save(args.output)
+    print(
+        f"{len(comparables)} ventes, {len(comparables.groups)} groupes "
+        f"→ {args.output}",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,234 @@
+"""Cube historique du prix médian au m² DVF, base du mode de revente « marché ».
+
+Construit depuis le magasin Parquet (:mod:`infrastructure.dvf`) par deux
+agrégations groupées (type de bien × commune × section × année, puis
+type de bien × commune × année), le cube range une ligne par zone et une
+colonne par année : prix médian au m² et nombre de ventes.
+
+Il est écrit en fichiers ``.npy`` non compressés et ouvert en mémoire
+projetée (``mmap_mode="r"``) : le chargement est immédiat et seules les
+pages consultées sont lues. Une recherche est une dichotomie sur les clés
+triées.
+
+Usage::
+
+    python -m infrastructure.dvf_growth output/dvf output/dvf_growth
+"""
+
+import argparse
+import os
+import sys
+from collections.abc import Sequence
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from application.market import GrowthCurve
+from infrastructure.dvf_index import (
+    ANY,
+    MIN_COUNT,
+    PROPERTY_TYPES,
+    commune_directory,
+    load_sales,
+    resolve_commune,
+)
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+
+CUBE_PATH_ENV = "LMNP_DVF_GROWTH"
+DEFAULT_CUBE_PATH = "./output/dvf_growth"
+ARRAYS = ("keys", "years", "medians", "counts", "commune_names", "commune_codes")
+# Nombre minimal de variations annuelles exploitables pour retenir une zone.
+MIN_RATES = 2
+
+
+class GrowthCube:
+    """Prix médians au m² par zone et par année."""
+
+    def __init__(
+        self,
+        keys: "np.ndarray",
+        years: "np.ndarray",
+        medians: "np.ndarray",
+        counts: "np.ndarray",
+        commune_names: "np.ndarray",
+        commune_codes: "np.ndarray",
+    ) -> None:
+        """Initialise le cube depuis ses tableaux.
+
+        Args:
+            keys: Clés de zone triées (``b"A|31555|826AD"``, ``*`` pour la
+                commune entière).
+            years: Années, croissantes et consécutives.
+            medians: Prix médian au m², forme ``(zones, années)`` (NaN si
+                aucune vente).
+            counts: Nombre de ventes, même forme.
+            commune_names: Noms de commune normalisés, triés.
+            commune_codes: Code INSEE de chaque nom.
+        """
+        self.keys = keys
+        self.years = years
+        self.medians = medians
+        self.counts = counts
+        self.commune_names = commune_names
+        self.commune_codes = commune_codes
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    @classmethod
+    def open(cls, directory: Path | str) -> "GrowthCube":
+        """Ouvre un cube écrit par :meth:`save`, en mémoire projetée."""
+        import numpy as np
+
+        directory = Path(directory)
+        return cls(
+            **{
+                name: np.load(directory / f"{name}.npy", mmap_mode="r")
+                for name in ARRAYS
+            }
+        )
+
+    def save(self, directory: Path | str) -> None:
+        """Écrit le cube, un fichier ``.npy`` par tableau."""
+        import numpy as np
+
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        for name in ARRAYS:
+            np.save(directory / f"{name}.npy", getattr(self, name))
+
+    def growth_curve(
+        self,
+        city: str,
+        property_type: str = "Appartement",
+        section: str | None = None,
+        min_count: int = MIN_COUNT,
+    ) -> GrowthCurve | None:
+        """Évolution du prix médian de la zone la plus fine exploitable.
+
+        La section est essayée en premier si elle est fournie, puis la
+        commune. Seules les variations entre deux années consécutives
+        comptant chacune au moins ``min_count`` ventes sont retenues.
+
+        Args:
+            city: Commune (nom ou code INSEE).
+            property_type: ``"Appartement"`` ou ``"Maison"``.
+            section: Section cadastrale, préfixe inclus (ex: ``"826AD"``).
+            min_count: Ventes minimales par année.
+
+        Returns:
+            Courbe d'au moins ``MIN_RATES`` variations, ou ``None``.
+        """
+        import numpy as np
+
+        code = resolve_commune(self.commune_names, self.commune_codes, city)
+        type_code = PROPERTY_TYPES.get(property_type)
+        if code is None or type_code is None:
+            return None
+        levels = [("commune", ANY)]
+        if section is not None:
+            levels.insert(0, ("section", section))
+        for level, zone in levels:
+            key = f"{type_code}|{code}|{zone}".encode()
+            i = int(np.searchsorted(self.keys, key))
+            if i == len(self.keys) or self.keys[i] != key:
+                continue
+            medians = np.asarray(self.medians[i], dtype=np.float64)
+            valid = np.asarray(self.counts[i]) >= min_count
+            pairs = valid[1:] & valid[:-1]
+            if pairs.sum() < MIN_RATES:
+                continue
+            rates = medians[1:][pairs] / medians[:-1][pairs] - 1
+            return GrowthCurve(
+                level=level,
+                years=tuple(int(y) for y in self.years[1:][pairs]),
+                rates=tuple(float(r) for r in rates),
+            )
+        return None
+
+
+def build_cube(store: Path | str) -> GrowthCube:
+    """Calcule le cube depuis le magasin Parquet DVF.
+
+    Args:
+        store: Racine du magasin Parquet (:func:`infrastructure.dvf.ingest`).
+
+    Returns:
+        Cube prêt à être enregistré ou interrogé.
+    """
+    import numpy as np
+    import pandas as pd
+
+    df = load_sales(store)
+    years = np.arange(df["year"].min(), df["year"].max() + 1, dtype=np.int16)
+    section_level = _aggregate(df, "section_key")
+    commune_level = _aggregate(df, None)
+    stats = pd.concat([section_level, commune_level]).sort_index()
+    medians = stats["median"].unstack("year").reindex(columns=years)
+    counts = stats["count"].unstack("year").reindex(columns=years).fillna(0)
+    commune_names, commune_codes = commune_directory(df)
+    return GrowthCube(
+        keys=medians.index.to_numpy(dtype=bytes),
+        years=years,
+        medians=medians.to_numpy(dtype=np.float32),
+        counts=counts.to_numpy(dtype=np.int32),
+        commune_names=commune_names,
+        commune_codes=commune_codes,
+    )
+
+
+def _aggregate(df: "pd.DataFrame", zone: str | None) -> "pd.DataFrame":
+    """Médiane et effectif par (clé de zone, année)."""
+    zone_key = df[zone] if zone is not None else ANY
+    keys = df["type_code"] + "|" + df["insee"] + "|" + zone_key
+    grouped = df.groupby([keys.rename("key"), df["year"]], observed=True)
+    stats = grouped["price_per_m2"].agg(["median", "size"])
+    return stats.rename(columns={"size": "count"})
+
+
+@lru_cache(maxsize=1)
+def default_growth_cube() -> GrowthCube | None:
+    """Cube du processus (``$LMNP_DVF_GROWTH``), ``None`` s'il n'existe pas."""
+    path = Path(os.environ.get(CUBE_PATH_ENV, DEFAULT_CUBE_PATH))
+    if not (path / "keys.npy").exists():
+        return None
+    return GrowthCube.open(path)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Point d'entrée en ligne de commande.
+
+    Args:
+        argv: Arguments (défaut : ``sys.argv[1:]``).
+
+    Returns:
+        Code de sortie (0 en cas de succès).
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m infrastructure.dvf_growth",
+        description="Construction du cube d'évolution des prix au m² DVF.",
+    )
+    parser.add_argument("store", type=Path, help="racine du magasin Parquet DVF")
+    parser.add_argument(
+        "output",
+        type=Path,
+        nargs="?",
+        default=Path(DEFAULT_CUBE_PATH),
+        help="répertoire du cube",
+    )
+    args = parser.parse_args(argv)
+    cube = build_cube(args.store)
+    cube.save(args.output)
+    print(
+        f"{len(cube)} zones × {len(cube.years)} années → {args.output}",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
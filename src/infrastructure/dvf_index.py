@@ -0,0 +1,450 @@
+"""Index précalculé des prix au m² DVF (quantiles par zone).
+
+Construit depuis le magasin Parquet (:mod:`infrastructure.dvf`), l'index
+résume la distribution du prix au m² par type de bien, commune, section
+cadastrale, nombre de pièces et année : effectif et quantiles P10, P25,
+P50, P75, P90. Les niveaux plus grossiers (commune + section, commune +
+pièces, commune) et l'agrégat toutes années sont précalculés de la même
+façon.
+
+Les clés sont triées dans un tableau ``numpy`` : une recherche est une
+dichotomie (``searchsorted``) par niveau, sans charger les transactions.
+Un niveau dont l'effectif est trop faible cède la place au suivant.
+
+Usage::
+
+    python -m infrastructure.dvf_index output/dvf output/dvf_index.npz
+"""
+
+import argparse
+import os
+import re
+import sys
+import unicodedata
+from collections.abc import Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+
+INDEX_PATH_ENV = "LMNP_DVF_INDEX"
+DEFAULT_INDEX_PATH = "./output/dvf_index.npz"
+QUANTILES = (0.1, 0.25, 0.5, 0.75, 0.9)
+MIN_COUNT = 20
+MAX_ROOMS = 5
+# Prix au m² retenus : écarte cessions symboliques et saisies aberrantes.
+PRICE_PER_M2_RANGE = (100.0, 50_000.0)
+PROPERTY_TYPES = {"Appartement": "A", "Maison": "M"}
+ANY = "*"
+# Code INSEE : département (2 ou 3 caractères, Corse incluse) + commune.
+INSEE_CODE = re.compile(r"^(\d{2,3}|2[AB])\d{3}$")
+# Niveaux de recherche, du plus fin au plus grossier.
+LEVELS = (
+    ("section", "rooms"),
+    ("section",),
+    ("rooms",),
+    (),
+)
+LEVEL_LABELS = {
+    ("section", "rooms"): "section et pièces",
+    ("section",): "section",
+    ("rooms",): "commune et pièces",
+    (): "commune",
+}
+
+
+@dataclass(frozen=True)
+class MarketQuote:
+    """Distribution du prix au m² d'une zone.
+
+    Attributes:
+        level: Niveau retenu (ex: ``"section et pièces"``).
+        year: Année, ``None`` pour toutes années confondues.
+        count: Nombre de ventes.
+        p10: 10e percentile (€/m²).
+        p25: Premier quartile (€/m²).
+        median: Médiane (€/m²).
+        p75: Troisième quartile (€/m²).
+        p90: 90e percentile (€/m²).
+    """
+
+    level: str
+    year: int | None
+    count: int
+    p10: float
+    p25: float
+    median: float
+    p75: float
+    p90: float
+
+    def percentile_of(self, price_per_m2: float) -> float:
+        """Rang approximatif (0–100) d'un prix au m² dans la distribution.
+
+        Interpolation linéaire entre quantiles, bornée à [10, 90] hors de
+        l'intervalle P10–P90.
+
+        Args:
+            price_per_m2: Prix au m² à situer.
+
+        Returns:
+            Percentile estimé.
+        """
+        import numpy as np
+
+        values = [self.p10, self.p25, self.median, self.p75, self.p90]
+        return float(np.interp(price_per_m2, values, [q * 100 for q in QUANTILES]))
+
+
+class MarketIndex:
+    """Index trié des quantiles de prix au m²."""
+
+    def __init__(
+        self,
+        keys: "np.ndarray",
+        counts: "np.ndarray",
+        quantiles: "np.ndarray",
+        commune_names: "np.ndarray",
+        commune_codes: "np.ndarray",
+    ) -> None:
+        """Initialise l'index depuis ses tableaux.
+
+        Args:
+            keys: Clés triées (``bytes``), voir :func:`index_key`.
+            counts: Effectif par clé.
+            quantiles: Quantiles ``QUANTILES`` par clé, forme ``(n, 5)``.
+            commune_names: Noms de commune normalisés, triés.
+            commune_codes: Code INSEE correspondant à chaque nom.
+        """
+        self.keys = keys
+        self.counts = counts
+        self.quantiles = quantiles
+        self.commune_names = commune_names
+        self.commune_codes = commune_codes
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    @classmethod
+    def load(cls, path: Path | str) -> "MarketIndex":
+        """Charge un index écrit par :meth:`save`."""
+        import numpy as np
+
+        with np.load(path) as data:
+            return cls(**{name: data[name] for name in data.files})
+
+    def save(self, path: Path | str) -> None:
+        """Écrit l'index (``.npz`` compressé)."""
+        import numpy as np
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        np.savez_compressed(
+            path,
+            keys=self.keys,
+            counts=self.counts,
+            quantiles=self.quantiles,
+            commune_names=self.commune_names,
+            commune_codes=self.commune_codes,
+        )
+
+    def commune_code(self, city: str) -> str | None:
+        """Code INSEE d'une commune (voir :func:`resolve_commune`)."""
+        return resolve_commune(self.commune_names, self.commune_codes, city)
+
+    def lookup(
+        self,
+        city: str,
+        property_type: str = "Appartement",
+        section: str | None = None,
+        rooms: int | None = None,
+        year: int | None = None,
+        min_count: int = MIN_COUNT,
+    ) -> MarketQuote | None:
+        """Distribution du prix au m² la plus fine disponible.
+
+        Les niveaux sont essayés du plus fin au plus grossier ; le premier
+        dont l'effectif atteint ``min_count`` est retenu, sinon le plus
+        fin disponible.
+
+        Args:
+            city: Commune (nom) ou code INSEE.
+            property_type: ``"Appartement"`` ou ``"Maison"``.
+            section: Section cadastrale, préfixe inclus (ex: ``"826AD"``).
+            rooms: Nombre de pièces principales.
+            year: Année de mutation, ``None`` pour toutes années.
+            min_count: Effectif minimal d'un niveau.
+
+        Returns:
+            Distribution, ou ``None`` si la commune est absente de l'index.
+        """
+        code = self.commune_code(city)
+        type_code = PROPERTY_TYPES.get(property_type)
+        if code is None or type_code is None:
+            return None
+        given = {"section": section, "rooms": rooms}
+        fallback = None
+        for level in LEVELS:
+            if any(given[name] is None for name in level):
+                continue
+            key = index_key(
+                type_code,
+                code,
+                section if "section" in level else None,
+                rooms if "rooms" in level else None,
+                year,
+            )
+            position = self._find(key)
+            if position is None:
+                continue
+            quote = self._quote(position, level, year)
+            if quote.count >= min_count:
+                return quote
+            fallback = fallback or quote
+        return fallback
+
+    def _find(self, key: bytes) -> int | None:
+        """Position d'une clé (dichotomie), ``None`` si absente."""
+        import numpy as np
+
+        i = int(np.searchsorted(self.keys, key))
+        if i < len(self.keys) and self.keys[i] == key:
+            return i
+        return None
+
+    def _quote(
+        self, position: int, level: tuple[str, ...], year: int | None
+    ) -> MarketQuote:
+        p10, p25, median, p75, p90 = (float(v) for v in self.quantiles[position])
+        return MarketQuote(
+            level=LEVEL_LABELS[level],
+            year=year,
+            count=int(self.counts[position]),
+            p10=p10,
+            p25=p25,
+            median=median,
+            p75=p75,
+            p90=p90,
+        )
+
+
+def normalize_commune(name: str) -> str:
+    """Nom de commune comparable : majuscules, sans accents ni tirets."""
+    ascii_name = (
+        unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode()
+    )
+    for separator in "-'’":
+        ascii_name = ascii_name.replace(separator, " ")
+    return " ".join(ascii_name.upper().split())
+
+
+def index_key(
+    type_code: str,
+    commune_code: str,
+    section: str | None,
+    rooms: int | None,
+    year: int | None,
+) -> bytes:
+    """Clé d'index d'une zone (``ANY`` pour une dimension agrégée)."""
+    rooms_part = ANY if rooms is None else str(min(max(int(rooms), 1), MAX_ROOMS))
+    return "|".join(
+        (
+            type_code,
+            commune_code,
+            ANY if section is None else section,
+            rooms_part,
+            ANY if year is None else str(year),
+        )
+    ).encode()
+
+
+def resolve_commune(
+    commune_names: "np.ndarray", commune_codes: "np.ndarray", city: str
+) -> str | None:
+    """Code INSEE d'une commune à partir de son nom ou de son code.
+
+    Pour un nom porté par plusieurs communes, celle qui compte le plus de
+    ventes est retenue.
+
+    Args:
+        commune_names: Noms normalisés triés (:func:`commune_directory`).
+        commune_codes: Code INSEE de chaque nom.
+        city: Nom saisi (casse, accents et tirets indifférents) ou code
+            INSEE.
+
+    Returns:
+        Code INSEE (département + commune), ou ``None`` si inconnue.
+    """
+    import numpy as np
+
+    if INSEE_CODE.match(city):
+        return city
+    name = normalize_commune(city).encode()
+    i = int(np.searchsorted(commune_names, name))
+    if i < len(commune_names) and commune_names[i] == name:
+        return commune_codes[i].decode()
+    return None
+
+
+def load_sales(store: Path | str, columns: Sequence[str] = ()) -> "pd.DataFrame":
+    """Ventes du magasin Parquet utiles aux agrégats, avec leurs clés.
+
+    Seules les colonnes nécessaires sont lues ; les types de bien hors
+    ``PROPERTY_TYPES`` et les prix au m² hors ``PRICE_PER_M2_RANGE`` sont
+    écartés à la lecture.
+
+    Args:
+        store: Racine du magasin Parquet (:func:`infrastructure.dvf.ingest`).
+        columns: Colonnes du magasin à lire en plus.
+
+    Returns:
+        DataFrame avec ``commune``, ``year``, ``price_per_m2`` et les clés
+        ``type_code``, ``insee``, ``section_key``, ``rooms_key``,
+        ``year_key``.
+    """
+    import pyarrow.dataset as ds
+
+    from infrastructure.dvf import open_dataset
+
+    low, high = PRICE_PER_M2_RANGE
+    table = open_dataset(store).to_table(
+        columns=[
+            "department",
+            "commune_code",
+            "commune",
+            "section_prefix",
+            "section",
+            "rooms",
+            "year",
+            "property_type",
+            "price_per_m2",
+            *columns,
+        ],
+        filter=ds.field("property_type").isin(list(PROPERTY_TYPES))
+        & (ds.field("price_per_m2") >= low)
+        & (ds.field("price_per_m2") <= high),
+    )
+    df = table.to_pandas()
+    df["type_code"] = df["property_type"].map(PROPERTY_TYPES).astype(str)
+    df["insee"] = df["department"].astype(str) + df["commune_code"].astype(str)
+    df["section_key"] = (
+        df["section_prefix"].fillna("000").astype(str)
+        + df["section"].fillna("").astype(str)
+    )
+    df["rooms_key"] = (
+        df["rooms"].fillna(1).clip(1, MAX_ROOMS).astype(int).astype(str)
+    )
+    df["year_key"] = df["year"].astype(int).astype(str)
+    return df
+
+
+def commune_directory(df: "pd.DataFrame") -> tuple["np.ndarray", "np.ndarray"]:
+    """Noms de commune normalisés triés et code INSEE de chacun.
+
+    Args:
+        df: Ventes (:func:`load_sales`).
+
+    Returns:
+        ``(noms, codes)`` en tableaux ``bytes``, pour :func:`resolve_commune`.
+    """
+    names = (
+        df.groupby("commune")["insee"]
+        .agg(lambda s: s.value_counts().index[0])
+        .rename(index=normalize_commune)
+    )
+    names = names[~names.index.duplicated()].sort_index()
+    return names.index.to_numpy(dtype=bytes), names.to_numpy(dtype=bytes)
+
+
+def build_index(store: Path | str) -> MarketIndex:
+    """Calcule l'index depuis le magasin Parquet DVF.
+
+    Une agrégation groupée par niveau, avec et sans l'année.
+
+    Args:
+        store: Racine du magasin Parquet (:func:`infrastructure.dvf.ingest`).
+
+    Returns:
+        Index prêt à être enregistré ou interrogé.
+    """
+    import numpy as np
+    import pandas as pd
+
+    df = load_sales(store)
+    frames = []
+    for level in LEVELS:
+        dims = [{"section": "section_key", "rooms": "rooms_key"}[d] for d in level]
+        for by_year in (True, False):
+            group = ["type_code", "insee", *dims, *(["year_key"] if by_year else [])]
+            frames.append(_summarize(df, group, level, by_year))
+    summary = pd.concat(frames, ignore_index=True).sort_values("key")
+
+    commune_names, commune_codes = commune_directory(df)
+    return MarketIndex(
+        keys=summary["key"].to_numpy(dtype=bytes),
+        counts=summary["count"].to_numpy(dtype=np.int32),
+        quantiles=summary[[f"q{q}" for q in QUANTILES]].to_numpy(dtype=np.float32),
+        commune_names=commune_names,
+        commune_codes=commune_codes,
+    )
+
+
+def _summarize(
+    df: "pd.DataFrame", group: list[str], level: tuple[str, ...], by_year: bool
+) -> "pd.DataFrame":
+    """Effectif et quantiles d'un niveau, avec la clé d'index de chaque groupe."""
+    grouped = df.groupby(group, observed=True, sort=False)["price_per_m2"]
+    stats = grouped.quantile(list(QUANTILES)).unstack()
+    stats.columns = [f"q{q}" for q in QUANTILES]
+    stats["count"] = grouped.size()
+    stats = stats.reset_index()
+    key = stats["type_code"] + "|" + stats["insee"]
+    key += "|" + (stats["section_key"] if "section" in level else ANY)
+    key += "|" + (stats["rooms_key"] if "rooms" in level else ANY)
+    key += "|" + (stats["year_key"] if by_year else ANY)
+    stats["key"] = key.str.encode("ascii")
+    return stats[["key", "count", *[f"q{q}" for q in QUANTILES]]]
+
+
+@lru_cache(maxsize=1)
+def default_market_index() -> MarketIndex | None:
+    """Index du processus (``$LMNP_DVF_INDEX``), ``None`` s'il n'existe pas."""
+    path = Path(os.environ.get(INDEX_PATH_ENV, DEFAULT_INDEX_PATH))
+    if not path.exists():
+        return None
+    return MarketIndex.load(path)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Point d'entrée en ligne de commande.
+
+    Args:
+        argv: Arguments (défaut : ``sys.argv[1:]``).
+
+    Returns:
+        Code de sortie (0 en cas de succès).
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m infrastructure.dvf_index",
+        description="Construction de l'index des prix au m² DVF.",
+    )
+    parser.add_argument("store", type=Path, help="racine du magasin Parquet DVF")
+    parser.add_argument(
+        "output",
+        type=Path,
+        nargs="?",
+        default=Path(DEFAULT_INDEX_PATH),
+        help="fichier d'index (.npz)",
+    )
+    args = parser.parse_args(argv)
+    index = build_index(args.store)
+    index.save(args.output)
+    print(f"{len(index)} zones → {args.output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
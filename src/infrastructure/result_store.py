@@ -0,0 +1,220 @@
+"""Cache persistant des résultats de simulation sur disque (SQLite).
+
+Le cache survit aux redémarrages et se partage entre les workers Streamlit
+et les traitements batch d'un même hôte : SQLite en mode WAL sérialise les
+écritures entre processus, chaque thread ouvre sa propre connexion.
+
+Les résultats sont sérialisés en pickle protocole 5 avec tampons hors-bande :
+les tableaux NumPy (colonnes des DataFrame) sont stockés bruts à la suite du
+flux pickle, sans copie intermédiaire. L'éviction est LRU et bornée en
+taille totale.
+"""
+
+import os
+import pickle
+import sqlite3
+import struct
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "simu_immo"
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+CACHE_DIR_ENV = "LMNP_CACHE_DIR"
+CACHE_MAX_MB_ENV = "LMNP_CACHE_MAX_MB"
+BUSY_TIMEOUT_SECONDS = 30.0
+
+_HEADER = struct.Struct("<I")
+_LENGTH = struct.Struct("<Q")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    payload BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_last_access ON results (last_access);
+"""
+
+
+def serialize(obj: Any) -> bytes:
+    """Sérialise un objet en pickle 5 suivi de ses tampons hors-bande.
+
+    Format : nombre de tampons (u32), longueurs (u64 × (n + 1)) du flux
+    pickle puis de chaque tampon, puis les octets bout à bout.
+
+    Args:
+        obj: Objet picklable (ex: ``SimulationResult``).
+
+    Returns:
+        Représentation binaire compacte.
+    """
+    buffers: list[pickle.PickleBuffer] = []
+    stream = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+    raws = [b.raw() for b in buffers]
+    parts: list[bytes | memoryview] = [_HEADER.pack(len(raws))]
+    parts.append(_LENGTH.pack(len(stream)))
+    parts.extend(_LENGTH.pack(r.nbytes) for r in raws)
+    parts.append(stream)
+    parts.extend(raws)
+    return b"".join(parts)
+
+
+def deserialize(data: bytes) -> Any:
+    """Reconstruit un objet sérialisé par :func:`serialize`.
+
+    Les tampons sont des vues sur ``data`` : aucune copie des tableaux.
+
+    Args:
+        data: Représentation binaire.
+
+    Returns:
+        Objet reconstruit.
+    """
+    view = memoryview(data)
+    (count,) = _HEADER.unpack_from(view, 0)
+    offset = _HEADER.size
+    lengths = []
+    for _ in range(count + 1):
+        (length,) = _LENGTH.unpack_from(view, offset)
+        lengths.append(length)
+        offset += _LENGTH.size
+    stream = view[offset : offset + lengths[0]]
+    offset += lengths[0]
+    buffers = []
+    for length in lengths[1:]:
+        buffers.append(view[offset : offset + length])
+        offset += length
+    return pickle.loads(stream, buffers=buffers)
+
+
+class ResultStore:
+    """Cache clé → résultat persistant, borné en taille, éviction LRU.
+
+    Les clés sont des empreintes de paramètres (voir
+    ``application.fingerprint``), qui intègrent la version du moteur.
+    """
+
+    def __init__(self, path: Path | str, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        """Ouvre (ou crée) le cache.
+
+        Args:
+            path: Chemin du fichier SQLite.
+            max_bytes: Taille totale maximale des résultats stockés (octets).
+        """
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._max_bytes = max_bytes
+        self._local = threading.local()
+        with self._connection() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        """Connexion propre au thread courant (SQLite n'est pas partageable)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self._path, timeout=BUSY_TIMEOUT_SECONDS, isolation_level=None
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> Any | None:
+        """Retourne le résultat associé à ``key``, ou ``None`` s'il est absent.
+
+        Args:
+            key: Empreinte des paramètres.
+
+        Returns:
+            Résultat désérialisé, ou ``None``.
+        """
+        conn = self._connection()
+        row = conn.execute(
+            "SELECT payload FROM results WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        conn.execute(
+            "UPDATE results SET last_access = ? WHERE key = ?", (time.time(), key)
+        )
+        return deserialize(row[0])
+
+    def put(self, key: str, value: Any) -> None:
+        """Stocke un résultat puis évince les moins récemment utilisés.
+
+        Args:
+            key: Empreinte des paramètres.
+            value: Résultat à stocker.
+        """
+        payload = serialize(value)
+        if len(payload) > self._max_bytes:
+            return
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO results (key, payload, size, last_access)"
+                " VALUES (?, ?, ?, ?)",
+                (key, payload, len(payload), time.time()),
+            )
+            self._evict(conn)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Supprime les entrées les plus anciennes au-delà du budget."""
+        (total,) = conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM results"
+        ).fetchone()
+        if total <= self._max_bytes:
+            return
+        excess = total - self._max_bytes
+        freed = 0
+        victims: list[str] = []
+        for key, size in conn.execute(
+            "SELECT key, size FROM results ORDER BY last_access"
+        ):
+            victims.append(key)
+            freed += size
+            if freed >= excess:
+                break
+        conn.executemany("DELETE FROM results WHERE key = ?", [(k,) for k in victims])
+
+    def total_bytes(self) -> int:
+        """Taille totale des résultats stockés (octets)."""
+        (total,) = self._connection().execute(
+            "SELECT COALESCE(SUM(size), 0) FROM results"
+        ).fetchone()
+        return total
+
+    def __len__(self) -> int:
+        """Nombre de résultats stockés."""
+        (count,) = self._connection().execute(
+            "SELECT COUNT(*) FROM results"
+        ).fetchone()
+        return count
+
+    def clear(self) -> None:
+        """Vide le cache."""
+        self._connection().execute("DELETE FROM results")
+
+
+@lru_cache(maxsize=1)
+def default_result_store() -> ResultStore:
+    """Cache persistant partagé du processus.
+
+    Emplacement : ``$LMNP_CACHE_DIR/results.sqlite`` (défaut
+    ``~/.cache/simu_immo``). Budget : ``$LMNP_CACHE_MAX_MB`` (défaut 512 Mo).
+    """
+    directory = Path(os.environ.get(CACHE_DIR_ENV, DEFAULT_CACHE_DIR))
+    max_mb = os.environ.get(CACHE_MAX_MB_ENV)
+    max_bytes = int(float(max_mb) * 1024 * 1024) if max_mb else DEFAULT_MAX_BYTES
+    return ResultStore(directory / "results.sqlite", max_bytes=max_bytes)
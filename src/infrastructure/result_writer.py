@@ -0,0 +1,109 @@
+"""Écriture en flux de tables de résultats (JSONL, CSV, Parquet).
+
+Les résultats arrivent par paquets (``pd.DataFrame``) et sont écrits au
+fil de l'eau : la mémoire reste bornée par la taille d'un paquet. Le
+Parquet est écrit par groupes de lignes via ``pyarrow``, importé à la
+demande.
+"""
+
+import sys
+from pathlib import Path
+from typing import TextIO
+
+import pandas as pd
+
+
+OUTPUT_FORMATS = ("jsonl", "csv", "parquet")
+_SUFFIX_FORMATS = {
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+    ".csv": "csv",
+    ".parquet": "parquet",
+    ".pq": "parquet",
+}
+
+
+class ResultWriter:
+    """Écrit des paquets de résultats dans un fichier ou sur la sortie standard.
+
+    S'utilise comme gestionnaire de contexte ; toutes les tables doivent
+    avoir les mêmes colonnes.
+    """
+
+    def __init__(self, path: Path | str | None, fmt: str | None = None) -> None:
+        """Prépare l'écriture.
+
+        Args:
+            path: Fichier de sortie, ou ``None`` pour la sortie standard.
+            fmt: Format (``"jsonl"``, ``"csv"`` ou ``"parquet"``), déduit de
+                l'extension si omis (JSONL par défaut sur la sortie standard).
+
+        Raises:
+            ValueError: Si le format est inconnu, ou si du Parquet est
+                demandé sur la sortie standard.
+        """
+        self._path = None if path is None else Path(path)
+        if fmt is None:
+            fmt = (
+                "jsonl"
+                if self._path is None
+                else _SUFFIX_FORMATS.get(self._path.suffix.lower())
+            )
+        if fmt not in OUTPUT_FORMATS:
+            raise ValueError(f"Format de sortie non reconnu : {fmt!r}")
+        if fmt == "parquet" and self._path is None:
+            raise ValueError("Le Parquet ne peut pas être écrit sur la sortie standard.")
+        self.format = fmt
+        self._stream: TextIO | None = None
+        self._parquet = None
+        self._header_written = False
+
+    def __enter__(self) -> "ResultWriter":
+        if self.format != "parquet":
+            self._stream = (
+                sys.stdout
+                if self._path is None
+                else open(self._path, "w", encoding="utf-8", newline="")
+            )
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def write(self, frame: pd.DataFrame) -> None:
+        """Ajoute un paquet de résultats.
+
+        Args:
+            frame: Résultats du paquet.
+        """
+        if frame.empty:
+            return
+        if self.format == "jsonl":
+            frame.to_json(self._stream, orient="records", lines=True, force_ascii=False)
+        elif self.format == "csv":
+            frame.to_csv(self._stream, index=False, header=not self._header_written)
+            self._header_written = True
+        else:
+            self._write_parquet(frame)
+        if self._stream is not None:
+            self._stream.flush()
+
+    def close(self) -> None:
+        """Termine l'écriture (pied de fichier Parquet, fermeture du fichier)."""
+        if self._parquet is not None:
+            self._parquet.close()
+            self._parquet = None
+        if self._stream is not None and self._stream is not sys.stdout:
+            self._stream.close()
+        self._stream = None
+
+    def _write_parquet(self, frame: pd.DataFrame) -> None:
+        """Écrit un groupe de lignes Parquet (schéma fixé par le premier)."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+        if self._parquet is None:
+            self._parquet = pq.ParquetWriter(self._path, table.schema)
+        self._parquet.write_table(table.cast(self._parquet.schema))
+
@@ -0,0 +1,468 @@
+"""Chargement en flux de grands fichiers de scénarios (CSV, JSONL, YAML).
+
+Les fichiers sont lus par paquets de taille fixe : la mémoire reste
+constante quelle que soit la taille de l'entrée. La correspondance
+colonnes → champs de ``SimulationParams`` est établie une fois par
+fichier, la conversion de types et la validation sont vectorisées par
+paquet, et les scénarios valides sont livrés en colonnes
+(:class:`~application.params_batch.ParamsBatch`), sans objet par ligne.
+Les lignes invalides (valeurs, nombre de champs CSV, JSON illisible)
+sont signalées avec leur numéro de ligne physique dans le fichier (lignes
+vides et champs CSV multilignes compris), sans interrompre le flux.
+"""
+
+import csv
+import dataclasses
+import io
+import json
+from collections.abc import Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TextIO
+
+import numpy as np
+import pandas as pd
+import yaml
+from pandas.api.types import is_float_dtype, is_integer_dtype
+
+from application.params import SimulationParams
+from application.params_batch import ACQUISITION_FEES_TREATMENTS, ParamsBatch
+from application.simulation import PERIOD_MULTIPLIERS, SIMULATION_DURATION_YEARS
+from infrastructure.config import YAML_LOADER
+
+
+DEFAULT_BATCH_SIZE = 10_000
+YAML_SUFFIXES = (".yaml", ".yml")
+STREAM_FORMATS = ("csv", "jsonl")
+
+_FIELDS = {f.name: f for f in dataclasses.fields(SimulationParams)}
+_REQUIRED = [
+    name
+    for name, f in _FIELDS.items()
+    if f.default is dataclasses.MISSING and f.default_factory is dataclasses.MISSING
+]
+_NUMERIC = [name for name, f in _FIELDS.items() if f.type in (float, int)]
+_INTEGER = [name for name, f in _FIELDS.items() if f.type is int]
+_PERIOD_FIELDS = [name for name in _FIELDS if name.endswith("_period")]
+
+
+@dataclass(frozen=True)
+class RowError:
+    """Ligne rejetée lors du chargement.
+
+    Attributes:
+        source: Fichier d'origine.
+        line: Numéro de ligne dans le fichier (1-indexé), 0 pour un fichier
+            YAML entier.
+        message: Motif du rejet.
+    """
+
+    source: str
+    line: int
+    message: str
+
+
+@dataclass(frozen=True)
+class ScenarioBatch:
+    """Paquet de scénarios validés issu d'un fichier.
+
+    Attributes:
+        source: Fichier d'origine.
+        params: Scénarios valides du paquet, en colonnes.
+        lines: Numéro de ligne de chaque scénario valide (0 pour un
+            fichier YAML entier).
+        errors: Lignes rejetées du paquet.
+        sources: Fichier d'origine de chaque scénario valide, si le paquet
+            regroupe plusieurs fichiers (répertoire YAML) ; ``None`` si
+            tous viennent de ``source``.
+    """
+
+    source: str
+    params: ParamsBatch
+    lines: list[int]
+    errors: list[RowError]
+    sources: list[str] | None = None
+
+
+def iter_scenarios(
+    path: Path | str | TextIO,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    fmt: str | None = None,
+) -> Iterator[ScenarioBatch]:
+    """Lit un fichier, un flux ou un répertoire de scénarios par paquets.
+
+    Le format est déduit de l'extension : ``.csv``, ``.jsonl`` / ``.ndjson``,
+    ou un répertoire de fichiers ``.yaml`` / ``.yml`` (un scénario chacun).
+    Un flux texte (ex: ``sys.stdin``) n'a pas d'extension : ``fmt`` est
+    alors obligatoire.
+
+    Args:
+        path: Fichier CSV/JSONL, répertoire YAML ou flux texte.
+        batch_size: Nombre de lignes lues par paquet.
+        fmt: Format imposé (``"csv"`` ou ``"jsonl"``), prioritaire sur
+            l'extension.
+
+    Yields:
+        Paquets de scénarios validés, avec les rejets du paquet.
+
+    Raises:
+        ValueError: Si le format n'est pas reconnu ou si une colonne
+            obligatoire manque dans l'en-tête.
+    """
+    if isinstance(path, (str, Path)):
+        path = Path(path)
+        if path.is_dir():
+            yield from _iter_yaml_directory(path, batch_size)
+            return
+        source = str(path)
+        suffix = fmt or path.suffix.lower().lstrip(".")
+    else:
+        source = getattr(path, "name", "<flux>")
+        if fmt is None:
+            raise ValueError(f"{source}: format obligatoire pour un flux")
+        suffix = fmt
+    if suffix == "csv":
+        if isinstance(path, Path):
+            with open(path, "r", encoding="utf-8-sig", newline="") as stream:
+                yield from _iter_csv(source, stream, batch_size)
+        else:
+            yield from _iter_csv(source, path, batch_size)
+    elif suffix in ("jsonl", "ndjson"):
+        if isinstance(path, Path):
+            with open(path, "r", encoding="utf-8") as stream:
+                yield from _iter_json_lines(source, stream, batch_size)
+        else:
+            yield from _iter_json_lines(source, path, batch_size)
+    else:
+        raise ValueError(f"{source}: format de scénarios non reconnu ({suffix!r})")
+
+
+def load_records(records: Sequence[Mapping], source: str) -> ScenarioBatch:
+    """Valide des scénarios déjà décodés (dictionnaires champ → valeur).
+
+    Même validation que pour un fichier ; les clés inconnues sont ignorées.
+
+    Args:
+        records: Scénarios, un dictionnaire chacun.
+        source: Origine à reporter dans les rejets.
+
+    Returns:
+        Paquet validé ; ``lines`` et ``RowError.line`` désignent le rang
+        (0-indexé) de l'enregistrement dans ``records``.
+    """
+    return _convert_records(source, records, np.arange(len(records)))
+
+
+def _convert_records(
+    source: str, records: Sequence[Mapping], lines: np.ndarray
+) -> ScenarioBatch:
+    """Valide des enregistrements, les clés inconnues étant ignorées."""
+    frame = pd.DataFrame.from_records(
+        [{k: r[k] for k in _FIELDS if k in r} for r in records],
+        columns=list(_FIELDS),
+    ).astype(object)
+    mapping = {name: name for name in _FIELDS}
+    return _convert_frame(source, frame, mapping, lines)
+
+
+def _column_mapping(source: str, columns: list[str]) -> dict[str, str]:
+    """Associe les colonnes du fichier aux champs (casse et espaces ignorés).
+
+    Raises:
+        ValueError: Si un champ obligatoire n'a pas de colonne.
+    """
+    normalized = {str(c).strip().lower(): c for c in columns}
+    mapping = {name: normalized[name] for name in _FIELDS if name in normalized}
+    missing = [name for name in _REQUIRED if name not in mapping]
+    if missing:
+        raise ValueError(f"{source}: colonnes obligatoires absentes : {', '.join(missing)}")
+    return mapping
+
+
+def _iter_csv(source: str, stream: TextIO, batch_size: int) -> Iterator[ScenarioBatch]:
+    """Lit un flux CSV par paquets de ``batch_size`` enregistrements.
+
+    Le découpage en enregistrements (:func:`_csv_records`) donne la ligne
+    physique de chacun ; les enregistrements de trop nombreux champs ou à
+    guillemet non fermé sont rejetés, les autres sont analysés par le
+    moteur C de pandas, en-tête en tête de chaque paquet.
+
+    Raises:
+        ValueError: Si l'en-tête manque ou s'il lui manque une colonne
+            obligatoire.
+    """
+    records = _csv_records(stream)
+    first = next(records, None)
+    if first is None:
+        raise ValueError(f"{source}: en-tête CSV absent")
+    header = first[1]
+    columns = list(_read_csv_chunk(header, [], {}).columns)
+    mapping = _column_mapping(source, columns)
+    width = len(columns)
+    # Les colonnes numériques sont converties par le moteur C ; seules
+    # celles qui contiennent du texte passent par la coercition générale.
+    dtype = {mapping[name]: str for name in mapping if name not in _NUMERIC}
+
+    chunk: list[str] = []
+    lines: list[int] = []
+    errors: list[RowError] = []
+    for line, text, closed in records:
+        if not closed:
+            errors.append(RowError(source, line, "guillemet non fermé"))
+        else:
+            count = _field_count(text)
+            if count > width:
+                errors.append(
+                    RowError(source, line, f"{count} champs au lieu de {width}")
+                )
+            else:
+                chunk.append(text)
+                lines.append(line)
+        if len(chunk) + len(errors) >= batch_size:
+            frame = _read_csv_chunk(header, chunk, dtype)
+            yield _with_errors(
+                _convert_frame(source, frame, mapping, np.array(lines)), errors
+            )
+            chunk, lines, errors = [], [], []
+    if chunk or errors:
+        frame = _read_csv_chunk(header, chunk, dtype)
+        yield _with_errors(
+            _convert_frame(source, frame, mapping, np.array(lines)), errors
+        )
+
+
+def _csv_records(stream: TextIO) -> Iterator[tuple[int, str, bool]]:
+    """Découpe un flux CSV en enregistrements, lignes vides ignorées.
+
+    Un champ entre guillemets peut couvrir plusieurs lignes physiques :
+    l'enregistrement se poursuit tant que le nombre de guillemets lus est
+    impair (un guillemet échappé ``""`` n'en change pas la parité).
+
+    Yields:
+        Ligne physique de début (1-indexée), texte terminé par une fin de
+        ligne, et ``False`` si le flux s'achève dans un champ entre
+        guillemets.
+    """
+    pending: list[str] = []
+    start = 0
+    quotes = 0
+    for number, text in enumerate(stream, start=1):
+        if not pending:
+            if '"' not in text:
+                if text.strip():
+                    yield number, text if text.endswith("\n") else text + "\n", True
+                continue
+            start = number
+        pending.append(text)
+        quotes += text.count('"')
+        if quotes % 2 == 0:
+            record = "".join(pending)
+            yield start, record if record.endswith("\n") else record + "\n", True
+            pending, quotes = [], 0
+    if pending:
+        yield start, "".join(pending), False
+
+
+def _field_count(record: str) -> int:
+    """Nombre de champs d'un enregistrement CSV."""
+    if '"' not in record:
+        return record.count(",") + 1
+    return len(next(csv.reader(io.StringIO(record))))
+
+
+def _read_csv_chunk(
+    header: str, records: list[str], dtype: dict[str, type]
+) -> pd.DataFrame:
+    """Analyse un paquet d'enregistrements précédé de l'en-tête (moteur C).
+
+    Seul un champ vide est une valeur manquante ; les colonnes absentes de
+    ``dtype`` sont typées par pandas.
+    """
+    return pd.read_csv(
+        io.StringIO(header + "".join(records)),
+        dtype=dtype,
+        keep_default_na=False,
+        na_values=[""],
+        index_col=False,
+    )
+
+
+def _iter_json_lines(
+    source: str, stream: TextIO, batch_size: int
+) -> Iterator[ScenarioBatch]:
+    """Lit un flux JSONL ligne à ligne, par paquets de ``batch_size`` lignes.
+
+    Une ligne qui n'est pas un objet JSON est rejetée avec son numéro, sans
+    interrompre la lecture ; les lignes vides sont ignorées. Les clés sont
+    associées aux champs sans tenir compte de la casse ni des espaces.
+    """
+    records: list[dict] = []
+    lines: list[int] = []
+    errors: list[RowError] = []
+    for number, text in enumerate(stream, start=1):
+        if not text.strip():
+            continue
+        try:
+            record = json.loads(text)
+        except json.JSONDecodeError as exc:
+            errors.append(RowError(source, number, f"JSON invalide : {exc.msg}"))
+        else:
+            if isinstance(record, dict):
+                records.append(
+                    {str(k).strip().lower(): v for k, v in record.items()}
+                )
+                lines.append(number)
+            else:
+                errors.append(RowError(source, number, "objet JSON attendu"))
+        if len(records) + len(errors) >= batch_size:
+            yield _with_errors(
+                _convert_records(source, records, np.array(lines)), errors
+            )
+            records, lines, errors = [], [], []
+    if records or errors:
+        yield _with_errors(_convert_records(source, records, np.array(lines)), errors)
+
+
+def _with_errors(batch: ScenarioBatch, errors: list[RowError]) -> ScenarioBatch:
+    """Ajoute des rejets à un paquet, dans l'ordre des lignes."""
+    if not errors:
+        return batch
+    merged = sorted(batch.errors + errors, key=lambda error: error.line)
+    return dataclasses.replace(batch, errors=merged)
+
+
+def _convert_frame(
+    source: str,
+    frame: pd.DataFrame,
+    mapping: dict[str, str],
+    lines: np.ndarray,
+) -> ScenarioBatch:
+    """Convertit un paquet : coercition vectorisée puis validation par masque."""
+    columns: dict[str, pd.Series] = {}
+    reasons: list[tuple[np.ndarray, str]] = []
+    for name, column in mapping.items():
+        raw = frame[column]
+        parsed = is_float_dtype(raw.dtype) or is_integer_dtype(raw.dtype)
+        if parsed:
+            blank = raw.isna()
+        else:
+            blank = raw.isna() | (raw.astype(str).str.strip() == "")
+        default = _FIELDS[name].default
+        if name in _REQUIRED:
+            reasons.append((blank.to_numpy(), f"{name} manquant"))
+        if name in _NUMERIC:
+            if parsed:
+                values = raw.astype(float)
+            else:
+                values = pd.to_numeric(raw.where(~blank), errors="coerce")
+                reasons.append(
+                    ((values.isna() & ~blank).to_numpy(), f"{name} non numérique")
+                )
+            if name not in _REQUIRED:
+                values = values.fillna(default)
+            if name in _INTEGER:
+                reasons.append(
+                    ((values.notna() & (values % 1 != 0)).to_numpy(),
+                     f"{name} non entier")
+                )
+            columns[name] = values
+        else:
+            values = raw.astype(str).str.strip()
+            if name not in _REQUIRED:
+                values = values.where(~blank, default)
+            columns[name] = values
+
+    reasons.extend(_domain_checks(columns))
+    invalid = np.zeros(len(frame), dtype=bool)
+    for mask, _ in reasons:
+        invalid |= mask
+    errors = [
+        RowError(
+            source=source,
+            line=int(lines[i]),
+            message="; ".join(msg for mask, msg in reasons if mask[i]),
+        )
+        for i in np.flatnonzero(invalid)
+    ]
+
+    valid = ~invalid
+    params = ParamsBatch.from_columns(
+        {name: values.to_numpy()[valid] for name, values in columns.items()},
+        size=int(valid.sum()),
+    )
+    return ScenarioBatch(
+        source=source, params=params, lines=lines[valid].tolist(), errors=errors
+    )
+
+
+def _domain_checks(columns: dict[str, pd.Series]) -> list[tuple[np.ndarray, str]]:
+    """Contrôles métier vectorisés (bornes et valeurs énumérées)."""
+    checks: list[tuple[np.ndarray, str]] = []
+
+    def check(name: str, valid: pd.Series, message: str) -> None:
+        checks.append(((~valid & columns[name].notna()).to_numpy(), message))
+
+    if "loan_duration" in columns:
+        check("loan_duration", columns["loan_duration"] > 0, "loan_duration ≤ 0")
+    if "start_month" in columns:
+        check(
+            "start_month",
+            columns["start_month"].between(1, 12),
+            "start_month hors de 1–12",
+        )
+    if "resale_horizon" in columns:
+        check(
+            "resale_horizon",
+            columns["resale_horizon"].between(1, SIMULATION_DURATION_YEARS),
+            f"resale_horizon hors de 1–{SIMULATION_DURATION_YEARS}",
+        )
+    for name in _PERIOD_FIELDS:
+        if name in columns:
+            check(name, columns[name].isin(list(PERIOD_MULTIPLIERS)), f"{name} inconnu")
+    if "acquisition_fees_treatment" in columns:
+        check(
+            "acquisition_fees_treatment",
+            columns["acquisition_fees_treatment"].isin(ACQUISITION_FEES_TREATMENTS),
+            "acquisition_fees_treatment inconnu",
+        )
+    return checks
+
+
+def _iter_yaml_directory(directory: Path, batch_size: int) -> Iterator[ScenarioBatch]:
+    """Lit un répertoire de fichiers YAML (un scénario par fichier).
+
+    Les fichiers sont accumulés en tables de ``batch_size`` lignes puis
+    validés comme un paquet CSV ; le numéro de ligne est 0, et ``sources``
+    (scénarios valides) comme ``source`` d'un rejet désignent le fichier.
+    """
+    files = sorted(
+        p for p in directory.iterdir() if p.suffix.lower() in YAML_SUFFIXES
+    )
+    for start in range(0, len(files), batch_size):
+        records: list[dict] = []
+        sources: list[str] = []
+        errors: list[RowError] = []
+        for file_path in files[start : start + batch_size]:
+            try:
+                with open(file_path, "r", encoding="utf-8") as file:
+                    raw = yaml.load(file, Loader=YAML_LOADER)
+            except yaml.YAMLError as exc:
+                errors.append(RowError(str(file_path), 0, f"YAML invalide : {exc}"))
+                continue
+            if not isinstance(raw, dict):
+                errors.append(RowError(str(file_path), 0, "document YAML non mappé"))
+                continue
+            records.append(raw)
+            sources.append(str(file_path))
+        # « Lignes » = rang du fichier dans le paquet, pour retrouver sa source.
+        batch = load_records(records, str(directory))
+        errors.extend(
+            RowError(sources[error.line], 0, error.message) for error in batch.errors
+        )
+        yield ScenarioBatch(
+            str(directory),
+            batch.params,
+            [0] * len(batch.params),
+            errors,
+            sources=[sources[rank] for rank in batch.lines],
+        )
@@ -1,16 +1,109 @@
-"""Constructeurs de figures Plotly pour l'affichage."""
+"""Constructeurs de figures Plotly pour l'affichage.
 
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
+Plotly et pandas sont importés à la première construction de figure, et
+non au chargement du module, pour ne pas ralentir l'affichage des pages.
 
+Les figures sont construites à partir de colonnes ``numpy`` avec
+``plotly.graph_objects`` (sans passer par ``plotly.express``). Au-delà de
+``WEBGL_THRESHOLD`` points, les courbes passent en WebGL (``Scattergl``) ;
+au-delà de ``MAX_LINE_POINTS``, elles sont réduites par LTTB, et les
+barres au-delà de ``MAX_BARS`` sont moyennées par paquets.
+:func:`cached_figure` conserve les figures construites d'un résultat à
+l'autre des réexécutions de page.
+"""
+
+from collections.abc import Callable, Sequence
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from application.fingerprint import params_fingerprint
+from application.result_cache import ResultCache
 from domain.loan import AmortizationEntry
 from domain.taxation import TaxationEntry
+from presentation.downsampling import bucket_means, lttb_indices
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import plotly.graph_objects as go
+
+    from application.simulation import SimulationResult
+
+
+WEBGL_THRESHOLD = 1_000
+MAX_LINE_POINTS = 2_000
+MAX_BARS = 500
+FIGURE_CACHE_ENTRIES = 128
+
+_figure_cache = ResultCache(max_entries=FIGURE_CACHE_ENTRIES)
+
+
+def cached_figure(
+    result: "SimulationResult", chart: str, build: Callable[[], "go.Figure"]
+) -> "go.Figure":
+    """Figure d'un résultat, construite une seule fois par processus.
+
+    Indexée par l'empreinte du calcul et le type de graphique : toutes les
+    sessions affichant le même résultat partagent la figure, qui ne doit
+    donc pas être modifiée.
+
+    Args:
+        result: Résultat tracé.
+        chart: Identifiant du graphique (ex: ``"loan.monthly"``).
+        build: Construction de la figure en cas d'absence.
+
+    Returns:
+        Figure Plotly prête à l'affichage.
+    """
+    key = f"{params_fingerprint(result.params)}:{chart}"
+    return _figure_cache.get_or_compute(key, build)
+
+
+def entry_column(entries: Sequence[object], attribute: str) -> np.ndarray:
+    """Colonne ``float64`` d'un attribut d'une liste de lignes.
+
+    Args:
+        entries: Lignes (``AmortizationEntry``, ``TaxationEntry``…).
+        attribute: Attribut à extraire.
+
+    Returns:
+        Tableau de longueur ``len(entries)``.
+    """
+    return np.fromiter(
+        (getattr(e, attribute) for e in entries),
+        dtype=np.float64,
+        count=len(entries),
+    )
+
+
+def line_trace(
+    x: np.ndarray, y: np.ndarray, name: str, markers: bool = True, **kwargs
+) -> "go.Scatter | go.Scattergl":
+    """Trace de courbe adaptée au nombre de points.
+
+    Args:
+        x: Abscisses croissantes.
+        y: Ordonnées.
+        name: Nom de la série (légende).
+        markers: Affiche les points (ignoré au-delà de ``WEBGL_THRESHOLD``).
+        **kwargs: Options Plotly supplémentaires de la trace.
+
+    Returns:
+        ``Scatter`` pour les séries courtes, ``Scattergl`` (réduite par
+        LTTB au-delà de ``MAX_LINE_POINTS``) pour les longues.
+    """
+    import plotly.graph_objects as go
+
+    if len(x) <= WEBGL_THRESHOLD:
+        mode = "lines+markers" if markers else "lines"
+        return go.Scatter(x=x, y=y, name=name, mode=mode, **kwargs)
+    kept = lttb_indices(x, y, MAX_LINE_POINTS)
+    return go.Scattergl(x=x[kept], y=y[kept], name=name, mode="lines", **kwargs)
 
 
 def build_amortization_chart(
     entries: list[AmortizationEntry], period_label: str
-) -> go.Figure:
+) -> "go.Figure":
     """Construit un graphique empilé intérêts / capital d'un emprunt.
 
     Args:
@@ -20,20 +113,25 @@ def build_amortization_chart(
     Returns:
         Figure Plotly prête à l'affichage.
     """
-    periods = [e.period for e in entries]
+    import plotly.graph_objects as go
+
+    periods = entry_column(entries, "period")
+    interest = entry_column(entries, "interest")
+    principal = entry_column(entries, "principal")
+    if len(periods) > MAX_BARS:
+        # Moyenne par paquet, abscisse au début du paquet.
+        edges = np.linspace(0, len(periods), MAX_BARS + 1).astype(np.int64)
+        periods = periods[edges[:-1]]
+        interest = bucket_means(interest, MAX_BARS)
+        principal = bucket_means(principal, MAX_BARS)
     fig = go.Figure()
     fig.add_trace(
-        go.Bar(
-            x=periods,
-            y=[e.interest for e in entries],
-            name="Intérêts",
-            marker_color="indianred",
-        )
+        go.Bar(x=periods, y=interest, name="Intérêts", marker_color="indianred")
     )
     fig.add_trace(
         go.Bar(
             x=periods,
-            y=[e.principal for e in entries],
+            y=principal,
             name="Capital remboursé",
             marker_color="seagreen",
         )
@@ -47,7 +145,7 @@ def build_amortization_chart(
     return fig
 
 
-def build_taxation_chart(entries: list[TaxationEntry]) -> go.Figure:
+def build_taxation_chart(entries: list[TaxationEntry]) -> "go.Figure":
     """Construit le graphique d'optimisation fiscale de la revente.
 
     Trace le résultat annuel, le déficit reportable et l'amortissement
@@ -59,31 +157,28 @@ def build_taxation_chart(entries: list[TaxationEntry]) -> go.Figure:
     Returns:
         Figure Plotly prête à l'affichage.
     """
-    df = pd.DataFrame(
-        [
-            {
-                "Année": e.year,
-                "Résultat avant amort. (€)": e.result_before_amort,
-                "Déficit reportable (€)": e.carry_forward_deficit,
-                "Amortissement reportable (€)": e.carry_forward_depreciation,
-            }
-            for e in entries
-        ]
-    )
-    fig = px.line(
-        df,
-        x="Année",
-        y=[
-            "Résultat avant amort. (€)",
-            "Déficit reportable (€)",
+    import plotly.graph_objects as go
+
+    years = entry_column(entries, "year")
+    deficit = entry_column(entries, "carry_forward_deficit")
+    fig = go.Figure()
+    for name, y in (
+        ("Résultat avant amort. (€)", entry_column(entries, "result_before_amort")),
+        ("Déficit reportable (€)", deficit),
+        (
             "Amortissement reportable (€)",
-        ],
+            entry_column(entries, "carry_forward_depreciation"),
+        ),
+    ):
+        fig.add_trace(line_trace(years, y, name))
+    fig.update_layout(
         title="Optimisation fiscale de la revente",
-        markers=True,
+        xaxis_title="Année",
+        yaxis_title="Montant (€)",
     )
-    zero_deficit = df.loc[df["Déficit reportable (€)"] == 0]
-    if not zero_deficit.empty:
-        breakeven_year = zero_deficit.iloc[0]["Année"]
+    zero_deficit = np.flatnonzero(deficit == 0)
+    if zero_deficit.size:
+        breakeven_year = years[zero_deficit[0]]
         fig.add_vline(
             x=breakeven_year,
             line_dash="dash",
@@ -92,3 +187,27 @@ def build_taxation_chart(entries: list[TaxationEntry]) -> go.Figure:
             annotation_position="top left",
         )
     return fig
+
+
+def build_cashflow_chart(df: "pd.DataFrame", column: str, title: str) -> "go.Figure":
+    """Construit la courbe annuelle d'une colonne du tableau de cashflow.
+
+    Args:
+        df: Tableau de cashflow annuel (colonne ``Année`` incluse).
+        column: Colonne à tracer.
+        title: Titre du graphique.
+
+    Returns:
+        Figure Plotly prête à l'affichage.
+    """
+    import plotly.graph_objects as go
+
+    fig = go.Figure(
+        line_trace(
+            df["Année"].to_numpy(dtype=np.float64),
+            df[column].to_numpy(dtype=np.float64),
+            column,
+        )
+    )
+    fig.update_layout(title=title, xaxis_title="Année", yaxis_title=column)
+    return fig
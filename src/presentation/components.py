@@ -1,10 +1,14 @@
 """Composants Streamlit réutilisables entre pages."""
 
-import pandas as pd
+from typing import TYPE_CHECKING
+
 import streamlit as st
 
+from application.result_cache import cached_simulation
 from application.simulation import SimulationResult
-from domain.loan import AmortizationEntry
+
+if TYPE_CHECKING:
+    import pyarrow as pa
 
 
 def display_params(result: SimulationResult) -> None:
@@ -55,42 +59,63 @@ def display_params(result: SimulationResult) -> None:
 
 
 def require_simulation() -> SimulationResult:
-    """Récupère la simulation en session ou stoppe la page avec un avertissement.
+    """Résout la simulation de la session ou stoppe la page avec un avertissement.
+
+    La session ne conserve que ses paramètres ; le résultat provient du
+    cache partagé entre sessions (recalculé s'il a été évincé).
 
     Returns:
         Résultat de simulation courant.
     """
-    result = st.session_state.get("simulation_result")
-    if not result:
+    params = st.session_state.get("simulation_params")
+    if params is None:
         st.warning(
             "⚠️ Veuillez d'abord définir les paramètres dans l'onglet 'Accueil'."
         )
         st.stop()
-    return result
+    return cached_simulation(params)
 
 
-def amortization_to_dataframe(
-    entries: list[AmortizationEntry], period_label: str
-) -> pd.DataFrame:
-    """Convertit un tableau d'amortissement en DataFrame pour ``st.dataframe``.
+def amortization_labels(period_label: str) -> dict[str, str]:
+    """Colonnes affichées d'un tableau d'amortissement et leurs libellés.
 
     Args:
-        entries: Lignes d'amortissement.
         period_label: "Mois" ou "Année" — détermine aussi le libellé du remboursement.
 
     Returns:
-        DataFrame formaté (valeurs arrondies à l'euro).
+        Libellé par colonne de ``SimulationResult.loan_*_table``.
     """
     payment_label = "Mensualité (€)" if period_label == "Mois" else "Annuité (€)"
-    return pd.DataFrame(
-        [
-            {
-                period_label: e.period,
-                payment_label: round(e.payment, 2),
-                "Part intérêts (€)": round(e.interest, 2),
-                "Part capital (€)": round(e.principal, 2),
-                "Capital restant dû (€)": round(e.remaining_balance, 2),
-            }
-            for e in entries
-        ]
+    return {
+        "period": period_label,
+        "payment": payment_label,
+        "interest": "Part intérêts (€)",
+        "principal": "Part capital (€)",
+        "remaining_balance": "Capital restant dû (€)",
+    }
+
+
+def display_table(table: "pa.Table", labels: dict[str, str] | None = None) -> None:
+    """Affiche une projection d'une table Arrow du résultat.
+
+    Sélection et renommage des colonnes ne copient pas les données ; les
+    montants sont arrondis au centime à l'affichage seulement.
+
+    Args:
+        table: Table colonnaire (ex: ``result.taxation_table``).
+        labels: Colonnes à afficher, dans l'ordre, et leur libellé
+            (défaut : toutes les colonnes, sous leur nom).
+    """
+    import pyarrow as pa
+
+    if labels is not None:
+        table = table.select(list(labels)).rename_columns(list(labels.values()))
+    st.dataframe(
+        table,
+        hide_index=True,
+        column_config={
+            field.name: st.column_config.NumberColumn(format="%.2f")
+            for field in table.schema
+            if pa.types.is_floating(field.type)
+        },
     )
@@ -0,0 +1,74 @@
+"""Réduction du nombre de points des séries avant affichage.
+
+Au-delà de quelques milliers de points, le navigateur passe plus de temps
+à dessiner qu'à transmettre : on ne garde que les points qui préservent
+la forme visuelle de la série.
+"""
+
+import numpy as np
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """Indices retenus par l'algorithme *Largest-Triangle-Three-Buckets*.
+
+    Le premier et le dernier point sont conservés ; entre les deux, la
+    série est découpée en ``threshold - 2`` paquets et l'on garde, dans
+    chacun, le point formant le plus grand triangle avec le point retenu
+    précédemment et la moyenne du paquet suivant. Pics et creux sont ainsi
+    préservés, contrairement à un sous-échantillonnage régulier.
+
+    Args:
+        x: Abscisses croissantes.
+        y: Ordonnées, de même longueur.
+        threshold: Nombre de points souhaité (≥ 3).
+
+    Returns:
+        Indices croissants des points retenus (tous si la série est plus
+        courte que ``threshold``).
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+    previous = 0
+    for bucket in range(threshold - 2):
+        start, stop = edges[bucket], edges[bucket + 1]
+        next_stop = edges[bucket + 2] if bucket + 2 < len(edges) else n
+        next_start = min(stop, n - 1)
+        avg_x = x[next_start:next_stop].mean()
+        avg_y = y[next_start:next_stop].mean()
+        # Double de l'aire du triangle (précédent, candidat, moyenne suivante).
+        areas = np.abs(
+            (x[previous] - avg_x) * (y[start:stop] - y[previous])
+            - (x[previous] - x[start:stop]) * (avg_y - y[previous])
+        )
+        previous = start + int(np.argmax(areas))
+        selected[bucket + 1] = previous
+    return selected
+
+
+def bucket_means(values: np.ndarray, buckets: int) -> np.ndarray:
+    """Moyennes de ``values`` sur ``buckets`` paquets consécutifs.
+
+    Adapté aux séries empilées (barres) : toutes les séries d'un même
+    graphique sont réduites sur les mêmes paquets, si bien que leurs
+    abscisses restent alignées.
+
+    Args:
+        values: Série à réduire.
+        buckets: Nombre de paquets.
+
+    Returns:
+        Moyenne de chaque paquet (série inchangée si déjà assez courte).
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if buckets >= len(values):
+        return values
+    edges = np.linspace(0, len(values), buckets + 1).astype(np.int64)
+    sums = np.add.reduceat(values, edges[:-1])
+    return sums / np.diff(edges)
@@ -0,0 +1,188 @@
+"""Boîtes à moustaches des prix DVF à partir de statistiques résumées.
+
+Plutôt que de transmettre toutes les ventes d'une zone à ``go.Box`` (qui
+les sérialise une à une dans la figure), les quartiles, moustaches et un
+échantillon borné de valeurs extrêmes sont calculés côté serveur et
+fournis à Plotly comme statistiques précalculées (``q1``, ``median``,
+``q3``, ``lowerfence``, ``upperfence``). La taille de la figure et son
+temps de rendu ne dépendent plus du nombre de ventes.
+
+Les quantiles précalculés de l'index DVF (:mod:`infrastructure.dvf_index`)
+donnent directement une boîte, sans relire les ventes.
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
+    from infrastructure.dvf_index import MarketQuote
+
+
+# Nombre maximal de valeurs extrêmes tracées par boîte.
+MAX_OUTLIERS = 100
+# Étendue des moustaches, en écarts interquartiles (convention de Tukey).
+WHISKER_IQR = 1.5
+
+
+@dataclass(frozen=True)
+class BoxStats:
+    """Statistiques d'une boîte à moustaches.
+
+    Attributes:
+        name: Libellé de la boîte (zone, filtre…).
+        count: Nombre de valeurs résumées.
+        q1: Premier quartile.
+        median: Médiane.
+        q3: Troisième quartile.
+        lower_fence: Extrémité basse de la moustache.
+        upper_fence: Extrémité haute de la moustache.
+        outliers: Échantillon des valeurs hors moustaches (au plus
+            ``MAX_OUTLIERS``, extrêmes inclus).
+    """
+
+    name: str
+    count: int
+    q1: float
+    median: float
+    q3: float
+    lower_fence: float
+    upper_fence: float
+    outliers: tuple[float, ...] = ()
+
+
+def box_stats(
+    name: str,
+    values: np.ndarray,
+    max_outliers: int = MAX_OUTLIERS,
+    seed: int = 0,
+) -> BoxStats | None:
+    """Résume une série de valeurs en boîte à moustaches.
+
+    Quartiles par interpolation linéaire (méthode par défaut de Plotly) ;
+    les moustaches s'arrêtent aux valeurs extrêmes comprises dans
+    ``WHISKER_IQR`` écarts interquartiles des quartiles. Au-delà de
+    ``max_outliers`` valeurs extrêmes, le minimum, le maximum et un tirage
+    aléatoire reproductible des autres sont conservés.
+
+    Args:
+        name: Libellé de la boîte.
+        values: Valeurs (ex: prix au m² des ventes d'une zone) ; les
+            ``NaN`` sont ignorées.
+        max_outliers: Nombre maximal de valeurs extrêmes conservées.
+        seed: Graine du tirage des valeurs extrêmes.
+
+    Returns:
+        Statistiques de la boîte, ou ``None`` sans valeur.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    values = values[~np.isnan(values)]
+    if len(values) == 0:
+        return None
+    q1, median, q3 = np.percentile(values, [25, 50, 75])
+    reach = WHISKER_IQR * (q3 - q1)
+    inside = (values >= q1 - reach) & (values <= q3 + reach)
+    outliers = values[~inside]
+    if len(outliers) > max_outliers:
+        extremes = np.unique([outliers.argmin(), outliers.argmax()])[:max_outliers]
+        rest = np.delete(np.arange(len(outliers)), extremes)
+        rng = np.random.default_rng(seed)
+        sample = rng.choice(rest, size=max_outliers - len(extremes), replace=False)
+        outliers = outliers[np.concatenate([extremes, sample])]
+    return BoxStats(
+        name=name,
+        count=len(values),
+        q1=float(q1),
+        median=float(median),
+        q3=float(q3),
+        lower_fence=float(values[inside].min()),
+        upper_fence=float(values[inside].max()),
+        outliers=tuple(float(v) for v in np.sort(outliers)),
+    )
+
+
+def quote_box_stats(name: str, quote: "MarketQuote") -> BoxStats:
+    """Boîte issue des quantiles précalculés de l'index DVF.
+
+    L'index ne conserve que les déciles extrêmes : les moustaches vont du
+    P10 au P90 et aucune valeur extrême n'est tracée.
+
+    Args:
+        name: Libellé de la boîte.
+        quote: Quantiles d'une zone (:meth:`MarketIndex.lookup`).
+
+    Returns:
+        Statistiques de la boîte.
+    """
+    return BoxStats(
+        name=name,
+        count=quote.count,
+        q1=quote.p25,
+        median=quote.median,
+        q3=quote.p75,
+        lower_fence=quote.p10,
+        upper_fence=quote.p90,
+    )
+
+
+def build_box_chart(
+    boxes: Sequence[BoxStats],
+    title: str,
+    value_label: str = "Prix au m² (€)",
+    count_label: str = "ventes",
+) -> "go.Figure":
+    """Construit les boîtes à moustaches de plusieurs zones côte à côte.
+
+    Toutes les boîtes forment une seule trace ``go.Box`` à statistiques
+    précalculées ; les valeurs extrêmes échantillonnées, une trace de
+    points.
+
+    Args:
+        boxes: Statistiques des boîtes, dans l'ordre d'affichage.
+        title: Titre du graphique.
+        value_label: Libellé de l'axe des valeurs.
+        count_label: Unité du nombre de valeurs, sous chaque boîte.
+
+    Returns:
+        Figure Plotly prête à l'affichage.
+    """
+    import plotly.graph_objects as go
+
+    names = [box.name for box in boxes]
+    fig = go.Figure(
+        go.Box(
+            x=names,
+            q1=[box.q1 for box in boxes],
+            median=[box.median for box in boxes],
+            q3=[box.q3 for box in boxes],
+            lowerfence=[box.lower_fence for box in boxes],
+            upperfence=[box.upper_fence for box in boxes],
+            boxpoints=False,
+            name="",
+        )
+    )
+    outlier_x = [box.name for box in boxes for _ in box.outliers]
+    if outlier_x:
+        fig.add_trace(
+            go.Scatter(
+                x=outlier_x,
+                y=[value for box in boxes for value in box.outliers],
+                mode="markers",
+                marker={"size": 4, "opacity": 0.6},
+                name="Valeurs extrêmes",
+            )
+        )
+    fig.update_layout(
+        title=title,
+        yaxis_title=value_label,
+        showlegend=False,
+    )
+    fig.update_xaxes(
+        ticktext=[f"{box.name}<br>({box.count} {count_label})" for box in boxes],
+        tickvals=names,
+    )
+    return fig
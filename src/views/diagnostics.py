@@ -0,0 +1,72 @@
+"""Page diagnostics (masquée) : latences par étape du processus serveur."""
+
+import dataclasses
+
+import pandas as pd
+import streamlit as st
+
+from application import instrumentation
+from application.result_cache import shared_result_cache
+
+
+st.title("🩺 Diagnostics")
+
+st.caption(
+    "Mesures accumulées par le processus serveur courant, toutes sessions "
+    "confondues. Les percentiles portent sur les "
+    f"{instrumentation.MAX_SAMPLES_PER_STAGE} dernières exécutions par étape."
+)
+
+col1, col2 = st.columns(2)
+with col1:
+    enabled = st.toggle(
+        "Instrumentation active", value=instrumentation.is_enabled()
+    )
+    if enabled != instrumentation.is_enabled():
+        if enabled:
+            instrumentation.enable()
+        else:
+            instrumentation.disable()
+with col2:
+    if st.button("Réinitialiser les mesures"):
+        instrumentation.reset()
+
+cache_stats = shared_result_cache().stats()
+st.subheader("Cache de résultats")
+budget_mb = (
+    f"{cache_stats.max_bytes / 1e6:.0f}" if cache_stats.max_bytes else "∞"
+)
+col1, col2, col3, col4, col5 = st.columns(5)
+col1.metric("Entrées", f"{cache_stats.size} / {cache_stats.max_entries}")
+col2.metric("Mémoire (Mo)", f"{cache_stats.nbytes / 1e6:.1f} / {budget_mb}")
+col3.metric("Taux de succès", f"{cache_stats.hit_rate:.0%}")
+col4.metric("Succès / échecs", f"{cache_stats.hits} / {cache_stats.misses}")
+col5.metric(
+    "Évictions / expirations",
+    f"{cache_stats.evictions} / {cache_stats.expirations}",
+)
+
+st.subheader("Étapes")
+rows = instrumentation.report()
+if not rows:
+    st.info(
+        "Aucune mesure pour l'instant : lancez une simulation depuis "
+        "l'onglet **Paramètres**."
+    )
+    st.stop()
+
+df = pd.DataFrame([dataclasses.asdict(r) for r in rows]).rename(
+    columns={
+        "name": "Étape",
+        "calls": "Appels",
+        "total_ms": "Total (ms)",
+        "mean_ms": "Moyenne (ms)",
+        "p50_ms": "P50 (ms)",
+        "p95_ms": "P95 (ms)",
+        "p99_ms": "P99 (ms)",
+        "max_ms": "Max (ms)",
+        "cache_hits": "Cache (succès)",
+        "cache_misses": "Cache (échecs)",
+    }
+)
+st.dataframe(df.round(3), hide_index=True)
@@ -2,12 +2,15 @@
 
 import streamlit as st
 
+from application.market import with_market_resale
 from application.params import SimulationParams
-from application.simulation import LMNPSimulation, SimulationResult
-from infrastructure.config import load_default_params
+from application.preview import preview
+from application.result_cache import cached_simulation
+from infrastructure.config import default_config_path, load_default_params
+from infrastructure.dvf_growth import default_growth_cube
+from infrastructure.dvf_index import default_market_index
 
 
-DEFAULT_CONFIG_PATH = "./default.yaml"
 PERIODS = ["mensuel", "trimestriel", "annuel"]
 MONTHS = [
     "Janvier", "Février", "Mars", "Avril", "Mai", "Juin",
@@ -15,33 +18,22 @@ MONTHS = [
 ]
 
 
-@st.cache_data
-def _run_simulation(params: SimulationParams) -> SimulationResult:
-    """Exécute la simulation avec cache Streamlit.
-
-    Args:
-        params: Paramètres d'entrée.
-
-    Returns:
-        Résultat de simulation.
-    """
-    return LMNPSimulation().run(params)
-
-
 LOAN_RATE_OPTIONS = ["TAEG (tout frais inclus)", "Taux nominal + Assurance (TAEA)"]
 EXPENSE_OPTIONS = ["Global (total annuel)", "Détaillé par poste"]
 
 
 def _init_session() -> None:
-    """Hydrate la session Streamlit avec les valeurs du YAML par défaut."""
-    defaults = load_default_params(DEFAULT_CONFIG_PATH)
-    st.session_state.simulation_result = None
-    for key, value in defaults.__dict__.items():
-        st.session_state[key] = value
+    """Initialise la session avec le scénario du YAML par défaut.
+
+    La session ne conserve que ses paramètres : le résultat, simulé au
+    démarrage du serveur (``prewarm``), est résolu depuis le cache partagé.
+    """
+    st.session_state.simulation_params = load_default_params(default_config_path())
     # Modes de saisie — clés persistantes non liées à un widget,
     # Streamlit ne les supprime pas lors des navigations entre pages.
     st.session_state.setdefault("_loan_rate_mode_idx", 0)
     st.session_state.setdefault("_expense_mode_idx", 0)
+    st.session_state.setdefault("_market_resale", False)
 
 
 def _expense_row(
@@ -65,7 +57,7 @@ def _expense_row(
     with col_a:
         amount = st.number_input(
             label,
-            value=float(st.session_state.get(amount_key, 0.0)),
+            value=float(getattr(st.session_state.simulation_params, amount_key)),
             min_value=0.0,
             key=f"_w_{amount_key}",
         )
@@ -73,20 +65,84 @@ def _expense_row(
         period = st.selectbox(
             "Périodicité",
             options=PERIODS,
-            index=PERIODS.index(st.session_state.get(period_key, default_period)),
+            index=PERIODS.index(
+                getattr(st.session_state.simulation_params, period_key)
+                or default_period
+            ),
             label_visibility="collapsed",
             key=f"_w_{period_key}",
         )
     return amount, period
 
 
+def _market_caption(
+    city: str, property_type: str, property_price: float, surface: float
+) -> None:
+    """Situe le prix au m² saisi dans le marché local (index et cube DVF).
+
+    Sans index ni cube DVF construits, ou pour une commune absente,
+    n'affiche rien.
+
+    Args:
+        city: Commune du bien.
+        property_type: Type de bien.
+        property_price: Prix d'achat net vendeur (€).
+        surface: Surface (m²).
+    """
+    index = default_market_index()
+    quote = index.lookup(city, property_type) if index is not None else None
+    if quote is not None and surface > 0:
+        price_per_m2 = property_price / surface
+        st.caption(
+            f"📍 {price_per_m2:,.0f} €/m² — marché local ({quote.level}, "
+            f"{quote.count} ventes) : médiane {quote.median:,.0f} €/m², "
+            f"P10–P90 {quote.p10:,.0f}–{quote.p90:,.0f} €/m², "
+            f"soit le {quote.percentile_of(price_per_m2):.0f}e percentile"
+        )
+    cube = default_growth_cube()
+    curve = cube.growth_curve(city, property_type) if cube is not None else None
+    if curve is not None:
+        st.caption(
+            f"📈 Évolution du prix médian ({curve.level}, "
+            f"{curve.years[0] - 1}–{curve.years[-1]}) : "
+            f"{curve.annual_rate:+.1%} par an, écart-type {curve.volatility:.1%}"
+        )
+
+
+def _preview_panel(params: SimulationParams) -> None:
+    """Aperçu des indicateurs clés, recalculé à chaque saisie.
+
+    Estimation en forme fermée (:func:`application.preview.preview`) : la
+    simulation complète n'est lancée qu'à l'enregistrement.
+    """
+    try:
+        estimate = preview(params)
+    except (ZeroDivisionError, OverflowError, ValueError):
+        st.caption("Aperçu indisponible pour ces valeurs.")
+        return
+    with st.container(border=True):
+        st.markdown("**Aperçu** (estimation, avant enregistrement)")
+        col1, col2, col3, col4, col5 = st.columns(5)
+        col1.metric("Mensualité", f"{estimate.monthly_payment:.0f} €")
+        col2.metric("Cashflow / mois", f"{estimate.monthly_cashflow:.0f} €")
+        col3.metric("Rendement brut", f"{estimate.gross_yield:.2f} %")
+        col4.metric("Rendement net", f"{estimate.net_yield:.2f} %")
+        col5.metric(
+            f"TRI ({params.resale_horizon} ans)",
+            "—" if estimate.irr is None else f"{estimate.irr:.2f} %",
+        )
+
+
 st.title("📝 Paramètres")
 
-if "property_price" not in st.session_state:
+if "simulation_params" not in st.session_state:
     _init_session()
+current = st.session_state.simulation_params
 
 st.session_state.setdefault("_loan_rate_mode_idx", 0)
 st.session_state.setdefault("_expense_mode_idx", 0)
+st.session_state.setdefault("_market_resale", False)
+growth_cube = default_growth_cube()
 
 col_mode1, col_mode2 = st.columns(2)
 with col_mode1:
@@ -106,13 +162,15 @@ with col_mode2:
     )
     st.session_state["_expense_mode_idx"] = EXPENSE_OPTIONS.index(expense_mode)
 
-with st.form("parameters"):
+# Pas de ``st.form`` : chaque modification relance la page pour mettre à
+# jour l'aperçu, la simulation complète n'étant lancée qu'à l'enregistrement.
+with st.container():
     st.header("Informations générales")
     col1, col2, col3, col4 = st.columns(4)
 
     with col1:
         property_type = st.selectbox("Type de bien", ["Appartement", "Maison"])
-        start_month_idx = int(st.session_state.get("start_month", 1)) - 1
+        start_month_idx = int(current.start_month) - 1
         selected_month = st.selectbox(
             "Mois de début d'activité",
             options=MONTHS,
@@ -122,51 +180,51 @@ with st.form("parameters"):
         st.header("Achat du bien")
         property_price = st.number_input(
             "Prix d'achat du bien (€, net vendeur)",
-            value=st.session_state.property_price,
+            value=current.property_price,
         )
         agency_fee_rate = st.number_input(
             "Frais d'agence (% si < 100, sinon €)",
-            value=st.session_state.agency_fee_rate,
+            value=current.agency_fee_rate,
         )
         notary_fee_rate = st.number_input(
             "Frais d'acte notaire (% si < 100, sinon €)",
-            value=st.session_state.notary_fee_rate,
+            value=current.notary_fee_rate,
         )
         broker_fee = st.number_input(
             "Frais de courtage (€, optionnel)",
-            value=float(st.session_state.get("broker_fee", 0.0)),
+            value=float(current.broker_fee),
             min_value=0.0,
         )
         renovation_cost = st.number_input(
-            "Montant travaux (€)", value=st.session_state.renovation_cost
+            "Montant travaux (€)", value=current.renovation_cost
         )
         furniture_cost = st.number_input(
-            "Montant ameublement (€)", value=st.session_state.furniture_cost
+            "Montant ameublement (€)", value=current.furniture_cost
         )
 
     with col2:
-        city = st.text_input("Ville", value=st.session_state.city)
+        city = st.text_input("Ville", value=current.city)
         st.header("Financement")
         down_payment = st.number_input(
-            "Apport personnel (€)", value=st.session_state.down_payment
+            "Apport personnel (€)", value=current.down_payment
         )
         use_nominal = loan_rate_mode == "Taux nominal + Assurance (TAEA)"
         if use_nominal:
             loan_rate = 0.0
             loan_nominal_rate = st.number_input(
                 "Taux nominal (%)",
-                value=float(st.session_state.get("loan_nominal_rate", 0.0)),
+                value=float(current.loan_nominal_rate),
                 min_value=0.0,
             )
             loan_insurance_rate = st.number_input(
                 "Taux assurance TAEA (%)",
-                value=float(st.session_state.get("loan_insurance_rate", 0.0)),
+                value=float(current.loan_insurance_rate),
                 min_value=0.0,
             )
         else:
             loan_rate = st.number_input(
                 "TAEG (%, tout frais inclus)",
-                value=st.session_state.loan_rate,
+                value=current.loan_rate,
             )
             loan_nominal_rate = 0.0
             loan_insurance_rate = 0.0
@@ -175,29 +233,29 @@ with st.form("parameters"):
             min_value=5,
             max_value=25,
             step=5,
-            value=st.session_state.loan_duration,
+            value=current.loan_duration,
         )
         guarantee_fee = st.number_input(
             "Frais de garantie (€, optionnel)",
-            value=float(st.session_state.get("guarantee_fee", 0.0)),
+            value=float(current.guarantee_fee),
             min_value=0.0,
         )
         dossier_fee = st.number_input(
             "Frais de dossier (€, optionnel)",
-            value=float(st.session_state.get("dossier_fee", 0.0)),
+            value=float(current.dossier_fee),
             min_value=0.0,
         )
         death_insurance_monthly = st.number_input(
             "Assurance décès (€/mois, optionnel)",
-            value=float(st.session_state.get("death_insurance_monthly", 0.0)),
+            value=float(current.death_insurance_monthly),
             min_value=0.0,
         )
 
     with col3:
-        surface = st.number_input("Surface (m²)", value=st.session_state.surface)
+        surface = st.number_input("Surface (m²)", value=current.surface)
         st.header("Location")
         monthly_rent = st.number_input(
-            "Loyer mensuel (€)", value=st.session_state.monthly_rent
+            "Loyer mensuel (€)", value=current.monthly_rent
         )
         use_detailed = expense_mode == "Détaillé par poste"
         if use_detailed:
@@ -230,7 +288,7 @@ with st.form("parameters"):
         else:
             annual_expenses = st.number_input(
                 "Charges annuelles (€, TF, copro, gestion, assurances)",
-                value=st.session_state.annual_expenses,
+                value=current.annual_expenses,
             )
             pno_insurance = pno_period = 0.0
             gli_insurance = gli_period = 0.0
@@ -246,7 +304,7 @@ with st.form("parameters"):
             accounting_fee_period = "annuel"
         rent_increase_rate = st.number_input(
             "Augmentation annuelle loyer (%)",
-            value=st.session_state.rent_increase_rate,
+            value=current.rent_increase_rate,
         )
 
     with col4:
@@ -254,60 +312,81 @@ with st.form("parameters"):
         st.header("Revente")
         resale = st.number_input(
             "Prix de revente (€, > 100) ou Inflation fixe (%, < 100)",
-            value=st.session_state.resale,
+            value=current.resale,
+        )
+        market_resale = st.checkbox(
+            "Taux du marché local (DVF)",
+            value=st.session_state["_market_resale"] and growth_cube is not None,
+            disabled=growth_cube is None,
+            help="Remplace le prix de revente par le taux annuel moyen du prix "
+            "médian au m² observé dans la commune (ventes DVF).",
         )
         resale_horizon = st.slider(
             "Horizon de revente (années)",
             min_value=1,
             max_value=30,
-            value=int(st.session_state.get("resale_horizon", 10)),
+            value=int(current.resale_horizon),
         )
 
-    submitted = st.form_submit_button("Enregistrer les paramètres")
-
-if submitted:
-    params = SimulationParams(
-        property_type=property_type,
-        city=city,
-        surface=surface,
-        dpe=dpe,
-        property_price=property_price,
-        agency_fee_rate=agency_fee_rate,
-        notary_fee_rate=notary_fee_rate,
-        broker_fee=broker_fee,
-        renovation_cost=renovation_cost,
-        furniture_cost=furniture_cost,
-        down_payment=down_payment,
-        loan_rate=loan_rate,
-        loan_duration=loan_duration,
-        monthly_rent=monthly_rent,
-        annual_expenses=annual_expenses,
-        rent_increase_rate=rent_increase_rate,
-        resale=resale,
-        loan_nominal_rate=loan_nominal_rate,
-        loan_insurance_rate=loan_insurance_rate,
-        guarantee_fee=guarantee_fee,
-        dossier_fee=dossier_fee,
-        pno_insurance=pno_insurance,
-        pno_period=pno_period,
-        gli_insurance=gli_insurance,
-        gli_period=gli_period,
-        agency_management_fee=agency_management_fee,
-        agency_management_fee_period=agency_management_fee_period,
-        property_tax=property_tax,
-        property_tax_period=property_tax_period,
-        condo_fees=condo_fees,
-        condo_fees_period=condo_fees_period,
-        accounting_fee=accounting_fee,
-        accounting_fee_period=accounting_fee_period,
-        death_insurance_monthly=death_insurance_monthly,
-        resale_horizon=resale_horizon,
-        start_month=start_month,
-    )
-    for key, value in params.__dict__.items():
-        st.session_state[key] = value
-    st.session_state.simulation_result = _run_simulation(params)
-    st.success(
-        "✅ Paramètres enregistrés ! Accédez aux onglets pour voir les résultats."
-    )
-    st.switch_page("views/summary.py")
+    _market_caption(city, property_type, property_price, surface)
+
+params = SimulationParams(
+    property_type=property_type,
+    city=city,
+    surface=surface,
+    dpe=dpe,
+    property_price=property_price,
+    agency_fee_rate=agency_fee_rate,
+    notary_fee_rate=notary_fee_rate,
+    broker_fee=broker_fee,
+    renovation_cost=renovation_cost,
+    furniture_cost=furniture_cost,
+    down_payment=down_payment,
+    loan_rate=loan_rate,
+    loan_duration=loan_duration,
+    monthly_rent=monthly_rent,
+    annual_expenses=annual_expenses,
+    rent_increase_rate=rent_increase_rate,
+    resale=resale,
+    loan_nominal_rate=loan_nominal_rate,
+    loan_insurance_rate=loan_insurance_rate,
+    guarantee_fee=guarantee_fee,
+    dossier_fee=dossier_fee,
+    pno_insurance=pno_insurance,
+    pno_period=pno_period,
+    gli_insurance=gli_insurance,
+    gli_period=gli_period,
+    agency_management_fee=agency_management_fee,
+    agency_management_fee_period=agency_management_fee_period,
+    property_tax=property_tax,
+    property_tax_period=property_tax_period,
+    condo_fees=condo_fees,
+    condo_fees_period=condo_fees_period,
+    accounting_fee=accounting_fee,
+    accounting_fee_period=accounting_fee_period,
+    death_insurance_monthly=death_insurance_monthly,
+    resale_horizon=resale_horizon,
+    start_month=start_month,
+)
+curve = growth_cube.growth_curve(city, property_type) if market_resale else None
+if curve is not None:
+    params = with_market_resale(params, curve)
+_preview_panel(params)
+
+if st.button("Enregistrer les paramètres", type="primary"):
+    st.session_state["_market_resale"] = market_resale
+    st.session_state.simulation_params = params
+    # Calcul immédiat : les pages de résultats le retrouvent dans le cache.
+    cached_simulation(params)
+    if market_resale and curve is None:
+        # Reste sur la page pour signaler le repli sur la valeur saisie.
+        st.warning(
+            f"Historique DVF insuffisant pour {city} : "
+            "la revente suit la valeur saisie."
+        )
+    else:
+        st.success(
+            "✅ Paramètres enregistrés ! "
+            "Accédez aux onglets pour voir les résultats."
+        )
+        st.switch_page("views/summary.py")
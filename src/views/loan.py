@@ -2,10 +2,11 @@
 
 import streamlit as st
 
-from presentation.charts import build_amortization_chart
+from presentation.charts import build_amortization_chart, cached_figure
 from presentation.components import (
-    amortization_to_dataframe,
+    amortization_labels,
     display_params,
+    display_table,
     require_simulation,
 )
 
@@ -28,17 +29,23 @@ with col3:
 tab_annual, tab_monthly = st.tabs(["📊 Annuel", "📆 Mensuel"])
 
 with tab_annual:
-    st.plotly_chart(build_amortization_chart(result.loan_annual_schedule, "Année"))
-    st.write("📋 **Tableau d'amortissement annuel**")
-    st.dataframe(
-        amortization_to_dataframe(result.loan_annual_schedule, "Année"),
-        hide_index=True,
+    st.plotly_chart(
+        cached_figure(
+            result,
+            "loan.annual",
+            lambda: build_amortization_chart(result.loan_annual_schedule, "Année"),
+        )
     )
+    st.write("📋 **Tableau d'amortissement annuel**")
+    display_table(result.loan_annual_table, amortization_labels("Année"))
 
 with tab_monthly:
-    st.plotly_chart(build_amortization_chart(result.loan_monthly_schedule, "Mois"))
-    st.write("📋 **Tableau d'amortissement mensuel**")
-    st.dataframe(
-        amortization_to_dataframe(result.loan_monthly_schedule, "Mois"),
-        hide_index=True,
+    st.plotly_chart(
+        cached_figure(
+            result,
+            "loan.monthly",
+            lambda: build_amortization_chart(result.loan_monthly_schedule, "Mois"),
+        )
     )
+    st.write("📋 **Tableau d'amortissement mensuel**")
+    display_table(result.loan_monthly_table, amortization_labels("Mois"))
@@ -1,9 +1,9 @@
 """Page rentabilité : rendements et courbes de cashflow."""
 
-import plotly.express as px
 import streamlit as st
 
-from presentation.components import display_params, require_simulation
+from presentation.charts import build_cashflow_chart, cached_figure
+from presentation.components import display_params, display_table, require_simulation
 
 
 st.title("📊 Rentabilité")
@@ -20,24 +20,24 @@ with col2:
 df = result.cashflow
 
 st.write("**Détail du cashflow annuel**")
-st.dataframe(df, hide_index=True)
+display_table(result.cashflow_table)
 
 st.plotly_chart(
-    px.line(
-        df,
-        x="Année",
-        y="Cashflow (€)",
-        title="Évolution du Cashflow",
-        markers=True,
+    cached_figure(
+        result,
+        "cashflow",
+        lambda: build_cashflow_chart(df, "Cashflow (€)", "Évolution du Cashflow"),
     )
 )
 
 st.plotly_chart(
-    px.line(
-        df,
-        x="Année",
-        y="Enrichissement cumulé (€)",
-        title="Évolution de l'enrichissement cumulé",
-        markers=True,
+    cached_figure(
+        result,
+        "cashflow.cumulative_wealth",
+        lambda: build_cashflow_chart(
+            df,
+            "Enrichissement cumulé (€)",
+            "Évolution de l'enrichissement cumulé",
+        ),
     )
 )
@@ -1,9 +1,144 @@
 """Page revente : VAN, TRI et graphique d'optimisation fiscale."""
 
+import uuid
+
 import streamlit as st
 
-from presentation.charts import build_taxation_chart
+from application.jobs import CANCELLED, DONE, shared_job_manager
+from application.montecarlo import (
+    DEFAULT_PATHS,
+    ResaleDistribution,
+    resale_distribution,
+    resale_job_key,
+)
+from application.params import SimulationParams
+from infrastructure.dvf_growth import default_growth_cube
+from presentation.charts import build_taxation_chart, cached_figure
 from presentation.components import display_params, require_simulation
+from presentation.dvf_charts import box_stats, build_box_chart
+
+
+PATH_OPTIONS = (10_000, 100_000)
+# Période de rafraîchissement de l'avancement d'une tâche en cours (s).
+POLL_SECONDS = 0.5
+
+
+def _subscriber() -> str:
+    """Identifiant de la session auprès du gestionnaire de tâches."""
+    return st.session_state.setdefault("_job_subscriber", uuid.uuid4().hex)
+
+
+def _job_panel(key: str, polling: bool) -> None:
+    """Avancement ou résultat de la tâche de tirages ``key``.
+
+    Exécuté en fragment, rafraîchi toutes les ``POLL_SECONDS`` tant que la
+    tâche est en cours : le reste de la page n'est pas recalculé. À la fin
+    de la tâche, la page est relancée pour arrêter le rafraîchissement.
+
+    Args:
+        key: Clé de la tâche.
+        polling: Vrai si le fragment est rafraîchi périodiquement.
+    """
+    manager = shared_job_manager()
+    status = manager.status(key)
+    if status is None:
+        return
+    if not status.finished:
+        st.progress(status.fraction, text=status.message or "En attente…")
+        if st.button("Annuler", key="_resale_job_cancel"):
+            st.session_state.pop("_resale_job", None)
+            if not manager.cancel(key, _subscriber()):
+                # Tâche poursuivie pour d'autres sessions, ou déjà terminée.
+                current = manager.status(key)
+                if current is not None and not current.finished:
+                    st.session_state["_resale_job_notice"] = (
+                        "Tirages abandonnés pour cette session : ils se "
+                        "poursuivent pour d'autres sessions qui les attendent."
+                    )
+            st.rerun()
+        return
+    if polling:
+        st.rerun()
+    if status.state == DONE:
+        _distribution(status.result)
+    elif status.state == CANCELLED:
+        st.info("Tirages annulés.")
+    else:
+        st.error(f"Échec des tirages : {status.error}")
+
+
+def _distribution(distribution: ResaleDistribution) -> None:
+    """Affiche la dispersion du TRI et de la VAN sur les trajectoires."""
+    import numpy as np
+
+    p10, p50, p90 = np.nanpercentile(distribution.irr_value, [10, 50, 90])
+    col1, col2, col3 = st.columns(3)
+    col1.metric("TRI médian", f"{p50:.2f} %")
+    col2.metric("TRI P10 – P90", f"{p10:.2f} – {p90:.2f} %")
+    col3.metric("VAN négative", f"{distribution.loss_probability:.1%}")
+    stats = box_stats("TRI", distribution.irr_value)
+    if stats is not None:
+        st.plotly_chart(
+            build_box_chart(
+                [stats],
+                f"TRI à {distribution.horizon} ans selon le prix de revente",
+                "TRI (%)",
+                "trajectoires",
+            )
+        )
+
+
+def _monte_carlo(params: SimulationParams) -> None:
+    """Tirages du prix de revente dans l'historique du marché local."""
+    st.markdown("### 🎲 Prix de revente : tirages du marché local")
+    cube = default_growth_cube()
+    curve = (
+        cube.growth_curve(params.city, params.property_type)
+        if cube is not None
+        else None
+    )
+    if curve is None:
+        st.caption(
+            "Tirages indisponibles : pas d'évolution des prix DVF pour "
+            f"{params.city}."
+        )
+        return
+    # Choix conservé dans une clé non liée au widget, qui survit aux
+    # changements de page.
+    paths = st.selectbox(
+        "Nombre de trajectoires",
+        PATH_OPTIONS,
+        index=PATH_OPTIONS.index(st.session_state.get("_resale_paths", DEFAULT_PATHS)),
+        format_func=lambda n: f"{n:,}".replace(",", " "),
+    )
+    st.session_state["_resale_paths"] = paths
+    manager = shared_job_manager()
+    key = resale_job_key(params, curve, paths)
+    notice = st.session_state.pop("_resale_job_notice", None)
+    if notice is not None:
+        st.info(notice)
+    if st.button("Lancer les tirages", key="_resale_job_run"):
+        previous = st.session_state.get("_resale_job")
+        if previous is not None and previous != key:
+            manager.cancel(previous, _subscriber())
+        manager.submit(
+            key,
+            lambda context: resale_distribution(
+                params, curve, paths, context=context
+            ),
+            total=paths,
+            subscriber=_subscriber(),
+        )
+        st.session_state["_resale_job"] = key
+    status = manager.status(key)
+    if status is None or (
+        st.session_state.get("_resale_job") != key and status.state != DONE
+    ):
+        return
+    running = not status.finished
+    st.fragment(_job_panel, run_every=POLL_SECONDS if running else None)(
+        key, running
+    )
 
 
 st.title("🏷️ Revente")
@@ -24,4 +159,10 @@ with col2:
         value=f"{result.irr_value:.2f} %",
     )
 
-st.plotly_chart(build_taxation_chart(result.taxation_entries))
+st.plotly_chart(
+    cached_figure(
+        result, "taxation", lambda: build_taxation_chart(result.taxation_entries)
+    )
+)
+
+_monte_carlo(result.params)
@@ -2,29 +2,34 @@
 
 import dataclasses
 
-import pandas as pd
 import streamlit as st
 
-from application.params import SimulationParams
-from application.simulation import LMNPSimulation, SimulationResult
-from presentation.components import display_params, require_simulation
+from application.result_cache import cached_simulation
+from presentation.components import display_params, display_table, require_simulation
 
 
 TREATMENT_OPTIONS = ["Déduire (charge en année 1)", "Amortir (intégré au bien)"]
 TREATMENT_VALUES = {"Déduire (charge en année 1)": "deduction", "Amortir (intégré au bien)": "amortissement"}
-
-
-@st.cache_data
-def _run_simulation(params: SimulationParams) -> SimulationResult:
-    """Exécute la simulation complète avec cache Streamlit.
-
-    Args:
-        params: Paramètres de simulation (hashables car frozen dataclass).
-
-    Returns:
-        Résultat complet de simulation.
-    """
-    return LMNPSimulation().run(params)
+TAXATION_LABELS = {
+    # Étape 1
+    "year": "Année",
+    "income": "Revenus (€)",
+    "current_expenses": "Charges courantes (€)",
+    "result_before_amort": "Résultat avant amort. (€)",
+    # Étape 2
+    "depreciation": "Amort. dotation (€)",
+    "depreciation_used": "Amort. déduit (€)",
+    "carry_forward_depreciation": "Stock amorts reportables (€)",
+    # Étape 3
+    "carry_depreciation_used": "Amorts reportés utilisés (€)",
+    # Étape 4
+    "deficit_added": "Déficit ajouté au stock (€)",
+    "deficit_used": "Déficits reportés utilisés (€)",
+    "carry_forward_deficit": "Stock déficits reportables (€)",
+    # Résultat
+    "fiscal_result": "Résultat fiscal (€)",
+    "taxable_bic": "Imposable micro-BIC (€)",
+}
 
 
 st.title("💰 Impôts")
@@ -46,10 +51,8 @@ if treatment != result.params.acquisition_fees_treatment:
     modified_params = dataclasses.replace(
         result.params, acquisition_fees_treatment=treatment
     )
-    result = _run_simulation(modified_params)
-    st.session_state.simulation_result = result
-
-taxation_entries = result.taxation_entries
+    st.session_state.simulation_params = modified_params
+    result = cached_simulation(modified_params)
 
 st.markdown(
     """
@@ -61,31 +64,5 @@ st.markdown(
     """
 )
 
-df = pd.DataFrame(
-    [
-        {
-            # Étape 1
-            "Année": e.year,
-            "Revenus (€)": e.income,
-            "Charges courantes (€)": e.current_expenses,
-            "Résultat avant amort. (€)": e.result_before_amort,
-            # Étape 2
-            "Amort. dotation (€)": e.depreciation,
-            "Amort. déduit (€)": e.depreciation_used,
-            "Stock amorts reportables (€)": e.carry_forward_depreciation,
-            # Étape 3
-            "Amorts reportés utilisés (€)": e.carry_depreciation_used,
-            # Étape 4
-            "Déficit ajouté au stock (€)": e.deficit_added,
-            "Déficits reportés utilisés (€)": e.deficit_used,
-            "Stock déficits reportables (€)": e.carry_forward_deficit,
-            # Résultat
-            "Résultat fiscal (€)": e.fiscal_result,
-            "Imposable micro-BIC (€)": e.taxable_bic,
-        }
-        for e in taxation_entries
-    ]
-)
-
 st.write("📋 **Tableau fiscal annuel**")
-st.dataframe(df, hide_index=True)
+display_table(result.taxation_table, TAXATION_LABELS)
@@ -0,0 +1,117 @@
+"""Configuration des essais : le code est importé depuis ``src/``."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from application.params import SimulationParams  # noqa: E402
+from infrastructure.config import (  # noqa: E402
+    default_config_path,
+    load_default_params,
+)
+
+
+@pytest.fixture
+def default_params() -> SimulationParams:
+    """Scénario du fichier ``default.yaml`` du dépôt."""
+    return load_default_params(default_config_path())
+
+
+# Vente type d'un fichier DVF (champs source, virgule décimale).
+DVF_SALE = {
+    "Identifiant de document": "",
+    "Date mutation": "15/03/2023",
+    "Nature mutation": "Vente",
+    "Valeur fonciere": "200000,00",
+    "No voie": "12",
+    "Type de voie": "RUE",
+    "Voie": "DES LILAS",
+    "Code postal": "31000",
+    "Commune": "Toulouse",
+    "Code departement": "31",
+    "Code commune": "555",
+    "Prefixe de section": "826",
+    "Section": "AD",
+    "No plan": "42",
+    "Surface Carrez du 1er lot": "50,00",
+    "Nombre de lots": "1",
+    "Type local": "Appartement",
+    "Surface reelle bati": "52",
+    "Nombre pieces principales": "2",
+}
+
+
+def write_dvf_file(path: Path, sales: list[dict]) -> Path:
+    """Écrit un fichier DVF (``|``) ; chaque vente complète ``DVF_SALE``."""
+    lines = ["|".join(DVF_SALE)]
+    lines += ["|".join({**DVF_SALE, **sale}.values()) for sale in sales]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def write_dvf():
+    """Fabrique de fichiers DVF de test (voir :func:`write_dvf_file`)."""
+    return write_dvf_file
+
+
+def _dvf_number(value: float) -> str:
+    return f"{value:.2f}".replace(".", ",")
+
+
+def dvf_sales() -> list[dict]:
+    """Ventes synthétiques de 2020 à 2023 (prix médian +5 %/an à Toulouse).
+
+    Toulouse : 24 appartements par an en section 826AD, 4 en 826AE,
+    3 maisons en 2023 et une cession symbolique ; Saint-Jean : 4
+    appartements en 2023.
+    """
+    sales = []
+    for year in range(2020, 2024):
+        base = 3000 * 1.05 ** (year - 2020)
+        for section, count in (("AD", 24), ("AE", 4)):
+            for j in range(count):
+                surface = 20 + 2.5 * j
+                spread = 0.8 + 0.4 * j / (count - 1)
+                sales.append(
+                    {
+                        "Date mutation": f"{1 + j:02d}/06/{year}",
+                        "Valeur fonciere": _dvf_number(surface * base * spread),
+                        "Surface Carrez du 1er lot": _dvf_number(surface),
+                        "Section": section,
+                        "No voie": str(j + 1),
+                        "Nombre pieces principales": str(1 + j % 4),
+                    }
+                )
+    for j in range(3):
+        sales.append(
+            {
+                "Type local": "Maison",
+                "Valeur fonciere": _dvf_number(300_000 + 10_000 * j),
+                "Surface Carrez du 1er lot": "90,00",
+            }
+        )
+    sales.append({"Valeur fonciere": "1000,00"})
+    for j in range(4):
+        sales.append(
+            {
+                "Commune": "Saint-Jean",
+                "Code commune": "488",
+                "Valeur fonciere": _dvf_number(2500 * (40 + j)),
+                "Surface Carrez du 1er lot": _dvf_number(40 + j),
+            }
+        )
+    return sales
+
+
+@pytest.fixture(scope="session")
+def dvf_store(tmp_path_factory) -> Path:
+    """Magasin Parquet DVF ingéré depuis :func:`dvf_sales`."""
+    from infrastructure.dvf import ingest
+
+    root = tmp_path_factory.mktemp("dvf")
+    ingest([write_dvf_file(root / "dvf.txt", dvf_sales())], root / "store")
+    return root / "store"
@@ -0,0 +1,137 @@
+"""Parité du moteur vectorisé avec le moteur scalaire."""
+
+import dataclasses
+
+import numpy as np
+import pytest
+
+from application.batch import BatchSimulation
+from application.simulation import SIMULATION_DURATION_YEARS, LMNPSimulation
+from benchmarks.scenarios import generate_scenarios
+
+
+SCENARIOS = generate_scenarios(40, seed=11)
+
+
+@pytest.fixture(scope="module")
+def batch_result():
+    return BatchSimulation().run(SCENARIOS)
+
+
+@pytest.mark.parametrize("index", range(0, len(SCENARIOS), 3))
+def test_batch_matches_scalar(batch_result, index):
+    params = SCENARIOS[index]
+    scalar = LMNPSimulation().run(params)
+    cashflow = scalar.cashflow["Cashflow (€)"].to_numpy()
+
+    assert batch_result.total_cost[index] == pytest.approx(scalar.total_cost)
+    assert batch_result.monthly_payment[index] == pytest.approx(
+        scalar.loan_monthly_schedule[0].payment
+    )
+    np.testing.assert_allclose(batch_result.cashflow[index], cashflow, atol=1e-6)
+    assert batch_result.npv_value[index] == pytest.approx(scalar.npv_value, abs=1e-6)
+    assert batch_result.irr_value[index] == pytest.approx(scalar.irr_value, abs=1e-8)
+    assert batch_result.wealth_growth[index] == pytest.approx(
+        scalar.wealth_growth, abs=1e-6
+    )
+    # Intérêts en forme fermée : écart d'un centime possible sur un
+    # montant arrondi tombant sur un demi-centime.
+    for name in batch_result.taxation.__dataclass_fields__:
+        expected = [getattr(entry, name) for entry in scalar.taxation_entries]
+        np.testing.assert_allclose(
+            getattr(batch_result.taxation, name)[index], expected, atol=0.0100001
+        )
+
+
+@pytest.mark.parametrize("horizon", [SIMULATION_DURATION_YEARS, 31, 45, 100])
+def test_horizon_beyond_projection_matches_scalar(default_params, horizon):
+    params = dataclasses.replace(default_params, resale_horizon=horizon)
+    scalar = LMNPSimulation().run(params)
+
+    result = BatchSimulation().run([params, default_params], with_taxation=False)
+
+    assert result.irr_value[0] == pytest.approx(scalar.irr_value, abs=1e-8)
+    assert result.npv_value[0] == pytest.approx(scalar.npv_value, abs=1e-6)
+    assert result.wealth_growth[0] == pytest.approx(scalar.wealth_growth, abs=1e-6)
+
+
+def cashflow_positive(year) -> np.ndarray:
+    """Critère d'arrêt : cashflow cumulé positif."""
+    return year.cumulative_cashflow > 0
+
+
+def test_iter_years_matches_run(batch_result):
+    years = list(BatchSimulation().iter_years(SCENARIOS))
+
+    assert [year.year for year in years] == list(range(1, len(years) + 1))
+    for i, year in enumerate(years):
+        np.testing.assert_array_equal(year.scenarios, np.arange(len(SCENARIOS)))
+        np.testing.assert_allclose(
+            year.cashflow, batch_result.cashflow[:, i], atol=1e-6
+        )
+        for name in batch_result.taxation.__dataclass_fields__:
+            np.testing.assert_allclose(
+                getattr(year.taxation, name),
+                getattr(batch_result.taxation, name)[:, i],
+                atol=0.0100001,
+            )
+    np.testing.assert_allclose(
+        years[-1].cumulative_cashflow, batch_result.cashflow.sum(axis=1), atol=1e-6
+    )
+
+
+def test_iter_years_matches_scalar_years():
+    params = SCENARIOS[4]
+    scalar = list(LMNPSimulation().iter_years(params))
+
+    batch = list(BatchSimulation().iter_years([params]))
+
+    assert len(batch) == len(scalar)
+    for year, expected in zip(batch, scalar):
+        assert year.cashflow[0] == pytest.approx(expected.cashflow, abs=1e-6)
+        assert year.cumulative_wealth[0] == pytest.approx(
+            expected.cumulative_wealth, abs=1e-6
+        )
+        assert year.depreciation[0] == pytest.approx(expected.depreciation)
+        assert year.taxation.carry_forward_deficit[0] == pytest.approx(
+            expected.taxation.carry_forward_deficit, abs=0.0100001
+        )
+
+
+def test_stopped_scenarios_leave_the_remaining_ones_unchanged(batch_result):
+    stopped = np.arange(len(SCENARIOS)) % 2 == 0
+
+    def until(year):
+        return stopped[year.scenarios] & (year.year == 3)
+
+    years = list(BatchSimulation().iter_years(SCENARIOS, until))
+
+    kept = np.flatnonzero(~stopped)
+    for i, year in enumerate(years[3:], start=3):
+        np.testing.assert_array_equal(year.scenarios, kept)
+        np.testing.assert_allclose(
+            year.cashflow, batch_result.cashflow[kept, i], atol=1e-6
+        )
+        np.testing.assert_allclose(
+            year.taxation.carry_forward_deficit,
+            batch_result.taxation.carry_forward_deficit[kept, i],
+            atol=0.0100001,
+        )
+
+
+def test_first_year_matches_scalar():
+    scenarios = SCENARIOS[:10]
+
+    first = BatchSimulation().first_year(
+        scenarios, cashflow_positive, with_taxation=False
+    )
+
+    simulation = LMNPSimulation()
+    for params, year in zip(scenarios, first):
+        found = simulation.first_year(params, cashflow_positive)
+        assert (found.year if found else 0) == year
+
+
+def test_iter_years_rejects_an_empty_batch():
+    with pytest.raises(ValueError):
+        next(BatchSimulation().iter_years([]))
@@ -0,0 +1,46 @@
+"""Regroupement des requêtes : un élément fautif n'échoue que seul."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from api.batcher import MicroBatcher
+
+
+def evaluate(items: list[int]) -> list[int]:
+    if 3 in items:
+        raise ValueError("élément 3 invalide")
+    return [item * 10 for item in items]
+
+
+def test_failing_item_does_not_fail_coalesced_requests():
+    async def scenario():
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            batcher = MicroBatcher(
+                evaluate, executor, max_batch_size=8, max_wait_ms=50
+            )
+            results = await asyncio.gather(
+                *(batcher.submit(i) for i in range(6)), return_exceptions=True
+            )
+            await batcher.drain()
+            return batcher, results
+
+    batcher, results = asyncio.run(scenario())
+
+    assert results[:3] == [0, 10, 20] and results[4:] == [40, 50]
+    assert isinstance(results[3], ValueError)
+    assert batcher.batches == 1
+    assert batcher.queue_depth == 0
+
+
+def test_request_spanning_failing_item_fails():
+    async def scenario():
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            batcher = MicroBatcher(evaluate, executor, max_wait_ms=50)
+            other = asyncio.ensure_future(batcher.submit(7))
+            with pytest.raises(ValueError):
+                await batcher.submit_many([1, 2, 3])
+            return await other
+
+    assert asyncio.run(scenario()) == 70
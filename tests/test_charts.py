@@ -0,0 +1,104 @@
+"""Graphiques : LTTB de référence, moyennes par paquets, traces et cache."""
+
+import math
+
+import numpy as np
+import pytest
+
+from application.simulation import LMNPSimulation
+from presentation.charts import (
+    MAX_LINE_POINTS,
+    WEBGL_THRESHOLD,
+    build_cashflow_chart,
+    cached_figure,
+    line_trace,
+)
+from presentation.downsampling import bucket_means, lttb_indices
+
+
+def reference_lttb(x: list[float], y: list[float], threshold: int) -> list[int]:
+    """LTTB d'origine (Steinarsson, 2013), point par point."""
+    n = len(x)
+    every = (n - 2) / (threshold - 2)
+    selected = [0]
+    a = 0
+    for i in range(threshold - 2):
+        start = math.floor(i * every) + 1
+        stop = math.floor((i + 1) * every) + 1
+        avg_stop = min(math.floor((i + 2) * every) + 1, n)
+        avg_x = sum(x[stop:avg_stop]) / (avg_stop - stop)
+        avg_y = sum(y[stop:avg_stop]) / (avg_stop - stop)
+        best, best_area = start, -1.0
+        for j in range(start, stop):
+            area = abs(
+                (x[a] - avg_x) * (y[j] - y[a]) - (x[a] - x[j]) * (avg_y - y[a])
+            )
+            if area > best_area:
+                best, best_area = j, area
+        selected.append(best)
+        a = best
+    selected.append(n - 1)
+    return selected
+
+
+@pytest.mark.parametrize("n, threshold", [(1000, 50), (997, 100), (5000, 3)])
+def test_matches_reference_lttb(n, threshold):
+    rng = np.random.default_rng(n)
+    x = np.sort(rng.uniform(0, 100, n))
+    y = np.cumsum(rng.normal(size=n))
+
+    kept = lttb_indices(x, y, threshold)
+
+    assert kept.tolist() == reference_lttb(x.tolist(), y.tolist(), threshold)
+
+
+def test_keeps_endpoints_and_isolated_peak():
+    x = np.arange(10_000, dtype=float)
+    y = np.zeros(10_000)
+    y[4321] = 50.0
+    y[7000] = -30.0
+
+    kept = lttb_indices(x, y, 100)
+
+    assert len(kept) == 100
+    assert kept[0] == 0 and kept[-1] == 9_999
+    assert np.all(np.diff(kept) > 0)
+    assert {4321, 7000} <= set(kept.tolist())
+
+
+def test_short_series_is_unchanged():
+    assert lttb_indices(np.arange(5.0), np.arange(5.0), 10).tolist() == list(range(5))
+
+
+def test_bucket_means():
+    values = np.arange(10.0)
+
+    np.testing.assert_allclose(bucket_means(values, 5), [0.5, 2.5, 4.5, 6.5, 8.5])
+    np.testing.assert_allclose(bucket_means(values, 3), [1.0, 4.0, 7.5])
+    np.testing.assert_array_equal(bucket_means(values, 20), values)
+
+
+def test_line_trace_switches_to_webgl_and_downsamples():
+    short = np.arange(float(WEBGL_THRESHOLD))
+    long = np.arange(10.0 * MAX_LINE_POINTS)
+
+    small = line_trace(short, short, "court")
+    large = line_trace(long, np.sin(long), "long")
+
+    assert small.type == "scatter" and len(small.x) == WEBGL_THRESHOLD
+    assert large.type == "scattergl" and len(large.x) == MAX_LINE_POINTS
+
+
+def test_figures_are_built_once_per_result(default_params):
+    result = LMNPSimulation().run(default_params)
+    built = []
+
+    def build():
+        built.append(1)
+        return build_cashflow_chart(result.cashflow, "Cashflow (€)", "Cashflow")
+
+    first = cached_figure(result, "essai.cashflow", build)
+    second = cached_figure(result.with_params(result.params), "essai.cashflow", build)
+
+    assert first is second
+    assert built == [1]
@@ -0,0 +1,37 @@
+"""Ligne de commande : les rejets sont signalés sans interrompre le lot."""
+
+import dataclasses
+import json
+
+from cli import main
+
+
+def test_rejected_rows_are_reported_and_skipped(tmp_path, capsys, default_params):
+    record = dataclasses.asdict(default_params)
+    rows = [record, {**record, "loan_duration": 0}, record]
+    source = tmp_path / "scenarios.jsonl"
+    source.write_text("\n".join(json.dumps(r) for r in rows), encoding="utf-8")
+    output = tmp_path / "resultats.jsonl"
+
+    status = main([str(source), "-o", str(output), "-q", "--chunk-size", "2"])
+
+    assert status == 1
+    assert f"{source}:2: loan_duration ≤ 0" in capsys.readouterr().err
+    written = [json.loads(line) for line in output.read_text().splitlines()]
+    assert [row["line"] for row in written] == [1, 3]
+    assert {row["source"] for row in written} == {str(source)}
+
+
+def test_clean_run_exits_zero(tmp_path, default_params):
+    source = tmp_path / "scenarios.jsonl"
+    source.write_text(json.dumps(dataclasses.asdict(default_params)), "utf-8")
+
+    assert main([str(source), "-o", str(tmp_path / "out.csv"), "-q"]) == 0
+
+
+def test_missing_column_is_an_input_error(tmp_path, capsys):
+    source = tmp_path / "scenarios.csv"
+    source.write_text("city\nLyon\n", encoding="utf-8")
+
+    assert main([str(source), "-o", str(tmp_path / "out.csv"), "-q"]) == 2
+    assert "colonnes obligatoires absentes" in capsys.readouterr().err
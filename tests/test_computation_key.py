@@ -0,0 +1,91 @@
+"""Clé de calcul : seules les entrées qui changent les résultats y figurent."""
+
+import dataclasses
+
+import pandas as pd
+import pytest
+
+from application.fingerprint import params_fingerprint
+from application.simulation import LMNPSimulation
+
+
+def same_economics(default_params):
+    """Variantes de ``default_params`` aux résultats identiques.
+
+    Les frais du scénario par défaut (8 % et 8,5 % de 100 000 €) dépassent
+    le seuil de 100 € : exprimés en euros, ils restent des montants.
+    """
+    price = default_params.property_price
+    return {
+        "présentation": dataclasses.replace(
+            default_params,
+            property_type="Maison",
+            city="Lyon",
+            surface=default_params.surface + 40,
+            dpe="A",
+        ),
+        "frais en euros": dataclasses.replace(
+            default_params,
+            agency_fee_rate=price * default_params.agency_fee_rate / 100,
+            notary_fee_rate=price * default_params.notary_fee_rate / 100,
+        ),
+        "charges détaillées": dataclasses.replace(
+            default_params,
+            annual_expenses=0.0,
+            property_tax=800.0,
+            condo_fees=100.0,
+            condo_fees_period="trimestriel",
+        ),
+        "charges détaillées autrement": dataclasses.replace(
+            default_params,
+            annual_expenses=123.0,
+            property_tax=1200.0,
+        ),
+    }
+
+
+@pytest.mark.parametrize(
+    "first, second",
+    [
+        ("présentation", None),
+        ("frais en euros", None),
+        ("charges détaillées", "charges détaillées autrement"),
+    ],
+)
+def test_equivalent_inputs_share_key_and_results(default_params, first, second):
+    variants = same_economics(default_params)
+    left = variants[first]
+    right = variants[second] if second else default_params
+    simulation = LMNPSimulation()
+
+    assert simulation.computation_key(left) == simulation.computation_key(right)
+    assert params_fingerprint(left) == params_fingerprint(right)
+    pd.testing.assert_frame_equal(
+        simulation.run(left).cashflow, simulation.run(right).cashflow
+    )
+
+
+def test_taeg_is_ignored_in_nominal_mode(default_params):
+    nominal = dataclasses.replace(
+        default_params, loan_nominal_rate=3.2, loan_insurance_rate=0.3
+    )
+    other_taeg = dataclasses.replace(nominal, loan_rate=nominal.loan_rate + 2)
+    simulation = LMNPSimulation()
+
+    assert simulation.computation_key(nominal) == simulation.computation_key(
+        other_taeg
+    )
+    assert simulation.computation_key(nominal) != simulation.computation_key(
+        dataclasses.replace(nominal, loan_nominal_rate=3.3)
+    )
+
+
+def test_with_params_reattaches_caller_params(default_params):
+    result = LMNPSimulation().run(default_params)
+    listing = dataclasses.replace(default_params, city="Lyon")
+
+    copy = result.with_params(listing)
+
+    assert copy.params is listing
+    assert copy.cashflow is result.cashflow
+    assert copy.cashflow_table is result.cashflow_table
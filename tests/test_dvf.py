@@ -0,0 +1,110 @@
+"""Ingestion DVF : filtres, typage, partitions et reprise incrémentale."""
+
+import os
+
+import pandas as pd
+import pytest
+
+from infrastructure.dvf import MANIFEST_NAME, ingest, open_dataset, read_dvf
+
+
+def _frames(path, chunk_size=1000):
+    return pd.concat(
+        [frame for _, frame in read_dvf(path, chunk_size)], ignore_index=True
+    )
+
+
+def test_read_dvf_keeps_single_lot_sales_with_carrez_area(tmp_path, write_dvf):
+    path = write_dvf(
+        tmp_path / "2023.txt",
+        [
+            {},
+            {"Nature mutation": "Echange"},
+            {"Nombre de lots": "2"},
+            {"Surface Carrez du 1er lot": ""},
+            {"Valeur fonciere": "0,00"},
+            {"Date mutation": "pas une date"},
+        ],
+    )
+
+    [(read, frame)] = list(read_dvf(path))
+
+    assert read == 6
+    assert len(frame) == 1
+    sale = frame.iloc[0]
+    assert sale["property_value"] == 200_000.0
+    assert sale["carrez_area"] == 50.0
+    assert sale["price_per_m2"] == 4000.0
+    assert sale["year"] == 2023
+    assert sale["mutation_date"] == pd.Timestamp("2023-03-15")
+
+
+def test_read_dvf_keeps_codes_as_zero_padded_strings(tmp_path, write_dvf):
+    path = write_dvf(
+        tmp_path / "2023.txt",
+        [{"Code departement": "2A", "Code commune": "4", "Prefixe de section": ""}],
+    )
+
+    sale = _frames(path).iloc[0]
+
+    assert sale["department"] == "2A"
+    assert sale["commune_code"] == "004"
+    assert pd.isna(sale["section_prefix"])
+
+
+def test_chunk_size_does_not_change_the_result(tmp_path, write_dvf):
+    sales = [{"Valeur fonciere": f"{100_000 + i},50"} for i in range(25)]
+    path = write_dvf(tmp_path / "2023.txt", sales)
+
+    pd.testing.assert_frame_equal(_frames(path, chunk_size=7), _frames(path))
+
+
+def test_ingest_writes_hive_partitions(tmp_path, write_dvf):
+    source = write_dvf(
+        tmp_path / "2023.txt",
+        [{}, {"Code commune": "4", "Commune": "Aigrefeuille"}],
+    )
+    store = tmp_path / "dvf"
+
+    [report] = ingest([source], store)
+
+    assert (report.rows_read, report.rows_kept, report.skipped) == (2, 2, False)
+    partitions = sorted(
+        p.relative_to(store).parent.as_posix() for p in store.rglob("*.parquet")
+    )
+    assert partitions == [
+        "department=31/commune_code=004/year=2023",
+        "department=31/commune_code=555/year=2023",
+    ]
+    table = open_dataset(store).to_table().to_pandas()
+    assert sorted(table["commune_code"]) == ["004", "555"]
+    assert (store / MANIFEST_NAME).exists()
+
+
+def test_unchanged_source_is_skipped(tmp_path, write_dvf):
+    source = write_dvf(tmp_path / "2023.txt", [{}, {}])
+    store = tmp_path / "dvf"
+    ingest([source], store)
+
+    [report] = ingest([source], store)
+
+    assert (report.rows_read, report.rows_kept, report.skipped) == (0, 2, True)
+
+
+@pytest.mark.parametrize("sales", [[{}], []])
+def test_modified_source_replaces_its_outputs(tmp_path, write_dvf, sales):
+    source = write_dvf(
+        tmp_path / "2023.txt", [{}, {}, {"Date mutation": "01/02/2022"}]
+    )
+    other = write_dvf(tmp_path / "2024.txt", [{"Date mutation": "01/02/2024"}])
+    store = tmp_path / "dvf"
+    ingest([source, other], store)
+
+    write_dvf(source, sales)
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    reports = ingest([source, other], store)
+
+    assert [r.skipped for r in reports] == [False, True]
+    years = open_dataset(store).to_table().to_pandas()["year"]
+    assert sorted(years) == [2023] * len(sales) + [2024]
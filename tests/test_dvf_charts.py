@@ -0,0 +1,89 @@
+"""Boîtes à moustaches DVF à statistiques précalculées."""
+
+import numpy as np
+import pytest
+
+from infrastructure.dvf_index import MarketQuote
+from presentation.dvf_charts import box_stats, build_box_chart, quote_box_stats
+
+
+def test_box_stats_follow_tukey_whiskers():
+    values = np.array([1.0, 2, 3, 4, 5, 6, 7, 8, 100, np.nan])
+
+    box = box_stats("zone", values)
+
+    assert box.count == 9
+    assert (box.q1, box.median, box.q3) == (3.0, 5.0, 7.0)
+    assert (box.lower_fence, box.upper_fence) == (1.0, 8.0)
+    assert box.outliers == (100.0,)
+
+
+def test_box_stats_without_values_is_none():
+    assert box_stats("zone", np.array([np.nan])) is None
+    assert box_stats("zone", np.array([])) is None
+
+
+def test_outliers_are_sampled_with_the_extremes():
+    rng = np.random.default_rng(0)
+    values = np.concatenate([rng.normal(3000, 100, 10_000), rng.uniform(1, 10, 500)])
+    values[-1] = -50.0
+
+    box = box_stats("zone", values, max_outliers=20, seed=3)
+
+    assert len(box.outliers) == 20
+    assert box.outliers[0] == -50.0
+    assert box.outliers == tuple(sorted(box.outliers))
+    assert box_stats("zone", values, max_outliers=20, seed=3) == box
+    assert box_stats("zone", values, max_outliers=20, seed=4) != box
+
+
+def test_quote_box_uses_deciles_as_whiskers():
+    box = quote_box_stats("Toulouse", _quote())
+
+    assert (box.lower_fence, box.q1, box.median, box.q3, box.upper_fence) == (
+        2000,
+        2500,
+        3000,
+        3500,
+        4200,
+    )
+    assert (box.count, box.outliers) == (120, ())
+
+
+def test_chart_size_does_not_grow_with_the_sales():
+    rng = np.random.default_rng(1)
+    small = box_stats("A", rng.lognormal(8, 0.3, 1_000), max_outliers=10)
+    large = box_stats("A", rng.lognormal(8, 0.3, 1_000_000), max_outliers=10)
+
+    sizes = [
+        len(build_box_chart([box, quote_box_stats("B", _quote())], "t").to_json())
+        for box in (small, large)
+    ]
+
+    assert sizes[1] < sizes[0] * 1.5
+
+
+def test_chart_has_one_box_trace_and_labelled_counts():
+    boxes = [
+        box_stats("A", np.array([1.0, 2, 3, 4, 50])),
+        quote_box_stats("B", _quote()),
+    ]
+
+    fig = build_box_chart(boxes, "Prix", count_label="ventes")
+
+    box, points = fig.data
+    assert box.type == "box"
+    assert list(box.median) == [3.0, 3000]
+    assert list(points.y) == [50.0]
+    assert list(fig.layout.xaxis.ticktext) == ["A<br>(5 ventes)", "B<br>(120 ventes)"]
+
+
+def test_chart_without_outliers_has_no_point_trace():
+    fig = build_box_chart([quote_box_stats("B", _quote())], "Prix")
+
+    assert len(fig.data) == 1
+    assert fig.data[0].q1 == pytest.approx((2500,))
+
+
+def _quote() -> MarketQuote:
+    return MarketQuote("commune", None, 120, 2000, 2500, 3000, 3500, 4200)
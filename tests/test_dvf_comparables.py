@@ -0,0 +1,94 @@
+"""Ventes DVF comparables : recherche par fenêtre de surface exacte."""
+
+import datetime
+
+import numpy as np
+import pytest
+
+from application.market import ComparableWeights, comparables
+from infrastructure.dvf import ingest
+from infrastructure.dvf_comparables import EPOCH, ComparableStore, build_store
+
+
+@pytest.fixture(scope="module")
+def store(dvf_store) -> ComparableStore:
+    return build_store(dvf_store)
+
+
+def _brute_force(store, surface, section, rooms, k, weights):
+    """Distances des ``k`` ventes les plus proches, groupe parcouru en entier."""
+    g = int(np.searchsorted(store.groups, b"A|31555"))
+    lo, hi = int(store.offsets[g]), int(store.offsets[g + 1])
+    reference = (store.latest - EPOCH).days
+    surfaces = store.surfaces[lo:hi].astype(np.float64)
+    distances = weights.surface * np.abs(np.log(surfaces / surface))
+    distances += weights.age * np.abs(reference - store.days[lo:hi]) / 365.25
+    if section is not None:
+        distances += weights.section * (store.sections[lo:hi] != section.encode())
+    if rooms is not None:
+        sale_rooms = store.rooms[lo:hi].astype(int)
+        distances += weights.rooms * np.where(
+            sale_rooms > 0, np.abs(sale_rooms - rooms), 1
+        )
+    return np.sort(distances)[:k]
+
+
+@pytest.mark.parametrize(
+    "surface, section, rooms, k, weights",
+    [
+        (35.0, None, None, 10, ComparableWeights()),
+        (20.0, "826AE", 2, 5, ComparableWeights()),
+        (200.0, None, None, 3, ComparableWeights()),
+        (45.0, "826AD", 4, 8, ComparableWeights(age=10.0)),
+        (30.0, None, 1, 6, ComparableWeights(surface=0.0)),
+    ],
+)
+def test_nearest_matches_a_full_scan(store, surface, section, rooms, k, weights):
+    found = store.nearest(
+        "Toulouse", "Appartement", surface, section, rooms, k=k, weights=weights
+    )
+
+    np.testing.assert_allclose(
+        [c.distance for c in found],
+        _brute_force(store, surface, section, rooms, k, weights),
+    )
+
+
+def test_comparable_describes_the_sale(store):
+    [sale] = store.nearest("Toulouse", "Appartement", 20.0, "826AD", 1, k=1)
+
+    assert sale.date == datetime.date(2023, 6, 1)
+    assert sale.address == "1 RUE DES LILAS"
+    assert (sale.section, sale.surface, sale.rooms) == ("826AD", 20.0, 1)
+    assert sale.price_per_m2 == pytest.approx(sale.value / sale.surface)
+    assert store.latest == datetime.date(2023, 6, 24)
+
+
+def test_small_or_unknown_groups(store):
+    assert len(store.nearest("Saint-Jean", "Appartement", 40.0, k=10)) == 4
+    assert store.nearest("Paris", "Appartement", 40.0) == []
+    assert store.nearest("Toulouse", "Terrain", 40.0) == []
+    assert store.nearest("Toulouse", "Appartement", 0.0) == []
+
+
+def test_values_keep_their_cents(tmp_path, write_dvf):
+    source = write_dvf(
+        tmp_path / "dvf.txt",
+        [{"Valeur fonciere": "1234567,89", "Surface Carrez du 1er lot": "250,00"}],
+    )
+    ingest([source], tmp_path / "store")
+
+    [sale] = build_store(tmp_path / "store").nearest("31555", "Appartement", 250.0)
+
+    assert sale.value == 1234567.89
+
+
+def test_saved_store_answers_the_same(store, tmp_path, default_params):
+    store.save(tmp_path / "comparables")
+    opened = ComparableStore.open(tmp_path / "comparables")
+
+    assert isinstance(opened.values, np.memmap)
+    assert opened.values.dtype == np.float64
+    expected = comparables(default_params, store, section="826AD", rooms=1)
+    assert comparables(default_params, opened, section="826AD", rooms=1) == expected
+    assert len(expected) == 10
@@ -0,0 +1,77 @@
+"""Cube d'évolution des prix DVF et mode de revente « marché »."""
+
+import numpy as np
+import pytest
+
+from application.market import GrowthCurve, with_market_resale
+from infrastructure.dvf_growth import GrowthCube, build_cube
+
+
+@pytest.fixture(scope="module")
+def cube(dvf_store) -> GrowthCube:
+    return build_cube(dvf_store)
+
+
+def test_commune_curve_follows_yearly_medians(cube):
+    curve = cube.growth_curve("Toulouse")
+
+    assert curve.level == "commune"
+    assert curve.years == (2021, 2022, 2023)
+    np.testing.assert_allclose(curve.rates, [0.05] * 3, rtol=1e-5)
+    assert curve.annual_rate == pytest.approx(0.05, rel=1e-5)
+
+
+def test_section_is_tried_before_the_commune(cube):
+    assert cube.growth_curve("Toulouse", section="826AD").level == "section"
+    assert cube.growth_curve("Toulouse", section="826AE").level == "commune"
+
+
+def test_zone_without_enough_sales_has_no_curve(cube):
+    assert cube.growth_curve("Saint-Jean") is None
+    assert cube.growth_curve("Toulouse", min_count=30) is None
+    assert cube.growth_curve("Toulouse", property_type="Maison") is None
+    assert cube.growth_curve("Paris") is None
+
+
+def test_rates_skip_years_without_enough_sales():
+    cube = GrowthCube(
+        keys=np.array([b"A|31555|*"]),
+        years=np.arange(2019, 2024, dtype=np.int16),
+        medians=np.array([[1000, 5000, 1000, 1100, 1210]], dtype=np.float32),
+        counts=np.array([[30, 3, 30, 30, 30]], dtype=np.int32),
+        commune_names=np.array([b"TOULOUSE"]),
+        commune_codes=np.array([b"31555"]),
+    )
+
+    curve = cube.growth_curve("Toulouse")
+
+    assert curve.years == (2022, 2023)
+    np.testing.assert_allclose(curve.rates, [0.1, 0.1], rtol=1e-6)
+
+
+def test_saved_cube_opens_memory_mapped(cube, tmp_path):
+    cube.save(tmp_path / "cube")
+    opened = GrowthCube.open(tmp_path / "cube")
+
+    assert isinstance(opened.medians, np.memmap)
+    assert len(opened) == len(cube)
+    assert opened.growth_curve("Toulouse") == cube.growth_curve("Toulouse")
+
+
+def test_market_resale_uses_the_annual_rate(default_params):
+    curve = GrowthCurve("commune", (2022, 2023), (0.02, 0.04))
+
+    params = with_market_resale(default_params, curve)
+
+    assert params.resale == round(((1.02 * 1.04) ** 0.5 - 1) * 100, 2)
+    assert curve.volatility == pytest.approx(np.std([0.02, 0.04], ddof=1))
+
+
+def test_sample_multipliers_bootstrap_historical_rates():
+    curve = GrowthCurve("commune", (2021, 2022, 2023), (0.0, 0.1, 0.2))
+
+    draws = curve.sample_multipliers(horizon=5, size=1000, seed=1)
+
+    assert draws.shape == (1000,)
+    assert draws.min() >= 1.0 and draws.max() <= 1.2**5 + 1e-12
+    np.testing.assert_array_equal(draws, curve.sample_multipliers(5, 1000, seed=1))
@@ -0,0 +1,111 @@
+"""Index des prix au m² DVF : quantiles, repli entre niveaux, communes."""
+
+import numpy as np
+import pytest
+
+from infrastructure.dvf import open_dataset
+from infrastructure.dvf_index import (
+    QUANTILES,
+    MarketIndex,
+    MarketQuote,
+    build_index,
+    index_key,
+)
+
+
+@pytest.fixture(scope="module")
+def index(dvf_store) -> MarketIndex:
+    return build_index(dvf_store)
+
+
+def _prices(store, **filters):
+    df = open_dataset(store).to_table().to_pandas()
+    df = df[(df["property_type"] == "Appartement") & (df["price_per_m2"] >= 100)]
+    for column, value in filters.items():
+        df = df[df[column] == value]
+    return df["price_per_m2"].to_numpy()
+
+
+def test_commune_quote_matches_sale_quantiles(index, dvf_store):
+    quote = index.lookup("Toulouse")
+    prices = _prices(dvf_store, commune_code="555")
+
+    assert (quote.level, quote.year, quote.count) == ("commune", None, 112)
+    np.testing.assert_allclose(
+        [quote.p10, quote.p25, quote.median, quote.p75, quote.p90],
+        np.quantile(prices, QUANTILES),
+        rtol=1e-6,
+    )
+
+
+def test_year_quote_uses_that_year_only(index, dvf_store):
+    quote = index.lookup("Toulouse", year=2023)
+    prices = _prices(dvf_store, commune_code="555", year=2023)
+
+    assert (quote.year, quote.count) == (2023, len(prices))
+    assert quote.median == pytest.approx(np.median(prices), rel=1e-6)
+
+
+@pytest.mark.parametrize(
+    "section, rooms, min_count, level, count",
+    [
+        ("826AD", 2, 20, "section", 24),
+        ("826AD", 2, 5, "section et pièces", 6),
+        ("826AE", None, 20, "commune", 28),
+        (None, 2, 5, "commune et pièces", 7),
+    ],
+)
+def test_lookup_falls_back_to_coarser_levels(
+    index, section, rooms, min_count, level, count
+):
+    quote = index.lookup(
+        "Toulouse", section=section, rooms=rooms, year=2023, min_count=min_count
+    )
+
+    assert (quote.level, quote.count) == (level, count)
+
+
+def test_sparse_zone_returns_the_finest_level(index):
+    quote = index.lookup("Saint-Jean", section="826AD", rooms=2)
+
+    assert (quote.level, quote.count) == ("section et pièces", 4)
+    assert quote.median == pytest.approx(2500.0)
+
+
+@pytest.mark.parametrize("city", ["Saint-Jean", "saint jean", "SAINT JEAN", "31488"])
+def test_commune_resolves_from_name_or_code(index, city):
+    assert index.commune_code(city) == "31488"
+    assert index.lookup(city).count == 4
+
+
+def test_unknown_commune_or_type_has_no_quote(index):
+    assert index.lookup("Paris") is None
+    assert index.lookup("Toulouse", property_type="Terrain") is None
+    assert index.lookup("Toulouse", property_type="Maison").count == 3
+
+
+def test_saved_index_answers_the_same(index, tmp_path):
+    path = tmp_path / "index.npz"
+    index.save(path)
+    loaded = MarketIndex.load(path)
+
+    assert len(loaded) == len(index)
+    np.testing.assert_array_equal(loaded.keys, index.keys)
+    for section, rooms in (("826AD", 2), (None, None)):
+        assert loaded.lookup("Toulouse", section=section, rooms=rooms) == (
+            index.lookup("Toulouse", section=section, rooms=rooms)
+        )
+
+
+def test_index_key_clamps_rooms():
+    assert index_key("A", "31555", None, 9, None) == b"A|31555|*|5|*"
+    assert index_key("A", "31555", "826AD", 0, 2023) == b"A|31555|826AD|1|2023"
+
+
+def test_percentile_of_interpolates_between_quantiles():
+    quote = MarketQuote("commune", None, 100, 10.0, 20.0, 30.0, 40.0, 50.0)
+
+    assert quote.percentile_of(30.0) == pytest.approx(50.0)
+    assert quote.percentile_of(35.0) == pytest.approx(62.5)
+    assert quote.percentile_of(1.0) == pytest.approx(10.0)
+    assert quote.percentile_of(99.0) == pytest.approx(90.0)
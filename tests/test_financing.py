@@ -0,0 +1,80 @@
+"""Optimiseur de financement : contraintes, élagage et optimalité."""
+
+import numpy as np
+import pytest
+
+from application.batch import BatchSimulation
+from application.financing import (
+    BINDING_CASHFLOW,
+    LoanOffer,
+    _candidates,
+    default_offers,
+    optimize_financing,
+)
+from application.params_batch import ParamsBatch
+from application.simulation import LMNPSimulation
+
+
+def test_dominance_needs_same_duration_and_no_worse_terms():
+    offer = LoanOffer(20, 3.5, 300, 1000)
+
+    assert offer.dominates(LoanOffer(20, 3.8, 300, 1000))
+    assert offer.dominates(LoanOffer(20, 3.5, 0, 1500))
+    assert not offer.dominates(LoanOffer(20, 3.5, 1000, 300))
+    assert not offer.dominates(LoanOffer(25, 3.8, 300, 1000))
+    assert not offer.dominates(LoanOffer(20, 3.0, 0, 2000))
+
+
+def test_plan_respects_the_cashflow_floor(default_params):
+    plan = optimize_financing(default_params, max_contribution=60_000)
+    scalar = LMNPSimulation().run(plan.params)
+
+    assert plan.first_year_cashflow >= 0
+    assert plan.params.down_payment <= 60_000
+    assert plan.binding == (BINDING_CASHFLOW,)
+    assert plan.irr == pytest.approx(scalar.irr_value, abs=1e-8)
+    assert plan.npv == pytest.approx(scalar.npv_value, abs=1e-6)
+
+
+@pytest.mark.parametrize("min_cashflow", [0.0, -1000.0, -3000.0])
+def test_plan_is_at_least_as_good_as_a_dense_grid(default_params, min_cashflow):
+    offers = default_offers(default_params)
+    plan = optimize_financing(
+        default_params, max_contribution=60_000, min_cashflow=min_cashflow
+    )
+
+    down = np.arange(1.0, 60_001.0, 250.0)
+    grid = _candidates(
+        ParamsBatch.from_params([default_params]),
+        [offer for offer in offers for _ in down],
+        np.tile(down, len(offers)),
+    )
+    result = BatchSimulation().run(grid, with_taxation=False)
+    feasible = result.first_year_cashflow >= min_cashflow
+
+    assert plan.irr >= np.nanmax(result.irr_value[feasible]) - 1e-9
+
+
+def test_dominated_offers_are_pruned(default_params):
+    offers = [
+        LoanOffer(25, 3.5, 300, 1000, label="A"),
+        LoanOffer(25, 3.9, 300, 1000, label="B"),
+        LoanOffer(20, 3.2, 300, 1000, label="C"),
+    ]
+
+    plan = optimize_financing(
+        default_params, max_contribution=60_000, min_cashflow=-3000, offers=offers
+    )
+
+    assert plan.pruned_offers >= 1
+    assert plan.offer.label in ("A", "C")
+
+
+def test_unreachable_constraints_give_no_plan(default_params):
+    assert optimize_financing(default_params, max_contribution=1000) is None
+
+
+@pytest.mark.parametrize("kwargs", [{"offers": []}, {"max_contribution": -1.0}])
+def test_invalid_arguments_are_rejected(default_params, kwargs):
+    with pytest.raises(ValueError):
+        optimize_financing(default_params, **{"max_contribution": 1e4, **kwargs})
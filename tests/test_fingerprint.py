@@ -0,0 +1,67 @@
+"""Empreinte des paramètres : stable d'un processus et d'un appel à l'autre."""
+
+import dataclasses
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from application.fingerprint import params_fingerprint
+from application.simulation import LMNPSimulation
+
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+_CHILD = """
+from application.fingerprint import params_fingerprint
+from infrastructure.config import default_config_path, load_default_params
+
+print(params_fingerprint(load_default_params(default_config_path())))
+"""
+
+
+def test_fingerprint_is_stable_across_processes(default_params):
+    env = {**os.environ, "PYTHONPATH": str(SRC), "PYTHONHASHSEED": "12345"}
+    completed = subprocess.run(
+        [sys.executable, "-c", _CHILD],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+        cwd=SRC.parent,
+    )
+
+    assert completed.stdout.strip() == params_fingerprint(default_params)
+
+
+def test_fingerprint_is_hex_sha256(default_params):
+    fingerprint = params_fingerprint(default_params)
+
+    assert len(fingerprint) == 64
+    int(fingerprint, 16)
+
+
+def test_equal_params_share_fingerprint(default_params):
+    copy = dataclasses.replace(default_params)
+
+    assert copy is not default_params
+    assert params_fingerprint(copy) == params_fingerprint(default_params)
+
+
+def test_economic_fields_change_fingerprint(default_params):
+    base = params_fingerprint(default_params)
+
+    for name, value in (
+        ("property_price", default_params.property_price + 1),
+        ("monthly_rent", default_params.monthly_rent + 1),
+        ("loan_duration", default_params.loan_duration + 1),
+        ("resale_horizon", default_params.resale_horizon + 1),
+    ):
+        changed = dataclasses.replace(default_params, **{name: value})
+        assert params_fingerprint(changed) != base, name
+
+
+def test_engine_configuration_changes_fingerprint(default_params):
+    assert params_fingerprint(
+        default_params, LMNPSimulation(discount_rate=0.03)
+    ) != params_fingerprint(default_params)
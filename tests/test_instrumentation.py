@@ -0,0 +1,62 @@
+"""Instrumentation des étapes : inactive par défaut, agrégée à la demande."""
+
+import pytest
+
+from application import instrumentation
+from application.simulation import LMNPSimulation
+
+
+@pytest.fixture
+def enabled():
+    was_enabled = instrumentation.is_enabled()
+    instrumentation.reset()
+    instrumentation.enable()
+    yield
+    instrumentation.reset()
+    if not was_enabled:
+        instrumentation.disable()
+
+
+def test_disabled_stage_records_nothing():
+    was_enabled = instrumentation.is_enabled()
+    instrumentation.disable()
+    instrumentation.reset()
+    try:
+        with instrumentation.stage("essai"):
+            pass
+        instrumentation.record_cache("essai", hit=True)
+        assert instrumentation.report() == []
+    finally:
+        if was_enabled:
+            instrumentation.enable()
+
+
+def test_simulation_stages_are_timed(enabled, default_params):
+    LMNPSimulation().run(default_params)
+    LMNPSimulation().run(default_params)
+
+    stages = {stats.name: stats for stats in instrumentation.report()}
+
+    for name in ("simulation.run", "loan.monthly_schedule", "taxation.compute"):
+        assert stages[name].calls == 2
+        assert 0 < stages[name].p50_ms <= stages[name].max_ms
+    assert stages["simulation.run"].total_ms >= stages["taxation.compute"].total_ms
+
+
+def test_cache_lookup_classifies_hits_and_misses(enabled):
+    for computed in (True, False, False):
+        with instrumentation.cache_lookup("page.resultat"):
+            if computed:
+                instrumentation.mark_cache_miss()
+
+    (stats,) = instrumentation.report()
+    assert (stats.cache_hits, stats.cache_misses) == (2, 1)
+
+
+def test_report_is_sorted_by_total_time(enabled):
+    for name, repeats in (("court", 1), ("long", 50)):
+        for _ in range(repeats):
+            with instrumentation.stage(name):
+                sum(range(1000))
+
+    assert [stats.name for stats in instrumentation.report()] == ["long", "court"]
@@ -0,0 +1,171 @@
+"""Gestionnaire de tâches : déduplication et sémantique d'annulation."""
+
+import threading
+import time
+
+import pytest
+
+from application.jobs import CANCELLED, DONE, FAILED, JobManager
+from application.result_cache import ResultCache
+
+
+TIMEOUT = 5.0
+
+
+class Blocking:
+    """Calcul qui attend ``release`` en consultant l'annulation."""
+
+    def __init__(self, result: object = "résultat") -> None:
+        self.result = result
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.calls = 0
+
+    def __call__(self, context):
+        self.calls += 1
+        self.started.set()
+        while not self.release.wait(0.005):
+            context.raise_if_cancelled()
+        return self.result
+
+
+@pytest.fixture
+def manager():
+    manager = JobManager(max_workers=1, cache=ResultCache())
+    yield manager
+    manager.shutdown()
+
+
+def wait_for(manager: JobManager, key: str, state: str) -> None:
+    deadline = time.monotonic() + TIMEOUT
+    while manager.status(key).state != state:
+        assert time.monotonic() < deadline, manager.status(key)
+        time.sleep(0.005)
+
+
+def test_resubmit_by_same_subscriber_then_cancel_stops_job(manager):
+    compute = Blocking()
+    manager.submit("k", compute, subscriber="session")
+    manager.submit("k", compute, subscriber="session")
+    compute.started.wait(TIMEOUT)
+
+    assert manager.cancel("k", "session")
+    wait_for(manager, "k", CANCELLED)
+    assert compute.calls == 1
+
+
+def test_job_runs_until_last_subscriber_cancels(manager):
+    compute = Blocking()
+    manager.submit("k", compute, subscriber="a")
+    manager.submit("k", compute, subscriber="b")
+    compute.started.wait(TIMEOUT)
+
+    assert not manager.cancel("k", "a")
+    assert not manager.cancel("k", "a")
+    assert not manager.cancel("k", "intrus")
+    assert not manager.status("k").finished
+
+    assert manager.cancel("k", "b")
+    wait_for(manager, "k", CANCELLED)
+
+
+def test_cancelled_before_start_never_runs(manager):
+    first, second = Blocking(), Blocking()
+    manager.submit("first", first)
+    first.started.wait(TIMEOUT)
+    manager.submit("second", second)
+
+    assert manager.cancel("second")
+    first.release.set()
+    wait_for(manager, "first", DONE)
+    assert manager.status("second").state == CANCELLED
+    assert second.calls == 0
+
+
+def test_finished_job_result_is_cached(manager):
+    compute = Blocking()
+    compute.release.set()
+    manager.submit("k", compute)
+    wait_for(manager, "k", DONE)
+
+    status = manager.submit("k", compute)
+
+    assert status.state == DONE
+    assert status.result == "résultat"
+    assert compute.calls == 1
+    assert not manager.cancel("k")
+
+
+def test_failure_is_reported(manager):
+    def fail(context):
+        raise RuntimeError("échec du calcul")
+
+    manager.submit("k", fail)
+    wait_for(manager, "k", FAILED)
+
+    assert manager.status("k").error == "échec du calcul"
+
+
+def test_progress_is_published(manager):
+    reported = threading.Event()
+    release = threading.Event()
+
+    def compute(context):
+        context.report(3, 4, "3 / 4")
+        reported.set()
+        release.wait(TIMEOUT)
+
+    manager.submit("k", compute, total=4)
+    reported.wait(TIMEOUT)
+    status = manager.status("k")
+    release.set()
+
+    assert (status.done, status.total, status.message) == (3, 4, "3 / 4")
+    assert status.fraction == 0.75
+
+
+class Uninterruptible(Blocking):
+    """Calcul qui attend ``release`` sans consulter l'annulation."""
+
+    def __call__(self, context):
+        self.calls += 1
+        self.started.set()
+        self.release.wait(TIMEOUT)
+        return self.result
+
+
+def test_resubmit_after_cancel_starts_a_new_job(manager):
+    cancelled, fresh = Uninterruptible("ancien"), Blocking("nouveau")
+    manager.submit("k", cancelled, subscriber="session")
+    cancelled.started.wait(TIMEOUT)
+    assert manager.cancel("k", "session")
+
+    manager.submit("k", fresh, subscriber="session")
+    cancelled.release.set()
+    fresh.started.wait(TIMEOUT)
+    fresh.release.set()
+    wait_for(manager, "k", DONE)
+
+    assert fresh.calls == 1
+    assert manager.status("k").result == "nouveau"
+    assert manager.active() == []
+
+
+def test_abandoned_job_does_not_hide_its_replacement():
+    manager = JobManager(max_workers=2, cache=ResultCache())
+    cancelled, fresh = Uninterruptible("ancien"), Blocking("nouveau")
+    fresh.release.set()
+    try:
+        manager.submit("k", cancelled)
+        cancelled.started.wait(TIMEOUT)
+        manager.cancel("k")
+        manager.submit("k", fresh)
+        wait_for(manager, "k", DONE)
+
+        cancelled.release.set()
+        manager.shutdown()
+
+        assert manager.status("k").result == "nouveau"
+    finally:
+        cancelled.release.set()
+        manager.shutdown()
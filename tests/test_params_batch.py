@@ -0,0 +1,89 @@
+"""Lot de paramètres en colonnes : conversions sans perte et vues."""
+
+import dataclasses
+import pickle
+
+import numpy as np
+import pytest
+
+from application.params import SimulationParams
+from application.params_batch import FIELD_NAMES, ParamsBatch
+from benchmarks.scenarios import generate_scenarios
+
+
+SCENARIOS = generate_scenarios(50, seed=5)
+
+
+def test_round_trip_is_lossless():
+    batch = ParamsBatch.from_params(SCENARIOS)
+
+    assert len(batch) == len(SCENARIOS)
+    assert batch.to_params() == SCENARIOS
+    assert batch[7] == SCENARIOS[7]
+    for params in batch.to_params()[:3]:
+        for name in ("loan_duration", "resale_horizon", "start_month"):
+            assert type(getattr(params, name)) is int
+
+
+def test_constant_columns_are_stored_once(default_params):
+    sweep = [
+        dataclasses.replace(default_params, monthly_rent=500.0 + i)
+        for i in range(1000)
+    ]
+
+    batch = ParamsBatch.from_params(sweep)
+
+    assert batch.columns["monthly_rent"].shape == (1000,)
+    assert batch.columns["property_price"].shape == ()
+    assert batch.columns["city"].shape == ()
+    assert batch.nbytes < 1000 * 8 + 200 * len(FIELD_NAMES)
+    np.testing.assert_array_equal(batch.column("property_price"), 100_000.0)
+
+
+def test_text_fields_are_category_codes():
+    batch = ParamsBatch.from_params(SCENARIOS)
+    cities = [p.city for p in SCENARIOS]
+
+    assert batch.decoded("city").tolist() == cities
+    assert batch.codes("city").dtype == np.uint32
+    assert batch.codes("pno_period").dtype == np.uint8
+    multipliers = batch.lookup("pno_period", {"mensuel": 12, "annuel": 1}, 4)
+    assert multipliers.tolist() == [
+        {"mensuel": 12, "annuel": 1}.get(p.pno_period, 4) for p in SCENARIOS
+    ]
+
+
+def test_slice_take_concat_and_with_column():
+    batch = ParamsBatch.from_params(SCENARIOS)
+
+    assert batch.slice(10, 20).to_params() == SCENARIOS[10:20]
+    assert batch.slice(45, 100).to_params() == SCENARIOS[45:]
+    assert batch.take(np.array([3, 1])).to_params() == [SCENARIOS[3], SCENARIOS[1]]
+    halves = [batch.slice(0, 20), batch.slice(20, 50)]
+    assert ParamsBatch.concat(halves).to_params() == SCENARIOS
+    longer = batch.with_column("loan_duration", 25)
+    assert longer.to_params() == [
+        dataclasses.replace(p, loan_duration=25) for p in SCENARIOS
+    ]
+    assert longer.columns["monthly_rent"] is batch.columns["monthly_rent"]
+
+
+def test_invalid_columns_are_rejected(default_params):
+    columns = dataclasses.asdict(default_params)
+
+    with pytest.raises(ValueError, match="inconnus"):
+        ParamsBatch.from_columns({**columns, "couleur": "bleu"})
+    with pytest.raises(ValueError, match="modalité"):
+        ParamsBatch.from_columns({**columns, "pno_period": "hebdomadaire"})
+    with pytest.raises(ValueError, match="obligatoire"):
+        ParamsBatch.from_columns({"city": "Lyon"})
+    with pytest.raises(ValueError, match="différentes"):
+        ParamsBatch.from_columns({**columns, "monthly_rent": [1, 2], "surface": [1]})
+
+
+def test_slotted_params_pickle_round_trip(default_params):
+    assert not hasattr(default_params, "__dict__")
+    restored = pickle.loads(pickle.dumps(default_params, protocol=5))
+
+    assert isinstance(restored, SimulationParams)
+    assert restored == default_params
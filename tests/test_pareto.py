@@ -0,0 +1,83 @@
+"""Front de Pareto : comparaison avec une recherche exhaustive."""
+
+import numpy as np
+import pytest
+
+from application.batch import BatchSimulation
+from application.pareto import OBJECTIVES, non_dominated, pareto_front
+from benchmarks.scenarios import generate_scenarios
+
+
+def brute_force(points: np.ndarray) -> np.ndarray:
+    """Indices des points qu'aucun autre ne domine (minimisation)."""
+    at_least = (points[:, None, :] <= points[None, :, :]).all(axis=2)
+    strictly = (points[:, None, :] < points[None, :, :]).any(axis=2)
+    dominated = (at_least & strictly).any(axis=0)
+    return np.flatnonzero(~dominated)
+
+
+@pytest.mark.parametrize("objectives", [1, 2, 3, 4])
+@pytest.mark.parametrize("seed", range(5))
+def test_matches_brute_force_on_continuous_points(objectives, seed):
+    points = np.random.default_rng(seed).normal(size=(300, objectives))
+
+    np.testing.assert_array_equal(non_dominated(points), brute_force(points))
+
+
+@pytest.mark.parametrize("objectives", [2, 3])
+@pytest.mark.parametrize("seed", range(5))
+def test_matches_brute_force_with_ties_and_duplicates(objectives, seed):
+    points = np.random.default_rng(seed).integers(0, 5, size=(200, objectives))
+
+    np.testing.assert_array_equal(
+        non_dominated(points), brute_force(points.astype(float))
+    )
+
+
+def test_empty_input():
+    assert non_dominated(np.empty((0, 3))).size == 0
+
+
+def anti_correlated(size: int, objectives: int, seed: int) -> np.ndarray:
+    """Points proches de l'hyperplan ``somme = 1`` : front très étendu."""
+    rng = np.random.default_rng(seed)
+    points = rng.random((size, objectives))
+    points /= points.sum(axis=1, keepdims=True)
+    return points + rng.normal(scale=0.01, size=points.shape)
+
+
+@pytest.mark.parametrize("objectives", [3, 4])
+@pytest.mark.parametrize("seed", range(3))
+def test_matches_brute_force_on_anti_correlated_points(objectives, seed):
+    points = anti_correlated(1500, objectives, seed)
+
+    np.testing.assert_array_equal(non_dominated(points), brute_force(points))
+
+
+def test_large_three_objective_front():
+    rng = np.random.default_rng(0)
+    plane = rng.random((200_000, 3))
+    plane[:, 2] = 1 - plane[:, 0] - plane[:, 1]
+    points = np.concatenate([plane, plane[:1000] + 0.5])
+
+    np.testing.assert_array_equal(non_dominated(points), np.arange(200_000))
+
+
+def test_front_of_a_batch():
+    scenarios = generate_scenarios(200, seed=5)
+    result = BatchSimulation().run(scenarios, with_taxation=False)
+
+    front = pareto_front(result, scenarios)
+
+    senses = [1.0 if OBJECTIVES[name] == "min" else -1.0 for name in front.objectives]
+    values = np.column_stack(
+        [
+            result.irr_value,
+            result.first_year_cashflow,
+            [p.down_payment for p in scenarios],
+        ]
+    )
+    finite = np.flatnonzero(np.isfinite(values).all(axis=1))
+    expected = finite[brute_force(values[finite] * senses)]
+    np.testing.assert_array_equal(np.sort(front.indices), expected)
+    assert np.all(np.diff(front.column("irr_value")) <= 0)
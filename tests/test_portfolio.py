@@ -0,0 +1,106 @@
+"""Portefeuille : calendrier commun et règles fiscales du foyer."""
+
+import dataclasses
+
+import numpy as np
+import pytest
+
+from application.batch import BatchSimulation
+from application.portfolio import (
+    LMP_RECEIPTS_THRESHOLD,
+    MICRO_BIC_THRESHOLD,
+    Household,
+    PortfolioAsset,
+    PortfolioSimulation,
+)
+
+
+@pytest.fixture
+def growing(default_params) -> list[PortfolioAsset]:
+    """Trois biens achetés en 2024, mi-2025 et 2027."""
+    return [
+        PortfolioAsset(
+            dataclasses.replace(default_params, monthly_rent=rent, start_month=month),
+            year,
+        )
+        for rent, month, year in ((1500, 1, 2024), (2500, 7, 2025), (3000, 1, 2027))
+    ]
+
+
+@pytest.fixture
+def two_purchases(default_params) -> list[PortfolioAsset]:
+    """Deux biens achetés la même année : déficit de frais en année 1."""
+    params = dataclasses.replace(default_params, monthly_rent=1000)
+    return [PortfolioAsset(params, 2024), PortfolioAsset(params, 2024)]
+
+
+def test_assets_are_placed_on_a_common_calendar(growing):
+    result = PortfolioSimulation().run(growing)
+    batch = BatchSimulation().run([a.params for a in growing], with_taxation=False)
+    duration = batch.cashflow.shape[1]
+
+    assert result.calendar_years[0] == 2024
+    assert len(result.calendar_years) == duration + 3
+    for row, offset in enumerate((0, 1, 3)):
+        placed = result.asset_cashflow[row]
+        assert not placed[:offset].any()
+        np.testing.assert_allclose(
+            placed[offset : offset + duration], batch.cashflow[row]
+        )
+    np.testing.assert_allclose(result.cashflow, result.asset_cashflow.sum(axis=0))
+    np.testing.assert_allclose(
+        result.remaining_debt, result.asset_remaining_debt.sum(axis=0)
+    )
+    # Bien acquis en juillet : six mois de loyer la première année.
+    assert result.incomes[1] == pytest.approx(1500 * 12 + 2500 * 6, rel=0.02)
+
+
+def test_household_thresholds_follow_total_receipts(growing):
+    result = PortfolioSimulation().run(growing, Household(other_activity_income=0))
+
+    assert result.incomes[2] <= MICRO_BIC_THRESHOLD < result.incomes[3]
+    assert result.micro_bic_eligible[:4].tolist() == [True, True, True, False]
+    assert result.incomes[0] <= LMP_RECEIPTS_THRESHOLD < result.incomes[1]
+    assert result.lmp_status[:4].tolist() == [False, True, True, True]
+    assert not result.micro_bic_applied.any()
+
+
+def test_micro_bic_applies_only_in_eligible_years(growing):
+    real = PortfolioSimulation().run(growing)
+    micro = PortfolioSimulation().run(growing, Household(real_regime_option=False))
+
+    assert (micro.micro_bic_applied == micro.micro_bic_eligible).all()
+    eligible = micro.micro_bic_applied
+    np.testing.assert_allclose(
+        micro.taxable_income[eligible], micro.incomes[eligible] * 0.5
+    )
+    assert micro.taxation_entries[0].current_expenses == 0.0
+    np.testing.assert_allclose(
+        real.taxable_income, [e.fiscal_result for e in real.taxation_entries]
+    )
+    # Pas d'imputation des stocks réels pendant le micro-BIC : les bénéfices
+    # réels reprennent en 2027 sans les déficits de 2024.
+    assert micro.taxable_income[3] >= real.taxable_income[3]
+
+
+def test_lmp_deficit_is_imputed_on_global_income(two_purchases):
+    lmp = PortfolioSimulation().run(two_purchases, Household())
+    lmnp = PortfolioSimulation().run(
+        two_purchases, Household(other_activity_income=100_000)
+    )
+
+    assert lmp.lmp_status[0] and not lmnp.lmp_status[0]
+    first_lmp, first_lmnp = lmp.taxation_entries[0], lmnp.taxation_entries[0]
+    assert first_lmnp.result_before_amort < 0
+    assert first_lmp.result_before_amort == first_lmnp.result_before_amort
+    assert lmp.global_income_deficit[0] == pytest.approx(
+        -first_lmnp.result_before_amort, abs=0.01
+    )
+    assert first_lmp.deficit_added == 0.0 and first_lmp.carry_forward_deficit == 0.0
+    assert first_lmnp.deficit_added > 0 and not lmnp.global_income_deficit.any()
+    assert lmp.taxable_income.sum() >= lmnp.taxable_income.sum()
+
+
+def test_empty_portfolio_is_rejected():
+    with pytest.raises(ValueError):
+        PortfolioSimulation().run([])
@@ -0,0 +1,86 @@
+"""Aperçu instantané : parité avec la simulation complète."""
+
+import dataclasses
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from application.preview import AnnuityTable, annuity_factor, preview
+from application.simulation import LMNPSimulation
+from benchmarks.scenarios import generate_scenarios
+
+
+SCENARIOS = generate_scenarios(30, seed=7)
+
+
+def _assert_matches_run(params):
+    result = LMNPSimulation().run(params)
+    estimate = preview(params)
+    cashflow = result.cashflow["Cashflow (€)"].to_numpy()
+    first_full_year = 1 if params.start_month > 1 else 0
+
+    assert estimate.total_cost == pytest.approx(result.total_cost)
+    assert estimate.monthly_payment == pytest.approx(
+        result.loan_monthly_schedule[0].payment, abs=1e-6
+    )
+    assert estimate.monthly_cashflow == pytest.approx(
+        cashflow[first_full_year] / 12, abs=0.01
+    )
+    assert estimate.irr == pytest.approx(result.irr_value, abs=1e-4)
+
+
+@pytest.mark.parametrize("index", range(len(SCENARIOS)))
+def test_preview_matches_run(index):
+    _assert_matches_run(SCENARIOS[index])
+
+
+@pytest.mark.parametrize("horizon", [10, 30, 31, 45])
+@pytest.mark.parametrize("start_month", [1, 7])
+def test_preview_matches_run_across_horizons(default_params, horizon, start_month):
+    _assert_matches_run(
+        dataclasses.replace(
+            default_params, resale_horizon=horizon, start_month=start_month
+        )
+    )
+
+
+def test_preview_matches_run_with_a_resale_amount(default_params):
+    _assert_matches_run(dataclasses.replace(default_params, resale=250_000))
+
+
+def test_undefined_irr_is_none(default_params):
+    params = dataclasses.replace(default_params, resale_horizon=1)
+
+    assert preview(params).irr is None
+
+
+@pytest.mark.parametrize(
+    "rate, years", [(0.0, 20), (0.035, 25), (0.0351234, 25), (0.04, 35)]
+)
+def test_annuity_table_matches_the_formula(rate, years):
+    table = AnnuityTable()
+
+    assert table.factor(rate, years) == pytest.approx(
+        annuity_factor(rate, years), rel=1e-12
+    )
+
+
+def test_preview_does_not_import_numpy():
+    src = Path(__file__).resolve().parents[1] / "src"
+    code = (
+        "import sys, application.preview\n"
+        "print(sorted({'numpy', 'pandas'} & set(sys.modules)))"
+    )
+
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": str(src)},
+    ).stdout
+
+    assert output.strip() == "[]"
@@ -0,0 +1,154 @@
+"""Cache de résultats : durée de vie, éviction et calcul unique par clé."""
+
+import pickle
+import sys
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from application.result_cache import ResultCache, cached_simulation, estimated_size
+
+
+class Value:
+    """Valeur avec référence faible, comme un résultat de simulation."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_entry_expires_after_ttl():
+    clock = Clock()
+    cache = ResultCache(ttl_seconds=10, clock=clock)
+    value = cache.get_or_compute("k", lambda: Value("a"))
+
+    clock.now = 10.0
+    assert cache.get("k") is value
+    clock.now = 10.5
+    assert cache.get("k") is None
+    assert cache.stats().expirations == 1
+
+
+def test_expired_entry_is_recomputed():
+    clock = Clock()
+    cache = ResultCache(ttl_seconds=1, clock=clock)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return Value("a")
+
+    cache.get_or_compute("k", compute)
+    clock.now = 2.0
+    cache.get_or_compute("k", compute)
+
+    assert len(calls) == 2
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ResultCache(max_entries=2)
+    values = {key: cache.get_or_compute(key, lambda k=key: Value(k)) for key in "ab"}
+    cache.get("a")
+
+    values["c"] = cache.get_or_compute("c", lambda: Value("c"))
+
+    assert cache.get("b") is None
+    assert cache.get("a") is values["a"]
+    assert cache.get("c") is values["c"]
+    assert cache.stats().evictions == 1
+
+
+def test_byte_budget_evicts_oldest_but_keeps_new_entry():
+    cache = ResultCache(max_bytes=100, sizeof=lambda value: 60)
+    cache.get_or_compute("a", lambda: Value("a"))
+    cache.get_or_compute("b", lambda: Value("b"))
+
+    stats = cache.stats()
+    assert cache.get("a") is None
+    assert cache.get("b") is not None
+    assert (stats.size, stats.nbytes) == (1, 60)
+
+
+def test_evicted_value_still_referenced_is_revived():
+    cache = ResultCache(max_entries=1)
+    kept = cache.get_or_compute("a", lambda: Value("a"))
+    cache.get_or_compute("b", lambda: Value("b"))
+
+    revived = cache.get_or_compute("a", lambda: pytest.fail("recalcul inattendu"))
+
+    assert revived is kept
+    assert cache.stats().revivals == 1
+
+
+def test_concurrent_requests_share_one_computation():
+    cache = ResultCache()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return Value("a")
+
+    results = []
+
+    def request():
+        results.append(cache.get_or_compute("k", compute))
+
+    threads = [threading.Thread(target=request) for _ in range(4)]
+    threads[0].start()
+    started.wait(5)
+    for thread in threads[1:]:
+        thread.start()
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert len(results) == 4
+    assert all(result is results[0] for result in results)
+
+
+def test_failed_computation_is_not_cached():
+    cache = ResultCache()
+
+    def fail():
+        raise RuntimeError("échec")
+
+    with pytest.raises(RuntimeError):
+        cache.get_or_compute("k", fail)
+
+    assert cache.get_or_compute("k", lambda: Value("a")).name == "a"
+
+
+def test_size_estimate_counts_buffers_and_extrapolates_lists():
+    array = np.zeros(1000)
+    rows = [(1.0, 2.0)] * 100
+
+    assert estimated_size(array) == array.nbytes
+    assert estimated_size({"a": array}) > array.nbytes
+    assert estimated_size(rows) == sys.getsizeof(rows) + 100 * estimated_size(rows[0])
+
+
+def test_byte_budget_does_not_serialize_results(monkeypatch, default_params):
+    def forbidden(*args, **kwargs):
+        raise AssertionError("sérialisation inattendue")
+
+    monkeypatch.setattr(pickle, "dumps", forbidden)
+    cache = ResultCache(max_bytes=10 * 1024 * 1024)
+
+    result = cached_simulation(default_params, cache)
+
+    assert 10_000 < cache.stats().nbytes == estimated_size(result)
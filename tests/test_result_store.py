@@ -0,0 +1,117 @@
+"""Cache persistant : sérialisation, éviction LRU et partage entre processus."""
+
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from application.fingerprint import params_fingerprint
+from application.simulation import LMNPSimulation
+from infrastructure.result_store import ResultStore, deserialize, serialize
+
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+# Écrit puis relit depuis un autre processus le même fichier SQLite.
+_CHILD = """
+import sys
+import numpy as np
+from infrastructure.result_store import ResultStore
+
+store = ResultStore(sys.argv[1])
+if sys.argv[2] == "put":
+    store.put("partagé", np.arange(5.0))
+else:
+    print(store.get("parent").sum())
+"""
+
+
+def run_child(path: Path, action: str) -> str:
+    env = {**os.environ, "PYTHONPATH": str(SRC)}
+    completed = subprocess.run(
+        [sys.executable, "-c", _CHILD, str(path), action],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+    return completed.stdout.strip()
+
+
+def test_serialize_round_trip_keeps_arrays_out_of_band():
+    frame = pd.DataFrame({"a": np.arange(1000.0), "b": np.arange(1000)})
+    payload = serialize({"frame": frame, "texte": "é"})
+
+    restored = deserialize(payload)
+
+    pd.testing.assert_frame_equal(restored["frame"], frame)
+    assert restored["texte"] == "é"
+    assert len(payload) > frame.memory_usage(index=False).sum()
+
+
+def test_simulation_result_round_trip(tmp_path, default_params):
+    result = LMNPSimulation().run(default_params)
+    store = ResultStore(tmp_path / "results.sqlite")
+
+    store.put("k", result)
+    restored = store.get("k")
+
+    assert restored.params == default_params
+    assert restored.irr_value == result.irr_value
+    assert restored.taxation_entries == result.taxation_entries
+    pd.testing.assert_frame_equal(restored.cashflow, result.cashflow)
+    assert store.get("absent") is None
+
+
+def test_eviction_is_lru_by_total_bytes(tmp_path):
+    value = np.zeros(1000)
+    size = len(serialize(value))
+    store = ResultStore(tmp_path / "results.sqlite", max_bytes=2 * size)
+
+    store.put("a", value)
+    time.sleep(0.01)
+    store.put("b", value)
+    time.sleep(0.01)
+    store.get("a")
+    time.sleep(0.01)
+    store.put("c", value)
+
+    assert store.get("b") is None
+    assert store.get("a") is not None and store.get("c") is not None
+    assert store.total_bytes() == 2 * size
+    assert len(store) == 2
+
+
+def test_oversized_value_is_not_stored(tmp_path):
+    store = ResultStore(tmp_path / "results.sqlite", max_bytes=100)
+
+    store.put("gros", np.zeros(1000))
+
+    assert len(store) == 0
+
+
+def test_store_is_shared_across_processes(tmp_path):
+    path = tmp_path / "results.sqlite"
+    store = ResultStore(path)
+    store.put("parent", np.arange(4.0))
+
+    run_child(path, "put")
+
+    np.testing.assert_array_equal(store.get("partagé"), np.arange(5.0))
+    assert run_child(path, "get") == "6.0"
+
+
+def test_results_of_an_older_engine_are_not_served(tmp_path, default_params):
+    store = ResultStore(tmp_path / "results.sqlite")
+    store.put(params_fingerprint(default_params, engine_version="0"), "ancien")
+
+    assert store.get(params_fingerprint(default_params)) is None
+
+
+def test_engine_version_changes_fingerprint(default_params):
+    assert params_fingerprint(
+        default_params, engine_version="périmé"
+    ) != params_fingerprint(default_params)
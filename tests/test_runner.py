@@ -0,0 +1,57 @@
+"""Exécution hors interface : un échec du moteur n'atteint que son scénario."""
+
+import dataclasses
+
+import numpy as np
+import pytest
+
+import application.runner as runner
+from application.params_batch import ParamsBatch
+from application.runner import ERROR_COLUMN, SUMMARY_COLUMNS, ScenarioRunner
+
+
+@pytest.fixture
+def batch(default_params) -> ParamsBatch:
+    return ParamsBatch.from_params(
+        [
+            dataclasses.replace(default_params, monthly_rent=600.0 + i)
+            for i in range(7)
+        ]
+    )
+
+
+@pytest.mark.parametrize("engine", ["batched", "scalar"])
+def test_engine_failure_is_isolated(monkeypatch, batch, engine):
+    name = "_batched_summary" if engine == "batched" else "_scalar_summary"
+    evaluate = getattr(runner, name)
+
+    def flaky(params):
+        if (params.column("monthly_rent") == 604.0).any():
+            raise RuntimeError("échec du moteur")
+        return evaluate(params)
+
+    monkeypatch.setattr(runner, name, flaky)
+
+    (summary,) = ScenarioRunner(engine).run([batch])
+
+    assert list(summary.columns) == [*SUMMARY_COLUMNS, ERROR_COLUMN]
+    assert summary[ERROR_COLUMN].tolist() == [None] * 4 + ["échec du moteur"] + [
+        None
+    ] * 2
+    assert np.isnan(summary["irr_value"][4])
+    assert np.isfinite(summary["irr_value"].drop(index=4)).all()
+
+
+def test_engines_agree(batch):
+    (batched,) = ScenarioRunner("batched").run([batch])
+    (scalar,) = ScenarioRunner("scalar").run([batch])
+
+    for name in SUMMARY_COLUMNS:
+        np.testing.assert_allclose(batched[name], scalar[name], atol=1e-6)
+
+
+def test_empty_batch(batch):
+    (summary,) = ScenarioRunner().run([batch.slice(0, 0)])
+
+    assert summary.empty
+    assert list(summary.columns) == [*SUMMARY_COLUMNS, ERROR_COLUMN]
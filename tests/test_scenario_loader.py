@@ -0,0 +1,215 @@
+"""Chargeur de scénarios : rejets ligne à ligne sans interrompre le flux."""
+
+import dataclasses
+import io
+import json
+
+import pytest
+import yaml
+
+from infrastructure.scenario_loader import iter_scenarios, load_records
+
+
+@pytest.fixture
+def record(default_params) -> dict:
+    return dataclasses.asdict(default_params)
+
+
+def _csv(records: list[dict], extra_line: int | None = None) -> str:
+    columns = list(records[0])
+    lines = [",".join(columns)]
+    for i, record in enumerate(records):
+        line = ",".join(str(record[c]) for c in columns)
+        if i == extra_line:
+            line += ",surplus,surplus"
+        lines.append(line)
+    return "\n".join(lines) + "\n"
+
+
+def _collect(batches) -> tuple[list[int], list[tuple[int, str]]]:
+    lines: list[int] = []
+    errors: list[tuple[int, str]] = []
+    for batch in batches:
+        assert len(batch.params) == len(batch.lines)
+        lines.extend(batch.lines)
+        errors.extend((error.line, error.message) for error in batch.errors)
+    return lines, errors
+
+
+def test_csv_rejects_invalid_values_with_line_numbers(tmp_path, record):
+    path = tmp_path / "scenarios.csv"
+    records = [
+        record,
+        {**record, "loan_duration": 0},
+        {**record, "start_month": 13},
+        {**record, "resale_horizon": 31},
+        {**record, "monthly_rent": "abc"},
+        record,
+    ]
+    path.write_text(_csv(records), encoding="utf-8")
+
+    lines, errors = _collect(iter_scenarios(path, batch_size=4))
+
+    assert lines == [2, 7]
+    assert errors == [
+        (3, "loan_duration ≤ 0"),
+        (4, "start_month hors de 1–12"),
+        (5, "resale_horizon hors de 1–30"),
+        (6, "monthly_rent non numérique"),
+    ]
+
+
+def test_csv_row_with_too_many_fields_does_not_stop_stream(tmp_path, record):
+    path = tmp_path / "scenarios.csv"
+    path.write_text(_csv([record] * 5, extra_line=1), encoding="utf-8")
+
+    lines, errors = _collect(iter_scenarios(path, batch_size=2))
+
+    assert lines == [2, 4, 5, 6]
+    assert [line for line, _ in errors] == [3]
+    assert "champs au lieu de" in errors[0][1]
+
+
+def test_csv_missing_required_column_is_fatal(tmp_path, record):
+    path = tmp_path / "scenarios.csv"
+    del record["property_price"]
+    path.write_text(_csv([record]), encoding="utf-8")
+
+    with pytest.raises(ValueError, match="property_price"):
+        list(iter_scenarios(path))
+
+
+def test_csv_lines_are_physical_despite_blank_lines_and_quotes(tmp_path, record):
+    header = _csv([record]).splitlines()
+    valid = header[1]
+    city = list(record).index("city")
+    fields = valid.split(",")
+    fields[city] = '"Saint-Denis\nde la ""Réunion"", 974"'
+    multiline = ",".join(fields)
+    invalid = _csv([{**record, "start_month": 13}]).splitlines()[1]
+    text = "\n".join(
+        [
+            header[0],  # 1
+            valid,  # 2
+            "",  # 3
+            multiline,  # 4-5
+            "   ",  # 6
+            invalid,  # 7
+            valid + ",surplus",  # 8
+            valid,  # 9
+        ]
+    )
+    path = tmp_path / "scenarios.csv"
+    path.write_text(text, encoding="utf-8")
+
+    batches = list(iter_scenarios(path, batch_size=2))
+    lines, errors = _collect(batches)
+
+    assert lines == [2, 4, 9]
+    assert errors[0] == (7, "start_month hors de 1–12")
+    assert errors[1][0] == 8
+    assert errors[1][1] == f"{len(record) + 1} champs au lieu de {len(record)}"
+    cities = [c for batch in batches for c in batch.params.decoded("city")]
+    assert cities[1] == 'Saint-Denis\nde la "Réunion", 974'
+
+
+def test_csv_unterminated_quote_is_rejected(tmp_path, record):
+    text = _csv([record, record])
+    fields = text.splitlines()[-1].split(",")
+    fields[1] = '"Toulouse'
+    path = tmp_path / "scenarios.csv"
+    path.write_text(text + ",".join(fields) + "\n" + text.splitlines()[1], "utf-8")
+
+    lines, errors = _collect(iter_scenarios(path))
+
+    assert lines == [2, 3]
+    assert errors == [(4, "guillemet non fermé")]
+
+
+def test_csv_numeric_columns_with_text_fall_back_per_row(tmp_path, record):
+    path = tmp_path / "scenarios.csv"
+    path.write_text(
+        _csv([record, {**record, "surface": "grand"}, {**record, "surface": ""}]),
+        encoding="utf-8-sig",
+    )
+
+    (batch,) = iter_scenarios(path)
+
+    assert batch.lines == [2]
+    assert [(e.line, e.message) for e in batch.errors] == [
+        (3, "surface non numérique"),
+        (4, "surface manquant"),
+    ]
+
+
+def test_csv_header_only_and_empty_files(tmp_path, record):
+    path = tmp_path / "scenarios.csv"
+    path.write_text(_csv([record]).splitlines()[0] + "\n", encoding="utf-8")
+    assert list(iter_scenarios(path)) == []
+
+    path.write_text("\n\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="en-tête CSV absent"):
+        list(iter_scenarios(path))
+
+
+def test_jsonl_rejects_malformed_lines(record):
+    text = "\n".join(
+        [
+            json.dumps(record),
+            "{pas du json",
+            "",
+            "[1, 2]",
+            json.dumps({k: v for k, v in record.items() if k != "property_price"}),
+            json.dumps({**record, " Monthly_Rent ": 900}),
+        ]
+    )
+
+    batches = list(iter_scenarios(io.StringIO(text), batch_size=2, fmt="jsonl"))
+    lines, errors = _collect(batches)
+
+    assert lines == [1, 6]
+    assert [line for line, _ in errors] == [2, 4, 5]
+    assert errors[0][1].startswith("JSON invalide")
+    assert errors[1][1] == "objet JSON attendu"
+    assert errors[2][1] == "property_price manquant"
+    assert batches[-1].params.column("monthly_rent")[-1] == 900
+
+
+def test_stream_requires_format():
+    with pytest.raises(ValueError, match="format obligatoire"):
+        list(iter_scenarios(io.StringIO("")))
+
+
+def test_unknown_format(tmp_path):
+    path = tmp_path / "scenarios.txt"
+    path.write_text("", encoding="utf-8")
+
+    with pytest.raises(ValueError, match="non reconnu"):
+        list(iter_scenarios(path))
+
+
+def test_yaml_directory_keeps_source_of_each_row(tmp_path, record):
+    (tmp_path / "a.yaml").write_text(yaml.safe_dump(record), encoding="utf-8")
+    (tmp_path / "b.yaml").write_text(
+        yaml.safe_dump({**record, "loan_duration": 0}), encoding="utf-8"
+    )
+    (tmp_path / "c.yml").write_text(yaml.safe_dump(record), encoding="utf-8")
+    (tmp_path / "d.yaml").write_text("- liste\n", encoding="utf-8")
+    (tmp_path / "e.yaml").write_text("clé: [non fermée\n", encoding="utf-8")
+
+    (batch,) = iter_scenarios(tmp_path)
+
+    assert batch.sources == [str(tmp_path / "a.yaml"), str(tmp_path / "c.yml")]
+    assert batch.lines == [0, 0]
+    assert sorted(error.source for error in batch.errors) == [
+        str(tmp_path / name) for name in ("b.yaml", "d.yaml", "e.yaml")
+    ]
+
+
+def test_load_records_reports_rank(record):
+    batch = load_records([record, {**record, "resale_horizon": 0}, record], "api")
+
+    assert batch.lines == [0, 2]
+    assert [(e.line, e.message) for e in batch.errors] == [
+        (1, "resale_horizon hors de 1–30")
+    ]
@@ -0,0 +1,78 @@
+"""Analyse tornado : bornes des perturbations et cohérence avec le moteur."""
+
+import dataclasses
+
+import pytest
+
+from application.sensitivity import MIN_NOMINAL_RATE, tornado
+from application.simulation import LMNPSimulation
+
+
+def bar(result, field):
+    (found,) = [b for b in result.bars if b.field == field]
+    return found
+
+
+def test_bars_match_scalar_runs(default_params):
+    result = tornado(default_params, fields=["monthly_rent", "loan_duration"])
+    simulation = LMNPSimulation()
+    base_irr = simulation.run(default_params).irr_value
+
+    assert result.base_irr == pytest.approx(base_irr, abs=1e-8)
+    rent = bar(result, "monthly_rent")
+    low = simulation.run(
+        dataclasses.replace(default_params, monthly_rent=rent.low_value)
+    )
+    assert rent.irr_low == pytest.approx(low.irr_value - base_irr, abs=1e-8)
+    assert rent.irr_low < 0 < rent.irr_high
+    assert bar(result, "loan_duration").low_value == default_params.loan_duration - 5
+
+
+def test_nominal_rate_stays_positive(default_params):
+    base = dataclasses.replace(
+        default_params, loan_nominal_rate=3.0, loan_insurance_rate=0.3
+    )
+
+    rate = bar(
+        tornado(base, fields=["loan_rate"], absolute_steps={"loan_rate": 10.0}),
+        "loan_rate",
+    )
+
+    assert rate.low_value == MIN_NOMINAL_RATE
+    lowered = dataclasses.replace(base, loan_nominal_rate=MIN_NOMINAL_RATE)
+    simulation = LMNPSimulation()
+    expected = simulation.run(lowered).irr_value - simulation.run(base).irr_value
+    assert rate.irr_low == pytest.approx(expected, abs=1e-8)
+    assert rate.irr_low > 0
+
+
+def test_signed_fields_may_turn_negative(default_params):
+    base = dataclasses.replace(default_params, rent_increase_rate=1.0, resale=1.0)
+
+    result = tornado(
+        base,
+        fields=["rent_increase_rate", "resale"],
+        absolute_steps={"rent_increase_rate": 3.0, "resale": 3.0},
+    )
+
+    assert bar(result, "rent_increase_rate").low_value == -2.0
+    assert bar(result, "resale").low_value == -2.0
+
+
+def test_threshold_fields_keep_their_interpretation(default_params):
+    steps = {"agency_fee_rate": 80.0}
+
+    def fee_bar(value):
+        base = dataclasses.replace(default_params, agency_fee_rate=value)
+        result = tornado(base, ["agency_fee_rate"], absolute_steps=steps)
+        return bar(result, "agency_fee_rate")
+
+    percent, amount = fee_bar(95.0), fee_bar(150.0)
+
+    assert (percent.low_value, percent.high_value) == (15.0, 99.99)
+    assert (amount.low_value, amount.high_value) == (100.0, 230.0)
+
+
+def test_unknown_field_is_rejected(default_params):
+    with pytest.raises(ValueError):
+        tornado(default_params, fields=["city"])
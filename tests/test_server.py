@@ -0,0 +1,75 @@
+"""Serveur HTTP : délais de lecture et limite d'en-tête."""
+
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from api.server import MAX_HEADER_LINES, start
+from api.service import SimulationService
+
+
+READ_TIMEOUT = 0.2
+
+
+async def exchange(request: bytes) -> tuple[int, dict, bytes]:
+    """Envoie ``request`` à un serveur éphémère ; statut, corps, reste lu."""
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        async with SimulationService(executor=executor) as service:
+            server = await start(service, "127.0.0.1", 0, READ_TIMEOUT)
+            async with server:
+                port = server.sockets[0].getsockname()[1]
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+                writer.write(request)
+                await writer.drain()
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = int(head.split(b"Content-Length: ")[1].split(b"\r\n")[0])
+                body = json.loads(await reader.readexactly(length))
+                rest = await asyncio.wait_for(reader.read(), READ_TIMEOUT * 5)
+                writer.close()
+    return int(head.split()[1]), body, rest
+
+
+def headers(count: int) -> bytes:
+    lines = b"".join(b"X-Essai-%d: %d\r\n" % (i, i) for i in range(count - 1))
+    return b"GET /health HTTP/1.1\r\nConnection: close\r\n" + lines + b"\r\n"
+
+
+def test_complete_request_is_served():
+    status, body, _ = asyncio.run(exchange(headers(MAX_HEADER_LINES)))
+
+    assert status == 200
+    assert body["status"] == "ok"
+
+
+@pytest.mark.parametrize(
+    "request_bytes",
+    [
+        b"",
+        b"GET /health HTTP/1.1\r\nHost: essai\r\n",
+        b"POST /kpi HTTP/1.1\r\nContent-Length: 50\r\n\r\n{\"mo",
+    ],
+    ids=["inactive", "en-tete-partiel", "corps-partiel"],
+)
+def test_slow_client_gets_408_and_is_disconnected(request_bytes):
+    status, body, rest = asyncio.run(exchange(request_bytes))
+
+    assert status == 408
+    assert "Délai" in body["error"]
+    assert rest == b""
+
+
+def test_too_many_header_lines_get_431():
+    status, _, rest = asyncio.run(exchange(headers(MAX_HEADER_LINES + 1)))
+
+    assert status == 431
+    assert rest == b""
+
+
+def test_overlong_header_line_gets_431():
+    request = b"GET /health HTTP/1.1\r\nX-Long: " + b"a" * 100_000 + b"\r\n\r\n"
+
+    status, _, _ = asyncio.run(exchange(request))
+
+    assert status == 431
@@ -0,0 +1,49 @@
+"""Tableaux Arrow des résultats : colonnes typées, mêmes valeurs, sans copie."""
+
+import dataclasses
+import pickle
+
+import numpy as np
+import pyarrow as pa
+
+from application.simulation import LMNPSimulation
+from domain.loan import AmortizationEntry
+from domain.taxation import TaxationEntry
+
+
+def test_entry_tables_match_domain_rows(default_params):
+    result = LMNPSimulation().run(default_params)
+
+    for table, entries, entry_type in (
+        (result.loan_monthly_table, result.loan_monthly_schedule, AmortizationEntry),
+        (result.loan_annual_table, result.loan_annual_schedule, AmortizationEntry),
+        (result.taxation_table, result.taxation_entries, TaxationEntry),
+    ):
+        assert table.num_rows == len(entries)
+        for field in dataclasses.fields(entry_type):
+            expected = pa.int32() if field.type in (int, "int") else pa.float64()
+            assert table.schema.field(field.name).type == expected
+            assert table.column(field.name).to_pylist() == [
+                getattr(e, field.name) for e in entries
+            ]
+
+
+def test_cashflow_table_matches_frame(default_params):
+    result = LMNPSimulation().run(default_params)
+    table = result.cashflow_table
+
+    assert table.column_names == list(result.cashflow.columns)
+    column = "Cashflow (€)"
+    np.testing.assert_array_equal(
+        table.column(column).to_numpy(), result.cashflow[column].to_numpy()
+    )
+
+
+def test_tables_are_built_once_and_not_pickled(default_params):
+    result = LMNPSimulation().run(default_params)
+    table = result.taxation_table
+
+    assert result.taxation_table is table
+    restored = pickle.loads(pickle.dumps(result))
+    assert "taxation_table" not in restored.__dict__
+    assert restored.taxation_table.equals(table)